@@ -114,11 +114,11 @@ INSTALLED_APPS = [
      'django_redis',
      'django_mailbox',
      'post_office',
-     'silk',
      *LOCAL_APPS,
 ]
 MIDDLEWARE = [
-    'silk.middleware.SilkyMiddleware',
+    'src.core.profiling.middleware.ProfilingMiddleware',  # Sampled per-view timing/SQL/cache counters
+    'src.core.profiling.query_budget.QueryBudgetMiddleware',  # Per-view query budgets + N+1 detection (test/staging)
      'django.middleware.security.SecurityMiddleware',
      'src.core.security.admin_security_middleware.AdminSecurityMiddleware',  # 🔒 Admin Security - باید بعد از SecurityMiddleware باشد
      'src.core.security.middleware.SecurityLoggingMiddleware',
@@ -135,6 +135,26 @@ MIDDLEWARE = [
      'src.core.feature_flags.middleware.FeatureFlagMiddleware',  # Feature Flag checking at runtime
      'src.analytics.middleware.AnalyticsMiddleware',  # Analytics tracking
 ]
+# Silk records every intercepted request into the database - enable only while debugging
+SILK_ENABLED = env.bool('SILK_ENABLED', default=False)
+SILKY_INTERCEPT_PERCENT = env.int('SILKY_INTERCEPT_PERCENT', default=100)
+if SILK_ENABLED:
+    INSTALLED_APPS.append('silk')
+    MIDDLEWARE.insert(1, 'silk.middleware.SilkyMiddleware')
+
+PROFILING = {
+    'ENABLED': env.bool('PROFILING_ENABLED', default=True),
+    'SAMPLE_RATE': env.float('PROFILING_SAMPLE_RATE', default=0.01),       # Fraction of requests recorded
+    'SLOW_REQUEST_MS': env.float('PROFILING_SLOW_REQUEST_MS', default=500),  # Always record requests slower than this
+    'BUFFER_SIZE': 2000,
+    'FLUSH_INTERVAL': 10,
+    'RETENTION': 24 * 60 * 60,
+}
+QUERY_BUDGET = {
+    'ENABLED': env.bool('QUERY_BUDGET_ENABLED', default=False),  # Enable in test/staging
+    'MODE': env('QUERY_BUDGET_MODE', default='warn'),  # warn | raise
+    'N_PLUS_ONE_THRESHOLD': env.int('QUERY_BUDGET_N_PLUS_ONE_THRESHOLD', default=3),
+}
 ROOT_URLCONF = 'config.urls'
 TEMPLATES = [
      {
@@ -223,6 +243,8 @@ REST_FRAMEWORK = {
         'captcha': '100/min',         # 🔧 Captcha - راحت برای ادمین‌ها
         'failed_login': '10/hour',    # 🔧 Failed logins - فقط برای امنیت
         'security': '100/hour',       # 🔧 Security endpoints - راحتتر
+        'property_inquiry': '10/hour',  # 🔧 Public inquiry form - جلوگیری از spam
+        'property_favorite': '60/hour', # 🔧 Favorite toggles
     },
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
@@ -362,15 +384,18 @@ CACHES = {
         'BACKEND': 'django_redis.cache.RedisCache',
         'LOCATION': f'redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}',
         'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CLIENT_CLASS': 'src.core.profiling.instrumentation.ProfiledRedisClient',
+            'CONNECTION_POOL_CLASS': 'src.core.profiling.instrumentation.CountingConnectionPool',
             'CONNECTION_POOL_KWARGS': {
                 'max_connections': 50,
                 'retry_on_timeout': True,
                 'socket_connect_timeout': 5,
                 'socket_timeout': 5,
             },
-            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
-            'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
+            'COMPRESSOR': 'src.core.cache.codec.ThresholdCompressor',
+            'COMPRESS_MIN_LENGTH': int(os.getenv('CACHE_COMPRESS_MIN_LENGTH', 1024)),
+            'COMPRESS_ALGORITHM': os.getenv('CACHE_COMPRESS_ALGORITHM', 'auto'),  # auto | zstd | lz4 | zlib
+            'SERIALIZER': 'src.core.cache.codec.FastJSONSerializer',
             'IGNORE_EXCEPTIONS': True,
         },
         'KEY_PREFIX': 'webtalik',
@@ -395,6 +420,9 @@ CACHES = {
 
 CACHE_TTL = int(os.getenv('DEFAULT_CACHE_TIMEOUT_SECONDS', 60 * 15))
 
+# Unique visitors come from Redis HyperLogLogs; True forces the exact DB distinct count (audit only)
+ANALYTICS_EXACT_UNIQUE_AUDIT = env.bool('ANALYTICS_EXACT_UNIQUE_AUDIT', default=False)
+
 CAPTCHA_EXPIRY_SECONDS = int(os.getenv('CAPTCHA_EXPIRY_SECONDS', 300))
 CAPTCHA_LENGTH = int(os.getenv('CAPTCHA_LENGTH', 4))
 CAPTCHA_REDIS_PREFIX = os.getenv('CAPTCHA_REDIS_PREFIX', 'captcha:')
@@ -409,6 +437,12 @@ MELIPAYAMAK_API_URL = os.getenv('MELIPAYAMAK_API_URL')
 MELIPAYAMAK_BODY_ID = int(os.getenv('MELIPAYAMAK_BODY_ID'))
 MELIPAYAMAK_API_KEY = os.getenv('MELIPAYAMAK_API_KEY')
 
+# OTP SMS is dispatched from a Celery task through a pooled gateway session
+SMS_GATEWAY_BACKEND = os.getenv('SMS_GATEWAY_BACKEND', 'src.user.services.sms_gateway.MelipayamakGateway')
+SMS_CONNECT_TIMEOUT = float(os.getenv('SMS_CONNECT_TIMEOUT', 3))
+SMS_READ_TIMEOUT = float(os.getenv('SMS_READ_TIMEOUT', 5))
+SMS_POOL_SIZE = int(os.getenv('SMS_POOL_SIZE', 10))
+
 USE_OTP_SIMULATOR = os.getenv('USE_OTP_SIMULATOR', 'False').lower() == 'true'
 OTP_SIMULATOR_CODE = os.getenv('OTP_SIMULATOR_CODE', '').strip()
 
@@ -478,7 +512,11 @@ POST_OFFICE = {
     'BACKENDS': {
         'default': 'django.core.mail.backends.smtp.EmailBackend',
     },
-    'DEFAULT_PRIORITY': 'now',
+    'DEFAULT_PRIORITY': 'medium',
+    'BATCH_SIZE': env.int('POST_OFFICE_BATCH_SIZE', default=100),
+    'MAX_RETRIES': env.int('POST_OFFICE_MAX_RETRIES', default=4),
+    'RETRY_INTERVAL': timedelta(minutes=env.int('POST_OFFICE_RETRY_INTERVAL_MINUTES', default=5)),
+    'THREADS_PER_PROCESS': 1,
     'LOG_LEVEL': 1,
 }
 
@@ -230,6 +230,8 @@ REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
     'captcha': '10/min',        # همان
     'failed_login': '5/hour',   # کاهش از 10 به 5
     'security': '10/hour',      # کاهش از 20 به 10
+    'property_inquiry': '5/hour',
+    'property_favorite': '30/hour',
 }
 
 # ============================================
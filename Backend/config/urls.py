@@ -47,6 +47,8 @@ if settings.DEBUG:
 
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+
+if getattr(settings, 'SILK_ENABLED', False):
     try:
         urlpatterns.append(path('silk/', include('silk.urls', namespace='silk')))
     except ImportError:
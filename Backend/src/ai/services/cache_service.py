@@ -1,6 +1,6 @@
 from src.core.cache import CacheService
 from typing import List, Dict, Any, Optional
-from src.ai.utils.cache import AICacheKeys, AICacheManager
+from src.ai.utils.cache import AICacheKeys, AICacheManager, ai_local_cache
 from src.ai.utils.cache_ttl import AICacheTTL
 
 class AICacheService:
@@ -17,19 +17,19 @@ class AICacheService:
     
     @classmethod
     def get_provider(cls, slug: str):
-        return CacheService.get(AICacheKeys.provider(slug))
+        return ai_local_cache.get(AICacheKeys.provider(slug))
     
     @classmethod
     def set_provider(cls, slug: str, data: Any):
-        CacheService.set(AICacheKeys.provider(slug), data, AICacheTTL.PROVIDER)
+        ai_local_cache.set(AICacheKeys.provider(slug), data, AICacheTTL.PROVIDER)
     
     @classmethod
     def get_active_providers(cls):
-        return CacheService.get(AICacheKeys.providers_active())
+        return ai_local_cache.get(AICacheKeys.providers_active())
     
     @classmethod
     def set_active_providers(cls, data: List):
-        CacheService.set(AICacheKeys.providers_active(), data, AICacheTTL.PROVIDER)
+        ai_local_cache.set(AICacheKeys.providers_active(), data, AICacheTTL.PROVIDER)
     
     @classmethod
     def clear_provider(cls, slug: str):
@@ -41,27 +41,27 @@ class AICacheService:
     
     @classmethod
     def get_models_by_provider(cls, provider_slug: str, capability: Optional[str] = None):
-        return CacheService.get(AICacheKeys.models_by_provider(provider_slug, capability))
+        return ai_local_cache.get(AICacheKeys.models_by_provider(provider_slug, capability))
     
     @classmethod
     def set_models_by_provider(cls, provider_slug: str, capability: Optional[str], data: List):
-        CacheService.set(AICacheKeys.models_by_provider(provider_slug, capability), data, AICacheTTL.MODEL)
+        ai_local_cache.set(AICacheKeys.models_by_provider(provider_slug, capability), data, AICacheTTL.MODEL)
     
     @classmethod
     def get_models_by_capability(cls, capability: str):
-        return CacheService.get(AICacheKeys.models_by_capability(capability))
+        return ai_local_cache.get(AICacheKeys.models_by_capability(capability))
     
     @classmethod
     def set_models_by_capability(cls, capability: str, data: List):
-        CacheService.set(AICacheKeys.models_by_capability(capability), data, AICacheTTL.MODEL)
+        ai_local_cache.set(AICacheKeys.models_by_capability(capability), data, AICacheTTL.MODEL)
     
     @classmethod
     def get_models_bulk(cls, provider_slugs: List[str]):
-        return CacheService.get(AICacheKeys.models_bulk(provider_slugs))
+        return ai_local_cache.get(AICacheKeys.models_bulk(provider_slugs))
     
     @classmethod
     def set_models_bulk(cls, provider_slugs: List[str], data: Dict):
-        CacheService.set(AICacheKeys.models_bulk(provider_slugs), data, AICacheTTL.MODEL)
+        ai_local_cache.set(AICacheKeys.models_bulk(provider_slugs), data, AICacheTTL.MODEL)
     
     @classmethod
     def clear_all_models(cls):
@@ -1,4 +1,4 @@
-from .cache_admin import AICacheAdminKeys, AICacheAdminManager
+from .cache_admin import AICacheAdminKeys, AICacheAdminManager, ai_local_cache
 
 AICacheKeys = AICacheAdminKeys
 AICacheManager = AICacheAdminManager
@@ -8,5 +8,6 @@ __all__ = [
     "AICacheManager",
     "AICacheAdminKeys",
     "AICacheAdminManager",
+    "ai_local_cache",
 ]
 
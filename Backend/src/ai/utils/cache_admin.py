@@ -1,7 +1,9 @@
-from src.core.cache import CacheKeyBuilder, CacheService
+from src.core.cache import CacheKeyBuilder, CacheService, get_local_cache
 
 from .cache_shared import hash_sorted_slugs
 
+ai_local_cache = get_local_cache('ai', max_entries=256, ttl=10.0)
+
 class AICacheAdminKeys:
     @staticmethod
     def provider(slug: str):
@@ -67,11 +69,15 @@ class AICacheAdminKeys:
 class AICacheAdminManager:
     @staticmethod
     def invalidate_provider(slug: str):
-        return CacheService.clear_ai_provider(slug)
+        deleted = CacheService.clear_ai_provider(slug)
+        ai_local_cache.invalidate()
+        return deleted
 
     @staticmethod
     def invalidate_providers():
-        return CacheService.clear_ai_providers()
+        deleted = CacheService.clear_ai_providers()
+        ai_local_cache.invalidate()
+        return deleted
 
     @staticmethod
     def invalidate_models_by_provider(provider_slug: str):
@@ -79,6 +85,7 @@ class AICacheAdminManager:
         deleted += CacheService.delete_pattern(AICacheAdminKeys.provider_models_pattern(provider_slug))
         deleted += int(bool(CacheService.delete(AICacheAdminKeys.active_provider_model(provider_slug))))
         deleted += CacheService.delete_pattern(f"ai:model:active:{provider_slug}:*")
+        ai_local_cache.invalidate()
         return deleted
 
     @staticmethod
@@ -87,6 +94,7 @@ class AICacheAdminManager:
         deleted += CacheService.delete_pattern(AICacheAdminKeys.bulk_pattern())
         deleted += CacheService.delete_pattern("ai:model:catalog:*")
         deleted += CacheService.delete_pattern("ai:model:active:*")
+        ai_local_cache.invalidate()
         return deleted
 
     @staticmethod
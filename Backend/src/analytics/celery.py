@@ -28,6 +28,31 @@ app.conf.beat_schedule = {
         'task': 'src.analytics.tasks.get_queue_size',
         'schedule': 600.0,
     },
+    
+    'refresh-market-price-index': {
+        'task': 'src.real_estate.tasks.refresh_market_price_index',
+        'schedule': 600.0,
+    },
+    
+    'flush-property-engagement': {
+        'task': 'src.real_estate.tasks.flush_property_engagement',
+        'schedule': 30.0,
+    },
+    
+    'rebuild-related-properties': {
+        'task': 'src.real_estate.tasks.rebuild_related_properties',
+        'schedule': crontab(hour=3, minute=30),
+    },
+    
+    'purge-sync-tombstones': {
+        'task': 'src.core.tasks.purge_sync_tombstones',
+        'schedule': crontab(hour=4, minute=15),
+    },
+    
+    'send-queued-mail': {
+        'task': 'src.email.tasks.send_queued_mail',
+        'schedule': 60.0,
+    },
 }
 
 app.conf.update(
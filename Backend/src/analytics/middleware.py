@@ -3,7 +3,7 @@ import json
 from django.utils.deprecation import MiddlewareMixin
 from src.core.cache import CacheService
 from .services.tracking import TrackingService
-from .services.realtime import OnlineUsersRealtimeService
+from .services.realtime import OnlineUsersRealtimeService, UniqueVisitorsRealtimeService
 from .utils.geoip import get_country_from_ip
 
 class AnalyticsMiddleware(MiddlewareMixin):
@@ -92,6 +92,11 @@ class AnalyticsMiddleware(MiddlewareMixin):
                 session_id=request.session.session_key,
                 site_id=site_id,
             )
+            UniqueVisitorsRealtimeService.track(
+                session_id=request.session.session_key,
+                site_id=site_id,
+                path=request.path,
+            )
             
         except Exception as e:
             pass
@@ -1,5 +1,7 @@
 from .online_users_service import OnlineUsersRealtimeService
+from .unique_visitors_service import UniqueVisitorsRealtimeService
 
 __all__ = [
     "OnlineUsersRealtimeService",
+    "UniqueVisitorsRealtimeService",
 ]
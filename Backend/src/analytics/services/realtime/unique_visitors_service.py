@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from django.utils import timezone
+
+from src.core.cache import CacheService
+from src.analytics.utils.cache_admin import AnalyticsAdminCacheKeys
+from src.analytics.utils.cache_ttl import AnalyticsCacheTTL
+
+class UniqueVisitorsRealtimeService:
+    @classmethod
+    def track(cls, session_id: str, site_id: str = "default", path: Optional[str] = None, day: Optional[date] = None) -> None:
+        if not session_id:
+            return
+
+        day = day or timezone.now().date()
+        retention = AnalyticsCacheTTL.UNIQUE_VISITORS_RETENTION
+        CacheService.pfadd(AnalyticsAdminCacheKeys.unique_visitors(site_id, day), session_id, timeout=retention)
+        if path:
+            CacheService.pfadd(
+                AnalyticsAdminCacheKeys.unique_visitors_path(site_id, path, day),
+                session_id,
+                timeout=retention,
+            )
+
+    @staticmethod
+    def _count_existing(key: str) -> Optional[int]:
+        if not CacheService.count_existing(key):
+            return None
+        return CacheService.pfcount(key)
+
+    @classmethod
+    def count_day(cls, site_id: str = "default", day: Optional[date] = None) -> Optional[int]:
+        day = day or timezone.now().date()
+        return cls._count_existing(AnalyticsAdminCacheKeys.unique_visitors(site_id, day))
+
+    @classmethod
+    def count_path_day(cls, path: str, site_id: str = "default", day: Optional[date] = None) -> Optional[int]:
+        day = day or timezone.now().date()
+        return cls._count_existing(AnalyticsAdminCacheKeys.unique_visitors_path(site_id, path, day))
+
+    @classmethod
+    def count_range(cls, start: date, end: date, site_id: str = "default") -> Optional[int]:
+        if start > end:
+            return 0
+
+        today = timezone.now().date()
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        closed_keys = [AnalyticsAdminCacheKeys.unique_visitors(site_id, day) for day in days if day < today]
+        open_keys = [AnalyticsAdminCacheKeys.unique_visitors(site_id, day) for day in days if day >= today]
+        if not closed_keys:
+            return CacheService.pfcount(*open_keys)
+
+        range_key = AnalyticsAdminCacheKeys.unique_visitors_range(site_id, start, days[len(closed_keys) - 1])
+        if not CacheService.count_existing(range_key):
+            if CacheService.count_existing(*closed_keys) != len(closed_keys):
+                return None
+            if not CacheService.pfmerge(range_key, *closed_keys, timeout=AnalyticsCacheTTL.UNIQUE_VISITORS_RANGE):
+                return None
+        return CacheService.pfcount(range_key, *open_keys)
+
+    @classmethod
+    def count_week(cls, site_id: str = "default", end: Optional[date] = None) -> Optional[int]:
+        end = end or timezone.now().date()
+        return cls.count_range(end - timedelta(days=6), end, site_id=site_id)
+
+    @classmethod
+    def count_month(cls, site_id: str = "default", end: Optional[date] = None) -> Optional[int]:
+        end = end or timezone.now().date()
+        return cls.count_range(end.replace(day=1), end, site_id=site_id)
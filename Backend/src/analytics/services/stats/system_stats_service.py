@@ -2,7 +2,7 @@ import os
 from django.utils import timezone
 from django.db import connection
 from django.db.models import Sum, Count
-from src.core.cache import CacheService
+from src.core.cache import CacheService, local_cache_stats
 from src.media.models.media import ImageMedia, VideoMedia, AudioMedia, DocumentMedia
 from src.analytics.messages.messages import ANALYTICS_ERRORS
 from src.analytics.utils.cache import AnalyticsCacheKeys, AnalyticsCacheManager
@@ -105,6 +105,7 @@ class SystemStatsService:
                 'hit_rate': round(hit_rate, 2),
                 'keyspace_hits': keyspace_hits,
                 'keyspace_misses': keyspace_misses,
+                'local': local_cache_stats(),
             }
         except Exception as e:
             return {
@@ -114,6 +115,7 @@ class SystemStatsService:
                 'used_memory_formatted': '0B',
                 'total_keys': 0,
                 'hit_rate': 0,
+                'local': local_cache_stats(),
             }
 
     @classmethod
@@ -1,4 +1,5 @@
 from django.db.models import Sum, Q, Avg
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 from calendar import monthrange
@@ -6,7 +7,7 @@ from src.core.cache import CacheService
 from src.analytics.models import DailyStats, PageView
 from src.analytics.utils.cache_admin import AnalyticsAdminCacheKeys
 from src.analytics.utils.cache_ttl import AnalyticsCacheTTL
-from src.analytics.services.realtime import OnlineUsersRealtimeService
+from src.analytics.services.realtime import OnlineUsersRealtimeService, UniqueVisitorsRealtimeService
 
 class WebsiteTrafficService:
     @classmethod
@@ -68,7 +69,13 @@ class WebsiteTrafficService:
         return data
 
     @classmethod
-    def get_dashboard_stats(cls, site_id='default'):
+    def get_exact_unique_visitors(cls, day, site_id='default'):
+        return PageView.objects.filter(date=day, site_id=site_id).values('session_id').distinct().count()
+
+    @classmethod
+    def get_dashboard_stats(cls, site_id='default', exact_unique=None):
+        if exact_unique is None:
+            exact_unique = getattr(settings, 'ANALYTICS_EXACT_UNIQUE_AUDIT', False)
         
         today = timezone.now().date()
         yesterday = today - timedelta(days=1)
@@ -76,7 +83,9 @@ class WebsiteTrafficService:
         prev_30_days = today - timedelta(days=60)
         
         today_total = PageView.objects.filter(date=today, site_id=site_id).count()
-        today_unique = PageView.objects.filter(date=today, site_id=site_id).values('session_id').distinct().count()
+        today_unique = None if exact_unique else UniqueVisitorsRealtimeService.count_day(site_id=site_id, day=today)
+        if today_unique is None:
+            today_unique = cls.get_exact_unique_visitors(today, site_id=site_id)
         
         yesterday_stats = DailyStats.objects.filter(date=yesterday, site_id=site_id).first()
         y_total = yesterday_stats.total_visits if yesterday_stats else 0
@@ -95,7 +104,16 @@ class WebsiteTrafficService:
         )
         
         total_30 = (stats_30['total'] or 0) + today_total
-        unique_30 = (stats_30['unique'] or 0) + today_unique
+        prev_30_end = last_30_days - timedelta(days=1)
+        unique_30 = unique_prev_30 = None
+        if not exact_unique:
+            unique_30 = UniqueVisitorsRealtimeService.count_range(last_30_days, today, site_id=site_id)
+            unique_prev_30 = UniqueVisitorsRealtimeService.count_range(prev_30_days, prev_30_end, site_id=site_id)
+        if unique_30 is None or unique_prev_30 is None:
+            unique_30 = (stats_30['unique'] or 0) + today_unique
+            unique_prev_30 = DailyStats.objects.filter(
+                date__range=[prev_30_days, prev_30_end], site_id=site_id
+            ).aggregate(unique=Sum('unique_visitors'))['unique'] or 0
         
         this_month_start = today.replace(day=1)
         prev_month_end = this_month_start - timedelta(days=1)
@@ -130,6 +148,13 @@ class WebsiteTrafficService:
         source_dist = recent_daily.sources_distribution if recent_daily else {}
         top_pages = recent_daily.top_pages if recent_daily else {}
         top_countries = recent_daily.top_countries if recent_daily else {}
+        top_pages = sorted(top_pages.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_pages_unique = {}
+        if recent_daily:
+            for path, _ in top_pages:
+                unique = UniqueVisitorsRealtimeService.count_path_day(path, site_id=site_id, day=recent_daily.date)
+                if unique is not None:
+                    top_pages_unique[path] = unique
 
         return {
             'online_users_now': OnlineUsersRealtimeService.get_online_users(site_id=site_id),
@@ -141,6 +166,7 @@ class WebsiteTrafficService:
             'last_30_days': {
                 'total': total_30,
                 'unique': unique_30,
+                'unique_trend': cls._calculate_trend(unique_30, unique_prev_30),
             },
             'this_month': {
                 'total': this_month_total,
@@ -153,7 +179,8 @@ class WebsiteTrafficService:
                 'tablet': stats_30['tablet'] or 0,
             },
             'monthly_trend': monthly_trend[::-1],
-            'top_pages': sorted(top_pages.items(), key=lambda x: x[1], reverse=True)[:10],
+            'top_pages': top_pages,
+            'top_pages_unique': top_pages_unique,
             'top_countries': sorted(top_countries.items(), key=lambda x: x[1], reverse=True)[:10],
         }
 
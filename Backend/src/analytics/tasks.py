@@ -1,10 +1,12 @@
 from celery import shared_task
+from django.conf import settings
 from django.utils import timezone
 from django.db.models import Count, Q
 import json
 from src.core.cache import CacheService
 from src.analytics.utils.cache import AnalyticsCacheManager
 from .models import PageView, DailyStats
+from .services.realtime import UniqueVisitorsRealtimeService
 
 ANALYTICS_QUEUE = "analytics:queue"  # Redis List
 
@@ -265,11 +267,14 @@ def _sync_module_statistics(visits):
 def calculate_daily():
     yesterday = timezone.now().date() - timezone.timedelta(days=1)
     
+    exact_unique = getattr(settings, 'ANALYTICS_EXACT_UNIQUE_AUDIT', False)
     site_ids = PageView.objects.filter(date=yesterday).values_list('site_id', flat=True).distinct()
     
     for site_id in site_ids:
             total_visits = PageView.objects.filter(site_id=site_id, date=yesterday).count()
-            unique_visitors = PageView.objects.filter(site_id=site_id, date=yesterday).values('session_id').distinct().count()
+            unique_visitors = None if exact_unique else UniqueVisitorsRealtimeService.count_day(site_id=site_id, day=yesterday)
+            if not unique_visitors:
+                unique_visitors = PageView.objects.filter(site_id=site_id, date=yesterday).values('session_id').distinct().count()
             
             web_visits = PageView.objects.filter(site_id=site_id, date=yesterday, source='web').count()
             app_visits = PageView.objects.filter(site_id=site_id, date=yesterday, source='app').count()
@@ -312,6 +317,7 @@ def calculate_daily():
 def capture_market_snapshots():
     
     from src.real_estate.models import Property, RegionalStatistics
+    from django.db import transaction
     from django.db.models import Avg, Count
     from django.utils import timezone
     
@@ -319,28 +325,39 @@ def capture_market_snapshots():
     
     active_properties = Property.objects.filter(is_published=True, is_active=True)
     
-    geo_stats = active_properties.values('province', 'city', 'region').annotate(
+    geo_stats = active_properties.order_by().values('province', 'city', 'region').annotate(
         avg_price=Avg('price', filter=Q(state__slug='sale')),
         avg_rent=Avg('monthly_rent', filter=Q(state__slug='rent')),
         total=Count('id')
     )
     
-    count = 0
-    for stat in geo_stats:
-        RegionalStatistics.objects.update_or_create(
-            province_id=stat['province'],
-            city_id=stat['city'],
-            region_id=stat['region'],
-            date=today,
-            defaults={
-                'avg_price_sale': stat['avg_price'] or 0,
-                'avg_rent_monthly': stat['avg_rent'] or 0,
-                'total_active_listings': stat['total']
-            }
-        )
-        count += 1
+    with transaction.atomic():
+        existing = {
+            (row.province_id, row.city_id, row.region_id): row
+            for row in RegionalStatistics.objects.select_for_update().filter(date=today)
+        }
+        to_create = []
+        to_update = []
+        for stat in geo_stats:
+            key = (stat['province'], stat['city'], stat['region'])
+            row = existing.get(key)
+            if row is None:
+                row = RegionalStatistics(province_id=key[0], city_id=key[1], region_id=key[2], date=today)
+                to_create.append(row)
+            else:
+                to_update.append(row)
+            row.avg_price_sale = int(stat['avg_price'] or 0)
+            row.avg_rent_monthly = int(stat['avg_rent'] or 0)
+            row.total_active_listings = stat['total']
         
-    return f"Market snapshots captured for {count} regions."
+        RegionalStatistics.objects.bulk_create(to_create, batch_size=1000)
+        RegionalStatistics.objects.bulk_update(
+            to_update,
+            ['avg_price_sale', 'avg_rent_monthly', 'total_active_listings'],
+            batch_size=1000,
+        )
+    
+    return f"Market snapshots captured for {len(to_create) + len(to_update)} regions."
 
 @shared_task
 def cleanup_old_views():
@@ -1,3 +1,5 @@
+import hashlib
+
 from src.core.cache import CacheService
 from src.analytics.utils.cache_shared import compose_analytics_key
 
@@ -74,6 +76,19 @@ class AnalyticsAdminCacheKeys:
     def online_users_pattern():
         return f"{compose_analytics_key('realtime:online_users')}:*"
 
+    @staticmethod
+    def unique_visitors(site_id: str, day):
+        return compose_analytics_key("realtime:uv", f"{site_id}:{day.isoformat()}")
+
+    @staticmethod
+    def unique_visitors_path(site_id: str, path: str, day):
+        path_hash = hashlib.md5(path.encode()).hexdigest()[:12]
+        return compose_analytics_key("realtime:uv:path", f"{site_id}:{path_hash}:{day.isoformat()}")
+
+    @staticmethod
+    def unique_visitors_range(site_id: str, start, end):
+        return compose_analytics_key("realtime:uv:range", f"{site_id}:{start.isoformat()}:{end.isoformat()}")
+
     @staticmethod
     def all_keys():
         return [
@@ -5,3 +5,5 @@ class AnalyticsCacheTTL:
     TRAFFIC_MONTHLY = 60
     CONTENT_TREND = 30
     ONLINE_USERS_WINDOW_SECONDS = 60
+    UNIQUE_VISITORS_RETENTION = 62 * 24 * 60 * 60
+    UNIQUE_VISITORS_RANGE = 24 * 60 * 60
@@ -6,6 +6,8 @@ class BlogConfig(AppConfig):
 
     def ready(self):
         import src.blog.signals
+        from src.blog.sync import register_sync_resources
+        register_sync_resources()
         try:
             from src.ai.destinations.registry import ContentDestinationRegistry
             from src.blog.services.ai_integration import save_ai_content_to_blog
@@ -0,0 +1,27 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_blog_created_by_blogaudio_created_by_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='blog',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, help_text='Weighted full-text search vector (normalized Persian text)', null=True, verbose_name='Search Vector'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='idx_blog_gin_fulltext'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='idx_blog_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
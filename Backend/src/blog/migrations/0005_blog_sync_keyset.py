@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-03-09 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_blog_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_blog_sync_keyset'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-03-10 09:20
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from src.core.search.normalization import normalize_persian_text
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def backfill_search_title(apps, schema_editor):
+    Model = apps.get_model('blog', 'Blog')
+    batch = []
+    for obj in Model.objects.only('id', 'title').iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        obj.search_title = normalize_persian_text(obj.title)
+        batch.append(obj)
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Model.objects.bulk_update(batch, ['search_title'])
+            batch = []
+    if batch:
+        Model.objects.bulk_update(batch, ['search_title'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_blog_sync_keyset'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='search_title',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Normalized title matched by the trigram search fallback', max_length=100, verbose_name='Search Title'),
+        ),
+        migrations.RunPython(backfill_search_title, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='blog',
+            name='idx_blog_title_trgm',
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_title'], name='idx_blog_search_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
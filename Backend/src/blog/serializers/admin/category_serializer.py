@@ -27,9 +27,16 @@ class BlogCategoryAdminListSerializer(CountsMixin, serializers.ModelSerializer):
         return obj.get_depth()
     
     def get_has_children(self, obj):
+        tree = self.context.get('category_tree')
+        if tree is not None and obj.id in tree:
+            return tree.children_count(obj.id) > 0
         return obj.get_children_count() > 0
     
     def get_parent_name(self, obj):
+        tree = self.context.get('category_tree')
+        if tree is not None and obj.id in tree:
+            parent = tree.parent(obj.id)
+            return parent['name'] if parent else None
         parent = obj.get_parent()
         return parent.name if parent else None
     
@@ -66,6 +73,18 @@ class BlogCategoryAdminDetailSerializer(SEODataMixin, serializers.ModelSerialize
         read_only_fields = ['id', 'public_id', 'created_at', 'updated_at']
     
     def get_parent(self, obj):
+        tree = self.context.get('category_tree')
+        if tree is not None and obj.id in tree:
+            parent = tree.parent(obj.id)
+            if parent:
+                return {
+                    'id': parent['id'],
+                    'public_id': parent['public_id'],
+                    'name': parent['name'],
+                    'slug': parent['slug']
+                }
+            return None
+
         parent = obj.get_parent()
         if parent:
             return {
@@ -77,6 +96,21 @@ class BlogCategoryAdminDetailSerializer(SEODataMixin, serializers.ModelSerialize
         return None
     
     def get_children(self, obj):
+        tree = self.context.get('category_tree')
+        if tree is not None and obj.id in tree:
+            return [
+                {
+                    'id': child['id'],
+                    'public_id': child['public_id'],
+                    'name': child['name'],
+                    'slug': child['slug'],
+                    'blog_count': child['blog_count'],
+                    'has_children': child['children_count'] > 0
+                }
+                for child in tree.children(obj.id)
+                if child['is_active']
+            ]
+
         children = obj.get_children().filter(is_active=True)
         return [
             {
@@ -91,6 +125,10 @@ class BlogCategoryAdminDetailSerializer(SEODataMixin, serializers.ModelSerialize
         ]
     
     def get_breadcrumbs(self, obj):
+        tree = self.context.get('category_tree')
+        if tree is not None and obj.id in tree:
+            return tree.breadcrumbs(obj.id, ('id', 'name', 'slug'))
+
         ancestors = obj.get_ancestors()
         breadcrumbs = [
             {
@@ -11,9 +11,12 @@ from src.blog.utils.cache_admin import CategoryCacheKeys, CategoryCacheManager
 from src.blog.utils import cache_ttl
 from src.blog.messages.messages import CATEGORY_ERRORS
 from src.media.models.media import ImageMedia
+from src.core.utils.tree_materializer import TreeMaterializer
 
 class BlogCategoryAdminService:
 
+    TREE_FIELDS = ('public_id', 'name', 'slug', 'is_active', 'is_public', 'blog_count')
+
     @staticmethod
     def _normalize_query_params(query_params):
         if hasattr(query_params, 'lists'):
@@ -115,36 +118,30 @@ class BlogCategoryAdminService:
         
         return root_categories
 
+    @staticmethod
+    def get_materialized_tree(use_cache=True):
+        queryset = BlogCategoryAdminService._with_blog_count(BlogCategory.objects.all())
+        return TreeMaterializer(
+            queryset,
+            fields=BlogCategoryAdminService.TREE_FIELDS,
+            cache_namespace=CategoryCacheKeys.tree_admin(),
+            timeout=cache_ttl.ADMIN_TAXONOMY_TREE_TTL,
+        ).get(use_cache=use_cache)
+
     @staticmethod
     def get_tree_data():
-        cache_key = CategoryCacheKeys.tree_admin()
-        tree_data = cache.get(cache_key)
-        
-        if tree_data is None:
-            def build_tree(nodes):
-                tree = []
-                for node in nodes:
-                    children = node.get_children().filter(is_active=True)
-                    tree_node = {
-                        'id': node.id,
-                        'public_id': node.public_id,
-                        'name': node.name,
-                        'slug': node.slug,
-                        'level': node.get_depth(),
-                        'blog_count': getattr(node, 'blog_count', 0),
-                        'children': build_tree(children) if children else []
-                    }
-                    tree.append(tree_node)
-                return tree
-            
-            root_nodes = BlogCategoryAdminService._with_blog_count(
-                BlogCategory.get_root_nodes().filter(is_active=True)
-            )
-            
-            tree_data = build_tree(root_nodes)
-            cache.set(cache_key, tree_data, cache_ttl.ADMIN_TAXONOMY_TREE_TTL)
-        
-        return tree_data
+        tree = BlogCategoryAdminService.get_materialized_tree()
+        return tree.nested(
+            fields={
+                'id': 'id',
+                'public_id': 'public_id',
+                'name': 'name',
+                'slug': 'slug',
+                'level': 'depth',
+                'blog_count': 'blog_count',
+            },
+            include=lambda node: node['is_active'],
+        )
 
     @staticmethod
     def create_category(validated_data, created_by=None):
@@ -265,6 +262,10 @@ class BlogCategoryAdminService:
     
     @staticmethod
     def get_breadcrumbs(category):
+        tree = BlogCategoryAdminService.get_materialized_tree()
+        if category.id in tree:
+            return tree.breadcrumbs(category.id, ('id', 'name', 'slug'))
+
         ancestors = category.get_ancestors()
         breadcrumbs = []
         
@@ -1,7 +1,7 @@
 from datetime import date
 
-from django.core.cache import cache
-from django.db.models import Q
+from src.core.cache import get_or_compute
+from src.core.search import FullTextSearchService
 from src.blog.models.blog import Blog
 from src.blog.serializers.public.blog_serializer import (
     BlogPublicDetailSerializer,
@@ -59,13 +59,9 @@ class BlogPublicService:
                 queryset = queryset.filter(created_at__date__lte=created_before)
         
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(short_description__icontains=search) |
-                Q(description__icontains=search) |
-                Q(categories__name__icontains=search) |
-                Q(tags__name__icontains=search)
-            ).distinct()
+            queryset = FullTextSearchService.search(queryset, search)
+            if not ordering:
+                return queryset.order_by('-search_rank', '-created_at')
         
         queryset = queryset.order_by(BlogPublicService._normalize_ordering(ordering))
         return queryset
@@ -111,84 +107,72 @@ class BlogPublicService:
     @staticmethod
     def get_blog_list_data(filters=None, search=None, ordering=None):
         cache_key = BlogPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = BlogPublicService.get_blog_queryset(filters=filters, search=search, ordering=ordering)
-        data = list(BlogPublicListSerializer(queryset, many=True).data)
-        cache.set(cache_key, data, BlogPublicService.LIST_CACHE_TTL)
-        return data
+        def compute():
+            queryset = BlogPublicService.get_blog_queryset(filters=filters, search=search, ordering=ordering)
+            return list(BlogPublicListSerializer(queryset, many=True).data)
+
+        return get_or_compute(cache_key, compute, BlogPublicService.LIST_CACHE_TTL)
 
     @staticmethod
     def get_blog_detail_by_slug_data(slug):
         cache_key = BlogPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        blog = BlogPublicService.get_blog_by_slug(slug)
-        if not blog:
-            return None
+        def compute():
+            blog = BlogPublicService.get_blog_by_slug(slug)
+            if not blog:
+                return None
+
+            return dict(BlogPublicDetailSerializer(blog).data)
 
-        data = dict(BlogPublicDetailSerializer(blog).data)
-        cache.set(cache_key, data, BlogPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_blog_detail_by_public_id_data(public_id):
         cache_key = BlogPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        blog = BlogPublicService.get_blog_by_public_id(public_id)
-        if not blog:
-            return None
+        def compute():
+            blog = BlogPublicService.get_blog_by_public_id(public_id)
+            if not blog:
+                return None
+
+            return dict(BlogPublicDetailSerializer(blog).data)
 
-        data = dict(BlogPublicDetailSerializer(blog).data)
-        cache.set(cache_key, data, BlogPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_blog_detail_by_id_data(blog_id):
         cache_key = BlogPublicCacheKeys.detail_id(blog_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        blog = BlogPublicService.get_blog_by_id(blog_id)
-        if not blog:
-            return None
+        def compute():
+            blog = BlogPublicService.get_blog_by_id(blog_id)
+            if not blog:
+                return None
+
+            return dict(BlogPublicDetailSerializer(blog).data)
 
-        data = dict(BlogPublicDetailSerializer(blog).data)
-        cache.set(cache_key, data, BlogPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_featured_blogs_data(limit=6):
         cache_key = BlogPublicCacheKeys.featured(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        blogs = BlogPublicService.get_featured_blogs(limit=limit)
-        data = list(BlogPublicListSerializer(blogs, many=True).data)
-        cache.set(cache_key, data, BlogPublicService.FEATURED_CACHE_TTL)
-        return data
+        def compute():
+            blogs = BlogPublicService.get_featured_blogs(limit=limit)
+            return list(BlogPublicListSerializer(blogs, many=True).data)
+
+        return get_or_compute(cache_key, compute, BlogPublicService.FEATURED_CACHE_TTL)
 
     @staticmethod
     def get_related_blogs_by_slug_data(slug, limit=4):
         cache_key = BlogPublicCacheKeys.related(slug, limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        blog = BlogPublicService.get_blog_by_slug(slug)
-        if not blog:
-            return None
+        def compute():
+            blog = BlogPublicService.get_blog_by_slug(slug)
+            if not blog:
+                return None
+
+            related_blogs = BlogPublicService.get_related_blogs(blog, limit=limit)
+            return list(BlogPublicListSerializer(related_blogs, many=True).data)
 
-        related_blogs = BlogPublicService.get_related_blogs(blog, limit=limit)
-        data = list(BlogPublicListSerializer(related_blogs, many=True).data)
-        cache.set(cache_key, data, BlogPublicService.RELATED_CACHE_TTL)
-        return data
\ No newline at end of file
+        return get_or_compute(cache_key, compute, BlogPublicService.RELATED_CACHE_TTL)
\ No newline at end of file
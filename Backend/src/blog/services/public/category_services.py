@@ -1,5 +1,5 @@
-from django.core.cache import cache
 from django.db.models import Count, Q
+from src.core.cache import get_or_compute
 from src.blog.models.category import BlogCategory
 from src.blog.serializers.public.category_serializer import BlogCategoryPublicSerializer
 from src.blog.utils.cache_public import BlogCategoryPublicCacheKeys
@@ -166,81 +166,69 @@ class BlogCategoryPublicService:
     @staticmethod
     def get_category_list_data(filters=None, search=None, ordering=None):
         cache_key = BlogCategoryPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = BlogCategoryPublicService.get_category_queryset(filters=filters, search=search, ordering=ordering)
-        data = BlogCategoryPublicService._serialize_categories(queryset)
-        cache.set(cache_key, data, BlogCategoryPublicService.LIST_CACHE_TTL)
-        return data
+        def compute():
+            queryset = BlogCategoryPublicService.get_category_queryset(filters=filters, search=search, ordering=ordering)
+            return BlogCategoryPublicService._serialize_categories(queryset)
+
+        return get_or_compute(cache_key, compute, BlogCategoryPublicService.LIST_CACHE_TTL)
 
     @staticmethod
     def get_tree_data_serialized():
         cache_key = BlogCategoryPublicCacheKeys.tree()
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = BlogCategoryPublicService.get_tree_data()
-        data = BlogCategoryPublicService._serialize_categories(queryset)
-        cache.set(cache_key, data, BlogCategoryPublicService.TREE_CACHE_TTL)
-        return data
+        def compute():
+            queryset = BlogCategoryPublicService.get_tree_data()
+            return BlogCategoryPublicService._serialize_categories(queryset)
+
+        return get_or_compute(cache_key, compute, BlogCategoryPublicService.TREE_CACHE_TTL)
 
     @staticmethod
     def get_root_categories_serialized():
         cache_key = BlogCategoryPublicCacheKeys.roots()
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        categories = BlogCategoryPublicService.get_root_categories()
-        data = BlogCategoryPublicService._serialize_categories(categories)
-        cache.set(cache_key, data, BlogCategoryPublicService.ROOTS_CACHE_TTL)
-        return data
+        def compute():
+            categories = BlogCategoryPublicService.get_root_categories()
+            return BlogCategoryPublicService._serialize_categories(categories)
+
+        return get_or_compute(cache_key, compute, BlogCategoryPublicService.ROOTS_CACHE_TTL)
 
     @staticmethod
     def get_category_detail_by_slug_data(slug):
         cache_key = BlogCategoryPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        category = BlogCategoryPublicService.get_category_by_slug(slug)
-        if not category:
-            return None
+        def compute():
+            category = BlogCategoryPublicService.get_category_by_slug(slug)
+            if not category:
+                return None
+
+            return BlogCategoryPublicService._serialize_category(category)
 
-        data = BlogCategoryPublicService._serialize_category(category)
-        cache.set(cache_key, data, BlogCategoryPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogCategoryPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_category_detail_by_public_id_data(public_id):
         cache_key = BlogCategoryPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        category = BlogCategoryPublicService.get_category_by_public_id(public_id)
-        if not category:
-            return None
+        def compute():
+            category = BlogCategoryPublicService.get_category_by_public_id(public_id)
+            if not category:
+                return None
+
+            return BlogCategoryPublicService._serialize_category(category)
 
-        data = BlogCategoryPublicService._serialize_category(category)
-        cache.set(cache_key, data, BlogCategoryPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogCategoryPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_category_detail_by_id_data(category_id):
         cache_key = BlogCategoryPublicCacheKeys.detail_id(category_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        category = BlogCategoryPublicService.get_category_by_id(category_id)
-        if not category:
-            return None
+        def compute():
+            category = BlogCategoryPublicService.get_category_by_id(category_id)
+            if not category:
+                return None
+
+            return BlogCategoryPublicService._serialize_category(category)
 
-        data = BlogCategoryPublicService._serialize_category(category)
-        cache.set(cache_key, data, BlogCategoryPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogCategoryPublicService.DETAIL_CACHE_TTL)
 
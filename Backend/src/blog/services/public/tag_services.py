@@ -1,5 +1,5 @@
-from django.core.cache import cache
 from django.db.models import Count, Q
+from src.core.cache import get_or_compute
 from src.blog.models.tag import BlogTag
 from src.blog.serializers.public.tag_serializer import BlogTagPublicSerializer
 from src.blog.utils.cache_public import BlogTagPublicCacheKeys
@@ -94,69 +94,59 @@ class BlogTagPublicService:
     @staticmethod
     def get_tag_list_data(filters=None, search=None, ordering=None):
         cache_key = BlogTagPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = BlogTagPublicService.get_tag_queryset(filters=filters, search=search, ordering=ordering)
-        data = list(BlogTagPublicSerializer(queryset, many=True).data)
-        cache.set(cache_key, data, BlogTagPublicService.LIST_CACHE_TTL)
-        return data
+        def compute():
+            queryset = BlogTagPublicService.get_tag_queryset(filters=filters, search=search, ordering=ordering)
+            return list(BlogTagPublicSerializer(queryset, many=True).data)
+
+        return get_or_compute(cache_key, compute, BlogTagPublicService.LIST_CACHE_TTL)
 
     @staticmethod
     def get_tag_detail_by_slug_data(slug):
         cache_key = BlogTagPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = BlogTagPublicService.get_tag_by_slug(slug)
-        if not tag:
-            return None
+        def compute():
+            tag = BlogTagPublicService.get_tag_by_slug(slug)
+            if not tag:
+                return None
+
+            return dict(BlogTagPublicSerializer(tag).data)
 
-        data = dict(BlogTagPublicSerializer(tag).data)
-        cache.set(cache_key, data, BlogTagPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogTagPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_tag_detail_by_public_id_data(public_id):
         cache_key = BlogTagPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = BlogTagPublicService.get_tag_by_public_id(public_id)
-        if not tag:
-            return None
+        def compute():
+            tag = BlogTagPublicService.get_tag_by_public_id(public_id)
+            if not tag:
+                return None
+
+            return dict(BlogTagPublicSerializer(tag).data)
 
-        data = dict(BlogTagPublicSerializer(tag).data)
-        cache.set(cache_key, data, BlogTagPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogTagPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_tag_detail_by_id_data(tag_id):
         cache_key = BlogTagPublicCacheKeys.detail_id(tag_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = BlogTagPublicService.get_tag_by_id(tag_id)
-        if not tag:
-            return None
+        def compute():
+            tag = BlogTagPublicService.get_tag_by_id(tag_id)
+            if not tag:
+                return None
+
+            return dict(BlogTagPublicSerializer(tag).data)
 
-        data = dict(BlogTagPublicSerializer(tag).data)
-        cache.set(cache_key, data, BlogTagPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, BlogTagPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_popular_tags_data(limit=10):
         cache_key = BlogTagPublicCacheKeys.popular(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        tags = BlogTagPublicService.get_popular_tags(limit=limit)
-        data = list(BlogTagPublicSerializer(tags, many=True).data)
-        cache.set(cache_key, data, BlogTagPublicService.POPULAR_CACHE_TTL)
-        return data
+
+        def compute():
+            tags = BlogTagPublicService.get_popular_tags(limit=limit)
+            return list(BlogTagPublicSerializer(tags, many=True).data)
+
+        return get_or_compute(cache_key, compute, BlogTagPublicService.POPULAR_CACHE_TTL)
 
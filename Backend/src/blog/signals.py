@@ -1,5 +1,6 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from src.core.search.signals import register_search_index
 from src.blog.models.blog import Blog
 from src.user.services.admin_performance_service import AdminPerformanceService
 from src.user.models.admin_profile import AdminProfile
@@ -10,3 +11,5 @@ def track_blog_creation(sender, instance, created, **kwargs):
         profile = AdminProfile.objects.filter(admin_user=instance.created_by).first()
         if profile:
             AdminPerformanceService.track_content_creation(profile, 'blog')
+
+register_search_index(Blog)
@@ -0,0 +1,29 @@
+from src.blog.models.blog import Blog
+from src.blog.models.category import BlogCategory
+from src.blog.models.tag import BlogTag
+from src.blog.serializers.public.blog_serializer import BlogPublicListSerializer
+from src.blog.serializers.public.category_serializer import BlogCategoryPublicSerializer
+from src.blog.serializers.public.tag_serializer import BlogTagPublicSerializer
+from src.core.sync import SyncRegistry
+
+def register_sync_resources():
+    SyncRegistry.register(
+        'blogs',
+        Blog,
+        visible=lambda: Blog.objects.active().published(),
+        serialize=lambda queryset: list(BlogPublicListSerializer(queryset.for_public_listing(), many=True).data),
+    )
+    SyncRegistry.register(
+        'blog-categories',
+        BlogCategory,
+        visible=lambda: BlogCategory.objects.filter(is_active=True, is_public=True),
+        serialize=lambda queryset: list(
+            BlogCategoryPublicSerializer(queryset.with_counts().select_related('image'), many=True).data
+        ),
+    )
+    SyncRegistry.register(
+        'blog-tags',
+        BlogTag,
+        visible=lambda: BlogTag.objects.filter(is_active=True, is_public=True),
+        serialize=lambda queryset: list(BlogTagPublicSerializer(queryset.with_counts(), many=True).data),
+    )
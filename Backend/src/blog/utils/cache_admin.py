@@ -1,6 +1,7 @@
 from django.core.cache import cache
 
 from src.core.cache import CacheKeyBuilder, CacheService
+from src.core.utils.tree_materializer import TreeMaterializer
 from src.blog.utils.cache_shared import hash_payload
 
 class BlogCacheKeys:
@@ -123,6 +124,7 @@ class CategoryCacheManager:
         all_keys.extend(CategoryCacheKeys.all_popular_keys())
         if all_keys:
             cache.delete_many(all_keys)
+        TreeMaterializer.invalidate(CategoryCacheKeys.tree_admin())
         deleted = CacheService.delete_pattern("admin:blog:category:list:*")
         deleted += CacheService.delete_pattern("public:blog:category:*")
         return deleted
@@ -39,6 +39,7 @@ from src.core.utils.validation_helpers import extract_validation_message, normal
 
 class BlogAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
     permission_classes = [blog_permission]
+    query_budget = {'list': 12, 'retrieve': 14}
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = BlogAdminFilter
     search_fields = ['title', 'short_description', 'meta_title', 'meta_description']
@@ -61,6 +61,12 @@ class BlogCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
         else:
             return BlogCategoryAdminDetailSerializer
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in ('list', 'retrieve', 'children'):
+            context['category_tree'] = BlogCategoryAdminService.get_materialized_tree()
+        return context
+
     def list(self, request, *args, **kwargs):
         tree_mode = request.GET.get('tree', '').lower() == 'true'
         if tree_mode:
@@ -82,7 +88,7 @@ class BlogCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
         queryset = self.filter_queryset(BlogCategoryAdminService.get_tree_queryset())
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = BlogCategoryAdminListSerializer(page, many=True)
+            serializer = BlogCategoryAdminListSerializer(page, many=True, context=self.get_serializer_context())
             response = self.get_paginated_response(serializer.data)
             BlogCategoryAdminService.set_cached_list_payload(
                 user_id=user_id,
@@ -91,7 +97,7 @@ class BlogCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
             )
             return response
         
-        serializer = BlogCategoryAdminListSerializer(queryset, many=True)
+        serializer = BlogCategoryAdminListSerializer(queryset, many=True, context=self.get_serializer_context())
         response = APIResponse.success(
             message=CATEGORY_SUCCESS["category_list_success"],
             data=serializer.data,
@@ -246,7 +252,7 @@ class BlogCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
             )
         
         children = category.get_children().filter(is_active=True)
-        serializer = BlogCategoryAdminListSerializer(children, many=True)
+        serializer = BlogCategoryAdminListSerializer(children, many=True, context=self.get_serializer_context())
         
         return APIResponse.success(
             message=CATEGORY_SUCCESS["category_list_success"],
@@ -13,6 +13,7 @@ from src.blog.services.public.blog_services import BlogPublicService
 
 class BlogPublicViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [AllowAny]
+    query_budget = {'list': 8, 'retrieve': 10}
     lookup_field = 'slug'
     pagination_class = StandardLimitPagination
 
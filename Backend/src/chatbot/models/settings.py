@@ -2,7 +2,7 @@ from django.db import models
 from src.core.cache import CacheService
 from src.core.models import BaseModel
 from src.chatbot.utils.cache import ChatbotCacheManager
-from src.chatbot.utils.cache_public import ChatbotPublicCacheKeys
+from src.chatbot.utils.cache_public import ChatbotPublicCacheKeys, chatbot_settings_cache
 from src.chatbot.utils.cache_ttl import ChatbotCacheTTL
 from src.chatbot.messages.messages import CHATBOT_DEFAULTS
 
@@ -53,6 +53,13 @@ class ChatbotSettings(BaseModel):
     
     @classmethod
     def get_settings(cls):
+        return chatbot_settings_cache.get_or_set_local(
+            ChatbotPublicCacheKeys.settings_instance(),
+            cls._load_settings,
+        )
+
+    @classmethod
+    def _load_settings(cls):
         cache_key = ChatbotPublicCacheKeys.settings_id()
         settings_id = CacheService.get(cache_key)
         if settings_id:
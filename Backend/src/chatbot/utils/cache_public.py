@@ -1,4 +1,6 @@
-from src.core.cache import CacheService
+from src.core.cache import CacheService, get_local_cache
+
+chatbot_settings_cache = get_local_cache('chatbot_settings', max_entries=4, ttl=30.0)
 
 class ChatbotPublicCacheKeys:
     @staticmethod
@@ -17,6 +19,10 @@ class ChatbotPublicCacheKeys:
     def settings_legacy():
         return "chatbot:settings"
 
+    @staticmethod
+    def settings_instance():
+        return "public:chatbot:settings:instance"
+
 class ChatbotPublicCacheManager:
     @staticmethod
     def invalidate_faqs():
@@ -27,3 +33,4 @@ class ChatbotPublicCacheManager:
     def invalidate_settings():
         CacheService.delete(ChatbotPublicCacheKeys.settings_id())
         CacheService.delete(ChatbotPublicCacheKeys.settings_legacy())
+        chatbot_settings_cache.invalidate()
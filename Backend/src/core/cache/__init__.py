@@ -5,6 +5,24 @@ from .redis_manager import (
     cache_result,
 )
 
+from .local_cache import (
+    LocalCache,
+    get_local_cache,
+    local_cache_stats,
+)
+
+from .stale_while_revalidate import (
+    get_or_compute,
+)
+
+from .invalidation import (
+    InvalidationBatch,
+    bump_generation,
+    deferred_invalidation,
+    invalidate_keys,
+    invalidate_pattern,
+)
+
 from .namespaces import (
     CacheNamespace,
     CacheTTL,
@@ -19,6 +37,15 @@ __all__ = [
     'SessionRedisManager',
     'CacheService',
     'cache_result',
+    'get_or_compute',
+    'LocalCache',
+    'get_local_cache',
+    'local_cache_stats',
+    'InvalidationBatch',
+    'bump_generation',
+    'deferred_invalidation',
+    'invalidate_keys',
+    'invalidate_pattern',
     'CacheNamespace',
     'CacheTTL',
     'CacheKeyBuilder',
@@ -0,0 +1,100 @@
+import json
+import zlib
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django_redis.compressors.base import BaseCompressor
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.base import BaseSerializer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESS_MIN_LENGTH = 1024
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+LZ4_MAGIC = b'\x04\x22\x4d\x18'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+_json_encoder = DjangoJSONEncoder()
+
+def _default(value: Any) -> Any:
+    return _json_encoder.default(value)
+
+def available_algorithms() -> list[str]:
+    algorithms = []
+    if zstandard is not None:
+        algorithms.append('zstd')
+    if lz4_frame is not None:
+        algorithms.append('lz4')
+    algorithms.append('zlib')
+    return algorithms
+
+def _resolve_algorithm(algorithm: str) -> str:
+    if algorithm == 'auto':
+        return available_algorithms()[0]
+    if algorithm not in available_algorithms():
+        return 'zlib'
+    return algorithm
+
+def _is_zlib(value: bytes) -> bool:
+    return len(value) >= 2 and value[0] == 0x78 and (value[0] * 256 + value[1]) % 31 == 0
+
+class FastJSONSerializer(BaseSerializer):
+
+    def dumps(self, value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                value,
+                default=_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        return json.dumps(value, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+
+    def loads(self, value: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value.decode())
+
+class ThresholdCompressor(BaseCompressor):
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.min_length = int(options.get('COMPRESS_MIN_LENGTH', COMPRESS_MIN_LENGTH))
+        self.algorithm = _resolve_algorithm(options.get('COMPRESS_ALGORITHM', 'auto'))
+        self._zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if self.algorithm == 'zstd' else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+    def compress(self, value: bytes) -> bytes:
+        if len(value) < self.min_length:
+            return value
+        if self.algorithm == 'zstd':
+            return self._zstd_compressor.compress(value)
+        if self.algorithm == 'lz4':
+            return lz4_frame.compress(value)
+        return zlib.compress(value, ZLIB_LEVEL)
+
+    def decompress(self, value: bytes) -> bytes:
+        try:
+            if value[:4] == ZSTD_MAGIC and self._zstd_decompressor is not None:
+                return self._zstd_decompressor.decompress(value)
+            if value[:4] == LZ4_MAGIC and lz4_frame is not None:
+                return lz4_frame.decompress(value)
+            if _is_zlib(value):
+                return zlib.decompress(value)
+        except Exception as e:
+            raise CompressorError(e) from e
+        raise CompressorError("value is not compressed")
@@ -0,0 +1,126 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Optional
+
+from django.core.cache import caches
+
+from src.core.utils.commit_batch import add_to_commit_batch
+
+logger = logging.getLogger(__name__)
+
+UNLINK_CHUNK_SIZE = 1000
+SCAN_COUNT = 1000
+
+class InvalidationBatch:
+
+    __slots__ = ('keys', 'patterns', 'generations')
+
+    def __init__(self):
+        self.keys: set[str] = set()
+        self.patterns: set[str] = set()
+        self.generations: dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.keys or self.patterns or self.generations)
+
+    def __len__(self) -> int:
+        return len(self.keys) + len(self.patterns) + len(self.generations)
+
+    def merge_into(self, other: 'InvalidationBatch') -> None:
+        other.keys.update(self.keys)
+        other.patterns.update(self.patterns)
+        other.generations.update(self.generations)
+
+    def flush(self, cache_alias: str = 'default') -> int:
+        if not self:
+            return 0
+
+        cache = caches[cache_alias]
+        try:
+            from django_redis import get_redis_connection
+            client = get_redis_connection(cache_alias)
+        except Exception:
+            client = None
+
+        if client is None:
+            return self._flush_fallback(cache)
+
+        try:
+            raw_keys = {cache.make_key(key) for key in self.keys}
+            for pattern in self.patterns:
+                raw_keys.update(client.scan_iter(match=cache.make_key(pattern), count=SCAN_COUNT))
+
+            now_ms = _now_ms()
+            pipe = client.pipeline(transaction=False)
+            raw_keys = list(raw_keys)
+            for start in range(0, len(raw_keys), UNLINK_CHUNK_SIZE):
+                pipe.unlink(*raw_keys[start:start + UNLINK_CHUNK_SIZE])
+            for key, timeout in self.generations.items():
+                pipe.set(cache.make_key(key), now_ms, ex=timeout)
+            pipe.execute()
+            return len(raw_keys)
+        except Exception as e:
+            logger.warning(f"Cache invalidation flush failed, falling back to per-key deletes: {e}")
+            return self._flush_fallback(cache)
+
+    def _flush_fallback(self, cache) -> int:
+        deleted = 0
+        try:
+            if self.keys:
+                cache.delete_many(list(self.keys))
+                deleted += len(self.keys)
+            for pattern in self.patterns:
+                if hasattr(cache, 'delete_pattern'):
+                    deleted += cache.delete_pattern(pattern) or 0
+            now_ms = _now_ms()
+            for key, timeout in self.generations.items():
+                cache.set(key, now_ms, timeout)
+        except Exception as e:
+            logger.warning(f"Cache invalidation fallback failed: {e}")
+        return deleted
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+_deferred: ContextVar[Optional[InvalidationBatch]] = ContextVar('cache_invalidation_deferred', default=None)
+
+def _add(update):
+    deferred = _deferred.get()
+    if deferred is not None:
+        return update(deferred)
+    return add_to_commit_batch('cache_invalidation', InvalidationBatch, InvalidationBatch.flush, update)
+
+def invalidate_keys(keys: Iterable[str]) -> int:
+    def update(batch):
+        before = len(batch.keys)
+        batch.keys.update(keys)
+        return len(batch.keys) - before
+    return _add(update)
+
+def invalidate_pattern(*patterns: str) -> int:
+    _add(lambda batch: batch.patterns.update(patterns))
+    return len(patterns)
+
+def bump_generation(key: str, timeout: int) -> int:
+    def update(batch):
+        batch.generations[key] = timeout
+    _add(update)
+    return 1
+
+@contextmanager
+def deferred_invalidation():
+    outer = _deferred.get()
+    if outer is not None:
+        yield outer
+        return
+
+    batch = InvalidationBatch()
+    token = _deferred.set(batch)
+    try:
+        yield batch
+    finally:
+        _deferred.reset(token)
+        if batch:
+            add_to_commit_batch('cache_invalidation', InvalidationBatch, InvalidationBatch.flush, batch.merge_into)
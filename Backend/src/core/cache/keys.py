@@ -22,6 +22,10 @@ class CacheKeyBuilder:
     def otp(mobile: str) -> str:
         return CacheKeyBuilder._build(CacheNamespace.OTP, mobile)
     
+    @staticmethod
+    def otp_delivery(otp_id: str) -> str:
+        return CacheKeyBuilder._build(CacheNamespace.OTP, 'delivery', otp_id)
+    
     @staticmethod
     def captcha(captcha_id: str) -> str:
         return CacheKeyBuilder._build(CacheNamespace.CAPTCHA, captcha_id)
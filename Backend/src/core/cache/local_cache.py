@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from .redis_manager import CacheService
+
+_MISSING = object()
+
+class LocalCache:
+
+    GENERATION_TIMEOUT = 7 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 256,
+        ttl: float = 5.0,
+        generation_check_interval: float = 1.0,
+    ):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation_check_interval = generation_check_interval
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = None
+        self._generation_checked_at = 0.0
+        self.hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _generation_key(self) -> str:
+        return f"l1:generation:{self.namespace}"
+
+    def _sync_generation(self) -> None:
+        now = time.monotonic()
+        if now - self._generation_checked_at < self.generation_check_interval:
+            return
+        generation = CacheService.get(self._generation_key())
+        with self._lock:
+            self._generation_checked_at = now
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+
+    def _get_local(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _drop_local(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._sync_generation()
+
+        value = self._get_local(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        value = CacheService.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            self.misses += 1
+            return default
+
+        self.l2_hits += 1
+        self._set_local(key, value)
+        return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        stored = CacheService.set(key, value, timeout)
+        if stored:
+            self._set_local(key, value)
+        return stored
+
+    def get_or_set(self, key: str, compute: Callable[[], Any], timeout: Optional[int] = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = compute()
+        if value is not None:
+            self.set(key, value, timeout)
+        return value
+
+    def get_or_set_local(self, key: str, compute: Callable[[], Any]) -> Any:
+        self._sync_generation()
+
+        value = self._get_local(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = compute()
+        if value is not None:
+            self._set_local(key, value)
+        return value
+
+    def delete(self, key: str) -> bool:
+        self._drop_local(key)
+        deleted = CacheService.delete(key)
+        self.invalidate()
+        return deleted
+
+    def invalidate(self) -> bool:
+        with self._lock:
+            self._entries.clear()
+        return CacheService.set(
+            self._generation_key(),
+            int(time.time() * 1000),
+            self.GENERATION_TIMEOUT,
+        )
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.l2_hits + self.misses
+        return {
+            'namespace': self.namespace,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'l2_hits': self.l2_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0,
+            'l2_hit_ratio': round((self.hits + self.l2_hits) / lookups, 4) if lookups else 0,
+        }
+
+_registry: dict[str, LocalCache] = {}
+_registry_lock = threading.Lock()
+
+def get_local_cache(namespace: str, **options) -> LocalCache:
+    local_cache = _registry.get(namespace)
+    if local_cache is None:
+        with _registry_lock:
+            local_cache = _registry.get(namespace)
+            if local_cache is None:
+                local_cache = LocalCache(namespace, **options)
+                _registry[namespace] = local_cache
+    return local_cache
+
+def local_cache_stats() -> dict:
+    return {namespace: local_cache.stats() for namespace, local_cache in sorted(_registry.items())}
@@ -3,6 +3,7 @@ from django.conf import settings
 from typing import Optional, Any, Callable
 from .namespaces import CacheTTL, CacheNamespace
 from .keys import CacheKeyBuilder
+from .stale_while_revalidate import get_or_compute
 import time
 
 try:
@@ -216,6 +217,51 @@ class RedisManager:
         except Exception:
             return 0
 
+    def pfadd(self, key: str, *values: str, timeout: Optional[int] = None) -> Optional[int]:
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return None
+            pipe = client.pipeline()
+            pipe.pfadd(key, *values)
+            if timeout:
+                pipe.expire(key, timeout)
+            return int(pipe.execute()[0] or 0)
+        except Exception:
+            return None
+
+    def pfcount(self, *keys: str) -> Optional[int]:
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return None
+            return int(client.pfcount(*keys) or 0)
+        except Exception:
+            return None
+
+    def count_existing(self, *keys: str) -> Optional[int]:
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return None
+            return int(client.exists(*keys) or 0)
+        except Exception:
+            return None
+
+    def pfmerge(self, dest: str, *sources: str, timeout: Optional[int] = None) -> bool:
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return False
+            pipe = client.pipeline()
+            pipe.pfmerge(dest, *sources)
+            if timeout:
+                pipe.expire(dest, timeout)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
 class SessionRedisManager(RedisManager):
     
     def __init__(self):
@@ -378,6 +424,22 @@ class CacheService:
         key = CacheKeyBuilder.otp(mobile)
         return cls.delete(key)
     
+    @classmethod
+    def set_otp_delivery(cls, otp_id: str, mobile: str, otp: str, ttl: Optional[int] = None) -> bool:
+        key = CacheKeyBuilder.otp_delivery(otp_id)
+        timeout = ttl or CacheTTL.OTP
+        return cls.set(key, {'mobile': mobile, 'code': otp}, timeout)
+    
+    @classmethod
+    def get_otp_delivery(cls, otp_id: str) -> Optional[dict]:
+        key = CacheKeyBuilder.otp_delivery(otp_id)
+        return cls.get(key)
+    
+    @classmethod
+    def delete_otp_delivery(cls, otp_id: str) -> bool:
+        key = CacheKeyBuilder.otp_delivery(otp_id)
+        return cls.delete(key)
+    
     @classmethod
     def set_captcha(cls, captcha_id: str, answer: str, ttl: Optional[int] = None) -> bool:
         key = CacheKeyBuilder.captcha(captcha_id)
@@ -438,6 +500,22 @@ class CacheService:
     def zremrangebyscore(cls, key: str, min_score: float, max_score: float) -> int:
         return cls.get_default_manager().zremrangebyscore(key, min_score, max_score)
 
+    @classmethod
+    def pfadd(cls, key: str, *values: str, timeout: Optional[int] = None) -> Optional[int]:
+        return cls.get_default_manager().pfadd(key, *values, timeout=timeout)
+
+    @classmethod
+    def pfcount(cls, *keys: str) -> Optional[int]:
+        return cls.get_default_manager().pfcount(*keys)
+
+    @classmethod
+    def count_existing(cls, *keys: str) -> Optional[int]:
+        return cls.get_default_manager().count_existing(*keys)
+
+    @classmethod
+    def pfmerge(cls, dest: str, *sources: str, timeout: Optional[int] = None) -> bool:
+        return cls.get_default_manager().pfmerge(dest, *sources, timeout=timeout)
+
     @classmethod
     def clear_property_cache(cls, property_id: int) -> int:
         
@@ -474,16 +552,6 @@ def cache_result(key_builder: Callable, timeout: Optional[int] = None):
     def decorator(func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
             cache_key = key_builder(*args, **kwargs)
-            
-            cached_value = CacheService.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-            
-            result = func(*args, **kwargs)
-            
-            if result is not None:
-                CacheService.set(cache_key, result, timeout)
-            
-            return result
+            return get_or_compute(cache_key, lambda: func(*args, **kwargs), timeout)
         return wrapper
     return decorator
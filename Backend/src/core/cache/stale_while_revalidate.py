@@ -0,0 +1,126 @@
+import math
+import random
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .namespaces import CacheTTL
+
+ENVELOPE_MARKER = '__swr__'
+STALE_RATIO = 0.5
+MIN_STALE_TIMEOUT = 30
+LEASE_TIMEOUT = 30
+WAIT_TIMEOUT = 5.0
+WAIT_INTERVAL = 0.05
+EARLY_EXPIRATION_BETA = 1.0
+
+def lease_key(cache_key: str) -> str:
+    return f"{cache_key}:lease"
+
+def _unwrap(entry: Any) -> Optional[dict]:
+    if isinstance(entry, dict) and entry.get(ENVELOPE_MARKER):
+        return entry
+    return None
+
+def _read(cache_key: str) -> Optional[dict]:
+    try:
+        return _unwrap(cache.get(cache_key))
+    except Exception:
+        return None
+
+def _is_fresh(envelope: dict, beta: float) -> bool:
+    soft_expires_at = envelope.get('soft_expires_at') or 0
+    delta = envelope.get('delta') or 0
+    now = time.time()
+    if beta <= 0 or delta <= 0:
+        return now < soft_expires_at
+    return now - delta * beta * math.log(random.random() or 1e-12) < soft_expires_at
+
+def _acquire_lease(cache_key: str, timeout: int) -> Optional[str]:
+    token = uuid.uuid4().hex
+    try:
+        if cache.add(lease_key(cache_key), token, timeout):
+            return token
+    except Exception:
+        return token
+    return None
+
+def _release_lease(cache_key: str, token: str) -> None:
+    try:
+        if cache.get(lease_key(cache_key)) == token:
+            cache.delete(lease_key(cache_key))
+    except Exception:
+        pass
+
+def _compute_and_store(cache_key: str, compute: Callable[[], Any], timeout: int, stale_timeout: int) -> Any:
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+
+    try:
+        if value is None:
+            cache.delete(cache_key)
+        else:
+            cache.set(
+                cache_key,
+                {
+                    ENVELOPE_MARKER: 1,
+                    'value': value,
+                    'soft_expires_at': time.time() + timeout,
+                    'delta': delta,
+                },
+                timeout + stale_timeout,
+            )
+    except Exception:
+        pass
+    return value
+
+def get_or_compute(
+    cache_key: str,
+    compute: Callable[[], Any],
+    timeout: Optional[int] = None,
+    stale_timeout: Optional[int] = None,
+    lease_timeout: int = LEASE_TIMEOUT,
+    wait_timeout: float = WAIT_TIMEOUT,
+    beta: float = EARLY_EXPIRATION_BETA,
+) -> Any:
+    timeout = timeout or getattr(settings, 'CACHE_TTL', CacheTTL.DEFAULT)
+    if stale_timeout is None:
+        stale_timeout = max(MIN_STALE_TIMEOUT, int(timeout * STALE_RATIO))
+
+    envelope = _read(cache_key)
+    if envelope is not None:
+        if _is_fresh(envelope, beta):
+            return envelope['value']
+
+        token = _acquire_lease(cache_key, lease_timeout)
+        if token is None:
+            return envelope['value']
+        try:
+            return _compute_and_store(cache_key, compute, timeout, stale_timeout)
+        finally:
+            _release_lease(cache_key, token)
+
+    token = _acquire_lease(cache_key, lease_timeout)
+    if token is not None:
+        try:
+            return _compute_and_store(cache_key, compute, timeout, stale_timeout)
+        finally:
+            _release_lease(cache_key, token)
+
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        envelope = _read(cache_key)
+        if envelope is not None:
+            return envelope['value']
+        try:
+            if cache.get(lease_key(cache_key)) is None:
+                break
+        except Exception:
+            break
+
+    return _compute_and_store(cache_key, compute, timeout, stale_timeout)
@@ -1,11 +1,13 @@
-from django.core.cache import cache
+from src.core.cache import get_local_cache
 from .models import FeatureFlag
 
 CACHE_TTL = 300
 
+flags_cache = get_local_cache('feature_flags', max_entries=512, ttl=5.0)
+
 def is_feature_active(key: str) -> bool:
     cache_key = f'feature_flag:{key}'
-    value = cache.get(cache_key)
+    value = flags_cache.get(cache_key)
 
     if value is None:
         try:
@@ -13,29 +15,29 @@ def is_feature_active(key: str) -> bool:
             value = flag.is_active
         except FeatureFlag.DoesNotExist:
             value = True
-        cache.set(cache_key, value, CACHE_TTL)
+        flags_cache.set(cache_key, value, CACHE_TTL)
 
     return value
 
 def invalidate_feature_flag_cache(key: str = None):
     if key:
         cache_key = f'feature_flag:{key}'
-        cache.delete(cache_key)
-        cache.delete('feature_flags_api')
+        flags_cache.delete(cache_key)
+        flags_cache.delete('feature_flags_api')
     else:
         flags = FeatureFlag.objects.values_list('key', flat=True)
         for flag_key in flags:
-            cache.delete(f'feature_flag:{flag_key}')
-        cache.delete('feature_flags_api')
+            flags_cache.delete(f'feature_flag:{flag_key}')
+        flags_cache.delete('feature_flags_api')
 
 def get_all_feature_flags() -> dict:
-    flags = cache.get('feature_flags_api')
+    flags = flags_cache.get('feature_flags_api')
 
     if flags is None:
         flags = {
             f.key: f.is_active
             for f in FeatureFlag.objects.all()
         }
-        cache.set('feature_flags_api', flags, CACHE_TTL)
+        flags_cache.set('feature_flags_api', flags, CACHE_TTL)
 
     return flags
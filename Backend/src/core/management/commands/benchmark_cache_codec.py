@@ -0,0 +1,147 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_redis.compressors.zlib import ZlibCompressor
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.json import JSONSerializer
+
+from src.core.cache.codec import (
+    COMPRESS_MIN_LENGTH,
+    FastJSONSerializer,
+    ThresholdCompressor,
+    available_algorithms,
+)
+
+def _property_list_page(page_size: int = 24) -> dict:
+    now = timezone.now()
+    results = []
+    for index in range(page_size):
+        results.append({
+            'id': 1000 + index,
+            'slug': f'apartment-tehran-saadat-abad-{1000 + index}',
+            'title': f'آپارتمان ۱۲۰ متری نوساز در سعادت آباد - واحد {index}',
+            'short_description': 'آپارتمان نوساز با دسترسی عالی به مترو، پارکینگ اختصاصی و انباری' * 2,
+            'price': Decimal('18500000000') + index,
+            'mortgage_amount': None,
+            'rent_amount': None,
+            'built_area': 120 + index,
+            'bedrooms': 2 + index % 3,
+            'bathrooms': 1 + index % 2,
+            'parking_spaces': 1,
+            'year_built': 1400 + index % 4,
+            'latitude': Decimal('35.7806') + Decimal(index) / 1000,
+            'longitude': Decimal('51.3648') + Decimal(index) / 1000,
+            'is_featured': index % 5 == 0,
+            'views_count': 350 + index * 7,
+            'published_at': now - timedelta(days=index),
+            'main_image': {
+                'id': 5000 + index,
+                'url': f'/media/properties/2025/01/property-{1000 + index}.webp',
+                'alt': 'نمای ساختمان',
+            },
+            'city': {'id': 1, 'name': 'تهران', 'slug': 'tehran'},
+            'region': {'id': 12, 'name': 'منطقه ۲', 'code': 2},
+            'property_type': {'id': 3, 'title': 'آپارتمان', 'slug': 'apartment'},
+            'state': {'id': 1, 'title': 'فروش', 'slug': 'sale'},
+            'labels': [{'id': 1, 'title': 'فوری'}, {'id': 4, 'title': 'ویژه'}],
+            'features': [{'id': feature, 'title': f'امکانات {feature}'} for feature in range(6)],
+            'agent': {'id': 40, 'full_name': 'مشاور املاک', 'phone': '09120000000'},
+        })
+    return {
+        'results': results,
+        'pagination': {'count': 1842, 'page': 1, 'page_size': page_size, 'total_pages': 77},
+    }
+
+def _dashboard_stats() -> dict:
+    return {
+        'properties': {'total': 1842, 'published': 1630, 'draft': 212, 'featured': 48},
+        'inquiries': {'today': 37, 'week': 241, 'month': 988},
+        'visits': {
+            'daily': [{'date': f'2025-01-{day:02d}', 'web': 900 + day, 'app': 300 + day} for day in range(1, 31)],
+        },
+        'top_regions': [{'region_id': region, 'count': 100 - region} for region in range(1, 11)],
+        'generated_at': timezone.now(),
+    }
+
+def _permission_map() -> dict:
+    modules = ['blog', 'portfolio', 'real_estate', 'ticket', 'email', 'media', 'settings', 'analytics', 'ai', 'chatbot']
+    actions = ['read', 'create', 'update', 'delete', 'publish', 'export']
+    return {
+        'is_superadmin': False,
+        'roles': ['content_manager', 'real_estate_manager'],
+        'permissions': {f'{module}.{action}': action != 'delete' for module in modules for action in actions},
+    }
+
+PAYLOADS = {
+    'session_flag': lambda: True,
+    'permission_map': _permission_map,
+    'dashboard_stats': _dashboard_stats,
+    'property_list_page': _property_list_page,
+}
+
+def _codecs(min_length: int) -> dict:
+    codecs = {
+        'json+zlib (current)': (JSONSerializer({}), ZlibCompressor({})),
+    }
+    for algorithm in available_algorithms():
+        options = {'COMPRESS_MIN_LENGTH': min_length, 'COMPRESS_ALGORITHM': algorithm}
+        codecs[f'fast+{algorithm}'] = (FastJSONSerializer(options), ThresholdCompressor(options))
+    return codecs
+
+def _encode(serializer, compressor, value) -> bytes:
+    return compressor.compress(serializer.dumps(value))
+
+def _decode(serializer, compressor, value: bytes):
+    try:
+        value = compressor.decompress(value)
+    except CompressorError:
+        pass
+    return serializer.loads(value)
+
+class Command(BaseCommand):
+    help = "Benchmark cache serializer/compressor combinations over representative payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help="Encode/decode rounds per payload and codec (default: 2000).",
+        )
+        parser.add_argument(
+            '--min-length',
+            type=int,
+            default=COMPRESS_MIN_LENGTH,
+            help=f"Compression threshold in bytes for the fast codecs (default: {COMPRESS_MIN_LENGTH}).",
+        )
+
+    def handle(self, *args, **options):
+        iterations = max(1, options['iterations'])
+        codecs = _codecs(options['min_length'])
+
+        self.stdout.write(
+            f"{'payload':<20} {'codec':<22} {'bytes':>9} {'encode us':>11} {'decode us':>11}"
+        )
+        for payload_name, factory in PAYLOADS.items():
+            value = factory()
+            for codec_name, (serializer, compressor) in codecs.items():
+                encoded = _encode(serializer, compressor, value)
+
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    _encode(serializer, compressor, value)
+                encode_us = (time.perf_counter() - started) / iterations * 1_000_000
+
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    _decode(serializer, compressor, encoded)
+                decode_us = (time.perf_counter() - started) / iterations * 1_000_000
+
+                self.stdout.write(
+                    f"{payload_name:<20} {codec_name:<22} {len(encoded):>9} {encode_us:>11.1f} {decode_us:>11.1f}"
+                )
+
+        self.stdout.write(self.style.SUCCESS(f"Done ({iterations} iterations per row)."))
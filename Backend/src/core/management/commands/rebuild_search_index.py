@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from src.core.search import FullTextSearchService
+
+SEARCH_MODELS = {
+    'blog': 'blog.Blog',
+    'portfolio': 'portfolio.Portfolio',
+}
+
+class Command(BaseCommand):
+    help = "Rebuild the normalized full-text search vectors for blog and portfolio."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=sorted(SEARCH_MODELS.keys()),
+            help="Only rebuild one model (default: all).",
+        )
+
+    def handle(self, *args, **options):
+        targets = [options['model']] if options.get('model') else sorted(SEARCH_MODELS.keys())
+
+        for name in targets:
+            model = apps.get_model(SEARCH_MODELS[name])
+            updated = FullTextSearchService.reindex(model)
+            self.stdout.write(self.style.SUCCESS(f"{name}: {updated} rows reindexed."))
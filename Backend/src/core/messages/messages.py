@@ -1,11 +1,18 @@
 CORE_SUCCESS = {
     "request_successful": "درخواست با موفقیت انجام شد.",
     "upload_settings_retrieved": "تنظیمات آپلود با موفقیت دریافت شد.",
+    "profiling_retrieved": "گزارش پروفایلینگ با موفقیت دریافت شد.",
+    "profiling_reset": "داده‌های پروفایلینگ پاک شد.",
+    "sync_resources_retrieved": "فهرست منابع همگام‌سازی با موفقیت دریافت شد.",
+    "sync_changes_retrieved": "تغییرات با موفقیت دریافت شد.",
 }
 
 CORE_ERRORS = {
     "error_occurred": "خطایی رخ داد.",
     "request_failed": "درخواست ناموفق بود.",
     "xlsxwriter_not_installed": "پکیج XlsxWriter نصب نیست.",
+    "sync_resource_not_found": "منبع همگام‌سازی یافت نشد.",
+    "sync_cursor_invalid": "نشانگر همگام‌سازی نامعتبر است.",
+    "sync_cursor_expired": "نشانگر همگام‌سازی منقضی شده است. همگام‌سازی کامل را از ابتدا انجام دهید.",
 }
 
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-03-09 10:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_city_slug_province_slug_city_cities_slug_905566_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(max_length=64, verbose_name='Resource')),
+                ('object_id', models.IntegerField(verbose_name='Object ID')),
+                ('public_id', models.UUIDField(blank=True, null=True, verbose_name='Public ID')),
+                ('deleted_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Deleted At')),
+            ],
+            options={
+                'verbose_name': 'Sync Tombstone',
+                'verbose_name_plural': 'Sync Tombstones',
+                'db_table': 'core_sync_tombstones',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['resource', 'id'], name='idx_sync_tombstone_resource')],
+            },
+        ),
+    ]
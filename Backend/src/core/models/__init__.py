@@ -1,9 +1,11 @@
 from .base import BaseModel
 from .location import Country, Province, City
+from .sync import SyncTombstone
 
 __all__ = [
     'BaseModel',
     'Country',
     'Province',
     'City',
+    'SyncTombstone',
 ]
\ No newline at end of file
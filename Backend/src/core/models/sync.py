@@ -0,0 +1,21 @@
+from django.db import models
+from django.utils import timezone
+
+class SyncTombstone(models.Model):
+
+    resource = models.CharField(max_length=64, verbose_name="Resource")
+    object_id = models.IntegerField(verbose_name="Object ID")
+    public_id = models.UUIDField(null=True, blank=True, verbose_name="Public ID")
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True, verbose_name="Deleted At")
+
+    class Meta:
+        db_table = 'core_sync_tombstones'
+        verbose_name = "Sync Tombstone"
+        verbose_name_plural = "Sync Tombstones"
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['resource', 'id'], name='idx_sync_tombstone_resource'),
+        ]
+
+    def __str__(self):
+        return f"{self.resource}:{self.object_id}"
@@ -0,0 +1,31 @@
+from .collector import (
+    RequestMetrics,
+    current_metrics,
+)
+
+from .buffer import (
+    ProfileBuffer,
+    ProfileStore,
+    get_profiling_config,
+    profile_buffer,
+)
+
+from .query_budget import (
+    QueryBudgetExceeded,
+    QueryInspector,
+    query_budget,
+    query_shape,
+)
+
+__all__ = [
+    'RequestMetrics',
+    'current_metrics',
+    'ProfileBuffer',
+    'ProfileStore',
+    'get_profiling_config',
+    'profile_buffer',
+    'QueryBudgetExceeded',
+    'QueryInspector',
+    'query_budget',
+    'query_shape',
+]
@@ -0,0 +1,237 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from django.conf import settings
+
+from src.core.cache import CacheService
+
+DEFAULT_BUFFER_SIZE = 2000
+DEFAULT_FLUSH_INTERVAL = 10.0
+DEFAULT_RETENTION = 24 * 60 * 60
+RECENT_SAMPLES_LIMIT = 200
+
+COUNTER_FIELDS = (
+    'count',
+    'slow_count',
+    'duration_ms',
+    'sql_count',
+    'sql_ms',
+    'cache_hits',
+    'cache_misses',
+    'redis_calls',
+)
+
+def get_profiling_config() -> dict:
+    config = getattr(settings, 'PROFILING', {}) or {}
+    return {
+        'ENABLED': bool(config.get('ENABLED', False)),
+        'SAMPLE_RATE': float(config.get('SAMPLE_RATE', 0.01)),
+        'SLOW_REQUEST_MS': float(config.get('SLOW_REQUEST_MS', 500)),
+        'BUFFER_SIZE': int(config.get('BUFFER_SIZE', DEFAULT_BUFFER_SIZE)),
+        'FLUSH_INTERVAL': float(config.get('FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)),
+        'RETENTION': int(config.get('RETENTION', DEFAULT_RETENTION)),
+        'EXCLUDED_PATHS': tuple(config.get('EXCLUDED_PATHS', ('/static/', '/media/', '/silk/'))),
+    }
+
+class ProfileStore:
+
+    VIEWS_KEY = "profiling:views"
+    VIEW_KEY_PREFIX = "profiling:view"
+    MAX_MS_KEY = "profiling:max_ms"
+    SAMPLES_KEY = "profiling:samples"
+
+    @classmethod
+    def _view_key(cls, label: str) -> str:
+        return f"{cls.VIEW_KEY_PREFIX}:{label}"
+
+    @staticmethod
+    def _client():
+        return CacheService.get_default_manager().get_redis_client()
+
+    @classmethod
+    def write(cls, samples: list[dict], retention: int = DEFAULT_RETENTION) -> bool:
+        totals: dict[str, dict] = {}
+        max_ms: dict[str, float] = {}
+        for sample in samples:
+            label = f"{sample['method']} {sample['view']}"
+            view_totals = totals.setdefault(label, dict.fromkeys(COUNTER_FIELDS, 0))
+            view_totals['count'] += 1
+            view_totals['slow_count'] += 1 if sample['slow'] else 0
+            for field in COUNTER_FIELDS[2:]:
+                view_totals[field] += sample[field]
+            max_ms[label] = max(max_ms.get(label, 0), sample['duration_ms'])
+
+        try:
+            client = cls._client()
+            if not client:
+                return False
+
+            pipe = client.pipeline(transaction=False)
+            for label, view_totals in totals.items():
+                view_key = cls._view_key(label)
+                for field, value in view_totals.items():
+                    if isinstance(value, float):
+                        pipe.hincrbyfloat(view_key, field, round(value, 3))
+                    else:
+                        pipe.hincrby(view_key, field, value)
+                pipe.expire(view_key, retention)
+                pipe.sadd(cls.VIEWS_KEY, label)
+            pipe.zadd(cls.MAX_MS_KEY, max_ms, gt=True)
+            pipe.lpush(cls.SAMPLES_KEY, *[json.dumps(sample) for sample in samples[-RECENT_SAMPLES_LIMIT:]])
+            pipe.ltrim(cls.SAMPLES_KEY, 0, RECENT_SAMPLES_LIMIT - 1)
+            for key in (cls.VIEWS_KEY, cls.MAX_MS_KEY, cls.SAMPLES_KEY):
+                pipe.expire(key, retention)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def views(cls) -> list[dict]:
+        try:
+            client = cls._client()
+            if not client:
+                return []
+            labels = sorted(label.decode() for label in client.smembers(cls.VIEWS_KEY))
+            pipe = client.pipeline(transaction=False)
+            for label in labels:
+                pipe.hgetall(cls._view_key(label))
+            rows = pipe.execute()
+            max_ms = {label.decode(): score for label, score in client.zrange(cls.MAX_MS_KEY, 0, -1, withscores=True)}
+        except Exception:
+            return []
+
+        views = []
+        for label, row in zip(labels, rows):
+            if not row:
+                continue
+            method, _, view = label.partition(' ')
+            stats = {field: float(row.get(field.encode(), 0)) for field in COUNTER_FIELDS}
+            count = stats['count'] or 1
+            views.append({
+                'method': method,
+                'view': view,
+                'count': int(stats['count']),
+                'slow_count': int(stats['slow_count']),
+                'avg_ms': round(stats['duration_ms'] / count, 2),
+                'max_ms': round(max_ms.get(label, 0), 2),
+                'total_ms': round(stats['duration_ms'], 2),
+                'avg_sql_count': round(stats['sql_count'] / count, 2),
+                'avg_sql_ms': round(stats['sql_ms'] / count, 2),
+                'cache_hits': int(stats['cache_hits']),
+                'cache_misses': int(stats['cache_misses']),
+                'avg_redis_calls': round(stats['redis_calls'] / count, 2),
+            })
+        views.sort(key=lambda item: item['total_ms'], reverse=True)
+        return views
+
+    @classmethod
+    def recent_samples(cls, limit: int = 50) -> list[dict]:
+        try:
+            client = cls._client()
+            if not client:
+                return []
+            return [json.loads(sample) for sample in client.lrange(cls.SAMPLES_KEY, 0, limit - 1)]
+        except Exception:
+            return []
+
+    @classmethod
+    def prometheus_text(cls) -> str:
+        metrics = (
+            ('requests_sampled_total', 'counter', 'Sampled requests per view.', lambda view: view['count']),
+            ('requests_slow_total', 'counter', 'Sampled requests above the slow threshold.', lambda view: view['slow_count']),
+            ('request_duration_ms_sum', 'counter', 'Total duration of sampled requests in ms.', lambda view: view['total_ms']),
+            ('request_duration_ms_max', 'gauge', 'Slowest sampled request in ms.', lambda view: view['max_ms']),
+            ('request_sql_queries_avg', 'gauge', 'Average SQL queries per sampled request.', lambda view: view['avg_sql_count']),
+            ('request_sql_ms_avg', 'gauge', 'Average SQL time per sampled request in ms.', lambda view: view['avg_sql_ms']),
+            ('cache_hits_total', 'counter', 'Cache hits during sampled requests.', lambda view: view['cache_hits']),
+            ('cache_misses_total', 'counter', 'Cache misses during sampled requests.', lambda view: view['cache_misses']),
+            ('request_redis_calls_avg', 'gauge', 'Average Redis round trips per sampled request.', lambda view: view['avg_redis_calls']),
+        )
+        views = cls.views()
+        lines = []
+        for name, metric_type, help_text, value in metrics:
+            metric = f"webtalik_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for view in views:
+                label = view['view'].replace('\\', '\\\\').replace('"', '\\"')
+                lines.append(f'{metric}{{method="{view["method"]}",view="{label}"}} {value(view)}')
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def reset(cls) -> bool:
+        try:
+            client = cls._client()
+            if not client:
+                return False
+            labels = [label.decode() for label in client.smembers(cls.VIEWS_KEY)]
+            client.delete(cls.VIEWS_KEY, cls.MAX_MS_KEY, cls.SAMPLES_KEY, *[cls._view_key(label) for label in labels])
+            return True
+        except Exception:
+            return False
+
+class ProfileBuffer:
+
+    def __init__(self, max_entries: int = DEFAULT_BUFFER_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._entries: deque = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.recorded = 0
+        self.dropped = 0
+
+    def record(self, sample: dict) -> None:
+        with self._lock:
+            if len(self._entries) == self._entries.maxlen:
+                self.dropped += 1
+            self._entries.append(sample)
+            self.recorded += 1
+        self._ensure_flusher()
+
+    def drain(self) -> list[dict]:
+        with self._lock:
+            entries = list(self._entries)
+            self._entries.clear()
+        return entries
+
+    def flush(self) -> int:
+        entries = self.drain()
+        if entries:
+            ProfileStore.write(entries, get_profiling_config()['RETENTION'])
+        return len(entries)
+
+    def _ensure_flusher(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='profiling-flusher', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def stats(self) -> dict:
+        return {
+            'pending': len(self._entries),
+            'max_entries': self._entries.maxlen,
+            'recorded': self.recorded,
+            'dropped': self.dropped,
+        }
+
+_config = get_profiling_config()
+profile_buffer = ProfileBuffer(_config['BUFFER_SIZE'], _config['FLUSH_INTERVAL'])
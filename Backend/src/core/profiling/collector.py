@@ -0,0 +1,61 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+class RequestMetrics:
+
+    __slots__ = (
+        'started_at',
+        'sql_count',
+        'sql_ms',
+        'cache_hits',
+        'cache_misses',
+        'redis_calls',
+    )
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.redis_calls = 0
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar('profiling_request_metrics', default=None)
+
+def start_request() -> RequestMetrics:
+    metrics = RequestMetrics()
+    _current.set(metrics)
+    return metrics
+
+def end_request() -> None:
+    _current.set(None)
+
+def current_metrics() -> Optional[RequestMetrics]:
+    return _current.get()
+
+def record_cache_lookup(hits: int, misses: int) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+def record_redis_call() -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.redis_calls += 1
+
+def sql_execute_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql_count += 1
+        metrics.sql_ms += (time.perf_counter() - started) * 1000
@@ -0,0 +1,33 @@
+from django_redis.client import DefaultClient
+from redis.connection import Connection, ConnectionPool
+
+from .collector import record_cache_lookup, record_redis_call
+
+_MISSING = object()
+
+class CountingConnection(Connection):
+
+    def send_packed_command(self, command, check_health=True):
+        record_redis_call()
+        return super().send_packed_command(command, check_health=check_health)
+
+class CountingConnectionPool(ConnectionPool):
+
+    def __init__(self, connection_class=CountingConnection, **kwargs):
+        super().__init__(connection_class=connection_class, **kwargs)
+
+class ProfiledRedisClient(DefaultClient):
+
+    def get(self, key, default=None, version=None, client=None):
+        value = super().get(key, default=_MISSING, version=version, client=client)
+        if value is _MISSING:
+            record_cache_lookup(0, 1)
+            return default
+        record_cache_lookup(1, 0)
+        return value
+
+    def get_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        values = super().get_many(keys, version=version, client=client)
+        record_cache_lookup(len(values), len(keys) - len(values))
+        return values
@@ -0,0 +1,50 @@
+import random
+import time
+
+from django.db import connection
+
+from .buffer import get_profiling_config, profile_buffer
+from .collector import end_request, start_request, sql_execute_wrapper
+
+class ProfilingMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_profiling_config()
+
+    def __call__(self, request):
+        if not self.config['ENABLED'] or request.path.startswith(self.config['EXCLUDED_PATHS']):
+            return self.get_response(request)
+
+        metrics = start_request()
+        try:
+            with connection.execute_wrapper(sql_execute_wrapper):
+                response = self.get_response(request)
+        finally:
+            end_request()
+
+        duration_ms = metrics.elapsed_ms()
+        slow = duration_ms >= self.config['SLOW_REQUEST_MS']
+        if slow or random.random() < self.config['SAMPLE_RATE']:
+            profile_buffer.record({
+                'view': self._view_label(request),
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'slow': slow,
+                'duration_ms': round(duration_ms, 3),
+                'sql_count': metrics.sql_count,
+                'sql_ms': round(metrics.sql_ms, 3),
+                'cache_hits': metrics.cache_hits,
+                'cache_misses': metrics.cache_misses,
+                'redis_calls': metrics.redis_calls,
+                'timestamp': time.time(),
+            })
+        return response
+
+    @staticmethod
+    def _view_label(request) -> str:
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return 'unresolved'
+        return resolver_match.route or resolver_match.view_name or 'unresolved'
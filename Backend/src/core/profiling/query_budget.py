@@ -0,0 +1,151 @@
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 3
+
+_PROJECT_MARKER = f"{os.sep}src{os.sep}"
+_SKIPPED_PATHS = (
+    f"{os.sep}src{os.sep}core{os.sep}profiling{os.sep}",
+    f"{os.sep}site-packages{os.sep}",
+    f"{os.sep}dist-packages{os.sep}",
+)
+
+_IN_LIST = re.compile(r"IN \((?:%s|\?)(?:, (?:%s|\?))*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+def get_query_budget_config() -> dict:
+    config = getattr(settings, 'QUERY_BUDGET', {}) or {}
+    return {
+        'ENABLED': bool(config.get('ENABLED', False)),
+        'MODE': config.get('MODE', 'warn'),
+        'N_PLUS_ONE_THRESHOLD': int(config.get('N_PLUS_ONE_THRESHOLD', DEFAULT_N_PLUS_ONE_THRESHOLD)),
+    }
+
+def query_shape(sql: str) -> str:
+    shape = _IN_LIST.sub("IN (...)", sql)
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+def query_origin() -> str:
+    frame = sys._getframe(1)
+    first_project_frame = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if _PROJECT_MARKER in filename and not any(path in filename for path in _SKIPPED_PATHS):
+            location = f"{filename[filename.rindex(_PROJECT_MARKER) + 1:]}:{frame.f_code.co_name}"
+            if f"{os.sep}serializers{os.sep}" in filename:
+                return location
+            if first_project_frame is None:
+                first_project_frame = location
+        frame = frame.f_back
+    return first_project_frame or 'unknown'
+
+class QueryInspector:
+
+    def __init__(self, n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD, using=None):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.connection = connection if using is None else using
+        self.queries: list[dict] = []
+        self._wrapper_context = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'sql': sql,
+                'shape': query_shape(sql),
+                'origin': query_origin(),
+                'duration_ms': round((time.perf_counter() - started) * 1000, 3),
+            })
+
+    def __enter__(self):
+        self._wrapper_context = self.connection.execute_wrapper(self)
+        self._wrapper_context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrapper_context.__exit__(exc_type, exc_value, traceback)
+        self._wrapper_context = None
+        return False
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def n_plus_one(self) -> list[dict]:
+        shapes = Counter((query['shape'], query['origin']) for query in self.queries)
+        return [
+            {'shape': shape, 'origin': origin, 'count': count}
+            for (shape, origin), count in shapes.most_common()
+            if count >= self.n_plus_one_threshold
+        ]
+
+    def report(self, budget: Optional[int] = None, label: str = '') -> list[str]:
+        problems = []
+        if budget is not None and self.count > budget:
+            problems.append(f"{label or 'block'} ran {self.count} queries (budget {budget})")
+        for suspect in self.n_plus_one():
+            problems.append(
+                f"{label or 'block'} repeated a query {suspect['count']}x from {suspect['origin']}: {suspect['shape'][:200]}"
+            )
+        return problems
+
+def resolve_view_budget(view, method: str) -> Optional[int]:
+    budget = getattr(view, 'query_budget', None)
+    if budget is None:
+        view_class = getattr(view, 'cls', None) or getattr(view, 'view_class', None)
+        budget = getattr(view_class, 'query_budget', None)
+    if isinstance(budget, dict):
+        actions = getattr(view, 'actions', None) or {}
+        action = actions.get(method.lower(), method.lower())
+        return budget.get(action)
+    return budget
+
+def query_budget(budget):
+    def decorator(view):
+        view.query_budget = budget
+        return view
+    return decorator
+
+class QueryBudgetMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_query_budget_config()
+
+    def __call__(self, request):
+        if not self.config['ENABLED']:
+            return self.get_response(request)
+
+        with QueryInspector(self.config['N_PLUS_ONE_THRESHOLD']) as inspector:
+            response = self.get_response(request)
+
+        label = f"{request.method} {request.path}"
+        resolver_match = getattr(request, 'resolver_match', None)
+        budget = resolve_view_budget(resolver_match.func, request.method) if resolver_match else None
+        problems = inspector.report(budget, label)
+        response['X-Query-Count'] = str(inspector.count)
+        if problems:
+            if self.config['MODE'] == 'raise':
+                raise QueryBudgetExceeded('\n'.join(problems))
+            for problem in problems:
+                logger.warning(problem)
+        return response
@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from typing import Optional
+from urllib.parse import urlsplit
+
+from django.urls import resolve
+
+from .query_budget import DEFAULT_N_PLUS_ONE_THRESHOLD, QueryInspector, resolve_view_budget
+
+class QueryBudgetTestMixin:
+    n_plus_one_threshold = DEFAULT_N_PLUS_ONE_THRESHOLD
+
+    @contextmanager
+    def assertQueryBudget(self, budget: Optional[int], label: str = ''):
+        with QueryInspector(self.n_plus_one_threshold) as inspector:
+            yield inspector
+        problems = inspector.report(budget, label)
+        if problems:
+            self.fail('\n'.join(problems))
+
+    def assertEndpointQueryBudget(self, url: str, method: str = 'get', budget: Optional[int] = None, **kwargs):
+        if budget is None:
+            budget = resolve_view_budget(resolve(urlsplit(url).path).func, method)
+        self.assertIsNotNone(budget, f"{method.upper()} {url} does not declare a query_budget")
+
+        with self.assertQueryBudget(budget, f"{method.upper()} {url}"):
+            response = getattr(self.client, method.lower())(url, **kwargs)
+        return response
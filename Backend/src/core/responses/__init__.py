@@ -1,3 +1,4 @@
 from .response import APIResponse
+from .cached_response import ResponseCache
 
-__all__ = ["APIResponse"]
\ No newline at end of file
+__all__ = ["APIResponse", "ResponseCache"]
\ No newline at end of file
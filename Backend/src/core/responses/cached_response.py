@@ -0,0 +1,142 @@
+import gzip
+import hashlib
+import time
+from typing import Callable, Optional
+
+from django.http import HttpResponse, HttpResponseNotModified
+from rest_framework.response import Response
+
+from src.core.cache import CacheService, bump_generation
+from .response import APIResponse
+
+class ResponseCache:
+
+    GENERATION_TIMEOUT = 7 * 24 * 60 * 60
+    MIN_COMPRESS_SIZE = 1024
+    CONTENT_TYPE = 'application/json'
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"response:{namespace}:generation"
+
+    @classmethod
+    def _generation(cls, namespace: str) -> int:
+        generation = CacheService.get(cls._generation_key(namespace))
+        if generation is None:
+            generation = int(time.time() * 1000)
+            CacheService.set(cls._generation_key(namespace), generation, cls.GENERATION_TIMEOUT)
+        return generation
+
+    @classmethod
+    def invalidate(cls, namespace: str) -> bool:
+        return CacheService.set(
+            cls._generation_key(namespace),
+            int(time.time() * 1000),
+            cls.GENERATION_TIMEOUT,
+        )
+
+    @classmethod
+    def invalidate_on_commit(cls, namespace: str) -> int:
+        return bump_generation(cls._generation_key(namespace), cls.GENERATION_TIMEOUT)
+
+    @classmethod
+    def build_key(cls, namespace: str, request) -> str:
+        query = '&'.join(sorted(request.GET.urlencode().split('&'))) if request.GET else ''
+        digest = hashlib.md5(f"{request.path}?{query}".encode()).hexdigest()
+        return f"response:{namespace}:g{cls._generation(namespace)}:{digest}"
+
+    @staticmethod
+    def _client():
+        return CacheService.get_default_manager().get_redis_client()
+
+    @classmethod
+    def _render(cls, request, response: Response) -> bytes:
+        renderer = APIResponse()
+        return renderer.render(
+            response.data,
+            accepted_media_type=cls.CONTENT_TYPE,
+            renderer_context={'request': request, 'response': response},
+        )
+
+    @classmethod
+    def _load(cls, cache_key: str) -> Optional[dict]:
+        try:
+            client = cls._client()
+            if not client:
+                return None
+            entry = client.hgetall(cache_key)
+        except Exception:
+            return None
+        if not entry or b'body' not in entry or b'etag' not in entry:
+            return None
+        return {
+            'body': entry[b'body'],
+            'gzip': entry.get(b'gzip') or None,
+            'etag': entry[b'etag'].decode(),
+        }
+
+    @classmethod
+    def _store(cls, cache_key: str, entry: dict, timeout: int) -> None:
+        mapping = {'body': entry['body'], 'etag': entry['etag']}
+        if entry['gzip']:
+            mapping['gzip'] = entry['gzip']
+        try:
+            client = cls._client()
+            if not client:
+                return
+            pipe = client.pipeline()
+            pipe.hset(cache_key, mapping=mapping)
+            pipe.expire(cache_key, timeout)
+            pipe.execute()
+        except Exception:
+            pass
+
+    @classmethod
+    def _respond(cls, request, entry: dict, cache_status: str) -> HttpResponse:
+        etag = entry['etag']
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        if if_none_match:
+            tags = {tag.strip() for tag in if_none_match.split(',')}
+            if '*' in tags or etag in tags or f"W/{etag}" in tags:
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                response['X-Cache'] = cache_status
+                return response
+
+        accepts_gzip = 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if entry['gzip'] and accepts_gzip:
+            response = HttpResponse(entry['gzip'], content_type=cls.CONTENT_TYPE)
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(entry['body'], content_type=cls.CONTENT_TYPE)
+        response['Content-Length'] = str(len(response.content))
+        response['ETag'] = etag
+        response['Vary'] = 'Accept-Encoding'
+        response['X-Cache'] = cache_status
+        return response
+
+    @classmethod
+    def serve(
+        cls,
+        request,
+        namespace: str,
+        build_response: Callable[[], Response],
+        timeout: int,
+    ) -> HttpResponse:
+        cache_key = cls.build_key(namespace, request)
+        entry = cls._load(cache_key)
+        if entry is not None:
+            return cls._respond(request, entry, 'HIT')
+
+        response = build_response()
+        if not isinstance(response, Response) or response.status_code != 200:
+            return response
+
+        body = cls._render(request, response)
+        entry = {
+            'body': body,
+            'gzip': gzip.compress(body, compresslevel=6) if len(body) >= cls.MIN_COMPRESS_SIZE else None,
+            'etag': f'"{hashlib.sha1(body).hexdigest()}"',
+        }
+        cls._store(cache_key, entry, timeout)
+        return cls._respond(request, entry, 'MISS')
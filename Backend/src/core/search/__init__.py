@@ -0,0 +1,11 @@
+from .normalization import (
+    normalize_persian_text,
+    tokenize_search_terms,
+)
+from .services import FullTextSearchService
+
+__all__ = [
+    'normalize_persian_text',
+    'tokenize_search_terms',
+    'FullTextSearchService',
+]
@@ -0,0 +1,37 @@
+import re
+
+ARABIC_TO_PERSIAN = str.maketrans({
+    'ي': 'ی',
+    'ى': 'ی',
+    'ئ': 'ی',
+    'ك': 'ک',
+    'ة': 'ه',
+    'ۀ': 'ه',
+    'أ': 'ا',
+    'إ': 'ا',
+    'ٱ': 'ا',
+    'ؤ': 'و',
+    '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4',
+    '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9',
+    '٠': '0', '١': '1', '٢': '2', '٣': '3', '٤': '4',
+    '٥': '5', '٦': '6', '٧': '7', '٨': '8', '٩': '9',
+    '\u200c': ' ',
+    '\u200d': '',
+    '\u200e': '',
+    '\u200f': '',
+    '\u0640': '',
+})
+
+DIACRITICS_RE = re.compile('[\u064b-\u065f\u0670]')
+NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+def normalize_persian_text(text) -> str:
+    if not text:
+        return ''
+    text = str(text).translate(ARABIC_TO_PERSIAN)
+    text = DIACRITICS_RE.sub('', text)
+    return ' '.join(NON_WORD_RE.sub(' ', text).lower().split())
+
+def tokenize_search_terms(text, max_terms: int = 8) -> list[str]:
+    normalized = normalize_persian_text(text)
+    return [term for term in normalized.split(' ') if term][:max_terms]
@@ -0,0 +1,131 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import transaction
+from django.db.models import F, Q, Value
+
+from src.core.utils.commit_batch import add_to_commit_batch
+
+from .normalization import normalize_persian_text, tokenize_search_terms
+
+class FullTextSearchService:
+
+    CONFIG = 'simple'
+    TRIGRAM_MIN_LENGTH = 3
+    REINDEX_BATCH_SIZE = 500
+
+    @staticmethod
+    def build_query(search) -> Optional[SearchQuery]:
+        terms = tokenize_search_terms(search)
+        if not terms:
+            return None
+        raw_query = ' & '.join(f"{term}:*" for term in terms)
+        return SearchQuery(raw_query, search_type='raw', config=FullTextSearchService.CONFIG)
+
+    @staticmethod
+    def search(queryset, search, trigram_field: Optional[str] = 'search_title'):
+        query = FullTextSearchService.build_query(search)
+        if query is None:
+            return queryset
+
+        condition = Q(search_vector=query)
+        normalized = normalize_persian_text(search)
+        if trigram_field and len(normalized) >= FullTextSearchService.TRIGRAM_MIN_LENGTH:
+            condition |= Q(**{f"{trigram_field}__trigram_word_similar": normalized})
+
+        return queryset.annotate(
+            search_rank=SearchRank(F('search_vector'), query)
+        ).filter(condition)
+
+    @staticmethod
+    def build_vector(weighted_texts: Iterable[tuple[str, str]]):
+        vector = None
+        for text, weight in weighted_texts:
+            part = SearchVector(
+                Value(normalize_persian_text(text)),
+                weight=weight,
+                config=FullTextSearchService.CONFIG,
+            )
+            vector = part if vector is None else vector + part
+        return vector
+
+    @staticmethod
+    def reindex(model, ids: Optional[Iterable[int]] = None) -> int:
+        field_weights = getattr(model, 'SEARCH_FIELDS', {})
+        related_weights = getattr(model, 'SEARCH_RELATED_FIELDS', {})
+        if not field_weights:
+            return 0
+
+        queryset = model.objects.all()
+        if ids is not None:
+            ids = list(set(ids))
+            if not ids:
+                return 0
+            queryset = queryset.filter(pk__in=ids)
+
+        updated = 0
+        pk_iterator = queryset.order_by('pk').values_list('pk', flat=True).iterator()
+        batch = []
+        for pk in pk_iterator:
+            batch.append(pk)
+            if len(batch) >= FullTextSearchService.REINDEX_BATCH_SIZE:
+                updated += FullTextSearchService._reindex_batch(model, batch, field_weights, related_weights)
+                batch = []
+        if batch:
+            updated += FullTextSearchService._reindex_batch(model, batch, field_weights, related_weights)
+        return updated
+
+    @staticmethod
+    def _reindex_batch(model, ids, field_weights, related_weights) -> int:
+        title_field = getattr(model, 'SEARCH_TITLE_FIELD', None)
+        value_fields = set(field_weights) | ({title_field} if title_field else set())
+        rows = {
+            row['pk']: row
+            for row in model.objects.filter(pk__in=ids).values('pk', *value_fields)
+        }
+
+        related_texts = defaultdict(lambda: defaultdict(list))
+        for lookup in related_weights:
+            pairs = model.objects.filter(
+                pk__in=ids,
+                **{f"{lookup}__isnull": False}
+            ).values_list('pk', lookup)
+            for pk, value in pairs:
+                related_texts[pk][lookup].append(value)
+
+        with transaction.atomic():
+            for pk, row in rows.items():
+                weighted_texts = [(row.get(field) or '', weight) for field, weight in field_weights.items()]
+                weighted_texts.extend(
+                    (' '.join(related_texts[pk][lookup]), weight)
+                    for lookup, weight in related_weights.items()
+                )
+                updates = {'search_vector': FullTextSearchService.build_vector(weighted_texts)}
+                if title_field:
+                    updates['search_title'] = normalize_persian_text(row.get(title_field))
+                model.objects.filter(pk=pk).update(**updates)
+        return len(rows)
+
+    @staticmethod
+    def _flush_reindex(pending) -> None:
+        for model, ids in pending.items():
+            FullTextSearchService.reindex(model, ids)
+
+    @staticmethod
+    def schedule_reindex(model, ids: Iterable[int]) -> None:
+        ids = {pk for pk in ids if pk}
+        if not ids:
+            return
+        add_to_commit_batch(
+            'search_reindex',
+            lambda: defaultdict(set),
+            FullTextSearchService._flush_reindex,
+            lambda pending: pending[model].update(ids),
+        )
+
+    @staticmethod
+    def touches_search_fields(model, update_fields) -> bool:
+        if not update_fields:
+            return True
+        return bool(set(update_fields) & set(getattr(model, 'SEARCH_FIELDS', {}).keys()))
@@ -0,0 +1,56 @@
+from django.db.models.signals import m2m_changed, post_save
+
+from .services import FullTextSearchService
+
+def _reindex_on_save(model):
+    def handler(sender, instance, update_fields=None, raw=False, **kwargs):
+        if not raw and FullTextSearchService.touches_search_fields(sender, update_fields):
+            FullTextSearchService.schedule_reindex(model, [instance.pk])
+    return handler
+
+def _reindex_on_m2m_change(model, relation):
+    def handler(sender, instance, action, reverse, pk_set, **kwargs):
+        if not reverse:
+            if action in ('post_add', 'post_remove', 'post_clear'):
+                FullTextSearchService.schedule_reindex(model, [instance.pk])
+        elif action in ('post_add', 'post_remove') and pk_set:
+            FullTextSearchService.schedule_reindex(model, pk_set)
+        elif action == 'pre_clear':
+            FullTextSearchService.schedule_reindex(
+                model,
+                model.objects.filter(**{relation: instance}).values_list('id', flat=True),
+            )
+    return handler
+
+def _reindex_on_related_save(model, relation, name_field):
+    def handler(sender, instance, created, update_fields=None, raw=False, **kwargs):
+        if raw or created or (update_fields and name_field not in update_fields):
+            return
+        FullTextSearchService.schedule_reindex(
+            model,
+            model.objects.filter(**{relation: instance}).values_list('id', flat=True),
+        )
+    return handler
+
+def register_search_index(model, relations=('categories', 'tags'), name_field='name'):
+    prefix = f"{model._meta.model_name}_search_index"
+    post_save.connect(
+        _reindex_on_save(model),
+        sender=model,
+        weak=False,
+        dispatch_uid=f'{prefix}_on_save',
+    )
+    for relation in relations:
+        field = model._meta.get_field(relation)
+        m2m_changed.connect(
+            _reindex_on_m2m_change(model, relation),
+            sender=field.remote_field.through,
+            weak=False,
+            dispatch_uid=f'{prefix}_{relation}',
+        )
+        post_save.connect(
+            _reindex_on_related_save(model, relation, name_field),
+            sender=field.related_model,
+            weak=False,
+            dispatch_uid=f'{prefix}_on_{relation}_save',
+        )
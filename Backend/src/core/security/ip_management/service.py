@@ -1,8 +1,11 @@
 from django.core.cache import cache
 from django.conf import settings
 from django.utils import timezone
+from src.core.cache import get_local_cache
 from src.core.security.messages import IP_MANAGEMENT_DEFAULTS
 
+ip_lists_cache = get_local_cache('ip_management', max_entries=8, ttl=5.0)
+
 class IPBanService:
     BAN_CACHE_KEY = 'banned_ips'
     ATTEMPT_CACHE_KEY = 'honeypot_attempts:{ip}'
@@ -41,13 +44,14 @@ class IPBanService:
             'banned_at': str(timezone.now())
         }
         cache.set(cls.BAN_CACHE_KEY, banned_ips, timeout=cls.BAN_DURATION)
+        ip_lists_cache.invalidate()
     
     @classmethod
     def is_banned(cls, ip: str) -> bool:
         if cls._is_whitelisted(ip):
             return False
         
-        banned_ips = cache.get(cls.BAN_CACHE_KEY, {})
+        banned_ips = ip_lists_cache.get(cls.BAN_CACHE_KEY, {})
         return ip in banned_ips
     
     @classmethod
@@ -56,6 +60,7 @@ class IPBanService:
         if ip in banned_ips:
             del banned_ips[ip]
             cache.set(cls.BAN_CACHE_KEY, banned_ips)
+            ip_lists_cache.invalidate()
     
     @classmethod
     def get_attempts(cls, ip: str) -> int:
@@ -69,14 +74,14 @@ class IPBanService:
     
     @classmethod
     def get_all_banned_ips(cls) -> dict:
-        return cache.get(cls.BAN_CACHE_KEY, {})
+        return ip_lists_cache.get(cls.BAN_CACHE_KEY, {})
     
     @classmethod
     def _is_whitelisted(cls, ip: str) -> bool:
         if settings.DEBUG and ip in ['127.0.0.1', 'localhost', '::1']:
             return True
         
-        cache_whitelist = cache.get(cls.WHITELIST_CACHE_KEY, [])
+        cache_whitelist = ip_lists_cache.get(cls.WHITELIST_CACHE_KEY, [])
         if ip in cache_whitelist:
             return True
         
@@ -88,7 +93,7 @@ class IPBanService:
     
     @classmethod
     def get_whitelist(cls) -> list:
-        cache_whitelist = cache.get(cls.WHITELIST_CACHE_KEY, [])
+        cache_whitelist = ip_lists_cache.get(cls.WHITELIST_CACHE_KEY, [])
         settings_whitelist = getattr(settings, 'IP_BAN_WHITELIST', [])
         if isinstance(settings_whitelist, str):
             settings_whitelist = [ip.strip() for ip in settings_whitelist.split(',') if ip.strip()]
@@ -102,6 +107,7 @@ class IPBanService:
         if ip not in whitelist:
             whitelist.append(ip)
             cache.set(cls.WHITELIST_CACHE_KEY, whitelist, timeout=86400)
+            ip_lists_cache.invalidate()
             return True
         return False
     
@@ -111,6 +117,7 @@ class IPBanService:
         if ip in whitelist:
             whitelist.remove(ip)
             cache.set(cls.WHITELIST_CACHE_KEY, whitelist, timeout=86400)
+            ip_lists_cache.invalidate()
             return True
         return False
 
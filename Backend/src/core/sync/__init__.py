@@ -0,0 +1,13 @@
+from .cursor import SyncCursorError, decode_cursor, encode_cursor
+from .registry import SyncRegistry, SyncResource
+from .services import DeltaSyncService, SyncCursorExpired
+
+__all__ = [
+    'SyncCursorError',
+    'SyncCursorExpired',
+    'decode_cursor',
+    'encode_cursor',
+    'SyncRegistry',
+    'SyncResource',
+    'DeltaSyncService',
+]
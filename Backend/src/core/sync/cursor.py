@@ -0,0 +1,42 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, TypedDict
+
+CURSOR_VERSION = 1
+
+class SyncCursorError(ValueError):
+    pass
+
+class SyncCursorState(TypedDict):
+    updated_at: datetime
+    id: int
+    tombstone_id: int
+
+def encode_cursor(updated_at: datetime, object_id: int, tombstone_id: int) -> str:
+    payload = json.dumps(
+        {'v': CURSOR_VERSION, 'u': updated_at.isoformat(), 'i': object_id, 't': tombstone_id},
+        separators=(',', ':'),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: Optional[str]) -> Optional[SyncCursorState]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload.get('v') != CURSOR_VERSION:
+            raise SyncCursorError(cursor)
+        updated_at = datetime.fromisoformat(payload['u'])
+        if updated_at.tzinfo is None:
+            raise SyncCursorError(cursor)
+        return {
+            'updated_at': updated_at,
+            'id': int(payload['i']),
+            'tombstone_id': int(payload['t']),
+        }
+    except SyncCursorError:
+        raise
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise SyncCursorError(cursor) from e
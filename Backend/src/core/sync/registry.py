@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete
+
+from src.core.models import SyncTombstone
+
+@dataclass(frozen=True)
+class SyncResource:
+    key: str
+    model: type
+    visible: Callable[[], QuerySet]
+    serialize: Callable[[QuerySet], List[dict]]
+
+class SyncRegistry:
+
+    _resources: Dict[str, SyncResource] = {}
+
+    @classmethod
+    def register(cls, key: str, model, visible: Callable[[], QuerySet], serialize: Callable[[QuerySet], List[dict]]):
+        cls._resources[key] = SyncResource(key=key, model=model, visible=visible, serialize=serialize)
+
+        def record_tombstone(sender, instance, **kwargs):
+            SyncTombstone.objects.create(
+                resource=key,
+                object_id=instance.pk,
+                public_id=getattr(instance, 'public_id', None),
+            )
+
+        post_delete.connect(record_tombstone, sender=model, weak=False, dispatch_uid=f'core_sync_tombstone_{key}')
+
+    @classmethod
+    def get(cls, key: str) -> SyncResource:
+        return cls._resources[key]
+
+    @classmethod
+    def has_resource(cls, key: str) -> bool:
+        return key in cls._resources
+
+    @classmethod
+    def get_all_resources(cls) -> List[str]:
+        return sorted(cls._resources)
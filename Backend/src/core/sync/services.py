@@ -0,0 +1,103 @@
+from datetime import timedelta
+from typing import Optional
+
+from django.db.models import Q
+from django.utils import timezone
+
+from src.core.models import SyncTombstone
+
+from .cursor import SyncCursorError, decode_cursor, encode_cursor
+from .registry import SyncRegistry
+
+class SyncCursorExpired(SyncCursorError):
+    pass
+
+class DeltaSyncService:
+
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 500
+    COMMIT_LAG = timedelta(seconds=5)
+    TOMBSTONE_RETENTION = timedelta(days=90)
+
+    @classmethod
+    def normalize_limit(cls, limit) -> int:
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            return cls.DEFAULT_LIMIT
+        return min(max(limit, 1), cls.MAX_LIMIT)
+
+    @staticmethod
+    def _latest_tombstone_id(key: str) -> int:
+        return SyncTombstone.objects.filter(resource=key).order_by('-id').values_list('id', flat=True).first() or 0
+
+    @classmethod
+    def get_changes(cls, key: str, cursor: Optional[str] = None, limit=None) -> dict:
+        resource = SyncRegistry.get(key)
+        limit = cls.normalize_limit(limit)
+        state = decode_cursor(cursor)
+        now = timezone.now()
+        horizon = now - cls.COMMIT_LAG
+
+        if state is None:
+            changed = resource.visible()
+            tombstone_id = cls._latest_tombstone_id(key)
+        else:
+            if state['updated_at'] < now - cls.TOMBSTONE_RETENTION:
+                raise SyncCursorExpired(cursor)
+            changed = resource.model._default_manager.filter(
+                Q(updated_at__gt=state['updated_at']) |
+                Q(updated_at=state['updated_at'], id__gt=state['id'])
+            )
+            tombstone_id = state['tombstone_id']
+
+        rows = list(
+            changed.filter(updated_at__lte=horizon)
+            .order_by('updated_at', 'id')
+            .values_list('id', 'updated_at')[:limit + 1]
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        ids = [row[0] for row in rows]
+
+        items = resource.serialize(resource.visible().filter(pk__in=ids)) if ids else []
+        position = {pk: index for index, pk in enumerate(ids)}
+        items.sort(key=lambda item: position[item['id']])
+        present = {item['id'] for item in items}
+        removed = [pk for pk in ids if pk not in present]
+
+        if state is not None:
+            tombstones = list(
+                SyncTombstone.objects.filter(
+                    resource=key,
+                    id__gt=tombstone_id,
+                    deleted_at__lte=horizon,
+                ).order_by('id').values_list('id', 'object_id')[:limit + 1]
+            )
+            has_more = has_more or len(tombstones) > limit
+            tombstones = tombstones[:limit]
+            if tombstones:
+                tombstone_id = tombstones[-1][0]
+                removed.extend(object_id for _, object_id in tombstones if object_id not in present)
+
+        if rows:
+            next_updated_at, next_id = rows[-1]
+        elif state is not None and has_more:
+            next_updated_at, next_id = state['updated_at'], state['id']
+        else:
+            next_updated_at, next_id = horizon, 0
+
+        return {
+            'resource': key,
+            'items': items,
+            'removed': list(dict.fromkeys(removed)),
+            'cursor': encode_cursor(next_updated_at, next_id, tombstone_id),
+            'has_more': has_more,
+        }
+
+    @classmethod
+    def purge_tombstones(cls) -> int:
+        deleted, _ = SyncTombstone.objects.filter(
+            deleted_at__lt=timezone.now() - cls.TOMBSTONE_RETENTION,
+        ).delete()
+        return deleted
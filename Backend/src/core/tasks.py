@@ -0,0 +1,7 @@
+from celery import shared_task
+
+from src.core.sync import DeltaSyncService
+
+@shared_task(ignore_result=True)
+def purge_sync_tombstones():
+    return DeltaSyncService.purge_tombstones()
@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from src.core.utils.commit_batch import add_to_commit_batch
+
+class CommitBatchTest(TransactionTestCase):
+
+    def setUp(self):
+        self.flushed = []
+
+    def collect(self, value):
+        add_to_commit_batch('test', set, self.flushed.append, lambda batch: batch.add(value))
+
+    def test_autocommit_flushes_immediately(self):
+        self.collect(1)
+        self.assertEqual(self.flushed, [{1}])
+
+    def test_transaction_coalesces_into_one_flush(self):
+        with transaction.atomic():
+            self.collect(1)
+            self.collect(2)
+            self.assertEqual(self.flushed, [])
+        self.assertEqual(self.flushed, [{1, 2}])
+
+    def test_rolled_back_transaction_does_not_leak_into_next_commit(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.collect(1)
+                raise RuntimeError
+        self.assertEqual(self.flushed, [])
+
+        with transaction.atomic():
+            self.collect(2)
+        self.assertEqual(self.flushed, [{2}])
+
+    def test_rolled_back_savepoint_drops_only_its_work(self):
+        with transaction.atomic():
+            self.collect(1)
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.collect(2)
+                    raise RuntimeError
+            self.collect(3)
+        self.assertEqual(self.flushed, [{1, 3}])
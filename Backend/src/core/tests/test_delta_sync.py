@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta, timezone
+
+from django.db.models.signals import post_delete
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone as django_timezone
+
+from src.core.models import Country, Province, SyncTombstone
+from src.core.sync import (
+    DeltaSyncService,
+    SyncCursorError,
+    SyncCursorExpired,
+    SyncRegistry,
+    decode_cursor,
+    encode_cursor,
+)
+
+class SyncCursorTest(SimpleTestCase):
+
+    def test_round_trip_preserves_position(self):
+        updated_at = datetime(2026, 3, 9, 10, 5, 30, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor(updated_at, 42, 7)
+
+        self.assertNotIn('=', cursor)
+        self.assertEqual(decode_cursor(cursor), {
+            'updated_at': updated_at,
+            'id': 42,
+            'tombstone_id': 7,
+        })
+
+    def test_empty_cursor_starts_full_sync(self):
+        self.assertIsNone(decode_cursor(None))
+        self.assertIsNone(decode_cursor(''))
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ('not-a-cursor', 'e30', encode_cursor(datetime(2026, 1, 1), 1, 0)):
+            with self.assertRaises(SyncCursorError):
+                decode_cursor(cursor)
+
+class DeltaSyncServiceTest(TestCase):
+
+    resource = 'test-provinces'
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        SyncRegistry.register(
+            cls.resource,
+            Province,
+            visible=lambda: Province.objects.filter(is_active=True),
+            serialize=lambda queryset: list(queryset.values('id', 'name')),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        SyncRegistry._resources.pop(cls.resource, None)
+        post_delete.disconnect(sender=Province, dispatch_uid=f'core_sync_tombstone_{cls.resource}')
+        super().tearDownClass()
+
+    def setUp(self):
+        self.country = Country.get_iran()
+        self.base = django_timezone.now() - timedelta(hours=1)
+
+    def create_province(self, code, updated_at):
+        province = Province.objects.create(name=f'province-{code}', code=code, country=self.country)
+        Province.objects.filter(pk=province.pk).update(updated_at=updated_at)
+        return province
+
+    def cursor_at(self, updated_at, object_id=0, tombstone_id=0):
+        return encode_cursor(updated_at, object_id, tombstone_id)
+
+    def item_ids(self, page):
+        return [item['id'] for item in page['items']]
+
+    def test_keyset_paging_breaks_updated_at_ties_by_id(self):
+        tied = [self.create_province(str(code), self.base) for code in range(1, 4)]
+        later = self.create_province('4', self.base + timedelta(seconds=1))
+
+        first = DeltaSyncService.get_changes(self.resource, limit=2)
+        self.assertEqual(self.item_ids(first), [tied[0].pk, tied[1].pk])
+        self.assertTrue(first['has_more'])
+
+        second = DeltaSyncService.get_changes(self.resource, cursor=first['cursor'], limit=2)
+        self.assertEqual(self.item_ids(second), [tied[2].pk, later.pk])
+        self.assertFalse(second['has_more'])
+
+        third = DeltaSyncService.get_changes(self.resource, cursor=second['cursor'], limit=2)
+        self.assertEqual(third['items'], [])
+        self.assertFalse(third['has_more'])
+
+    def test_rows_inside_commit_lag_wait_for_next_sync(self):
+        settled = self.create_province('1', self.base)
+        recent = self.create_province('2', django_timezone.now())
+
+        page = DeltaSyncService.get_changes(self.resource, cursor=self.cursor_at(self.base - timedelta(seconds=1)))
+        self.assertEqual(self.item_ids(page), [settled.pk])
+
+        Province.objects.filter(pk=recent.pk).update(updated_at=self.base + timedelta(seconds=1))
+        page = DeltaSyncService.get_changes(self.resource, cursor=page['cursor'])
+        self.assertEqual(self.item_ids(page), [recent.pk])
+
+    def test_rows_no_longer_visible_are_reported_as_removed(self):
+        visible = self.create_province('1', self.base)
+        hidden = self.create_province('2', self.base)
+        Province.objects.filter(pk=hidden.pk).update(is_active=False)
+
+        page = DeltaSyncService.get_changes(self.resource, cursor=self.cursor_at(self.base - timedelta(seconds=1)))
+        self.assertEqual(self.item_ids(page), [visible.pk])
+        self.assertEqual(page['removed'], [hidden.pk])
+
+    def test_tombstones_are_paged_by_id(self):
+        deleted_ids = []
+        for code in ('1', '2', '3'):
+            province = self.create_province(code, self.base)
+            deleted_ids.append(province.pk)
+            province.delete()
+        SyncTombstone.objects.filter(resource=self.resource).update(deleted_at=self.base)
+
+        first = DeltaSyncService.get_changes(self.resource, cursor=self.cursor_at(self.base), limit=2)
+        self.assertEqual(first['removed'], deleted_ids[:2])
+        self.assertTrue(first['has_more'])
+
+        second = DeltaSyncService.get_changes(self.resource, cursor=first['cursor'], limit=2)
+        self.assertEqual(second['removed'], deleted_ids[2:])
+        self.assertFalse(second['has_more'])
+
+    def test_cursor_older_than_tombstone_retention_expires(self):
+        expired = self.cursor_at(django_timezone.now() - DeltaSyncService.TOMBSTONE_RETENTION - timedelta(days=1))
+
+        with self.assertRaises(SyncCursorExpired):
+            DeltaSyncService.get_changes(self.resource, cursor=expired)
+
+        response = self.client.get(f'/api/core/sync/{self.resource}/', {'cursor': expired})
+        self.assertEqual(response.status_code, 410)
@@ -0,0 +1,200 @@
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from src.blog.models.blog import Blog
+from src.blog.models.category import BlogCategory
+from src.blog.models.media import BlogImage
+from src.blog.models.tag import BlogTag
+from src.blog.views.admin.blog_views import BlogAdminViewSet
+from src.core.cache import CacheService
+from src.core.models import City, Country, Province
+from src.core.profiling import QueryInspector, query_shape
+from src.core.profiling.query_budget import DEFAULT_N_PLUS_ONE_THRESHOLD, resolve_view_budget
+from src.core.profiling.testing import QueryBudgetTestMixin
+from src.media.models.media import ImageMedia
+from src.portfolio.models.category import PortfolioCategory
+from src.portfolio.models.media import PortfolioImage
+from src.portfolio.models.portfolio import Portfolio
+from src.portfolio.models.tag import PortfolioTag
+from src.portfolio.views.admin.portfolio_views import PortfolioAdminViewSet
+from src.real_estate.models.agency import RealEstateAgency
+from src.real_estate.models.agent import PropertyAgent
+from src.real_estate.models.media import PropertyImage
+from src.real_estate.models.property import Property
+from src.real_estate.models.tag import PropertyTag
+from src.real_estate.views.admin.property_views import PropertyAdminViewSet
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix='query-budget-')
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+FIXTURE_ROWS = DEFAULT_N_PLUS_ONE_THRESHOLD + 1
+TINY_GIF = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00,'
+    b'\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+def create_listing_fixtures(agent_user):
+    province = Province.objects.create(name='تهران', code='1', country=Country.get_iran())
+    city = City.objects.create(name='تهران', code='1', province=province)
+    agency = RealEstateAgency.objects.create(
+        name='Budget Agency', slug='budget-agency', phone='02100000000', province=province, city=city,
+    )
+    agent = PropertyAgent.objects.create(
+        user=agent_user, agency=agency, license_number='BUDGET-1', slug='budget-agent',
+    )
+    property_tag = PropertyTag.objects.create(title='Budget tag', slug='budget-tag')
+    blog_category = BlogCategory.add_root(name='Budget category', slug='budget-category')
+    blog_tag = BlogTag.objects.create(name='Budget tag', slug='budget-tag')
+    portfolio_category = PortfolioCategory.add_root(name='Budget category', slug='budget-category')
+    portfolio_tag = PortfolioTag.objects.create(name='Budget tag', slug='budget-tag')
+
+    for index in range(FIXTURE_ROWS):
+        image = ImageMedia.objects.create(
+            title=f'Budget image {index}',
+            file=SimpleUploadedFile(f'budget-{index}.gif', TINY_GIF, content_type='image/gif'),
+        )
+
+        property_obj = Property.objects.create(
+            title=f'Budget property {index}',
+            slug=f'budget-property-{index}',
+            agent=agent,
+            agency=agency,
+            province=province,
+            city=city,
+            address='Tehran',
+            is_published=True,
+            is_public=True,
+        )
+        property_obj.tags.add(property_tag)
+        PropertyImage.objects.create(property=property_obj, image=image, is_main=True)
+
+        blog = Blog.objects.create(
+            title=f'Budget blog {index}', slug=f'budget-blog-{index}', status='published', is_public=True,
+        )
+        blog.categories.add(blog_category)
+        blog.tags.add(blog_tag)
+        BlogImage.objects.create(blog=blog, image=image, is_main=True)
+
+        portfolio = Portfolio.objects.create(
+            title=f'Budget portfolio {index}', slug=f'budget-portfolio-{index}', status='published', is_public=True,
+        )
+        portfolio.categories.add(portfolio_category)
+        portfolio.tags.add(portfolio_tag)
+        PortfolioImage.objects.create(portfolio=portfolio, image=image, is_main=True)
+
+class QueryShapeTest(SimpleTestCase):
+
+    def test_literals_and_in_lists_collapse_to_one_shape(self):
+        first = query_shape('SELECT * FROM "media" WHERE "media"."id" IN (%s, %s, %s) LIMIT 21')
+        second = query_shape('SELECT *  FROM "media" WHERE "media"."id" IN (%s) LIMIT 5')
+        self.assertEqual(first, second)
+
+    def test_repeated_shape_from_same_origin_is_reported(self):
+        inspector = QueryInspector(n_plus_one_threshold=3)
+        for object_id in range(4):
+            inspector.queries.append({
+                'sql': f'SELECT * FROM "media" WHERE "id" = {object_id}',
+                'shape': query_shape(f'SELECT * FROM "media" WHERE "id" = {object_id}'),
+                'origin': 'src/real_estate/serializers/public/property_serializer.py:get_main_image',
+                'duration_ms': 0.1,
+            })
+
+        suspects = inspector.n_plus_one()
+        self.assertEqual(len(suspects), 1)
+        self.assertEqual(suspects[0]['count'], 4)
+        self.assertIn('get_main_image', suspects[0]['origin'])
+        self.assertEqual(len(inspector.report(budget=10)), 1)
+        self.assertEqual(len(inspector.report(budget=2)), 2)
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES=LOCMEM_CACHES)
+class PublicEndpointQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        agent_user = get_user_model().objects.create_user(
+            mobile='09123000102',
+            password='test1234',
+            user_type='admin',
+            is_staff=True,
+            is_admin_active=True,
+        )
+        create_listing_fixtures(agent_user)
+
+    def setUp(self):
+        # Public views read through ResponseCache and get_or_compute; start every
+        # request cold so the budget measures the serializer path, not a warm key.
+        cache.clear()
+        default_manager = CacheService._default_manager
+        CacheService._default_manager = None
+        self.addCleanup(setattr, CacheService, '_default_manager', default_manager)
+
+    def test_property_list(self):
+        response = self.assertEndpointQueryBudget('/api/real-estate/properties/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_property_detail(self):
+        response = self.assertEndpointQueryBudget('/api/real-estate/properties/budget-property-0/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_blog_list(self):
+        response = self.assertEndpointQueryBudget('/api/blog/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_blog_detail(self):
+        response = self.assertEndpointQueryBudget('/api/blog/budget-blog-0/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_portfolio_list(self):
+        response = self.assertEndpointQueryBudget('/api/portfolio/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_portfolio_detail(self):
+        response = self.assertEndpointQueryBudget('/api/portfolio/budget-portfolio-0/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class AdminEndpointQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.super_user = get_user_model().objects.create_user(
+            mobile='09123000101',
+            password='test1234',
+            user_type='admin',
+            is_staff=True,
+            is_superuser=True,
+            is_admin_active=True,
+            is_admin_full=True,
+        )
+        create_listing_fixtures(cls.super_user)
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def assertAdminListWithinBudget(self, view_class, path):
+        view = view_class.as_view({'get': 'list'})
+        request = self.factory.get(path)
+        force_authenticate(request, user=self.super_user)
+
+        with self.assertQueryBudget(resolve_view_budget(view, 'get'), f"GET {path}"):
+            response = view(request)
+            response.render()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_property_admin_list(self):
+        self.assertAdminListWithinBudget(PropertyAdminViewSet, '/api/admin/property/')
+
+    def test_blog_admin_list(self):
+        self.assertAdminListWithinBudget(BlogAdminViewSet, '/api/admin/blog/')
+
+    def test_portfolio_admin_list(self):
+        self.assertAdminListWithinBudget(PortfolioAdminViewSet, '/api/admin/portfolio/')
@@ -0,0 +1,93 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from src.core.cache import get_or_compute
+from src.core.cache.stale_while_revalidate import ENVELOPE_MARKER
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'stale-while-revalidate-tests',
+    },
+}
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StaleWhileRevalidateLoadTest(SimpleTestCase):
+    workers = 32
+    compute_seconds = 0.2
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+        self.calls_lock = threading.Lock()
+
+    def compute(self):
+        with self.calls_lock:
+            self.calls += 1
+            call_number = self.calls
+        time.sleep(self.compute_seconds)
+        return {'call': call_number}
+
+    def hammer(self, cache_key, **kwargs):
+        barrier = threading.Barrier(self.workers)
+        results = []
+        results_lock = threading.Lock()
+
+        def worker():
+            barrier.wait()
+            value = get_or_compute(cache_key, self.compute, 60, beta=0, **kwargs)
+            with results_lock:
+                results.append(value)
+
+        threads = [threading.Thread(target=worker) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def expire_soft(self, cache_key):
+        entry = cache.get(cache_key)
+        entry['soft_expires_at'] = time.time() - 1
+        cache.set(cache_key, entry, 60)
+
+    def test_cold_key_is_computed_once(self):
+        results = self.hammer('swr:test:cold')
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), self.workers)
+        self.assertTrue(all(result == {'call': 1} for result in results))
+
+    def test_expired_key_is_refreshed_once_while_serving_stale(self):
+        get_or_compute('swr:test:stale', self.compute, 60, beta=0)
+        self.expire_soft('swr:test:stale')
+
+        results = self.hammer('swr:test:stale')
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(results.count({'call': 2}), 1)
+        self.assertEqual(results.count({'call': 1}), self.workers - 1)
+        self.assertEqual(cache.get('swr:test:stale')['value'], {'call': 2})
+
+    def test_invalidated_key_is_recomputed_once(self):
+        get_or_compute('swr:test:invalidated', self.compute, 60, beta=0)
+        cache.delete('swr:test:invalidated')
+
+        results = self.hammer('swr:test:invalidated')
+
+        self.assertEqual(self.calls, 2)
+        self.assertTrue(all(result == {'call': 2} for result in results))
+
+    def test_none_is_not_cached(self):
+        self.assertIsNone(get_or_compute('swr:test:none', lambda: None, 60))
+        self.assertIsNone(cache.get('swr:test:none'))
+
+    def test_value_is_stored_in_envelope(self):
+        get_or_compute('swr:test:envelope', self.compute, 60, beta=0)
+
+        entry = cache.get('swr:test:envelope')
+        self.assertEqual(entry[ENVELOPE_MARKER], 1)
+        self.assertGreater(entry['delta'], 0)
@@ -2,6 +2,8 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import upload_settings_view
 from .views.csrf_view import CSRFTokenView
+from .views.profiling_view import ProfilingMetricsView, ProfilingSummaryView
+from .views.sync_view import SyncChangesView, SyncResourceListView
 from .feature_flags.views import (
     feature_flags_api,
     feature_flag_detail,
@@ -21,5 +23,9 @@ urlpatterns = [
     path('feature-flags/', feature_flags_api, name='feature-flags'),
     path('feature-flags/<str:key>/', feature_flag_detail, name='feature-flag-detail'),
     path('feature-flags/config/', feature_config_api, name='feature-flags-config'),
+    path('admin/profiling/', ProfilingSummaryView.as_view(), name='admin-profiling'),
+    path('admin/profiling/metrics/', ProfilingMetricsView.as_view(), name='admin-profiling-metrics'),
+    path('sync/', SyncResourceListView.as_view(), name='sync-resources'),
+    path('sync/<slug:resource>/', SyncChangesView.as_view(), name='sync-changes'),
     path('', include(router.urls)),
 ] 
\ No newline at end of file
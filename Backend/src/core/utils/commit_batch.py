@@ -0,0 +1,56 @@
+from typing import Any, Callable, Optional, TypeVar
+
+from django.db import transaction
+
+T = TypeVar('T')
+
+class _CommitBatch:
+
+    __slots__ = ('batch', 'callback')
+
+    def __init__(self, batch, callback):
+        self.batch = batch
+        self.callback = callback
+
+def _pending_callbacks(connection) -> set[int]:
+    return {id(entry[1]) for entry in connection.run_on_commit}
+
+def add_to_commit_batch(
+    name: str,
+    factory: Callable[[], T],
+    flush: Callable[[T], Any],
+    update: Callable[[T], Any],
+    using: Optional[str] = None,
+) -> Any:
+    # Work is coalesced per (name, savepoint level) on the connection and flushed
+    # by a single on_commit callback. A batch is reused only while its callback is
+    # still queued, so a rolled-back transaction or savepoint takes its batch with
+    # it instead of leaking into the next commit. In autocommit it flushes at once.
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        batch = factory()
+        result = update(batch)
+        flush(batch)
+        return result
+
+    batches = getattr(connection, '_commit_batches', None)
+    if batches is None:
+        batches = connection._commit_batches = {}
+
+    pending = _pending_callbacks(connection)
+    for stale_key in [key for key, entry in batches.items() if id(entry.callback) not in pending]:
+        del batches[stale_key]
+
+    key = (name, tuple(connection.savepoint_ids))
+    entry = batches.get(key)
+    if entry is None:
+        batch = factory()
+
+        def callback():
+            if batches.get(key) is entry:
+                del batches[key]
+            flush(batch)
+
+        entry = batches[key] = _CommitBatch(batch, callback)
+        transaction.on_commit(callback, using=using)
+    return update(entry.batch)
@@ -0,0 +1,152 @@
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from src.core.cache import CacheService
+
+def _project(item: dict, fields) -> dict:
+    if isinstance(fields, dict):
+        return {output: item.get(source) for output, source in fields.items()}
+    return {field: item.get(field) for field in fields}
+
+class MaterializedTree:
+
+    def __init__(self, nodes: list[dict]):
+        self.nodes = nodes
+        self._by_id = {node['id']: node for node in nodes}
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._by_id
+
+    def get(self, node_id) -> Optional[dict]:
+        return self._by_id.get(node_id)
+
+    def roots(self) -> list[dict]:
+        return [node for node in self.nodes if node['parent_id'] is None]
+
+    def parent(self, node_id) -> Optional[dict]:
+        node = self._by_id.get(node_id)
+        if not node or node['parent_id'] is None:
+            return None
+        return self._by_id.get(node['parent_id'])
+
+    def children(self, node_id) -> list[dict]:
+        node = self._by_id.get(node_id)
+        if not node:
+            return []
+        return [self._by_id[child_id] for child_id in node['children_ids']]
+
+    def children_count(self, node_id) -> int:
+        node = self._by_id.get(node_id)
+        return len(node['children_ids']) if node else 0
+
+    def ancestors(self, node_id) -> list[dict]:
+        node = self._by_id.get(node_id)
+        if not node:
+            return []
+        return [self._by_id[ancestor_id] for ancestor_id in node['ancestor_ids']]
+
+    def breadcrumbs(self, node_id, fields) -> list[dict]:
+        node = self._by_id.get(node_id)
+        if not node:
+            return []
+        return [_project(item, fields) for item in self.ancestors(node_id) + [node]]
+
+    def nested(
+        self,
+        fields,
+        include: Optional[Callable[[dict], bool]] = None,
+        roots: Optional[list[dict]] = None,
+    ) -> list[dict]:
+        def build(items):
+            tree = []
+            for item in items:
+                if include is not None and not include(item):
+                    continue
+                tree_node = _project(item, fields)
+                tree_node['children'] = build(self.children(item['id']))
+                tree.append(tree_node)
+            return tree
+
+        return build(self.roots() if roots is None else roots)
+
+class TreeMaterializer:
+
+    VERSION_TIMEOUT = 7 * 24 * 60 * 60
+
+    def __init__(self, queryset, fields: Iterable[str], cache_namespace: str, timeout: Optional[int] = None):
+        self.queryset = queryset
+        self.fields = list(fields)
+        self.cache_namespace = cache_namespace
+        self.timeout = timeout
+
+    @staticmethod
+    def materialize(rows: Iterable[Any], fields: Iterable[str], steplen: int = 4) -> list[dict]:
+        fields = list(fields)
+        nodes = []
+        by_path = {}
+
+        for row in rows:
+            path = row['path'] if isinstance(row, dict) else row.path
+            node = {
+                field: (row.get(field) if isinstance(row, dict) else getattr(row, field, None))
+                for field in fields
+            }
+            node['id'] = row['id'] if isinstance(row, dict) else row.id
+            node['path'] = path
+            node['depth'] = len(path) // steplen
+            node['parent_id'] = None
+            node['ancestor_ids'] = []
+            node['children_ids'] = []
+
+            parent = by_path.get(path[:-steplen]) if len(path) > steplen else None
+            if parent is not None:
+                node['parent_id'] = parent['id']
+                node['ancestor_ids'] = parent['ancestor_ids'] + [parent['id']]
+                parent['children_ids'].append(node['id'])
+
+            by_path[path] = node
+            nodes.append(node)
+
+        for node in nodes:
+            node['children_count'] = len(node['children_ids'])
+
+        return nodes
+
+    def _version_key(self) -> str:
+        return f"{self.cache_namespace}:version"
+
+    def _current_version(self) -> int:
+        version = CacheService.get(self._version_key())
+        if version is None:
+            version = int(time.time() * 1000)
+            CacheService.set(self._version_key(), version, self.VERSION_TIMEOUT)
+        return version
+
+    def _blob_key(self, version: int) -> str:
+        return f"{self.cache_namespace}:v{version}"
+
+    def build(self) -> MaterializedTree:
+        steplen = getattr(self.queryset.model, 'steplen', 4)
+        rows = self.queryset.order_by('path').values('id', 'path', *self.fields)
+        return MaterializedTree(self.materialize(rows, self.fields, steplen=steplen))
+
+    def get(self, use_cache: bool = True) -> MaterializedTree:
+        if not use_cache:
+            return self.build()
+
+        blob_key = self._blob_key(self._current_version())
+        nodes = CacheService.get(blob_key)
+        if nodes is not None:
+            return MaterializedTree(nodes)
+
+        tree = self.build()
+        CacheService.set(blob_key, tree.nodes, self.timeout)
+        return tree
+
+    @classmethod
+    def invalidate(cls, cache_namespace: str) -> bool:
+        return CacheService.set(
+            f"{cache_namespace}:version",
+            int(time.time() * 1000),
+            cls.VERSION_TIMEOUT,
+        )
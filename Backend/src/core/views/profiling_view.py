@@ -0,0 +1,52 @@
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.views import APIView
+
+from src.core.messages import CORE_SUCCESS
+from src.core.profiling import ProfileStore, get_profiling_config, profile_buffer
+from src.core.responses.response import APIResponse
+from src.user.access_control import RequirePermission
+
+class ProfilingSummaryView(APIView):
+
+    def get_permissions(self):
+        if self.request.method == 'DELETE':
+            return [RequirePermission('analytics.manage')]
+        return [RequirePermission('analytics.system.read')]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 200)
+        except (TypeError, ValueError):
+            limit = 50
+
+        config = get_profiling_config()
+        return APIResponse.success(
+            message=CORE_SUCCESS["profiling_retrieved"],
+            data={
+                'enabled': config['ENABLED'],
+                'sample_rate': config['SAMPLE_RATE'],
+                'slow_request_ms': config['SLOW_REQUEST_MS'],
+                'buffer': profile_buffer.stats(),
+                'views': ProfileStore.views(),
+                'recent_samples': ProfileStore.recent_samples(limit),
+            },
+            status_code=status.HTTP_200_OK
+        )
+
+    def delete(self, request, *args, **kwargs):
+        profile_buffer.drain()
+        ProfileStore.reset()
+        return APIResponse.success(
+            message=CORE_SUCCESS["profiling_reset"],
+            data={},
+            status_code=status.HTTP_200_OK
+        )
+
+class ProfilingMetricsView(APIView):
+
+    def get_permissions(self):
+        return [RequirePermission('analytics.system.read')]
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(ProfileStore.prometheus_text(), content_type='text/plain; version=0.0.4; charset=utf-8')
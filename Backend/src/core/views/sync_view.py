@@ -0,0 +1,53 @@
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from src.core.messages import CORE_ERRORS, CORE_SUCCESS
+from src.core.responses.response import APIResponse
+from src.core.sync import DeltaSyncService, SyncCursorError, SyncCursorExpired, SyncRegistry
+
+class SyncResourceListView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        return APIResponse.success(
+            message=CORE_SUCCESS["sync_resources_retrieved"],
+            data={
+                'resources': SyncRegistry.get_all_resources(),
+                'max_limit': DeltaSyncService.MAX_LIMIT,
+            },
+            status_code=status.HTTP_200_OK
+        )
+
+class SyncChangesView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, resource, *args, **kwargs):
+        if not SyncRegistry.has_resource(resource):
+            return APIResponse.error(
+                message=CORE_ERRORS["sync_resource_not_found"],
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            data = DeltaSyncService.get_changes(
+                resource,
+                cursor=request.query_params.get('cursor'),
+                limit=request.query_params.get('limit'),
+            )
+        except SyncCursorExpired:
+            return APIResponse.error(
+                message=CORE_ERRORS["sync_cursor_expired"],
+                status_code=status.HTTP_410_GONE
+            )
+        except SyncCursorError:
+            return APIResponse.error(
+                message=CORE_ERRORS["sync_cursor_invalid"],
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        return APIResponse.success(
+            message=CORE_SUCCESS["sync_changes_retrieved"],
+            data=data,
+            status_code=status.HTTP_200_OK
+        )
@@ -8,6 +8,7 @@ EMAIL_SUCCESS = {
     "message_marked_as_read": "پیام به عنوان خوانده شده علامت‌گذاری شد.",
     "message_marked_as_replied": "پیام به عنوان پاسخ داده شده علامت‌گذاری شد.",
     "reply_sent": "پاسخ با موفقیت ارسال شد.",
+    "reply_queued": "پاسخ در صف ارسال قرار گرفت.",
     "messages_bulk_marked_as_read": "پیام‌ها با موفقیت به عنوان خوانده شده علامت‌گذاری شدند.",
     "messages_bulk_marked_as_replied": "پیام‌ها با موفقیت به عنوان پاسخ داده شده علامت‌گذاری شدند.",
     "messages_archived": "پیام‌ها با موفقیت آرشیو شدند.",
@@ -22,6 +23,7 @@ EMAIL_ERRORS = {
     "message_delete_failed": "حذف پیام ناموفق بود.",
     "message_send_failed": "خطا در ارسال پیام. لطفاً دوباره تلاش کنید.",
     "reply_send_failed": "خطا در ارسال پاسخ ایمیل.",
+    "reply_queue_failed": "خطا در قرار دادن پاسخ در صف ارسال.",
     "invalid_email": "ایمیل وارد شده معتبر نیست.",
     "required_fields": "لطفاً تمام فیلدهای الزامی را پر کنید.",
     "validation_error": "خطا در اعتبارسنجی داده‌ها.",
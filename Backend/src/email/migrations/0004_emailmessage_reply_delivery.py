@@ -0,0 +1,22 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email', '0003_alter_emailmessage_created_by_emailstatistics'),
+        ('post_office', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailmessage',
+            name='reply_email',
+            field=models.ForeignKey(blank=True, help_text='Outbox email carrying the reply', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='email_message_replies', to='post_office.email', verbose_name='Reply Email'),
+        ),
+        migrations.AddField(
+            model_name='emailmessage',
+            name='reply_delivery_status',
+            field=models.CharField(blank=True, choices=[('queued', 'Queued'), ('sent', 'Sent'), ('failed', 'Failed')], db_index=True, help_text='Delivery status of the queued reply email', max_length=20, null=True, verbose_name='Reply Delivery Status'),
+        ),
+    ]
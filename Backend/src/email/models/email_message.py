@@ -22,6 +22,12 @@ class EmailMessage(BaseModel):
         ('api', 'API'),
     ]
     
+    REPLY_DELIVERY_CHOICES = [
+        ('queued', 'Queued'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -95,6 +101,25 @@ class EmailMessage(BaseModel):
         help_text="Admin user who replied to this message"
     )
     
+    reply_email = models.ForeignKey(
+        'post_office.Email',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='email_message_replies',
+        verbose_name="Reply Email",
+        help_text="Outbox email carrying the reply"
+    )
+    reply_delivery_status = models.CharField(
+        max_length=20,
+        choices=REPLY_DELIVERY_CHOICES,
+        blank=True,
+        null=True,
+        db_index=True,
+        verbose_name="Reply Delivery Status",
+        help_text="Delivery status of the queued reply email"
+    )
+    
     dynamic_fields = models.JSONField(
         default=dict,
         blank=True,
@@ -157,7 +182,22 @@ class EmailMessage(BaseModel):
         self.status = 'replied'
         self.replied_at = timezone.now()
         self.replied_by = admin_user
-        self.save(update_fields=['status', 'replied_at', 'replied_by'])
+        update_fields = ['status', 'replied_at', 'replied_by', 'reply_message']
+        if self.reply_email_id:
+            self.reply_delivery_status = 'sent'
+            update_fields.append('reply_delivery_status')
+        self.save(update_fields=update_fields)
+    
+    def queue_reply(self, reply_text, admin_user, reply_email):
+        self.reply_message = reply_text
+        self.replied_by = admin_user
+        self.reply_email = reply_email
+        self.reply_delivery_status = 'queued'
+        self.save(update_fields=['reply_message', 'replied_by', 'reply_email', 'reply_delivery_status'])
+    
+    def mark_reply_failed(self):
+        self.reply_delivery_status = 'failed'
+        self.save(update_fields=['reply_delivery_status'])
     
     @property
     def has_attachments(self):
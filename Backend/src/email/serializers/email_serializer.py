@@ -49,6 +49,7 @@ class EmailMessageSerializer(serializers.ModelSerializer):
             'ip_address',
             'user_agent',
             'reply_message',
+            'reply_delivery_status',
             'replied_at',
             'replied_by',
             'read_at',
@@ -66,6 +67,7 @@ class EmailMessageSerializer(serializers.ModelSerializer):
             'public_id',
             'ip_address',
             'user_agent',
+            'reply_delivery_status',
             'replied_at',
             'replied_by',
             'read_at',
@@ -1,6 +1,9 @@
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+from post_office import mail
+from post_office.models import STATUS
 
 from src.core.cache import CacheService
 from src.email.messages.messages import EMAIL_TEXT
@@ -91,24 +94,43 @@ class EmailService:
                 'original_message': original_message or EMAIL_TEXT['original_message_not_found'],
             })
             
-            text_content = f
-            
-            email = EmailMultiAlternatives(
+            reply_email = mail.send(
+                recipients=[recipient_email],
+                sender=settings.DEFAULT_FROM_EMAIL,
                 subject=f"Re: {original_subject}",
-                body=text_content,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[recipient_email],
+                message=strip_tags(html_content),
+                html_message=html_content,
+                priority='medium',
             )
-            email.attach_alternative(html_content, "text/html")
-            email.send(fail_silently=False)
             
-            email_message.reply_message = reply_text
-            email_message.mark_as_replied(admin_user)
+            email_message.queue_reply(reply_text, admin_user, reply_email)
+            
+            from src.email.tasks import send_queued_mail
+            transaction.on_commit(send_queued_mail.delay)
             
             return True
         except Exception:
             return False
     
+    @staticmethod
+    def sync_reply_delivery_statuses() -> dict:
+        pending = EmailMessage.objects.filter(
+            reply_delivery_status='queued',
+            reply_email__isnull=False,
+        ).select_related('reply_email', 'replied_by')
+        
+        result = {'sent': 0, 'failed': 0}
+        for email_message in pending:
+            delivery_status = email_message.reply_email.status
+            if delivery_status == STATUS.sent:
+                email_message.mark_as_replied(email_message.replied_by)
+                result['sent'] += 1
+            elif delivery_status == STATUS.failed:
+                email_message.mark_reply_failed()
+                result['failed'] += 1
+        
+        return result
+    
     @staticmethod
     def get_statistics():
         cache_key = EmailCacheKeys.stats()
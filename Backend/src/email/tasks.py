@@ -0,0 +1,22 @@
+from celery import shared_task
+from django.core.cache import cache
+from post_office import mail
+
+from src.email.services.email_service import EmailService
+from src.email.utils.cache import EmailCacheKeys
+from src.email.utils.cache_ttl import EmailCacheTTL
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def send_queued_mail(self):
+    lock_key = EmailCacheKeys.outbox_lock()
+    if not cache.add(lock_key, 1, EmailCacheTTL.OUTBOX_LOCK):
+        return {'skipped': True}
+    
+    try:
+        mail.send_queued(processes=1)
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=self.default_retry_delay * (2 ** self.request.retries))
+    finally:
+        cache.delete(lock_key)
+    
+    return EmailService.sync_reply_delivery_statuses()
@@ -12,6 +12,10 @@ class EmailCacheAdminKeys:
     def stats():
         return compose_email_key("admin", "email", "stats")
 
+    @staticmethod
+    def outbox_lock():
+        return compose_email_key("admin", "email", "outbox", "lock")
+
     @staticmethod
     def legacy_message(message_id: int):
         return compose_email_key("email", "message", str(message_id))
@@ -1,2 +1,3 @@
 class EmailCacheTTL:
     STATS = 300
+    OUTBOX_LOCK = 300
@@ -195,20 +195,20 @@ class EmailMessageViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
                     status_code=status.HTTP_400_BAD_REQUEST
                 )
             
-            email_sent = EmailService.send_reply_email(message, reply_text, request.user)
+            reply_queued = EmailService.send_reply_email(message, reply_text, request.user)
             
-            if not email_sent:
+            if not reply_queued:
                 return APIResponse.error(
-                    message=EMAIL_ERRORS['email_send_failed'],
+                    message=EMAIL_ERRORS['reply_queue_failed'],
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
             
             serializer = self.get_serializer(message)
             
             return APIResponse.success(
-                message=EMAIL_SUCCESS['message_marked_as_replied'],
+                message=EMAIL_SUCCESS['reply_queued'],
                 data=serializer.data,
-                status_code=status.HTTP_200_OK
+                status_code=status.HTTP_202_ACCEPTED
             )
         except EmailMessage.DoesNotExist:
             return APIResponse.error(
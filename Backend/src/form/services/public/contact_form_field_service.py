@@ -1,4 +1,4 @@
-from src.core.cache import CacheService
+from src.core.cache import get_or_compute
 from src.form.serializers.public import PublicContactFormFieldSerializer
 from src.form.services.admin.contact_form_field_service import get_active_fields_for_platform
 from src.form.utils.cache_public import FormPublicCacheKeys
@@ -9,14 +9,12 @@ def get_public_contact_form_fields(platform):
 
 def get_public_contact_form_fields_data(platform):
     cache_key = FormPublicCacheKeys.fields_for_platform(platform)
-    cached_data = CacheService.get(cache_key)
-    if cached_data is not None:
-        return cached_data
 
-    fields = get_active_fields_for_platform(platform)
-    serialized_data = PublicContactFormFieldSerializer(fields, many=True).data
-    CacheService.set(cache_key, serialized_data, FormCacheTTL.PUBLIC_FIELDS_LIST)
-    return serialized_data
+    def compute():
+        fields = get_active_fields_for_platform(platform)
+        return PublicContactFormFieldSerializer(fields, many=True).data
+
+    return get_or_compute(cache_key, compute, FormCacheTTL.PUBLIC_FIELDS_LIST)
 
 __all__ = [
     'get_public_contact_form_fields',
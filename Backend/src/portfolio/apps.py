@@ -6,6 +6,8 @@ class PortfolioConfig(AppConfig):
 
     def ready(self):
         import src.portfolio.signals
+        from src.portfolio.sync import register_sync_resources
+        register_sync_resources()
         try:
             from src.ai.destinations.registry import ContentDestinationRegistry
             from src.portfolio.services.ai_integration import save_ai_content_to_portfolio
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-03-09 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_portfolio_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='portfolio',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_portfolio_sync_keyset'),
+        ),
+    ]
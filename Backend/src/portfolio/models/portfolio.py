@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from src.core.models.base import BaseModel
 from src.portfolio.models.seo import SEOMixin
 from src.portfolio.models.category import PortfolioCategory
@@ -115,6 +116,33 @@ class Portfolio(BaseModel, SEOMixin):
         help_text="Total number of favorites"
     )
     
+    search_vector = SearchVectorField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Search Vector",
+        help_text="Weighted full-text search vector (normalized Persian text)"
+    )
+    search_title = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name="Search Title",
+        help_text="Normalized title matched by the trigram search fallback"
+    )
+    
+    SEARCH_TITLE_FIELD = 'title'
+    SEARCH_FIELDS = {
+        'title': 'A',
+        'short_description': 'B',
+        'description': 'D',
+    }
+    SEARCH_RELATED_FIELDS = {
+        'categories__name': 'B',
+        'tags__name': 'C',
+    }
+    
     objects = PortfolioQuerySet.as_manager()
 
     class Meta(BaseModel.Meta, SEOMixin.Meta):
@@ -126,6 +154,9 @@ class Portfolio(BaseModel, SEOMixin):
             models.Index(fields=['status', 'is_public', '-created_at']),
             models.Index(fields=['is_featured', 'status', '-created_at']),
             GinIndex(fields=['extra_attributes'], name='idx_portfolio_gin_extra_attrs'),
+            GinIndex(fields=['search_vector'], name='idx_portfolio_gin_fulltext'),
+            GinIndex(fields=['search_title'], name='idx_portfolio_search_title_trgm', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['updated_at', 'id'], name='idx_portfolio_sync_keyset'),
         ]
 
     def __str__(self):
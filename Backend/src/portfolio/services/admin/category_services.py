@@ -11,9 +11,12 @@ from src.portfolio.utils.cache_admin import CategoryCacheKeys, CategoryCacheMana
 from src.portfolio.utils import cache_ttl
 from src.portfolio.messages.messages import CATEGORY_ERRORS
 from src.media.models.media import ImageMedia
+from src.core.utils.tree_materializer import TreeMaterializer
 
 class PortfolioCategoryAdminService:
 
+    TREE_FIELDS = ('public_id', 'name', 'slug', 'is_active', 'is_public', 'portfolio_count')
+
     @staticmethod
     def _normalize_query_params(query_params):
         if hasattr(query_params, 'lists'):
@@ -115,36 +118,30 @@ class PortfolioCategoryAdminService:
         
         return root_categories
 
+    @staticmethod
+    def get_materialized_tree(use_cache=True):
+        queryset = PortfolioCategoryAdminService._with_portfolio_count(PortfolioCategory.objects.all())
+        return TreeMaterializer(
+            queryset,
+            fields=PortfolioCategoryAdminService.TREE_FIELDS,
+            cache_namespace=CategoryCacheKeys.tree_admin(),
+            timeout=cache_ttl.ADMIN_TAXONOMY_TREE_TTL,
+        ).get(use_cache=use_cache)
+
     @staticmethod
     def get_tree_data():
-        cache_key = CategoryCacheKeys.tree_admin()
-        tree_data = cache.get(cache_key)
-        
-        if tree_data is None:
-            def build_tree(nodes):
-                tree = []
-                for node in nodes:
-                    children = node.get_children().filter(is_active=True)
-                    tree_node = {
-                        'id': node.id,
-                        'public_id': node.public_id,
-                        'name': node.name,
-                        'slug': node.slug,
-                        'level': node.get_depth(),
-                        'portfolio_count': getattr(node, 'portfolio_count', 0),
-                        'children': build_tree(children) if children else []
-                    }
-                    tree.append(tree_node)
-                return tree
-            
-            root_nodes = PortfolioCategoryAdminService._with_portfolio_count(
-                PortfolioCategory.get_root_nodes().filter(is_active=True)
-            )
-            
-            tree_data = build_tree(root_nodes)
-            cache.set(cache_key, tree_data, cache_ttl.ADMIN_TAXONOMY_TREE_TTL)
-        
-        return tree_data
+        tree = PortfolioCategoryAdminService.get_materialized_tree()
+        return tree.nested(
+            fields={
+                'id': 'id',
+                'public_id': 'public_id',
+                'name': 'name',
+                'slug': 'slug',
+                'level': 'depth',
+                'portfolio_count': 'portfolio_count',
+            },
+            include=lambda node: node['is_active'],
+        )
 
     @staticmethod
     def create_category(validated_data, created_by=None):
@@ -265,6 +262,10 @@ class PortfolioCategoryAdminService:
     
     @staticmethod
     def get_breadcrumbs(category):
+        tree = PortfolioCategoryAdminService.get_materialized_tree()
+        if category.id in tree:
+            return tree.breadcrumbs(category.id, ('id', 'name', 'slug'))
+
         ancestors = category.get_ancestors()
         breadcrumbs = []
         
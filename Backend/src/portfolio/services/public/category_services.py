@@ -1,5 +1,5 @@
-from django.core.cache import cache
 from django.db.models import Count, Q
+from src.core.cache import get_or_compute
 from src.portfolio.models.category import PortfolioCategory
 from src.portfolio.serializers.public.category_serializer import PortfolioCategoryPublicSerializer
 from src.portfolio.utils.cache_public import PortfolioCategoryPublicCacheKeys
@@ -166,81 +166,69 @@ class PortfolioCategoryPublicService:
     @staticmethod
     def get_category_list_data(filters=None, search=None, ordering=None):
         cache_key = PortfolioCategoryPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PortfolioCategoryPublicService.get_category_queryset(filters=filters, search=search, ordering=ordering)
-        data = PortfolioCategoryPublicService._serialize_categories(queryset)
-        cache.set(cache_key, data, PortfolioCategoryPublicService.LIST_CACHE_TTL)
-        return data
+        def compute():
+            queryset = PortfolioCategoryPublicService.get_category_queryset(filters=filters, search=search, ordering=ordering)
+            return PortfolioCategoryPublicService._serialize_categories(queryset)
+
+        return get_or_compute(cache_key, compute, PortfolioCategoryPublicService.LIST_CACHE_TTL)
 
     @staticmethod
     def get_tree_data_serialized():
         cache_key = PortfolioCategoryPublicCacheKeys.tree()
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PortfolioCategoryPublicService.get_tree_data()
-        data = PortfolioCategoryPublicService._serialize_categories(queryset)
-        cache.set(cache_key, data, PortfolioCategoryPublicService.TREE_CACHE_TTL)
-        return data
+        def compute():
+            queryset = PortfolioCategoryPublicService.get_tree_data()
+            return PortfolioCategoryPublicService._serialize_categories(queryset)
+
+        return get_or_compute(cache_key, compute, PortfolioCategoryPublicService.TREE_CACHE_TTL)
 
     @staticmethod
     def get_root_categories_serialized():
         cache_key = PortfolioCategoryPublicCacheKeys.roots()
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        categories = PortfolioCategoryPublicService.get_root_categories()
-        data = PortfolioCategoryPublicService._serialize_categories(categories)
-        cache.set(cache_key, data, PortfolioCategoryPublicService.ROOTS_CACHE_TTL)
-        return data
+        def compute():
+            categories = PortfolioCategoryPublicService.get_root_categories()
+            return PortfolioCategoryPublicService._serialize_categories(categories)
+
+        return get_or_compute(cache_key, compute, PortfolioCategoryPublicService.ROOTS_CACHE_TTL)
 
     @staticmethod
     def get_category_detail_by_slug_data(slug):
         cache_key = PortfolioCategoryPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        category = PortfolioCategoryPublicService.get_category_by_slug(slug)
-        if not category:
-            return None
+        def compute():
+            category = PortfolioCategoryPublicService.get_category_by_slug(slug)
+            if not category:
+                return None
+
+            return PortfolioCategoryPublicService._serialize_category(category)
 
-        data = PortfolioCategoryPublicService._serialize_category(category)
-        cache.set(cache_key, data, PortfolioCategoryPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioCategoryPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_category_detail_by_public_id_data(public_id):
         cache_key = PortfolioCategoryPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        category = PortfolioCategoryPublicService.get_category_by_public_id(public_id)
-        if not category:
-            return None
+        def compute():
+            category = PortfolioCategoryPublicService.get_category_by_public_id(public_id)
+            if not category:
+                return None
+
+            return PortfolioCategoryPublicService._serialize_category(category)
 
-        data = PortfolioCategoryPublicService._serialize_category(category)
-        cache.set(cache_key, data, PortfolioCategoryPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioCategoryPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_category_detail_by_id_data(category_id):
         cache_key = PortfolioCategoryPublicCacheKeys.detail_id(category_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        category = PortfolioCategoryPublicService.get_category_by_id(category_id)
-        if not category:
-            return None
+        def compute():
+            category = PortfolioCategoryPublicService.get_category_by_id(category_id)
+            if not category:
+                return None
+
+            return PortfolioCategoryPublicService._serialize_category(category)
 
-        data = PortfolioCategoryPublicService._serialize_category(category)
-        cache.set(cache_key, data, PortfolioCategoryPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioCategoryPublicService.DETAIL_CACHE_TTL)
 
@@ -1,7 +1,7 @@
 from datetime import date
 
-from django.core.cache import cache
-from django.db.models import Q
+from src.core.cache import get_or_compute
+from src.core.search import FullTextSearchService
 from src.portfolio.models.portfolio import Portfolio
 from src.portfolio.serializers.public.portfolio_serializer import (
     PortfolioPublicDetailSerializer,
@@ -61,13 +61,9 @@ class PortfolioPublicService:
                 queryset = queryset.filter(created_at__date__lte=created_before)
         
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(short_description__icontains=search) |
-                Q(description__icontains=search) |
-                Q(categories__name__icontains=search) |
-                Q(tags__name__icontains=search)
-            ).distinct()
+            queryset = FullTextSearchService.search(queryset, search)
+            if not ordering:
+                return queryset.order_by('-search_rank', '-created_at')
         
         queryset = queryset.order_by(PortfolioPublicService._normalize_ordering(ordering))
         return queryset
@@ -113,84 +109,72 @@ class PortfolioPublicService:
     @staticmethod
     def get_portfolio_list_data(filters=None, search=None, ordering=None):
         cache_key = PortfolioPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PortfolioPublicService.get_portfolio_queryset(filters=filters, search=search, ordering=ordering)
-        data = list(PortfolioPublicListSerializer(queryset, many=True).data)
-        cache.set(cache_key, data, PortfolioPublicService.LIST_CACHE_TTL)
-        return data
+        def compute():
+            queryset = PortfolioPublicService.get_portfolio_queryset(filters=filters, search=search, ordering=ordering)
+            return list(PortfolioPublicListSerializer(queryset, many=True).data)
+
+        return get_or_compute(cache_key, compute, PortfolioPublicService.LIST_CACHE_TTL)
 
     @staticmethod
     def get_portfolio_detail_by_slug_data(slug):
         cache_key = PortfolioPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        portfolio = PortfolioPublicService.get_portfolio_by_slug(slug)
-        if not portfolio:
-            return None
+        def compute():
+            portfolio = PortfolioPublicService.get_portfolio_by_slug(slug)
+            if not portfolio:
+                return None
+
+            return dict(PortfolioPublicDetailSerializer(portfolio).data)
 
-        data = dict(PortfolioPublicDetailSerializer(portfolio).data)
-        cache.set(cache_key, data, PortfolioPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_portfolio_detail_by_public_id_data(public_id):
         cache_key = PortfolioPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        portfolio = PortfolioPublicService.get_portfolio_by_public_id(public_id)
-        if not portfolio:
-            return None
+        def compute():
+            portfolio = PortfolioPublicService.get_portfolio_by_public_id(public_id)
+            if not portfolio:
+                return None
+
+            return dict(PortfolioPublicDetailSerializer(portfolio).data)
 
-        data = dict(PortfolioPublicDetailSerializer(portfolio).data)
-        cache.set(cache_key, data, PortfolioPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_portfolio_detail_by_id_data(portfolio_id):
         cache_key = PortfolioPublicCacheKeys.detail_id(portfolio_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        portfolio = PortfolioPublicService.get_portfolio_by_id(portfolio_id)
-        if not portfolio:
-            return None
+        def compute():
+            portfolio = PortfolioPublicService.get_portfolio_by_id(portfolio_id)
+            if not portfolio:
+                return None
+
+            return dict(PortfolioPublicDetailSerializer(portfolio).data)
 
-        data = dict(PortfolioPublicDetailSerializer(portfolio).data)
-        cache.set(cache_key, data, PortfolioPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_featured_portfolios_data(limit=6):
         cache_key = PortfolioPublicCacheKeys.featured(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        portfolios = PortfolioPublicService.get_featured_portfolios(limit=limit)
-        data = list(PortfolioPublicListSerializer(portfolios, many=True).data)
-        cache.set(cache_key, data, PortfolioPublicService.FEATURED_CACHE_TTL)
-        return data
+        def compute():
+            portfolios = PortfolioPublicService.get_featured_portfolios(limit=limit)
+            return list(PortfolioPublicListSerializer(portfolios, many=True).data)
+
+        return get_or_compute(cache_key, compute, PortfolioPublicService.FEATURED_CACHE_TTL)
 
     @staticmethod
     def get_related_portfolios_by_slug_data(slug, limit=4):
         cache_key = PortfolioPublicCacheKeys.related(slug, limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        portfolio = PortfolioPublicService.get_portfolio_by_slug(slug)
-        if not portfolio:
-            return None
+        def compute():
+            portfolio = PortfolioPublicService.get_portfolio_by_slug(slug)
+            if not portfolio:
+                return None
+
+            related_portfolios = PortfolioPublicService.get_related_portfolios(portfolio, limit=limit)
+            return list(PortfolioPublicListSerializer(related_portfolios, many=True).data)
 
-        related_portfolios = PortfolioPublicService.get_related_portfolios(portfolio, limit=limit)
-        data = list(PortfolioPublicListSerializer(related_portfolios, many=True).data)
-        cache.set(cache_key, data, PortfolioPublicService.RELATED_CACHE_TTL)
-        return data
\ No newline at end of file
+        return get_or_compute(cache_key, compute, PortfolioPublicService.RELATED_CACHE_TTL)
\ No newline at end of file
@@ -1,5 +1,5 @@
-from django.core.cache import cache
 from django.db.models import Count, Q
+from src.core.cache import get_or_compute
 from src.portfolio.models.tag import PortfolioTag
 from src.portfolio.serializers.public.tag_serializer import PortfolioTagPublicSerializer
 from src.portfolio.utils.cache_public import PortfolioTagPublicCacheKeys
@@ -94,69 +94,59 @@ class PortfolioTagPublicService:
     @staticmethod
     def get_tag_list_data(filters=None, search=None, ordering=None):
         cache_key = PortfolioTagPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PortfolioTagPublicService.get_tag_queryset(filters=filters, search=search, ordering=ordering)
-        data = list(PortfolioTagPublicSerializer(queryset, many=True).data)
-        cache.set(cache_key, data, PortfolioTagPublicService.LIST_CACHE_TTL)
-        return data
+        def compute():
+            queryset = PortfolioTagPublicService.get_tag_queryset(filters=filters, search=search, ordering=ordering)
+            return list(PortfolioTagPublicSerializer(queryset, many=True).data)
+
+        return get_or_compute(cache_key, compute, PortfolioTagPublicService.LIST_CACHE_TTL)
 
     @staticmethod
     def get_tag_detail_by_slug_data(slug):
         cache_key = PortfolioTagPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = PortfolioTagPublicService.get_tag_by_slug(slug)
-        if not tag:
-            return None
+        def compute():
+            tag = PortfolioTagPublicService.get_tag_by_slug(slug)
+            if not tag:
+                return None
+
+            return dict(PortfolioTagPublicSerializer(tag).data)
 
-        data = dict(PortfolioTagPublicSerializer(tag).data)
-        cache.set(cache_key, data, PortfolioTagPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioTagPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_tag_detail_by_public_id_data(public_id):
         cache_key = PortfolioTagPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = PortfolioTagPublicService.get_tag_by_public_id(public_id)
-        if not tag:
-            return None
+        def compute():
+            tag = PortfolioTagPublicService.get_tag_by_public_id(public_id)
+            if not tag:
+                return None
+
+            return dict(PortfolioTagPublicSerializer(tag).data)
 
-        data = dict(PortfolioTagPublicSerializer(tag).data)
-        cache.set(cache_key, data, PortfolioTagPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioTagPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_tag_detail_by_id_data(tag_id):
         cache_key = PortfolioTagPublicCacheKeys.detail_id(tag_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = PortfolioTagPublicService.get_tag_by_id(tag_id)
-        if not tag:
-            return None
+        def compute():
+            tag = PortfolioTagPublicService.get_tag_by_id(tag_id)
+            if not tag:
+                return None
+
+            return dict(PortfolioTagPublicSerializer(tag).data)
 
-        data = dict(PortfolioTagPublicSerializer(tag).data)
-        cache.set(cache_key, data, PortfolioTagPublicService.DETAIL_CACHE_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PortfolioTagPublicService.DETAIL_CACHE_TTL)
 
     @staticmethod
     def get_popular_tags_data(limit=10):
         cache_key = PortfolioTagPublicCacheKeys.popular(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        tags = PortfolioTagPublicService.get_popular_tags(limit=limit)
-        data = list(PortfolioTagPublicSerializer(tags, many=True).data)
-        cache.set(cache_key, data, PortfolioTagPublicService.POPULAR_CACHE_TTL)
-        return data
+
+        def compute():
+            tags = PortfolioTagPublicService.get_popular_tags(limit=limit)
+            return list(PortfolioTagPublicSerializer(tags, many=True).data)
+
+        return get_or_compute(cache_key, compute, PortfolioTagPublicService.POPULAR_CACHE_TTL)
 
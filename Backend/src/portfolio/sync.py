@@ -0,0 +1,37 @@
+from src.core.sync import SyncRegistry
+from src.portfolio.models.category import PortfolioCategory
+from src.portfolio.models.option import PortfolioOption
+from src.portfolio.models.portfolio import Portfolio
+from src.portfolio.models.tag import PortfolioTag
+from src.portfolio.serializers.public.category_serializer import PortfolioCategoryPublicSerializer
+from src.portfolio.serializers.public.option_serializer import PortfolioOptionPublicSerializer
+from src.portfolio.serializers.public.portfolio_serializer import PortfolioPublicListSerializer
+from src.portfolio.serializers.public.tag_serializer import PortfolioTagPublicSerializer
+
+def register_sync_resources():
+    SyncRegistry.register(
+        'portfolios',
+        Portfolio,
+        visible=lambda: Portfolio.objects.active().published(),
+        serialize=lambda queryset: list(PortfolioPublicListSerializer(queryset.for_public_listing(), many=True).data),
+    )
+    SyncRegistry.register(
+        'portfolio-categories',
+        PortfolioCategory,
+        visible=lambda: PortfolioCategory.objects.filter(is_active=True, is_public=True),
+        serialize=lambda queryset: list(
+            PortfolioCategoryPublicSerializer(queryset.with_counts().select_related('image'), many=True).data
+        ),
+    )
+    SyncRegistry.register(
+        'portfolio-tags',
+        PortfolioTag,
+        visible=lambda: PortfolioTag.objects.filter(is_active=True, is_public=True),
+        serialize=lambda queryset: list(PortfolioTagPublicSerializer(queryset.with_counts(), many=True).data),
+    )
+    SyncRegistry.register(
+        'portfolio-options',
+        PortfolioOption,
+        visible=lambda: PortfolioOption.objects.filter(is_active=True, is_public=True),
+        serialize=lambda queryset: list(PortfolioOptionPublicSerializer(queryset.with_portfolio_counts(), many=True).data),
+    )
@@ -61,6 +61,12 @@ class PortfolioCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewS
         else:
             return PortfolioCategoryAdminDetailSerializer
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in ('list', 'retrieve', 'children'):
+            context['category_tree'] = PortfolioCategoryAdminService.get_materialized_tree()
+        return context
+
     def list(self, request, *args, **kwargs):
         tree_mode = request.GET.get('tree', '').lower() == 'true'
         if tree_mode:
@@ -83,7 +89,7 @@ class PortfolioCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewS
         
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = PortfolioCategoryAdminListSerializer(page, many=True)
+            serializer = PortfolioCategoryAdminListSerializer(page, many=True, context=self.get_serializer_context())
             response = self.get_paginated_response(serializer.data)
             PortfolioCategoryAdminService.set_cached_list_payload(
                 user_id=user_id,
@@ -92,7 +98,7 @@ class PortfolioCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewS
             )
             return response
         
-        serializer = PortfolioCategoryAdminListSerializer(queryset, many=True)
+        serializer = PortfolioCategoryAdminListSerializer(queryset, many=True, context=self.get_serializer_context())
         response = APIResponse.success(
             message=CATEGORY_SUCCESS["category_list_success"],
             data=serializer.data,
@@ -246,7 +252,7 @@ class PortfolioCategoryAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewS
             )
         
         children = category.get_children().filter(is_active=True)
-        serializer = PortfolioCategoryAdminListSerializer(children, many=True)
+        serializer = PortfolioCategoryAdminListSerializer(children, many=True, context=self.get_serializer_context())
         
         return APIResponse.success(
             message=CATEGORY_SUCCESS["category_list_success"],
@@ -39,6 +39,7 @@ from src.core.utils.validation_helpers import extract_validation_message, normal
 
 class PortfolioAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
     permission_classes = [portfolio_permission]
+    query_budget = {'list': 12, 'retrieve': 16}
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = PortfolioAdminFilter
     search_fields = ['title', 'short_description', 'meta_title', 'meta_description']
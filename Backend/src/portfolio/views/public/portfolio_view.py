@@ -13,6 +13,7 @@ from src.portfolio.serializers.public.portfolio_serializer import (
 
 class PortfolioPublicViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [AllowAny]
+    query_budget = {'list': 8, 'retrieve': 12}
     lookup_field = 'slug'
     pagination_class = StandardLimitPagination
 
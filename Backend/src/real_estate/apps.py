@@ -6,6 +6,8 @@ class RealEstateConfig(AppConfig):
 
     def ready(self):
         import src.real_estate.signals  # noqa
+        from src.real_estate.sync import register_sync_resources
+        register_sync_resources()
         try:
             from src.ai.destinations.registry import ContentDestinationRegistry
             from src.real_estate.services.ai_integration import save_ai_content_to_real_estate
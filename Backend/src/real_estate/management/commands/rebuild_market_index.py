@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from src.real_estate.services.analytics.market_index_service import MarketPriceIndexService
+
+class Command(BaseCommand):
+    help = "Rebuild the market price index (price per sqm and rent aggregates) for the last N months."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months', type=int, default=24, help='Number of monthly periods to rebuild')
+
+    def handle(self, *args, **options):
+        buckets = MarketPriceIndexService.rebuild(months=options['months'])
+        self.stdout.write(self.style.SUCCESS(f"Market price index rebuilt: {buckets} bucket(s)."))
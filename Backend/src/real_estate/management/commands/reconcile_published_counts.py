@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.core.management.base import BaseCommand
+
+from src.real_estate.services.admin.property_counter_service import PropertyCounterService
+
+class Command(BaseCommand):
+    help = "Recompute published_property_count on taxonomy, agency and agent rows and fix any drift."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drift = PropertyCounterService.reconcile()
+
+        for model_name, fixed in drift.items():
+            style = self.style.WARNING if fixed else self.style.SUCCESS
+            self.stdout.write(style(f"{model_name}: {fixed} row(s) corrected"))
+
+        self.stdout.write(self.style.SUCCESS(f"Reconciliation completed. Total corrected: {sum(drift.values())}"))
@@ -21,6 +21,12 @@ PROPERTY_SUCCESS = {
     "property_geo_results_retrieved": "نتایج جستجوی مکانی با موفقیت دریافت شد.",
     "property_map_data_retrieved": "داده‌های نقشه با موفقیت دریافت شد.",
     "property_geo_engine_status_retrieved": "وضعیت موتور جستجوی مکانی با موفقیت دریافت شد.",
+    "property_import_started": "درون‌ریزی املاک در صف پردازش قرار گرفت.",
+    "property_import_status_retrieved": "وضعیت درون‌ریزی املاک با موفقیت دریافت شد.",
+    "property_import_retry_started": "ادامه درون‌ریزی املاک در صف پردازش قرار گرفت.",
+    "property_market_index_retrieved": "شاخص قیمت بازار با موفقیت دریافت شد.",
+    "property_inquiry_received": "درخواست شما ثبت شد و به‌زودی با شما تماس گرفته می‌شود.",
+    "property_favorite_recorded": "علاقه‌مندی با موفقیت ثبت شد.",
 }
 
 PROPERTY_ERRORS = {
@@ -78,6 +84,16 @@ PROPERTY_ERRORS = {
     "rent_requires_mortgage_and_rent": "برای حالت «رهن و اجاره» باید هم مبلغ رهن و هم مبلغ اجاره وارد شود.",
     "mortgage_requires_deposit": "برای حالت «رهن کامل» وارد کردن مبلغ رهن الزامی است.",
     "mortgage_disallow_rent_amount": "برای حالت «رهن کامل» مبلغ اجاره باید خالی یا صفر باشد.",
+    "property_import_file_required": "فایل درون‌ریزی الزامی است.",
+    "property_import_invalid_format": "فرمت فایل درون‌ریزی نامعتبر است. فرمت‌های مجاز: CSV و XLSX",
+    "property_import_xlsx_unavailable": "پشتیبانی از فایل XLSX روی سرور فعال نیست.",
+    "property_import_job_not_found": "عملیات درون‌ریزی یافت نشد.",
+    "property_import_failed": "درون‌ریزی املاک ناموفق بود.",
+    "property_import_not_retryable": "این عملیات درون‌ریزی در حال اجرا یا تکمیل شده است و قابل تکرار نیست.",
+    "property_import_lookup_not_found": "مقدار «{value}» برای فیلد {field} یافت نشد.",
+    "property_map_tile_invalid": "مختصات تایل نقشه نامعتبر است.",
+    "property_map_tile_failed": "دریافت تایل نقشه ناموفق بود.",
+    "property_market_index_province_required": "انتخاب استان برای شاخص قیمت بازار الزامی است.",
 }
 
 AGENT_DEFAULTS = {
@@ -124,6 +140,7 @@ AGENT_SUCCESS = {
 }
 
 AGENT_ERRORS = {
+    "coordinates_required": "مختصات جغرافیایی معتبر الزامی است.",
     "agent_not_found": "مشاور یافت نشد.",
     "agent_not_authorized": "شما اجازه دسترسی به مشاورین را ندارید.",
     "agent_create_failed": "ایجاد مشاور ناموفق بود.",
@@ -152,6 +169,7 @@ AGENCY_SUCCESS = {
 }
 
 AGENCY_ERRORS = {
+    "coordinates_required": "مختصات جغرافیایی معتبر الزامی است.",
     "agency_not_found": "آژانس یافت نشد.",
     "agency_not_authorized": "شما اجازه دسترسی به آژانس‌ها را ندارید.",
     "agency_create_failed": "ایجاد آژانس ناموفق بود.",
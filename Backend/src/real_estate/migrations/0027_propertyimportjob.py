@@ -0,0 +1,47 @@
+# Generated by Django 6.0.2 on 2026-03-02 10:12
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0026_alter_listingtype_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyImportJob',
+            fields=[
+                ('id', models.AutoField(editable=False, help_text='Primary key identifier', primary_key=True, serialize=False, verbose_name='ID')),
+                ('public_id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, help_text='Unique identifier for public-facing operations', unique=True, verbose_name='Public ID')),
+                ('is_active', models.BooleanField(db_index=True, default=True, help_text='Designates whether this record should be treated as active', verbose_name='Active Status')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False, help_text='Date and time when the record was created', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Date and time when the record was last updated', verbose_name='Updated At')),
+                ('file', models.FileField(help_text='Uploaded CSV/XLSX file', upload_to='real_estate/imports/%Y/%m/', verbose_name='Source File')),
+                ('file_name', models.CharField(blank=True, max_length=255, verbose_name='Original File Name')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], db_index=True, default='pending', max_length=20, verbose_name='Status')),
+                ('options', models.JSONField(blank=True, default=dict, help_text='Import options (defaults applied to every row)', verbose_name='Options')),
+                ('total_rows', models.IntegerField(default=0, verbose_name='Total Rows')),
+                ('processed_rows', models.IntegerField(default=0, verbose_name='Processed Rows')),
+                ('created_count', models.IntegerField(default=0, verbose_name='Created')),
+                ('failed_count', models.IntegerField(default=0, verbose_name='Failed')),
+                ('errors', models.JSONField(blank=True, default=list, help_text='Row-level validation errors (capped)', verbose_name='Errors')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+                ('created_by', models.ForeignKey(blank=True, help_text='User who created this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+            ],
+            options={
+                'verbose_name': 'Property Import Job',
+                'verbose_name_plural': 'Property Import Jobs',
+                'db_table': 'real_estate_property_import_jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', '-created_at'], name='idx_prop_import_status')],
+            },
+        ),
+    ]
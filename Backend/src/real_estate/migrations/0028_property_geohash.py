@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-03-04 09:41
+
+from django.db import migrations, models
+
+
+def backfill_geohash(apps, schema_editor):
+    from src.real_estate.utils.geohash import encode
+
+    Property = apps.get_model('real_estate', 'Property')
+    queryset = Property.objects.filter(latitude__isnull=False, longitude__isnull=False).only('id', 'latitude', 'longitude')
+
+    batch = []
+    for prop in queryset.iterator(chunk_size=2000):
+        prop.geohash = encode(float(prop.latitude), float(prop.longitude))
+        batch.append(prop)
+        if len(batch) >= 2000:
+            Property.objects.bulk_update(batch, ['geohash'])
+            batch = []
+    if batch:
+        Property.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0027_propertyimportjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='geohash',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Geohash of the coordinates, used for prefix-indexed geo search', max_length=12, verbose_name='Geohash'),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('geohash', ''), _negated=True), fields=['geohash'], name='idx_geohash_prefix', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
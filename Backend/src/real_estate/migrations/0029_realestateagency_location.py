@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-03-05 11:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0028_property_geohash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='realestateagency',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=8, help_text='Geographic latitude of the agency office', max_digits=10, null=True, verbose_name='Latitude'),
+        ),
+        migrations.AddField(
+            model_name='realestateagency',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=8, help_text='Geographic longitude of the agency office', max_digits=11, null=True, verbose_name='Longitude'),
+        ),
+        migrations.AddField(
+            model_name='realestateagency',
+            name='geohash',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Geohash of the coordinates, used for prefix-indexed geo search', max_length=12, verbose_name='Geohash'),
+        ),
+        migrations.AddIndex(
+            model_name='realestateagency',
+            index=models.Index(condition=models.Q(('geohash', ''), _negated=True), fields=['geohash'], name='idx_agency_geohash_prefix', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 6.0.2 on 2026-03-06 10:15
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+COUNTED_RELATIONS = (
+    ('PropertyType', 'property_type'),
+    ('ListingType', 'state'),
+    ('PropertyTag', 'tags'),
+    ('PropertyLabel', 'labels'),
+    ('PropertyFeature', 'features'),
+    ('RealEstateAgency', 'agency'),
+    ('PropertyAgent', 'agent'),
+)
+
+
+def backfill_published_property_count(apps, schema_editor):
+    Property = apps.get_model('real_estate', 'Property')
+
+    for model_name, relation in COUNTED_RELATIONS:
+        model = apps.get_model('real_estate', model_name)
+        counts = Property.objects.filter(
+            **{relation: OuterRef('pk')},
+            is_active=True,
+            is_public=True,
+            is_published=True,
+        ).order_by().values(relation).annotate(total=Count('pk', distinct=True)).values('total')
+        model.objects.update(published_property_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0029_realestateagency_location'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertytype',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.AddField(
+            model_name='listingtype',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.AddField(
+            model_name='propertytag',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.AddField(
+            model_name='propertylabel',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.AddField(
+            model_name='propertyfeature',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.AddField(
+            model_name='realestateagency',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.AddField(
+            model_name='propertyagent',
+            name='published_property_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of active, public and published properties', verbose_name='Published Properties'),
+        ),
+        migrations.RunPython(backfill_published_property_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='propertytype',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_type_published_count'),
+        ),
+        migrations.AddIndex(
+            model_name='listingtype',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_listing_type_published_count'),
+        ),
+        migrations.AddIndex(
+            model_name='propertytag',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_tag_published_count'),
+        ),
+        migrations.AddIndex(
+            model_name='propertylabel',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_label_published_count'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyfeature',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_feature_published_count'),
+        ),
+        migrations.AddIndex(
+            model_name='realestateagency',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_agency_published_count'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyagent',
+            index=models.Index(fields=['is_active', '-published_property_count'], name='idx_agent_published_count'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0.2 on 2026-03-07 09:20
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('real_estate', '0030_published_property_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarketPriceIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField(db_index=True)),
+                ('listing_count', models.PositiveIntegerField(default=0)),
+                ('price_per_sqm_count', models.PositiveIntegerField(default=0)),
+                ('price_per_sqm_avg', models.BigIntegerField(blank=True, null=True)),
+                ('price_per_sqm_p25', models.BigIntegerField(blank=True, null=True)),
+                ('price_per_sqm_median', models.BigIntegerField(blank=True, null=True)),
+                ('price_per_sqm_p75', models.BigIntegerField(blank=True, null=True)),
+                ('price_per_sqm_p90', models.BigIntegerField(blank=True, null=True)),
+                ('rent_count', models.PositiveIntegerField(default=0)),
+                ('rent_avg', models.BigIntegerField(blank=True, null=True)),
+                ('rent_p25', models.BigIntegerField(blank=True, null=True)),
+                ('rent_median', models.BigIntegerField(blank=True, null=True)),
+                ('rent_p75', models.BigIntegerField(blank=True, null=True)),
+                ('rent_p90', models.BigIntegerField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('city', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='market_price_index', to='core.city')),
+                ('property_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='market_price_index', to='real_estate.propertytype')),
+                ('province', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='market_price_index', to='core.province')),
+                ('region', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='market_price_index', to='real_estate.cityregion')),
+                ('state', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='market_price_index', to='real_estate.listingtype')),
+            ],
+            options={
+                'db_table': 'real_estate_market_price_index',
+                'ordering': ['-period'],
+                'indexes': [django.contrib.postgres.indexes.BrinIndex(fields=['period'], name='idx_market_index_period_brin')],
+                'constraints': [models.UniqueConstraint(fields=('province', 'city', 'region', 'property_type', 'state', 'period'), name='uq_market_price_index_bucket', nulls_distinct=False)],
+            },
+        ),
+    ]
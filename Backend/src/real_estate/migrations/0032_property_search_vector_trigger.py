@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-03-08 11:40
+
+from django.db import migrations
+
+
+CREATE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION real_estate_properties_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.address, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS real_estate_properties_search_vector_trigger ON real_estate_properties;
+CREATE TRIGGER real_estate_properties_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, address, search_vector
+    ON real_estate_properties
+    FOR EACH ROW EXECUTE FUNCTION real_estate_properties_search_vector_update();
+
+UPDATE real_estate_properties SET title = title WHERE search_vector IS NULL;
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS real_estate_properties_search_vector_trigger ON real_estate_properties;
+DROP FUNCTION IF EXISTS real_estate_properties_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0031_marketpriceindex'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
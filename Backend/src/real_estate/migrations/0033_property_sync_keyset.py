@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-03-09 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0032_property_search_vector_trigger'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_property_sync_keyset'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.2 on 2026-03-10 09:30
+
+from django.db import migrations, models
+from django.db.models import Count, DurationField, ExpressionWrapper, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, Extract
+
+
+def backfill_engagement_counters(apps, schema_editor):
+    Property = apps.get_model('real_estate', 'Property')
+    PropertyInquiry = apps.get_model('real_estate', 'PropertyInquiry')
+
+    for model_name, relation in (('PropertyAgent', 'agent'), ('RealEstateAgency', 'agency')):
+        model = apps.get_model('real_estate', model_name)
+        inquiries = PropertyInquiry.objects.filter(
+            **{f'property__{relation}': OuterRef('pk')},
+        ).order_by().values(f'property__{relation}').annotate(total=Count('pk')).values('total')
+        closed = Property.objects.filter(
+            **{relation: OuterRef('pk')},
+            closed_at__isnull=False,
+        ).order_by().values(relation)
+        closed_count = closed.annotate(total=Count('pk')).values('total')
+        closed_days = closed.filter(published_at__isnull=False).annotate(
+            total=Sum(Extract(ExpressionWrapper(F('closed_at') - F('published_at'), output_field=DurationField()), 'day')),
+        ).values('total')
+        model.objects.update(
+            inquiry_count=Coalesce(Subquery(inquiries), 0),
+            closed_deal_count=Coalesce(Subquery(closed_count), 0),
+            total_deal_days=Coalesce(Subquery(closed_days), 0),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0033_property_sync_keyset'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyagent',
+            name='inquiry_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of inquiries received on assigned properties', verbose_name='Inquiries'),
+        ),
+        migrations.AddField(
+            model_name='propertyagent',
+            name='closed_deal_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of sold or rented properties', verbose_name='Closed Deals'),
+        ),
+        migrations.AddField(
+            model_name='propertyagent',
+            name='total_deal_days',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Sum of days from publishing to closing over closed deals', verbose_name='Total Deal Days'),
+        ),
+        migrations.AddField(
+            model_name='realestateagency',
+            name='inquiry_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of inquiries received on assigned properties', verbose_name='Inquiries'),
+        ),
+        migrations.AddField(
+            model_name='realestateagency',
+            name='closed_deal_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained count of sold or rented properties', verbose_name='Closed Deals'),
+        ),
+        migrations.AddField(
+            model_name='realestateagency',
+            name='total_deal_days',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Sum of days from publishing to closing over closed deals', verbose_name='Total Deal Days'),
+        ),
+        migrations.RunPython(backfill_engagement_counters, migrations.RunPython.noop),
+    ]
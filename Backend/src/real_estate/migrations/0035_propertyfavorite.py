@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('real_estate', '0034_engagement_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyFavorite',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='favorites', to='real_estate.property', verbose_name='Property')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='property_favorites', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Property Favorite',
+                'verbose_name_plural': 'Property Favorites',
+                'db_table': 'real_estate_property_favorites',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['property'], name='idx_property_favorite_property')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'property'), name='uq_property_favorite_user_property')],
+            },
+        ),
+    ]
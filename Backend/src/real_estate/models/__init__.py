@@ -13,7 +13,17 @@ from .agent_social_media import PropertyAgentSocialMedia
 from .agency_social_media import RealEstateAgencySocialMedia
 from .property import Property
 from .media import PropertyImage, PropertyVideo, PropertyAudio, PropertyDocument
-from .statistics import PropertyStatistics, AgentStatistics, AgencyStatistics, PropertyViewLog, PropertyInquiry
+from .statistics import (
+    PropertyStatistics,
+    AgentStatistics,
+    AgencyStatistics,
+    PropertyViewLog,
+    PropertyInquiry,
+    PropertyFavorite,
+    RegionalStatistics,
+    MarketPriceIndex,
+)
+from .import_job import PropertyImportJob
 
 __all__ = [
     'Country',
@@ -41,4 +51,8 @@ __all__ = [
     'AgencyStatistics',
     'PropertyViewLog',
     'PropertyInquiry',
+    'PropertyFavorite',
+    'RegionalStatistics',
+    'MarketPriceIndex',
+    'PropertyImportJob',
 ]
@@ -81,6 +81,30 @@ class RealEstateAgency(BaseModel, SEOMixin):
         verbose_name="Address",
         help_text="Full address of the agency"
     )
+    latitude = models.DecimalField(
+        max_digits=10,
+        decimal_places=8,
+        null=True,
+        blank=True,
+        verbose_name="Latitude",
+        help_text="Geographic latitude of the agency office"
+    )
+    longitude = models.DecimalField(
+        max_digits=11,
+        decimal_places=8,
+        null=True,
+        blank=True,
+        verbose_name="Longitude",
+        help_text="Geographic longitude of the agency office"
+    )
+    geohash = models.CharField(
+        max_length=12,
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name="Geohash",
+        help_text="Geohash of the coordinates, used for prefix-indexed geo search"
+    )
     
     profile_picture = models.ForeignKey(
         'media.ImageMedia',
@@ -113,6 +137,32 @@ class RealEstateAgency(BaseModel, SEOMixin):
         help_text="Agency description"
     )
     
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
+    inquiry_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Inquiries",
+        help_text="Maintained count of inquiries received on assigned properties"
+    )
+    closed_deal_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Closed Deals",
+        help_text="Maintained count of sold or rented properties"
+    )
+    total_deal_days = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Total Deal Days",
+        help_text="Sum of days from publishing to closing over closed deals"
+    )
+    
     objects = RealEstateAgencyQuerySet.as_manager()
     
     class Meta(BaseModel.Meta, SEOMixin.Meta):
@@ -127,6 +177,13 @@ class RealEstateAgency(BaseModel, SEOMixin):
             models.Index(fields=['license_number']),
             models.Index(fields=['slug']),
             models.Index(fields=['-rating', '-total_reviews']),
+            models.Index(
+                fields=['geohash'],
+                opclasses=['varchar_pattern_ops'],
+                condition=~models.Q(geohash=''),
+                name='idx_agency_geohash_prefix'
+            ),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_agency_published_count'),
         ]
         constraints = [
             models.CheckConstraint(
@@ -144,3 +201,11 @@ class RealEstateAgency(BaseModel, SEOMixin):
     
     def get_public_url(self):
         return f"/agency/{self.slug}/"
+
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            from src.real_estate.utils.geohash import encode
+            self.geohash = encode(float(self.latitude), float(self.longitude))
+        else:
+            self.geohash = ''
+        super().save(*args, **kwargs)
@@ -111,6 +111,32 @@ class PropertyAgent(BaseModel, SEOMixin):
         help_text="Agent biography"
     )
     
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
+    inquiry_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Inquiries",
+        help_text="Maintained count of inquiries received on assigned properties"
+    )
+    closed_deal_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Closed Deals",
+        help_text="Maintained count of sold or rented properties"
+    )
+    total_deal_days = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Total Deal Days",
+        help_text="Sum of days from publishing to closing over closed deals"
+    )
+    
     objects = PropertyAgentQuerySet.as_manager()
     
     class Meta(BaseModel.Meta, SEOMixin.Meta):
@@ -126,6 +152,7 @@ class PropertyAgent(BaseModel, SEOMixin):
             models.Index(fields=['license_number']),
             models.Index(fields=['slug']),
             models.Index(fields=['-rating', '-total_sales']),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_agent_published_count'),
         ]
         constraints = [
             models.CheckConstraint(
@@ -49,6 +49,13 @@ class PropertyFeature(BaseModel):
         help_text="Feature image or icon (SVG/PNG recommended)"
     )
     
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
     objects = PropertyFeatureQuerySet.as_manager()
     
     class Meta(BaseModel.Meta):
@@ -67,6 +74,7 @@ class PropertyFeature(BaseModel):
             models.Index(fields=['is_active', 'group', 'title']),
             models.Index(fields=['slug']),
             models.Index(fields=['parent']),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_feature_published_count'),
         ]
     
     def __str__(self):
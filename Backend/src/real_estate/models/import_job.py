@@ -0,0 +1,80 @@
+from django.db import models
+from django.utils import timezone
+
+from src.core.models import BaseModel
+
+IMPORT_JOB_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('running', 'Running'),
+    ('completed', 'Completed'),
+    ('failed', 'Failed'),
+]
+
+class PropertyImportJob(BaseModel):
+
+    MAX_STORED_ERRORS = 500
+
+    file = models.FileField(
+        upload_to='real_estate/imports/%Y/%m/',
+        verbose_name="Source File",
+        help_text="Uploaded CSV/XLSX file"
+    )
+    file_name = models.CharField(max_length=255, blank=True, verbose_name="Original File Name")
+    status = models.CharField(
+        max_length=20,
+        choices=IMPORT_JOB_STATUS_CHOICES,
+        default='pending',
+        db_index=True,
+        verbose_name="Status"
+    )
+    options = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Options",
+        help_text="Import options (defaults applied to every row)"
+    )
+    total_rows = models.IntegerField(default=0, verbose_name="Total Rows")
+    processed_rows = models.IntegerField(default=0, verbose_name="Processed Rows")
+    created_count = models.IntegerField(default=0, verbose_name="Created")
+    failed_count = models.IntegerField(default=0, verbose_name="Failed")
+    errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Errors",
+        help_text="Row-level validation errors (capped)"
+    )
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="Started At")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Finished At")
+
+    class Meta:
+        db_table = 'real_estate_property_import_jobs'
+        verbose_name = 'Property Import Job'
+        verbose_name_plural = 'Property Import Jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='idx_prop_import_status'),
+        ]
+
+    def __str__(self):
+        return f"{self.file_name or self.file.name} ({self.status})"
+
+    @property
+    def progress(self) -> float:
+        if not self.total_rows:
+            return 0.0
+        return round(self.processed_rows / self.total_rows * 100, 2)
+
+    def mark_running(self, total_rows: int):
+        self.status = 'running'
+        self.total_rows = total_rows
+        self.started_at = timezone.now()
+        self.save(update_fields=['status', 'total_rows', 'started_at', 'updated_at'])
+
+    def mark_finished(self, status: str = 'completed', error: str = None):
+        self.status = status
+        self.finished_at = timezone.now()
+        update_fields = ['status', 'finished_at', 'updated_at']
+        if error:
+            self.errors = (self.errors or [])[:self.MAX_STORED_ERRORS - 1] + [{'row': None, 'errors': {'file': [error]}}]
+            update_fields.append('errors')
+        self.save(update_fields=update_fields)
@@ -21,6 +21,13 @@ class PropertyLabel(BaseModel):
         help_text="URL-friendly identifier for the property label"
     )
     
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
     objects = PropertyLabelQuerySet.as_manager()
     
     class Meta(BaseModel.Meta):
@@ -38,6 +45,7 @@ class PropertyLabel(BaseModel):
         indexes = [
             models.Index(fields=['is_active', 'title']),
             models.Index(fields=['slug']),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_label_published_count'),
         ]
     
     def __str__(self):
@@ -48,6 +48,13 @@ class ListingType(BaseModel):
         help_text="Main image for this listing type",
     )
 
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
     objects = ListingTypeQuerySet.as_manager()
 
     class Meta(BaseModel.Meta):
@@ -58,6 +65,7 @@ class ListingType(BaseModel):
         indexes = [
             models.Index(fields=['is_active', 'title']),
             models.Index(fields=['slug']),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_listing_type_published_count'),
         ]
 
     def __str__(self):
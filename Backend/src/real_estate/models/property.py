@@ -2,7 +2,7 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.contrib.postgres.indexes import GinIndex, BrinIndex
-from django.contrib.postgres.search import SearchVectorField, SearchVector
+from django.contrib.postgres.search import SearchVectorField
 from django.db.models import Q
 from src.core.models import BaseModel, Province, City
 from src.real_estate.models.seo import SEOMixin
@@ -78,6 +78,14 @@ class Property(BaseModel, SEOMixin):
         verbose_name="Longitude",
         help_text="Geographic longitude for map display"
     )
+    geohash = models.CharField(
+        max_length=12,
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name="Geohash",
+        help_text="Geohash of the coordinates, used for prefix-indexed geo search"
+    )
 
     price = models.BigIntegerField(null=True, blank=True)
     sale_price = models.BigIntegerField(null=True, blank=True)
@@ -570,6 +578,12 @@ class Property(BaseModel, SEOMixin):
                 condition=models.Q(latitude__isnull=False, longitude__isnull=False),
                 name='idx_map_search'
             ),
+            models.Index(
+                fields=['geohash'],
+                opclasses=['varchar_pattern_ops'],
+                condition=~models.Q(geohash=''),
+                name='idx_geohash_prefix'
+            ),
             
             GinIndex(
                 fields=['search_vector'],
@@ -591,6 +605,7 @@ class Property(BaseModel, SEOMixin):
                 pages_per_range=128,
                 name='idx_brin_published'
             ),
+            models.Index(fields=['updated_at', 'id'], name='idx_property_sync_keyset'),
         ]
         constraints = [
             models.CheckConstraint(
@@ -812,7 +827,13 @@ class Property(BaseModel, SEOMixin):
                     'year_built': f'Year built cannot be greater than {year_max} (current year + {self.YEAR_BUFFER}).'
                 })
     
-    def save(self, *args, **kwargs):
+    def compute_geohash(self) -> str:
+        if self.latitude is None or self.longitude is None:
+            return ''
+        from src.real_estate.utils.geohash import encode
+        return encode(float(self.latitude), float(self.longitude))
+
+    def fill_seo_defaults(self):
         if not self.meta_title and self.title:
             self.meta_title = self.title[:70]
         
@@ -828,6 +849,36 @@ class Property(BaseModel, SEOMixin):
         if not self.og_description and self.meta_description:
             self.og_description = self.meta_description
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def _unchanged_validated_fields(self) -> set:
+        loaded = getattr(self, '_loaded_values', None)
+        if not loaded or self._state.adding:
+            return set()
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            if (field.is_relation or field.unique)
+            and not field.primary_key
+            and field.attname in loaded
+            and self.__dict__.get(field.attname) == loaded[field.attname]
+        }
+
+    def full_clean(self, exclude=None, validate_unique=True, validate_constraints=True):
+        exclude = set(exclude or ()) | self._unchanged_validated_fields()
+        super().full_clean(
+            exclude=exclude,
+            validate_unique=validate_unique,
+            validate_constraints=validate_constraints,
+        )
+
+    def save(self, *args, **kwargs):
+        self.fill_seo_defaults()
+
         if self.built_area and self.built_area > 0:
             if self.price:
                 self.price_per_sqm = int(self.price / float(self.built_area))
@@ -837,7 +888,12 @@ class Property(BaseModel, SEOMixin):
                 self.price_per_sqm = int(self.pre_sale_price / float(self.built_area))
 
         if self.city_id and not self.province_id:
-            self.province = self.city.province
+            if self._meta.get_field('city').is_cached(self):
+                self.province_id = self.city.province_id
+            else:
+                self.province_id = City.objects.filter(pk=self.city_id).values_list('province_id', flat=True).first()
+
+        self.geohash = self.compute_geohash()
         
         if self.is_published and not self.published_at:
             from django.utils import timezone
@@ -845,13 +901,11 @@ class Property(BaseModel, SEOMixin):
 
         super().save(*args, **kwargs)
 
-        Property.objects.filter(pk=self.pk).update(
-            search_vector=(
-                SearchVector('title', weight='A', config='english') +
-                SearchVector('description', weight='B', config='english') +
-                SearchVector('address', weight='C', config='english')
-            )
-        )
+        self._loaded_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
 
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
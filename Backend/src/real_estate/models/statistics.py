@@ -392,6 +392,40 @@ class PropertyInquiry(models.Model):
     def __str__(self):
         return f"{self.property.title} - {self.name} - {self.created_at}"
 
+class PropertyFavorite(models.Model):
+    
+    property = models.ForeignKey(
+        'real_estate.Property',
+        on_delete=models.CASCADE,
+        related_name='favorites',
+        verbose_name="Property"
+    )
+    user = models.ForeignKey(
+        'user.User',
+        on_delete=models.CASCADE,
+        related_name='property_favorites',
+        verbose_name="User"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Created At"
+    )
+    
+    class Meta:
+        db_table = 'real_estate_property_favorites'
+        verbose_name = 'Property Favorite'
+        verbose_name_plural = 'Property Favorites'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'property'], name='uq_property_favorite_user_property'),
+        ]
+        indexes = [
+            models.Index(fields=['property'], name='idx_property_favorite_property'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.property_id}"
+
 class PropertyTypeStatistics(models.Model):
     
     property_type = models.ForeignKey(
@@ -473,3 +507,48 @@ class RegionalStatistics(models.Model):
         if self.region:
             location += f" (Region {self.region.code})"
         return f"{location} - {self.date}"
+
+class MarketPriceIndex(models.Model):
+    
+    province = models.ForeignKey('core.Province', on_delete=models.CASCADE, related_name='market_price_index')
+    city = models.ForeignKey('core.City', on_delete=models.CASCADE, null=True, blank=True, related_name='market_price_index') # null = همه شهرهای استان
+    region = models.ForeignKey('real_estate.CityRegion', on_delete=models.CASCADE, null=True, blank=True, related_name='market_price_index') # null = همه مناطق شهر
+    property_type = models.ForeignKey('real_estate.PropertyType', on_delete=models.CASCADE, null=True, blank=True, related_name='market_price_index') # null = همه انواع
+    state = models.ForeignKey('real_estate.ListingType', on_delete=models.CASCADE, null=True, blank=True, related_name='market_price_index') # null = همه وضعیت‌ها
+    
+    period = models.DateField(db_index=True) # اولین روز ماه
+    
+    listing_count = models.PositiveIntegerField(default=0)
+    
+    price_per_sqm_count = models.PositiveIntegerField(default=0)
+    price_per_sqm_avg = models.BigIntegerField(null=True, blank=True)
+    price_per_sqm_p25 = models.BigIntegerField(null=True, blank=True)
+    price_per_sqm_median = models.BigIntegerField(null=True, blank=True)
+    price_per_sqm_p75 = models.BigIntegerField(null=True, blank=True)
+    price_per_sqm_p90 = models.BigIntegerField(null=True, blank=True)
+    
+    rent_count = models.PositiveIntegerField(default=0)
+    rent_avg = models.BigIntegerField(null=True, blank=True)
+    rent_p25 = models.BigIntegerField(null=True, blank=True)
+    rent_median = models.BigIntegerField(null=True, blank=True)
+    rent_p75 = models.BigIntegerField(null=True, blank=True)
+    rent_p90 = models.BigIntegerField(null=True, blank=True)
+    
+    refreshed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'real_estate_market_price_index'
+        ordering = ['-period']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['province', 'city', 'region', 'property_type', 'state', 'period'],
+                nulls_distinct=False,
+                name='uq_market_price_index_bucket'
+            ),
+        ]
+        indexes = [
+            BrinIndex(fields=['period'], name='idx_market_index_period_brin'),
+        ]
+
+    def __str__(self):
+        return f"{self.province_id}/{self.city_id}/{self.region_id}/{self.property_type_id}/{self.state_id} - {self.period}"
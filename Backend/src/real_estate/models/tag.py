@@ -33,6 +33,13 @@ class PropertyTag(BaseModel, SEOMixin):
         help_text="Designates whether this tag is publicly visible"
     )
     
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
     objects = PropertyTagQuerySet.as_manager()
     
     class Meta(BaseModel.Meta, SEOMixin.Meta):
@@ -43,6 +50,7 @@ class PropertyTag(BaseModel, SEOMixin):
         indexes = [
             models.Index(fields=['is_public', 'is_active', 'title']),
             models.Index(fields=['slug']),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_tag_published_count'),
         ]
     
     def __str__(self):
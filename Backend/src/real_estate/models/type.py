@@ -56,6 +56,13 @@ class PropertyType(MP_Node, BaseModel, SEOMixin):
 
     node_order_by = ['display_order', 'title']
     
+    published_property_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Published Properties",
+        help_text="Maintained count of active, public and published properties"
+    )
+    
     objects = PropertyTypeQuerySet.as_manager()
     
     class Meta(BaseModel.Meta, SEOMixin.Meta):
@@ -68,6 +75,7 @@ class PropertyType(MP_Node, BaseModel, SEOMixin):
             models.Index(fields=['depth']),
             models.Index(fields=['is_active', 'path']),
             models.Index(fields=['slug']),
+            models.Index(fields=['is_active', '-published_property_count'], name='idx_type_published_count'),
         ]
         constraints = [
             models.CheckConstraint(
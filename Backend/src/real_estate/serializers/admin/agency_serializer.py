@@ -56,6 +56,7 @@ class RealEstateAgencyAdminDetailSerializer(serializers.ModelSerializer):
             'id', 'public_id', 'name', 'slug', 'license_number', 'license_expire_date',
             'phone', 'email', 'website',
             'province', 'province_name', 'city', 'city_name', 'address',
+            'latitude', 'longitude',
             'profile_picture',
             'property_count', 'agent_count',
             'rating', 'total_reviews',
@@ -85,6 +86,7 @@ class RealEstateAgencyAdminCreateSerializer(serializers.ModelSerializer):
             'name', 'slug', 'license_number', 'license_expire_date',
             'phone', 'email', 'website',
             'province', 'city', 'address',
+            'latitude', 'longitude',
             'profile_picture',
             'social_media',
             'rating', 'total_reviews',
@@ -165,6 +167,7 @@ class RealEstateAgencyAdminUpdateSerializer(serializers.ModelSerializer):
             'name', 'slug', 'license_number', 'license_expire_date',
             'phone', 'email', 'website',
             'province', 'city', 'address',
+            'latitude', 'longitude',
             'profile_picture',
             'social_media',
             'rating', 'total_reviews',
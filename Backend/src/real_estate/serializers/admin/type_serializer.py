@@ -25,9 +25,16 @@ class PropertyTypeAdminListSerializer(serializers.ModelSerializer):
         return obj.get_depth()
     
     def get_has_children(self, obj):
+        tree = self.context.get('type_tree')
+        if tree is not None and obj.id in tree:
+            return tree.children_count(obj.id) > 0
         return obj.get_children_count() > 0
     
     def get_parent_name(self, obj):
+        tree = self.context.get('type_tree')
+        if tree is not None and obj.id in tree:
+            parent = tree.parent(obj.id)
+            return parent['title'] if parent else None
         parent = obj.get_parent()
         return parent.title if parent else None
     
@@ -64,6 +71,18 @@ class PropertyTypeAdminDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'public_id', 'created_at', 'updated_at']
     
     def get_parent(self, obj):
+        tree = self.context.get('type_tree')
+        if tree is not None and obj.id in tree:
+            parent = tree.parent(obj.id)
+            if parent:
+                return {
+                    'id': parent['id'],
+                    'public_id': parent['public_id'],
+                    'title': parent['title'],
+                    'slug': parent['slug']
+                }
+            return None
+
         parent = obj.get_parent()
         if parent:
             return {
@@ -75,6 +94,21 @@ class PropertyTypeAdminDetailSerializer(serializers.ModelSerializer):
         return None
     
     def get_children(self, obj):
+        tree = self.context.get('type_tree')
+        if tree is not None and obj.id in tree:
+            return [
+                {
+                    'id': child['id'],
+                    'public_id': child['public_id'],
+                    'title': child['title'],
+                    'slug': child['slug'],
+                    'property_count': child['property_count'],
+                    'has_children': child['children_count'] > 0
+                }
+                for child in tree.children(obj.id)
+                if child['is_active']
+            ]
+
         try:
             children = obj.get_children().filter(is_active=True)
             return [
@@ -92,6 +126,9 @@ class PropertyTypeAdminDetailSerializer(serializers.ModelSerializer):
             return []
     
     def get_breadcrumbs(self, obj):
+        tree = self.context.get('type_tree')
+        if tree is not None and obj.id in tree:
+            return [ancestor['title'] for ancestor in tree.ancestors(obj.id)] + [obj.title]
         return obj.get_ancestors_list() + [obj.title]
     
     def get_property_count(self, obj):
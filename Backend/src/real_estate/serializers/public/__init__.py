@@ -20,6 +20,10 @@ from .agent_serializer import (
     PropertyAgentPublicListSerializer,
     PropertyAgentPublicDetailSerializer,
 )
+from .inquiry_serializer import (
+    PropertyInquiryCreateSerializer,
+    PropertyFavoriteSerializer,
+)
 from .agency_serializer import (
     RealEstateAgencyPublicBriefSerializer,
     RealEstateAgencyPublicListSerializer,
@@ -42,4 +46,6 @@ __all__ = [
     'RealEstateAgencyPublicBriefSerializer',
     'RealEstateAgencyPublicListSerializer',
     'RealEstateAgencyPublicDetailSerializer',
+    'PropertyInquiryCreateSerializer',
+    'PropertyFavoriteSerializer',
 ]
@@ -56,6 +56,8 @@ class RealEstateAgencyPublicListSerializer(serializers.ModelSerializer):
             'city_id',
             'city_name',
             'address',
+            'latitude',
+            'longitude',
             'logo',
             'rating',
             'total_reviews',
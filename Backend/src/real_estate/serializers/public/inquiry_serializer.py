@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from src.real_estate.models.statistics import PropertyInquiry
+
+class PropertyInquiryCreateSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = PropertyInquiry
+        fields = ['name', 'email', 'phone', 'message', 'inquiry_type']
+
+class PropertyFavoriteSerializer(serializers.Serializer):
+    added = serializers.BooleanField(default=True)
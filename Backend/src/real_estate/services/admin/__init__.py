@@ -17,6 +17,8 @@ from .agency_services import RealEstateAgencyAdminService
 from .location_services import RealEstateLocationAdminService
 from .excel_export_service import PropertyExcelExportService
 from .pdf_list_export_service import PropertyPDFListExportService
+from .property_import_service import PropertyImportService
+from .property_counter_service import PropertyCounterService
 
 __all__ = [
     'PropertyAdminService',
@@ -36,5 +38,7 @@ __all__ = [
     'RealEstateLocationAdminService',
     'PropertyExcelExportService',
     'PropertyPDFListExportService',
+    'PropertyImportService',
+    'PropertyCounterService',
 ]
 
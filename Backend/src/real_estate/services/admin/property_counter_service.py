@@ -0,0 +1,188 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from src.real_estate.models.agency import RealEstateAgency
+from src.real_estate.models.agent import PropertyAgent
+from src.real_estate.models.feature import PropertyFeature
+from src.real_estate.models.label import PropertyLabel
+from src.real_estate.models.listing_type import ListingType
+from src.real_estate.models.property import Property
+from src.real_estate.models.tag import PropertyTag
+from src.real_estate.models.type import PropertyType
+
+COUNTER_FIELD = 'published_property_count'
+COUNTED_FILTER = {'is_active': True, 'is_public': True, 'is_published': True}
+COUNTED_FOREIGN_KEYS = {
+    'property_type': PropertyType,
+    'state': ListingType,
+    'agent': PropertyAgent,
+    'agency': RealEstateAgency,
+}
+COUNTED_MANY_TO_MANY = {
+    'labels': PropertyLabel,
+    'tags': PropertyTag,
+    'features': PropertyFeature,
+}
+SNAPSHOT_FIELDS = (
+    *COUNTED_FILTER,
+    *(f"{name}_id" for name in COUNTED_FOREIGN_KEYS),
+)
+
+class PropertyCounterService:
+
+    @staticmethod
+    def snapshot(values) -> Optional[dict]:
+        if any(field not in values for field in SNAPSHOT_FIELDS):
+            return None
+        snapshot = {
+            name: values[f"{name}_id"]
+            for name in COUNTED_FOREIGN_KEYS
+        }
+        snapshot['counted'] = all(values[field] for field in COUNTED_FILTER)
+        return snapshot
+
+    @classmethod
+    def _current_snapshot(cls, instance) -> dict:
+        return cls.snapshot(instance.__dict__) or cls.snapshot({
+            field: getattr(instance, field) for field in SNAPSHOT_FIELDS
+        })
+
+    @staticmethod
+    def _related_ids(property_id: int, relation: str) -> list[int]:
+        through = Property._meta.get_field(relation).remote_field.through
+        target = COUNTED_MANY_TO_MANY[relation]._meta.model_name
+        return list(
+            through.objects.filter(property_id=property_id).values_list(f"{target}_id", flat=True)
+        )
+
+    @staticmethod
+    def _apply(model, deltas: Dict[int, int]) -> None:
+        grouped = defaultdict(list)
+        for pk, delta in deltas.items():
+            if pk is not None and delta:
+                grouped[delta].append(pk)
+
+        for delta, ids in grouped.items():
+            model.objects.filter(pk__in=ids).update(**{
+                COUNTER_FIELD: Greatest(F(COUNTER_FIELD) + delta, Value(0)),
+            })
+
+    @classmethod
+    def on_property_saved(cls, instance, created: bool) -> None:
+        loaded = None if created else getattr(instance, '_loaded_values', None)
+        old = {'counted': False} if created else (cls.snapshot(loaded) if loaded else None)
+        if old is None:
+            cls.recount_for_properties([instance.pk])
+            return
+
+        new = cls._current_snapshot(instance)
+        if not old['counted'] and not new['counted']:
+            return
+
+        for name, model in COUNTED_FOREIGN_KEYS.items():
+            deltas = defaultdict(int)
+            if old['counted']:
+                deltas[old.get(name)] -= 1
+            if new['counted']:
+                deltas[new[name]] += 1
+            cls._apply(model, deltas)
+
+        if created or old['counted'] == new['counted']:
+            return
+
+        delta = 1 if new['counted'] else -1
+        for relation, model in COUNTED_MANY_TO_MANY.items():
+            cls._apply(model, {pk: delta for pk in cls._related_ids(instance.pk, relation)})
+
+    @classmethod
+    def on_property_deleting(cls, instance) -> None:
+        loaded = getattr(instance, '_loaded_values', None)
+        snapshot = (cls.snapshot(loaded) if loaded else None) or cls._current_snapshot(instance)
+        if not snapshot['counted']:
+            return
+
+        for name, model in COUNTED_FOREIGN_KEYS.items():
+            cls._apply(model, {snapshot[name]: -1})
+        for relation, model in COUNTED_MANY_TO_MANY.items():
+            cls._apply(model, {pk: -1 for pk in cls._related_ids(instance.pk, relation)})
+
+    @classmethod
+    def on_relation_changed(cls, relation: str, instance, action: str, reverse: bool, pk_set) -> None:
+        model = COUNTED_MANY_TO_MANY[relation]
+        through = Property._meta.get_field(relation).remote_field.through
+        target = f"{model._meta.model_name}_id"
+
+        if not reverse:
+            if not cls._current_snapshot(instance)['counted']:
+                return
+            if action == 'post_add' and pk_set:
+                cls._apply(model, {pk: 1 for pk in pk_set})
+            elif action == 'pre_remove' and pk_set:
+                linked = through.objects.filter(property_id=instance.pk, **{f"{target}__in": pk_set})
+                cls._apply(model, {pk: -1 for pk in linked.values_list(target, flat=True)})
+            elif action == 'pre_clear':
+                cls._apply(model, {pk: -1 for pk in cls._related_ids(instance.pk, relation)})
+            return
+
+        linked = Property.objects.filter(**{relation: instance}, **COUNTED_FILTER)
+        if action == 'post_add' and pk_set:
+            delta = Property.objects.filter(pk__in=pk_set, **COUNTED_FILTER).count()
+        elif action == 'pre_remove' and pk_set:
+            delta = -linked.filter(pk__in=pk_set).count()
+        elif action == 'pre_clear':
+            delta = -linked.count()
+        else:
+            return
+        cls._apply(model, {instance.pk: delta})
+
+    @staticmethod
+    def _recount(model, relation: str, ids: Optional[Iterable[int]] = None) -> int:
+        counts = Property.objects.filter(
+            **{relation: OuterRef('pk')},
+            **COUNTED_FILTER,
+        ).order_by().values(relation).annotate(total=Count('pk', distinct=True)).values('total')
+        actual = Coalesce(Subquery(counts), 0)
+
+        queryset = model.objects.all()
+        if ids is not None:
+            queryset = queryset.filter(pk__in=list(ids))
+
+        drifted = list(
+            queryset.annotate(_actual=actual)
+            .exclude(**{COUNTER_FIELD: F('_actual')})
+            .values_list('pk', flat=True)
+        )
+        if drifted:
+            model.objects.filter(pk__in=drifted).update(**{COUNTER_FIELD: actual})
+        return len(drifted)
+
+    @classmethod
+    def recount_for_properties(cls, property_ids: Iterable[int]) -> int:
+        property_ids = list(property_ids)
+        if not property_ids:
+            return 0
+
+        properties = Property.objects.filter(pk__in=property_ids).order_by()
+        updated = 0
+        for name, model in COUNTED_FOREIGN_KEYS.items():
+            ids = set(properties.exclude(**{f"{name}_id": None}).values_list(f"{name}_id", flat=True))
+            if ids:
+                updated += cls._recount(model, name, ids)
+        for relation, model in COUNTED_MANY_TO_MANY.items():
+            through = Property._meta.get_field(relation).remote_field.through
+            target = f"{model._meta.model_name}_id"
+            ids = set(through.objects.filter(property_id__in=property_ids).values_list(target, flat=True))
+            if ids:
+                updated += cls._recount(model, relation, ids)
+        return updated
+
+    @classmethod
+    def reconcile(cls) -> Dict[str, int]:
+        relations = {**COUNTED_FOREIGN_KEYS, **COUNTED_MANY_TO_MANY}
+        return {
+            model._meta.model_name: cls._recount(model, relation)
+            for relation, model in relations.items()
+        }
@@ -3,20 +3,56 @@ from decimal import Decimal
 import os
 import logging
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
-from django.db.models import QuerySet
+from django.db.models import QuerySet, Q, Avg, Case, Count, ExpressionWrapper, FloatField, IntegerField, Max, Min, Value, When
 from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Coalesce, Floor, NullIf
 from src.real_estate.models.property import Property
+from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
+from src.real_estate.utils.cache_ttl import PUBLIC_MAP_CLUSTER_TTL
+from src.real_estate.utils import geohash
 import math
 
 logger = logging.getLogger(__name__)
 
+MAP_MAX_ZOOM = 20
+MAP_POINTS_MIN_ZOOM = 15
+MAP_CLUSTER_GRID_DIVISIONS = 8
+MAP_CLUSTER_MAX_TILES = 64
+MAP_CLUSTER_MAX_ITEMS = 1000
+MAP_POINTS_MAX_ITEMS = 1000
+GEO_CANDIDATE_LIMIT = 5000
+
 class PropertyGeoService:
 
     _postgis_available: Optional[bool] = None
     _postgis_warning_emitted: bool = False
     _location_point_available: Optional[bool] = None
 
+    @staticmethod
+    def parse_coordinates(params) -> Optional[Tuple[float, float]]:
+        try:
+            latitude = float(params.get('latitude'))
+            longitude = float(params.get('longitude'))
+        except (TypeError, ValueError):
+            return None
+
+        if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+            return None
+        return latitude, longitude
+
+    @staticmethod
+    def parse_radius_km(value, default: float, max_value: float = 50.0) -> float:
+        try:
+            parsed = float(value)
+        except (TypeError, ValueError):
+            return default
+
+        if parsed <= 0:
+            return default
+        return min(parsed, max_value)
+
     @classmethod
     def _geo_engine_mode(cls) -> str:
         mode = getattr(settings, 'REAL_ESTATE_GEO_ENGINE', None) or os.getenv('REAL_ESTATE_GEO_ENGINE') or os.getenv('GEO_ENGINE') or 'auto'
@@ -57,10 +93,12 @@ class PropertyGeoService:
         return postgis_available
 
     @classmethod
-    def _location_point_expr_sql(cls) -> str:
-        if cls._has_location_point_column():
-            return 'location_point'
-        return 'ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)'
+    def _location_point_expr_sql(cls, model=None) -> str:
+        model = model or Property
+        table = connection.ops.quote_name(model._meta.db_table)
+        if model is Property and cls._has_location_point_column():
+            return f'{table}.location_point'
+        return f'ST_SetSRID(ST_MakePoint({table}.longitude, {table}.latitude), 4326)'
 
     @classmethod
     def _has_location_point_column(cls) -> bool:
@@ -89,6 +127,62 @@ class PropertyGeoService:
 
         return cls._location_point_available
 
+    @staticmethod
+    def _proximity_expr(center_lat: float, center_lon: float):
+        # Equirectangular squared distance: cheap to evaluate in SQL and ranks
+        # points the same way as haversine over search-sized areas.
+        lon_scale = math.cos(math.radians(center_lat)) ** 2
+        lat_delta = Cast('latitude', FloatField()) - Value(center_lat)
+        lon_delta = Cast('longitude', FloatField()) - Value(center_lon)
+        return ExpressionWrapper(
+            lat_delta * lat_delta + lon_delta * lon_delta * Value(lon_scale),
+            output_field=FloatField(),
+        )
+
+    @classmethod
+    def _geohash_candidates(
+        cls,
+        queryset: QuerySet,
+        min_lat: float,
+        max_lat: float,
+        min_lon: float,
+        max_lon: float,
+        center: Optional[Tuple[float, float]] = None,
+    ) -> List[Tuple[int, float, float]]:
+        prefix_filter = Q()
+        for cell in geohash.covering(min_lat, max_lat, min_lon, max_lon):
+            prefix_filter |= Q(geohash__startswith=cell)
+
+        center_lat, center_lon = center or ((min_lat + max_lat) / 2, (min_lon + max_lon) / 2)
+        rows = queryset.exclude(geohash='').filter(
+            prefix_filter,
+            latitude__gte=min_lat,
+            latitude__lte=max_lat,
+            longitude__gte=min_lon,
+            longitude__lte=max_lon,
+        ).annotate(
+            _proximity=cls._proximity_expr(center_lat, center_lon),
+        ).order_by('_proximity', 'id').values_list('id', 'latitude', 'longitude')
+        candidates = [(pk, float(lat), float(lon)) for pk, lat, lon in rows[:GEO_CANDIDATE_LIMIT + 1]]
+        if len(candidates) > GEO_CANDIDATE_LIMIT:
+            logger.warning(
+                f"Geo candidate limit {GEO_CANDIDATE_LIMIT} reached for bbox "
+                f"({min_lat}, {min_lon}, {max_lat}, {max_lon}); dropping the farthest candidates."
+            )
+            del candidates[GEO_CANDIDATE_LIMIT:]
+        return candidates
+
+    @staticmethod
+    def _ordered_by_distance(queryset: QuerySet, ranked: List[Tuple[float, int]]) -> QuerySet:
+        if not ranked:
+            return queryset.none()
+
+        distance_m = Case(
+            *[When(pk=pk, then=Value(distance_km * 1000.0)) for distance_km, pk in ranked],
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=[pk for _, pk in ranked]).annotate(_distance_m=distance_m).order_by('_distance_m')
+
     @classmethod
     def _search_nearby_basic(
         cls,
@@ -102,13 +196,23 @@ class PropertyGeoService:
         cos_lat = abs(math.cos(math.radians(latitude)))
         lon_delta = radius_km / (111.0 * max(cos_lat, 1e-6))
 
-        return queryset.filter(
-            latitude__gte=latitude - lat_delta,
-            latitude__lte=latitude + lat_delta,
-            longitude__gte=longitude - lon_delta,
-            longitude__lte=longitude + lon_delta
+        candidates = cls._geohash_candidates(
+            queryset,
+            latitude - lat_delta,
+            latitude + lat_delta,
+            longitude - lon_delta,
+            longitude + lon_delta,
+            center=(latitude, longitude),
+        )
+        distances = geohash.haversine_km_batch(latitude, longitude, [(lat, lon) for _, lat, lon in candidates])
+        ranked = sorted(
+            (distance, pk)
+            for distance, (pk, _, _) in zip(distances, candidates)
+            if distance <= radius_km
         )[:limit]
 
+        return cls._ordered_by_distance(queryset, ranked)
+
     @classmethod
     def _search_nearby_postgis(
         cls,
@@ -121,7 +225,7 @@ class PropertyGeoService:
         radius_m = float(radius_km) * 1000.0
         reference_lng = float(longitude)
         reference_lat = float(latitude)
-        point_expr = cls._location_point_expr_sql()
+        point_expr = cls._location_point_expr_sql(queryset.model)
 
         queryset = queryset.filter(latitude__isnull=False, longitude__isnull=False)
 
@@ -155,15 +259,17 @@ class PropertyGeoService:
         limit: int,
         queryset: QuerySet,
     ) -> QuerySet:
-        lats = [coord[0] for coord in polygon]
-        lons = [coord[1] for coord in polygon]
+        ring = [(float(lat), float(lon)) for lat, lon in polygon]
+        lats = [coord[0] for coord in ring]
+        lons = [coord[1] for coord in ring]
 
-        return queryset.filter(
-            latitude__gte=min(lats),
-            latitude__lte=max(lats),
-            longitude__gte=min(lons),
-            longitude__lte=max(lons)
-        )[:limit]
+        candidates = cls._geohash_candidates(queryset, min(lats), max(lats), min(lons), max(lons))
+        inside = geohash.points_in_polygon(ring, [(lat, lon) for _, lat, lon in candidates])
+        property_ids = [pk for (pk, _, _), is_inside in zip(candidates, inside) if is_inside][:limit]
+
+        if not property_ids:
+            return queryset.none()
+        return queryset.filter(pk__in=property_ids)
 
     @classmethod
     def _search_in_polygon_postgis(
@@ -192,13 +298,12 @@ class PropertyGeoService:
         return queryset.filter(latitude__isnull=False, longitude__isnull=False).annotate(_inside=inside_sql).filter(_inside=True)[:limit]
 
     @classmethod
-    def _search_in_bbox_postgis(
+    def _filter_bbox_postgis(
         cls,
         min_lat: float,
         max_lat: float,
         min_lon: float,
         max_lon: float,
-        limit: int,
         queryset: QuerySet,
     ) -> QuerySet:
         point_expr = cls._location_point_expr_sql()
@@ -213,7 +318,38 @@ class PropertyGeoService:
             (float(min_lon), float(min_lat), float(max_lon), float(max_lat)),
         )
 
-        return queryset.filter(latitude__isnull=False, longitude__isnull=False).annotate(_in_bbox=bbox_sql).filter(_in_bbox=True)[:limit]
+        return queryset.filter(latitude__isnull=False, longitude__isnull=False).annotate(_in_bbox=bbox_sql).filter(_in_bbox=True)
+
+    @classmethod
+    def _search_in_bbox_postgis(
+        cls,
+        min_lat: float,
+        max_lat: float,
+        min_lon: float,
+        max_lon: float,
+        limit: int,
+        queryset: QuerySet,
+    ) -> QuerySet:
+        return cls._filter_bbox_postgis(min_lat, max_lat, min_lon, max_lon, queryset)[:limit]
+
+    @classmethod
+    def _filter_bbox(
+        cls,
+        min_lat: float,
+        max_lat: float,
+        min_lon: float,
+        max_lon: float,
+        queryset: QuerySet,
+    ) -> QuerySet:
+        if cls._use_postgis():
+            return cls._filter_bbox_postgis(min_lat, max_lat, min_lon, max_lon, queryset)
+
+        return queryset.filter(
+            latitude__gte=min_lat,
+            latitude__lte=max_lat,
+            longitude__gte=min_lon,
+            longitude__lte=max_lon
+        )
 
     @classmethod
     def engine_status(cls) -> Dict[str, Any]:
@@ -242,6 +378,24 @@ class PropertyGeoService:
         if queryset is None:
             queryset = Property.objects.published()
 
+        return cls.search_nearby_locations(
+            queryset=queryset,
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
+        )
+
+    @classmethod
+    def search_nearby_locations(
+        cls,
+        queryset: QuerySet,
+        latitude: float,
+        longitude: float,
+        radius_km: float = 2.0,
+        limit: int = 20,
+    ) -> QuerySet:
+
         if cls._use_postgis():
             try:
                 return cls._search_nearby_postgis(
@@ -370,7 +524,8 @@ class PropertyGeoService:
     def properties_on_map(
         cls,
         city_id: Optional[int] = None,
-        queryset: Optional[QuerySet] = None
+        queryset: Optional[QuerySet] = None,
+        limit: int = MAP_POINTS_MAX_ITEMS
     ) -> List[Dict[str, Any]]:
         
         if queryset is None:
@@ -382,7 +537,7 @@ class PropertyGeoService:
         queryset = queryset.filter(
             latitude__isnull=False,
             longitude__isnull=False
-        )
+        )[:limit]
         
         return list(queryset.values(
             'id',
@@ -439,3 +594,156 @@ class PropertyGeoService:
             'state__title',
             'is_featured'
         ))
+
+    @staticmethod
+    def _tile_size(zoom: int) -> Tuple[float, float]:
+        return 360.0 / (2 ** zoom), 180.0 / (2 ** zoom)
+
+    @classmethod
+    def _tiles_for_bbox(
+        cls,
+        min_lat: float,
+        max_lat: float,
+        min_lon: float,
+        max_lon: float,
+        zoom: int,
+    ) -> List[Tuple[int, int]]:
+        lon_size, lat_size = cls._tile_size(zoom)
+        last = 2 ** zoom - 1
+
+        x0 = min(max(int((min_lon + 180.0) // lon_size), 0), last)
+        x1 = min(max(int((max_lon + 180.0) // lon_size), 0), last)
+        y0 = min(max(int((min_lat + 90.0) // lat_size), 0), last)
+        y1 = min(max(int((max_lat + 90.0) // lat_size), 0), last)
+
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    @classmethod
+    def _tile_bounds(cls, zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+        lon_size, lat_size = cls._tile_size(zoom)
+        min_lon = x * lon_size - 180.0
+        min_lat = y * lat_size - 90.0
+        return min_lat, min_lat + lat_size, min_lon, min_lon + lon_size
+
+    @classmethod
+    def _compute_cluster_tiles(
+        cls,
+        zoom: int,
+        tiles: List[Tuple[int, int]],
+        queryset: QuerySet,
+    ) -> Dict[Tuple[int, int], List[Dict[str, Any]]]:
+        bounds = [cls._tile_bounds(zoom, x, y) for x, y in tiles]
+        min_lat = min(b[0] for b in bounds)
+        max_lat = max(b[1] for b in bounds)
+        min_lon = min(b[2] for b in bounds)
+        max_lon = max(b[3] for b in bounds)
+
+        lon_size, lat_size = cls._tile_size(zoom)
+        cell_lon = lon_size / MAP_CLUSTER_GRID_DIVISIONS
+        cell_lat = lat_size / MAP_CLUSTER_GRID_DIVISIONS
+
+        queryset = cls._filter_bbox(
+            min_lat, max_lat, min_lon, max_lon,
+            queryset.filter(latitude__isnull=False, longitude__isnull=False),
+        )
+
+        rows = queryset.order_by().annotate(
+            _cell_x=Cast(Floor((Cast('longitude', FloatField()) + 180.0) / cell_lon), IntegerField()),
+            _cell_y=Cast(Floor((Cast('latitude', FloatField()) + 90.0) / cell_lat), IntegerField()),
+            _price=Coalesce(NullIf('price', 0), NullIf('sale_price', 0), NullIf('pre_sale_price', 0)),
+        ).values('_cell_x', '_cell_y').annotate(
+            count=Count('id'),
+            center_lat=Avg(Cast('latitude', FloatField())),
+            center_lon=Avg(Cast('longitude', FloatField())),
+            min_price=Min('_price'),
+            max_price=Max('_price'),
+            property_id=Min('id'),
+        )
+
+        wanted = set(tiles)
+        result: Dict[Tuple[int, int], List[Dict[str, Any]]] = {tile: [] for tile in tiles}
+        for row in rows:
+            tile = (row['_cell_x'] // MAP_CLUSTER_GRID_DIVISIONS, row['_cell_y'] // MAP_CLUSTER_GRID_DIVISIONS)
+            if tile not in wanted:
+                continue
+            result[tile].append({
+                'latitude': round(row['center_lat'], 6),
+                'longitude': round(row['center_lon'], 6),
+                'count': row['count'],
+                'min_price': row['min_price'],
+                'max_price': row['max_price'],
+                'property_id': row['property_id'] if row['count'] == 1 else None,
+            })
+        return result
+
+    @classmethod
+    def get_map_clusters(
+        cls,
+        min_lat: Decimal,
+        max_lat: Decimal,
+        min_lon: Decimal,
+        max_lon: Decimal,
+        zoom: int,
+        limit: int = 500,
+        queryset: Optional[QuerySet] = None
+    ) -> Dict[str, Any]:
+
+        zoom = max(0, min(int(zoom), MAP_MAX_ZOOM))
+
+        if zoom >= MAP_POINTS_MIN_ZOOM:
+            return {
+                'mode': 'points',
+                'zoom': zoom,
+                'items': cls.get_properties_for_map(
+                    min_lat=min_lat,
+                    max_lat=max_lat,
+                    min_lon=min_lon,
+                    max_lon=max_lon,
+                    limit=limit,
+                    queryset=queryset,
+                ),
+            }
+
+        bbox = (float(min_lat), float(max_lat), float(min_lon), float(max_lon))
+        tiles = cls._tiles_for_bbox(*bbox, zoom)
+        while len(tiles) > MAP_CLUSTER_MAX_TILES and zoom > 0:
+            zoom -= 1
+            tiles = cls._tiles_for_bbox(*bbox, zoom)
+
+        cacheable = queryset is None
+        if queryset is None:
+            queryset = Property.objects.published()
+
+        tile_clusters: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        missing = tiles
+        if cacheable:
+            keys = {PropertyPublicCacheKeys.map_cluster_tile(zoom, x, y): (x, y) for x, y in tiles}
+            try:
+                cached = cache.get_many(list(keys))
+            except Exception:
+                cached = {}
+            for key, value in cached.items():
+                tile_clusters[keys[key]] = value
+            missing = [tile for tile in tiles if tile not in tile_clusters]
+
+        if missing:
+            computed = cls._compute_cluster_tiles(zoom, missing, queryset)
+            tile_clusters.update(computed)
+            if cacheable:
+                try:
+                    cache.set_many(
+                        {PropertyPublicCacheKeys.map_cluster_tile(zoom, x, y): clusters for (x, y), clusters in computed.items()},
+                        PUBLIC_MAP_CLUSTER_TTL,
+                    )
+                except Exception:
+                    pass
+
+        items = [cluster for tile in tiles for cluster in tile_clusters.get(tile, [])]
+        items.sort(key=lambda cluster: cluster['count'], reverse=True)
+
+        return {
+            'mode': 'clusters',
+            'zoom': zoom,
+            'total': sum(cluster['count'] for cluster in items),
+            'items': items[:MAP_CLUSTER_MAX_ITEMS],
+        }
@@ -0,0 +1,368 @@
+import csv
+import io
+import logging
+import os
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Cast, Coalesce, Floor, NullIf
+from django.utils import timezone
+from django.utils.text import slugify
+
+from src.core.models import City
+from src.real_estate.messages.messages import PROPERTY_ERRORS
+from src.real_estate.models.agent import PropertyAgent
+from src.real_estate.models.import_job import PropertyImportJob
+from src.real_estate.models.listing_type import ListingType
+from src.real_estate.models.location import CityRegion
+from src.real_estate.models.property import Property
+from src.real_estate.models.type import PropertyType
+from src.real_estate.services.admin.property_counter_service import PropertyCounterService
+from src.real_estate.services.analytics.market_index_service import MarketPriceIndexService
+from src.real_estate.utils.cache_admin import PropertyCacheManager
+
+logger = logging.getLogger(__name__)
+
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_LEASE_TIMEOUT = timedelta(minutes=10)
+
+IMPORT_ALLOWED_EXTENSIONS = ('.csv', '.xlsx')
+
+IMPORT_VALUE_COLUMNS = (
+    'title', 'slug', 'short_description', 'description',
+    'neighborhood', 'address', 'postal_code', 'latitude', 'longitude',
+    'price', 'sale_price', 'pre_sale_price',
+    'monthly_rent', 'rent_amount', 'mortgage_amount', 'security_deposit',
+    'land_area', 'built_area', 'bedrooms', 'bathrooms', 'kitchens', 'living_rooms', 'capacity',
+    'year_built', 'build_years', 'floors_in_building', 'floor_number',
+    'parking_spaces', 'storage_rooms', 'has_elevator', 'document_type', 'has_document',
+    'status', 'is_published', 'is_featured', 'is_public',
+)
+
+class PropertyImportService:
+
+    @staticmethod
+    def create_job(uploaded_file, created_by=None, options=None):
+        extension = os.path.splitext(uploaded_file.name)[1].lower()
+        if extension not in IMPORT_ALLOWED_EXTENSIONS:
+            raise ValidationError({'file': [PROPERTY_ERRORS["property_import_invalid_format"]]})
+        if extension == '.xlsx' and not OPENPYXL_AVAILABLE:
+            raise ImportError(PROPERTY_ERRORS["property_import_xlsx_unavailable"])
+
+        return PropertyImportJob.objects.create(
+            file=uploaded_file,
+            file_name=uploaded_file.name[:255],
+            options=options or {},
+            created_by=created_by if created_by and created_by.is_authenticated else None,
+        )
+
+    @staticmethod
+    def get_job(job_id):
+        try:
+            return PropertyImportJob.objects.get(id=job_id)
+        except PropertyImportJob.DoesNotExist:
+            return None
+
+    @staticmethod
+    def serialize_job(job):
+        return {
+            'id': job.id,
+            'public_id': str(job.public_id),
+            'file_name': job.file_name,
+            'status': job.status,
+            'total_rows': job.total_rows,
+            'processed_rows': job.processed_rows,
+            'created_count': job.created_count,
+            'failed_count': job.failed_count,
+            'progress': job.progress,
+            'errors': job.errors,
+            'started_at': job.started_at,
+            'finished_at': job.finished_at,
+            'created_at': job.created_at,
+        }
+
+    @staticmethod
+    def _lease_expired(job):
+        return job.status == 'running' and job.updated_at < timezone.now() - IMPORT_LEASE_TIMEOUT
+
+    @classmethod
+    def is_retryable(cls, job):
+        return job.status == 'failed' or cls._lease_expired(job)
+
+    @staticmethod
+    def _claim(job):
+        now = timezone.now()
+        claimable = Q(status__in=('pending', 'failed')) | Q(status='running', updated_at__lt=now - IMPORT_LEASE_TIMEOUT)
+        return bool(PropertyImportJob.objects.filter(claimable, pk=job.pk).update(status='running', updated_at=now))
+
+    @classmethod
+    def run(cls, job_id, batch_size=IMPORT_BATCH_SIZE):
+        job = PropertyImportJob.objects.select_related('created_by').get(id=job_id)
+        stale = cls._lease_expired(job)
+        if not cls._claim(job):
+            logger.warning(f"⏭️  [PropertyImport] Job {job.id} already {job.status}, skipping")
+            return job
+        if stale:
+            logger.warning(f"♻️  [PropertyImport] Job {job.id} lease expired, taking over")
+
+        try:
+            rows = cls._read_rows(job)
+        except Exception as e:
+            logger.error(f"❌ [PropertyImport] Failed to read file for job {job.id}: {e}", exc_info=True)
+            job.mark_finished('failed', error=str(e))
+            return job
+
+        resume_from = job.processed_rows
+        if resume_from:
+            logger.info(f"🔁 [PropertyImport] Resuming job {job.id} at row {resume_from + 2}")
+
+        job.mark_running(len(rows))
+        if resume_from >= len(rows):
+            job.mark_finished('completed')
+            return job
+
+        importer = _BatchImporter(job)
+        try:
+            for start in range(resume_from, len(rows), batch_size):
+                importer.import_batch(rows[start:start + batch_size], first_row_number=start + 2)
+        except Exception as e:
+            logger.error(f"❌ [PropertyImport] Job {job.id} aborted: {e}", exc_info=True)
+            job.refresh_from_db()
+            job.mark_finished('failed', error=str(e))
+            return job
+
+        job.refresh_from_db()
+        job.mark_finished('completed')
+        logger.info(f"✅ [PropertyImport] Job {job.id} done: created={job.created_count}, failed={job.failed_count}")
+        return job
+
+    @staticmethod
+    def _read_rows(job):
+        extension = os.path.splitext(job.file.name)[1].lower()
+        job.file.open('rb')
+        try:
+            content = job.file.read()
+        finally:
+            job.file.close()
+
+        if extension == '.xlsx':
+            if not OPENPYXL_AVAILABLE:
+                raise ImportError(PROPERTY_ERRORS["property_import_xlsx_unavailable"])
+            workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+            try:
+                sheet_rows = workbook.active.iter_rows(values_only=True)
+                header = next(sheet_rows, None) or ()
+                columns = [str(cell).strip() if cell is not None else '' for cell in header]
+                return [
+                    dict(zip(columns, values))
+                    for values in sheet_rows
+                    if any(value not in (None, '') for value in values)
+                ]
+            finally:
+                workbook.close()
+
+        reader = csv.DictReader(io.StringIO(content.decode('utf-8-sig')))
+        reader.fieldnames = [name.strip() for name in (reader.fieldnames or [])]
+        return [row for row in reader if any((value or '').strip() for value in row.values() if isinstance(value, str))]
+
+class _BatchImporter:
+
+    def __init__(self, job):
+        self.job = job
+        self.created_by = job.created_by
+        self.defaults = job.options.get('defaults', {}) if isinstance(job.options, dict) else {}
+
+        self.property_types = self._lookup_map(PropertyType.objects.values_list('id', 'slug', 'title'))
+        self.listing_types = self._lookup_map(ListingType.objects.values_list('id', 'slug', 'title'))
+        self.cities = {}
+        self.city_province = {}
+        for city_id, slug, name, province_id in City.objects.values_list('id', 'slug', 'name', 'province_id'):
+            self.city_province[city_id] = province_id
+            for key in (city_id, slug, name):
+                self._put(self.cities, key, city_id)
+        self.regions = {}
+        for region_id, city_id, slug, name, code in CityRegion.objects.values_list('id', 'city_id', 'slug', 'name', 'code'):
+            for key in (region_id, slug, name, code):
+                if key not in (None, ''):
+                    self.regions[(city_id, self._normalize(key))] = region_id
+        self.agents = {}
+        self.agent_agency = {}
+        for agent_id, slug, license_number, agency_id in PropertyAgent.objects.values_list('id', 'slug', 'license_number', 'agency_id'):
+            self.agent_agency[agent_id] = agency_id
+            for key in (agent_id, slug, license_number):
+                self._put(self.agents, key, agent_id)
+
+        self.slugs = set(Property.objects.values_list('slug', flat=True))
+        self.skip_clean_fields = [field.name for field in Property._meta.concrete_fields if isinstance(field, models.ForeignKey)]
+
+    @staticmethod
+    def _normalize(value):
+        return str(value).strip().lower()
+
+    @classmethod
+    def _put(cls, mapping, key, value):
+        if key in (None, ''):
+            return
+        mapping[cls._normalize(key)] = value
+
+    @classmethod
+    def _lookup_map(cls, rows):
+        mapping = {}
+        for row in rows:
+            for key in row:
+                cls._put(mapping, key, row[0])
+        return mapping
+
+    def _resolve(self, mapping, field, value, errors):
+        if value in (None, ''):
+            return None
+        resolved = mapping.get(self._normalize(value))
+        if resolved is None:
+            errors.setdefault(field, []).append(
+                PROPERTY_ERRORS["property_import_lookup_not_found"].format(field=field, value=value)
+            )
+        return resolved
+
+    def _unique_slug(self, provided, title, errors):
+        if provided:
+            slug = str(provided).strip()
+            if slug in self.slugs:
+                errors.setdefault('slug', []).append(PROPERTY_ERRORS["property_slug_exists"])
+                return None
+            return slug
+
+        base_slug = slugify(title or '', allow_unicode=True)[:110] or 'property'
+        slug = base_slug
+        counter = 1
+        while slug in self.slugs:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        return slug
+
+    def build_property(self, row):
+        values = {**self.defaults, **{key: value for key, value in row.items() if key}}
+        errors = {}
+
+        property_obj = Property(created_by=self.created_by)
+        for column in IMPORT_VALUE_COLUMNS:
+            value = values.get(column)
+            if isinstance(value, str):
+                value = value.strip()
+            if value in (None, '') or column == 'slug':
+                continue
+            field = Property._meta.get_field(column)
+            if isinstance(value, str) and isinstance(field, (models.IntegerField, models.DecimalField, models.FloatField)):
+                value = value.replace(',', '')
+            setattr(property_obj, column, value)
+
+        property_obj.property_type_id = self._resolve(self.property_types, 'property_type', values.get('property_type'), errors)
+        property_obj.state_id = self._resolve(self.listing_types, 'state', values.get('state'), errors)
+        property_obj.agent_id = self._resolve(self.agents, 'agent', values.get('agent'), errors)
+        property_obj.agency_id = self.agent_agency.get(property_obj.agent_id)
+
+        city_id = self._resolve(self.cities, 'city', values.get('city'), errors)
+        if city_id is None and 'city' not in errors:
+            errors['city'] = [PROPERTY_ERRORS["city_required"]]
+        property_obj.city_id = city_id
+        property_obj.province_id = self.city_province.get(city_id)
+
+        region = values.get('region')
+        if city_id and region not in (None, ''):
+            property_obj.region_id = self.regions.get((city_id, self._normalize(region)))
+            if property_obj.region_id is None:
+                errors['region'] = [PROPERTY_ERRORS["region_city_mismatch"]]
+
+        try:
+            property_obj.full_clean(exclude=self.skip_clean_fields + ['slug'], validate_unique=False, validate_constraints=False)
+        except ValidationError as e:
+            for field, messages in e.message_dict.items():
+                errors.setdefault(field, []).extend(messages)
+
+        if errors:
+            return None, errors
+
+        slug = self._unique_slug(values.get('slug'), property_obj.title, errors)
+        if errors:
+            return None, errors
+
+        property_obj.slug = slug
+        property_obj.geohash = property_obj.compute_geohash()
+        property_obj.fill_seo_defaults()
+        if property_obj.is_published and not property_obj.published_at:
+            property_obj.published_at = timezone.now()
+        return property_obj, None
+
+    def import_batch(self, rows, first_row_number):
+        to_create = []
+        row_errors = []
+        for offset, row in enumerate(rows):
+            property_obj, errors = self.build_property(row)
+            if errors:
+                row_errors.append({'row': first_row_number + offset, 'errors': errors})
+                continue
+            self.slugs.add(property_obj.slug)
+            to_create.append(property_obj)
+
+        with transaction.atomic():
+            created = Property.objects.bulk_create(to_create, batch_size=len(to_create) or None)
+            created_ids = [obj.pk for obj in created]
+            if created_ids:
+                self._apply_derived_fields(created_ids)
+                PropertyCounterService.recount_for_properties(created_ids)
+
+            stored_errors = max(0, PropertyImportJob.MAX_STORED_ERRORS - len(self.job.errors))
+            if row_errors and stored_errors:
+                self.job.errors = self.job.errors + row_errors[:stored_errors]
+                PropertyImportJob.objects.filter(pk=self.job.pk).update(errors=self.job.errors)
+
+            PropertyImportJob.objects.filter(pk=self.job.pk).update(
+                processed_rows=F('processed_rows') + len(rows),
+                created_count=F('created_count') + len(created_ids),
+                failed_count=F('failed_count') + len(row_errors),
+                updated_at=timezone.now(),
+            )
+
+        if created_ids:
+            locations = [
+                (obj.latitude, obj.longitude)
+                for obj in created
+                if obj.is_published and obj.is_public
+            ]
+            market_buckets = [(obj.province_id, obj.published_at) for obj in created]
+            transaction.on_commit(self._after_batch_commit(len(created_ids), locations, market_buckets))
+        logger.info(f"📦 [PropertyImport] Job {self.job.id}: batch rows={len(rows)} created={len(created_ids)} failed={len(row_errors)}")
+
+    @staticmethod
+    def _apply_derived_fields(property_ids):
+        Property.objects.filter(pk__in=property_ids, built_area__gt=0).update(
+            price_per_sqm=Cast(
+                Floor(
+                    Coalesce(NullIf('price', 0), NullIf('sale_price', 0), NullIf('pre_sale_price', 0))
+                    / Cast('built_area', models.FloatField())
+                ),
+                models.IntegerField(),
+            )
+        )
+
+    def _after_batch_commit(self, created_count, locations, market_buckets):
+        def callback():
+            PropertyCacheManager.invalidate_list()
+            PropertyCacheManager.invalidate_map_tiles(locations)
+            MarketPriceIndexService.mark_dirty(market_buckets)
+            PropertyCacheManager.invalidate_statistics()
+            if self.created_by:
+                from src.user.models.admin_profile import AdminProfile
+                from src.user.services.admin_performance_service import AdminPerformanceService
+
+                profile = AdminProfile.objects.filter(admin_user=self.created_by).first()
+                if profile:
+                    AdminPerformanceService.track_content_creation(profile, 'property', count=created_count)
+        return callback
@@ -17,7 +17,9 @@ from src.real_estate.utils.cache_ttl import (
     ADMIN_PROPERTY_YEAR_CHOICES_TTL,
 )
 from src.real_estate.messages.messages import PROPERTY_ERRORS
+from src.real_estate.services.admin.property_counter_service import PropertyCounterService
 from src.real_estate.services.analytics.deals_service import DealsService
+from src.real_estate.services.analytics.market_index_service import MarketPriceIndexService
 
 logger = logging.getLogger(__name__)
 
@@ -482,8 +484,7 @@ class PropertyAdminService:
             deleted_count = properties.count()
             properties.delete()
             
-            for prop_id in property_ids:
-                PropertyCacheManager.invalidate_property(prop_id)
+            PropertyCacheManager.invalidate_properties(property_ids)
             PropertyCacheManager.invalidate_list()
             PropertyCacheManager.invalidate_statistics()
         
@@ -508,11 +509,18 @@ class PropertyAdminService:
         update_fields['updated_at'] = timezone.now()
         
         with transaction.atomic():
-            Property.objects.filter(id__in=property_ids).update(**update_fields)
+            properties = Property.objects.filter(id__in=property_ids)
+            locations = list(properties.values_list('latitude', 'longitude'))
+            market_buckets = list(properties.values_list('province_id', 'published_at'))
+            properties.update(**update_fields)
+            if is_published is not None:
+                PropertyCounterService.recount_for_properties(property_ids)
+                market_buckets += list(properties.values_list('province_id', 'published_at'))
+                transaction.on_commit(lambda: MarketPriceIndexService.mark_dirty(market_buckets))
             
-            for prop_id in property_ids:
-                PropertyCacheManager.invalidate_property(prop_id)
+            PropertyCacheManager.invalidate_properties(property_ids)
             PropertyCacheManager.invalidate_list()
+            PropertyCacheManager.invalidate_map_tiles(locations)
             PropertyCacheManager.invalidate_statistics()
         
         return True
@@ -16,9 +16,12 @@ from src.real_estate.utils.cache_ttl import (
 )
 from src.real_estate.messages import TYPE_ERRORS
 from src.media.models.media import ImageMedia
+from src.core.utils.tree_materializer import TreeMaterializer
 
 class PropertyTypeAdminService:
 
+    TREE_FIELDS = ('public_id', 'title', 'slug', 'is_active', 'is_public', 'property_count')
+
     @staticmethod
     def _normalize_query_params(query_params):
         if hasattr(query_params, 'lists'):
@@ -109,36 +112,30 @@ class PropertyTypeAdminService:
         
         return root_types
 
+    @staticmethod
+    def get_materialized_tree(use_cache=True):
+        queryset = PropertyType.objects.annotate(property_count=Count('properties', distinct=True))
+        return TreeMaterializer(
+            queryset,
+            fields=PropertyTypeAdminService.TREE_FIELDS,
+            cache_namespace=TypeCacheKeys.tree_admin(),
+            timeout=ADMIN_TYPE_TREE_TTL,
+        ).get(use_cache=use_cache)
+
     @staticmethod
     def get_tree_data():
-        cache_key = TypeCacheKeys.tree_admin()
-        tree_data = cache.get(cache_key)
-        
-        if tree_data is None:
-            def build_tree(nodes):
-                tree = []
-                for node in nodes:
-                    children = node.get_children().filter(is_active=True)
-                    tree_node = {
-                        'id': node.id,
-                        'public_id': node.public_id,
-                        'title': node.title,
-                        'slug': node.slug,
-                        'level': node.get_depth(),
-                        'property_count': getattr(node, 'property_count', 0),
-                        'children': build_tree(children) if children else []
-                    }
-                    tree.append(tree_node)
-                return tree
-            
-            root_nodes = PropertyType.get_root_nodes().annotate(
-                property_count=Count('properties', distinct=True)
-            ).filter(is_active=True)
-            
-            tree_data = build_tree(root_nodes)
-            cache.set(cache_key, tree_data, ADMIN_TYPE_TREE_TTL)
-        
-        return tree_data
+        tree = PropertyTypeAdminService.get_materialized_tree()
+        return tree.nested(
+            fields={
+                'id': 'id',
+                'public_id': 'public_id',
+                'title': 'title',
+                'slug': 'slug',
+                'level': 'depth',
+                'property_count': 'property_count',
+            },
+            include=lambda node: node['is_active'],
+        )
 
     @staticmethod
     def create_type(validated_data, created_by=None):
@@ -260,6 +257,10 @@ class PropertyTypeAdminService:
     
     @staticmethod
     def get_breadcrumbs(property_type):
+        tree = PropertyTypeAdminService.get_materialized_tree()
+        if property_type.id in tree:
+            return tree.breadcrumbs(property_type.id, ('id', 'title', 'slug'))
+
         ancestors = property_type.get_ancestors()
         breadcrumbs = []
         
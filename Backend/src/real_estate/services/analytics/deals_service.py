@@ -1,8 +1,10 @@
 from datetime import datetime, time
+from decimal import Decimal
 
 from django.utils import timezone
-from django.db import models
-from django.db.models import F, Avg
+from django.db.models import F
+from src.real_estate.models.agency import RealEstateAgency
+from src.real_estate.models.agent import PropertyAgent
 from src.real_estate.models.statistics import AgentStatistics, AgencyStatistics
 
 class DealsService:
@@ -97,72 +99,67 @@ class DealsService:
         cls._update_agent_kpis(property_obj, listing_time, final_amount=effective_final_amount, commission=commission)
         cls._update_agency_kpis(property_obj, listing_time, final_amount=effective_final_amount, commission=commission)
 
+    @staticmethod
+    def _deal_increments(property_obj, final_amount=None, commission=None):
+        updates = {}
+        if property_obj.status == 'sold':
+            updates['properties_sold'] = F('properties_sold') + 1
+            effective_final_amount = final_amount if final_amount is not None else (property_obj.sale_price or property_obj.price)
+            if effective_final_amount:
+                updates['total_sales_value'] = F('total_sales_value') + effective_final_amount
+        else:
+            updates['properties_rented'] = F('properties_rented') + 1
+
+        if commission is not None:
+            updates['total_commissions'] = F('total_commissions') + commission
+        return updates
+
+    @staticmethod
+    def _record_closed_deal(model, owner_id, listing_time):
+        model.objects.filter(pk=owner_id).update(
+            closed_deal_count=F('closed_deal_count') + 1,
+            total_deal_days=F('total_deal_days') + listing_time,
+        )
+
     @classmethod
     def _update_agent_kpis(cls, property_obj, listing_time, final_amount=None, commission=None):
-        if not property_obj.agent:
+        if not property_obj.agent_id:
             return
             
         now = timezone.now()
         stats, _ = AgentStatistics.objects.get_or_create(
-            agent=property_obj.agent,
+            agent_id=property_obj.agent_id,
             year=now.year,
             month=now.month
         )
         
-        is_sale = property_obj.status == 'sold'
-        if is_sale:
-            stats.properties_sold = F('properties_sold') + 1
-            effective_final_amount = final_amount if final_amount is not None else (property_obj.sale_price or property_obj.price)
-            if effective_final_amount:
-                stats.total_sales_value = F('total_sales_value') + effective_final_amount
-        else:
-            stats.properties_rented = F('properties_rented') + 1
+        updates = cls._deal_increments(property_obj, final_amount=final_amount, commission=commission)
+        cls._record_closed_deal(PropertyAgent, property_obj.agent_id, listing_time)
+
+        total_closed, total_deal_days, published = PropertyAgent.objects.filter(
+            pk=property_obj.agent_id
+        ).values_list('closed_deal_count', 'total_deal_days', 'published_property_count').get()
+        total_listed = total_closed + published
 
-        if commission is not None:
-            stats.total_commissions = F('total_commissions') + commission
-            
-        stats.save()
-        stats.refresh_from_db()
-        
-        all_agent_listings = property_obj.agent.properties.all()
-        total_listed = all_agent_listings.count()
-        total_closed = all_agent_listings.filter(closed_at__isnull=False).count()
-        total_inquiries = property_obj.agent.properties.aggregate(total=models.Sum('inquiries_count'))['total'] or 0
-        
         if total_listed > 0:
-            stats.conversion_rate = (total_closed / total_listed) * 100
-            
+            updates['conversion_rate'] = round(Decimal(total_closed * 100) / total_listed, 2)
         if total_closed > 0:
-            avg_time = all_agent_listings.filter(closed_at__isnull=False).aggregate(
-                avg=Avg(F('closed_at') - F('published_at'))
-            )['avg']
-            if avg_time:
-                stats.avg_deal_time = avg_time.days
-                
-        stats.save()
+            updates['avg_deal_time'] = total_deal_days // total_closed
+
+        AgentStatistics.objects.filter(pk=stats.pk).update(**updates)
 
     @classmethod
     def _update_agency_kpis(cls, property_obj, listing_time, final_amount=None, commission=None):
-        if not property_obj.agency:
+        if not property_obj.agency_id:
             return
             
         now = timezone.now()
         stats, _ = AgencyStatistics.objects.get_or_create(
-            agency=property_obj.agency,
+            agency_id=property_obj.agency_id,
             year=now.year,
             month=now.month
         )
         
-        is_sale = property_obj.status == 'sold'
-        if is_sale:
-            stats.properties_sold = F('properties_sold') + 1
-            effective_final_amount = final_amount if final_amount is not None else (property_obj.sale_price or property_obj.price)
-            if effective_final_amount:
-                stats.total_sales_value = F('total_sales_value') + effective_final_amount
-        else:
-            stats.properties_rented = F('properties_rented') + 1
-
-        if commission is not None:
-            stats.total_commissions = F('total_commissions') + commission
-            
-        stats.save()
+        updates = cls._deal_increments(property_obj, final_amount=final_amount, commission=commission)
+        cls._record_closed_deal(RealEstateAgency, property_obj.agency_id, listing_time)
+        AgencyStatistics.objects.filter(pk=stats.pk).update(**updates)
@@ -0,0 +1,172 @@
+import json
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from src.core.cache import CacheService
+from src.real_estate.models.agency import RealEstateAgency
+from src.real_estate.models.agent import PropertyAgent
+from src.real_estate.models.property import Property
+from src.real_estate.models.statistics import PropertyFavorite, PropertyInquiry, PropertyStatistics
+
+logger = logging.getLogger(__name__)
+
+ENGAGEMENT_QUEUE = 'real_estate:engagement:queue'
+ENGAGEMENT_FLUSH_BATCH = 5000
+INQUIRY_FIELDS = ('name', 'email', 'phone', 'message', 'inquiry_type')
+
+def _as_date(timestamp: float) -> date:
+    return timezone.localdate(datetime.fromtimestamp(timestamp, tz=dt_timezone.utc))
+
+def _grouped(deltas: Dict) -> Dict[Tuple[int, ...], List]:
+    grouped = defaultdict(list)
+    for key, values in deltas.items():
+        if any(values):
+            grouped[tuple(values)].append(key)
+    return grouped
+
+def _increments(fields: Iterable[str], values: Tuple[int, ...]) -> dict:
+    return {
+        field: Greatest(F(field) + delta, Value(0))
+        for field, delta in zip(fields, values)
+        if delta
+    }
+
+class PropertyEngagementService:
+
+    @staticmethod
+    def _client():
+        return CacheService.get_default_manager().get_redis_client()
+
+    @classmethod
+    def _enqueue(cls, event: dict) -> None:
+        event.setdefault('ts', timezone.now().timestamp())
+        if CacheService.list_push(ENGAGEMENT_QUEUE, json.dumps(event), side='left') is None:
+            cls.apply([event])
+
+    @classmethod
+    def record_favorite(cls, property_id: int, user_id: int, added: bool = True) -> bool:
+        if added:
+            _, changed = PropertyFavorite.objects.get_or_create(user_id=user_id, property_id=property_id)
+        else:
+            changed, _ = PropertyFavorite.objects.filter(user_id=user_id, property_id=property_id).delete()
+        if not changed:
+            return False
+        cls._enqueue({'type': 'favorite', 'property_id': property_id, 'delta': 1 if added else -1})
+        return True
+
+    @classmethod
+    def record_inquiry(cls, property_id: int, user_id: Optional[int] = None, **fields) -> None:
+        cls._enqueue({
+            'type': 'inquiry',
+            'property_id': property_id,
+            'user_id': user_id,
+            **{field: fields[field] for field in INQUIRY_FIELDS if fields.get(field) is not None},
+        })
+
+    @classmethod
+    def _drain(cls, limit: int) -> List[dict]:
+        client = cls._client()
+        if not client:
+            return []
+
+        pipe = client.pipeline(transaction=True)
+        pipe.lrange(ENGAGEMENT_QUEUE, -limit, -1)
+        pipe.ltrim(ENGAGEMENT_QUEUE, 0, -limit - 1)
+        raw_events, _ = pipe.execute()
+
+        events = []
+        for raw in reversed(raw_events):
+            try:
+                events.append(json.loads(raw))
+            except (TypeError, ValueError):
+                logger.warning(f"Dropping malformed engagement event: {raw!r}")
+        return events
+
+    @classmethod
+    def flush(cls, limit: int = ENGAGEMENT_FLUSH_BATCH) -> int:
+        events = cls._drain(limit)
+        if not events:
+            return 0
+
+        try:
+            cls.apply(events)
+        except Exception:
+            client = cls._client()
+            if client:
+                client.rpush(ENGAGEMENT_QUEUE, *(json.dumps(event) for event in reversed(events)))
+            raise
+        return len(events)
+
+    @classmethod
+    def apply(cls, events: List[dict]) -> None:
+        property_ids = {event['property_id'] for event in events}
+        owners = {
+            pk: (agent_id, agency_id)
+            for pk, agent_id, agency_id in Property.objects.filter(pk__in=property_ids).values_list('id', 'agent_id', 'agency_id')
+        }
+
+        property_deltas = defaultdict(lambda: [0, 0])
+        daily_deltas = defaultdict(lambda: [0, 0])
+        agent_deltas = defaultdict(lambda: [0])
+        agency_deltas = defaultdict(lambda: [0])
+        inquiries = []
+
+        for event in events:
+            property_id = event['property_id']
+            if property_id not in owners:
+                continue
+            day = _as_date(event['ts'])
+
+            if event['type'] == 'favorite':
+                property_deltas[property_id][0] += event['delta']
+                daily_deltas[(property_id, day)][0] += event['delta']
+            elif event['type'] == 'inquiry':
+                property_deltas[property_id][1] += 1
+                daily_deltas[(property_id, day)][1] += 1
+                agent_id, agency_id = owners[property_id]
+                if agent_id:
+                    agent_deltas[agent_id][0] += 1
+                if agency_id:
+                    agency_deltas[agency_id][0] += 1
+                inquiries.append(PropertyInquiry(
+                    property_id=property_id,
+                    user_id=event.get('user_id'),
+                    **{field: event[field] for field in INQUIRY_FIELDS if field in event},
+                ))
+
+        with transaction.atomic():
+            if inquiries:
+                PropertyInquiry.objects.bulk_create(inquiries, batch_size=500)
+
+            for values, ids in _grouped(property_deltas).items():
+                Property.objects.filter(pk__in=ids).update(
+                    **_increments(('favorites_count', 'inquiries_count'), values)
+                )
+
+            if daily_deltas:
+                PropertyStatistics.objects.bulk_create(
+                    [PropertyStatistics(property_id=property_id, date=day) for property_id, day in daily_deltas],
+                    batch_size=500,
+                    ignore_conflicts=True,
+                )
+                by_day = defaultdict(dict)
+                for (property_id, day), values in daily_deltas.items():
+                    by_day[day][property_id] = values
+                for day, deltas in by_day.items():
+                    for values, ids in _grouped(deltas).items():
+                        PropertyStatistics.objects.filter(property_id__in=ids, date=day).update(
+                            **_increments(('favorites', 'inquiries'), values)
+                        )
+
+            for model, deltas in ((PropertyAgent, agent_deltas), (RealEstateAgency, agency_deltas)):
+                for values, ids in _grouped(deltas).items():
+                    model.objects.filter(pk__in=ids).update(**_increments(('inquiry_count',), values))
+
+        logger.info(f"💬 [Engagement] events={len(events)} properties={len(property_deltas)} inquiries={len(inquiries)}")
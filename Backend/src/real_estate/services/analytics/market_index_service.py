@@ -0,0 +1,241 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Aggregate, Avg, Count, DateField, FloatField, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from src.core.cache import CacheService, get_or_compute, invalidate_pattern
+from src.real_estate.models.property import Property
+from src.real_estate.models.statistics import MarketPriceIndex
+
+logger = logging.getLogger(__name__)
+
+MARKET_INDEX_DIRTY_KEY = 'real_estate:market_index:dirty'
+MARKET_INDEX_SERIES_PATTERN = 'real_estate:market_index:series:*'
+MARKET_INDEX_SERIES_TTL = 900
+MARKET_INDEX_MAX_MONTHS = 60
+MARKET_INDEX_DRAIN_BATCH = 1000
+MARKET_INDEX_PERCENTILES = (('p25', 0.25), ('median', 0.5), ('p75', 0.75), ('p90', 0.9))
+
+GEO_LEVELS = (
+    ('city', 'region'),
+    ('city',),
+    (),
+)
+SEGMENT_LEVELS = (
+    ('property_type', 'state'),
+    ('property_type',),
+    ('state',),
+    (),
+)
+SERIES_FIELDS = (
+    'period',
+    'listing_count',
+    'price_per_sqm_count',
+    'price_per_sqm_avg',
+    'price_per_sqm_p25',
+    'price_per_sqm_median',
+    'price_per_sqm_p75',
+    'price_per_sqm_p90',
+    'rent_count',
+    'rent_avg',
+    'rent_p25',
+    'rent_median',
+    'rent_p75',
+    'rent_p90',
+)
+
+class PercentileCont(Aggregate):
+    function = 'percentile_cont'
+    name = 'PercentileCont'
+    template = '%(function)s(%(fraction)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression, fraction, **extra):
+        super().__init__(expression, fraction=float(fraction), **extra)
+
+def month_start(value) -> date:
+    if isinstance(value, datetime):
+        value = timezone.localtime(value) if timezone.is_aware(value) else value
+        value = value.date()
+    return value.replace(day=1)
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def _as_int(value) -> Optional[int]:
+    return int(round(value)) if value is not None else None
+
+class MarketPriceIndexService:
+
+    @staticmethod
+    def _client():
+        return CacheService.get_default_manager().get_redis_client()
+
+    @classmethod
+    def mark_dirty(cls, buckets: Iterable[Tuple[Optional[int], Optional[datetime]]]) -> int:
+        members = {
+            f"{province_id}:{month_start(published_at).isoformat()}"
+            for province_id, published_at in buckets
+            if province_id and published_at
+        }
+        if not members:
+            return 0
+        try:
+            client = cls._client()
+            if not client:
+                return 0
+            return int(client.sadd(MARKET_INDEX_DIRTY_KEY, *members) or 0)
+        except Exception as e:
+            logger.warning(f"Market index dirty marking failed: {e}")
+            return 0
+
+    @classmethod
+    def _drain_dirty(cls) -> Dict[int, set]:
+        dirty = defaultdict(set)
+        client = cls._client()
+        if not client:
+            return dirty
+
+        while True:
+            members = client.spop(MARKET_INDEX_DIRTY_KEY, MARKET_INDEX_DRAIN_BATCH)
+            if not members:
+                break
+            for member in members:
+                if isinstance(member, bytes):
+                    member = member.decode()
+                province_id, period = member.split(':', 1)
+                dirty[int(province_id)].add(date.fromisoformat(period))
+        return dirty
+
+    @classmethod
+    def refresh_dirty(cls) -> int:
+        dirty = cls._drain_dirty()
+        refreshed = 0
+        for province_id, periods in dirty.items():
+            try:
+                refreshed += cls.refresh(province_id, periods)
+            except Exception:
+                logger.exception(f"📈 [MarketIndex] refresh failed for province={province_id}; re-marked as dirty")
+                cls.mark_dirty((province_id, period) for period in periods)
+        return refreshed
+
+    @staticmethod
+    def _aggregates() -> dict:
+        ppsqm = Q(price_per_sqm__gt=0)
+        rent = Q(monthly_rent__gt=0)
+        aggregates = {
+            'listing_count': Count('id'),
+            'price_per_sqm_count': Count('id', filter=ppsqm),
+            'price_per_sqm_avg': Avg('price_per_sqm', filter=ppsqm),
+            'rent_count': Count('id', filter=rent),
+            'rent_avg': Avg('monthly_rent', filter=rent),
+        }
+        for suffix, fraction in MARKET_INDEX_PERCENTILES:
+            aggregates[f'price_per_sqm_{suffix}'] = PercentileCont('price_per_sqm', fraction, filter=ppsqm)
+            aggregates[f'rent_{suffix}'] = PercentileCont('monthly_rent', fraction, filter=rent)
+        return aggregates
+
+    @classmethod
+    def _compute(cls, province_id: int, periods: List[date]) -> List[MarketPriceIndex]:
+        base = Property.objects.filter(
+            province_id=province_id,
+            is_active=True,
+            published_at__gte=min(periods),
+            published_at__lt=add_months(max(periods), 1),
+        ).annotate(
+            period=TruncMonth('published_at', output_field=DateField()),
+        )
+        wanted = set(periods)
+        aggregates = cls._aggregates()
+
+        rows = []
+        for geo in GEO_LEVELS:
+            for segment in SEGMENT_LEVELS:
+                dimensions = (*geo, *segment)
+                queryset = base.filter(**{f"{name}__isnull": False for name in dimensions})
+                grouped = queryset.order_by().values('period', *dimensions).annotate(**aggregates)
+                for bucket in grouped:
+                    if bucket['period'] not in wanted:
+                        continue
+                    rows.append(MarketPriceIndex(
+                        province_id=province_id,
+                        city_id=bucket.get('city'),
+                        region_id=bucket.get('region'),
+                        property_type_id=bucket.get('property_type'),
+                        state_id=bucket.get('state'),
+                        period=bucket['period'],
+                        listing_count=bucket['listing_count'],
+                        price_per_sqm_count=bucket['price_per_sqm_count'],
+                        rent_count=bucket['rent_count'],
+                        **{
+                            field: _as_int(bucket[field])
+                            for field in SERIES_FIELDS
+                            if field.endswith(('_avg', '_p25', '_median', '_p75', '_p90'))
+                        },
+                    ))
+        return rows
+
+    @classmethod
+    def refresh(cls, province_id: int, periods: Iterable[date]) -> int:
+        periods = sorted({month_start(period) for period in periods})
+        if not periods:
+            return 0
+
+        rows = cls._compute(province_id, periods)
+        with transaction.atomic():
+            MarketPriceIndex.objects.filter(province_id=province_id, period__in=periods).delete()
+            MarketPriceIndex.objects.bulk_create(rows, batch_size=1000)
+            invalidate_pattern(MARKET_INDEX_SERIES_PATTERN)
+
+        logger.info(f"📈 [MarketIndex] province={province_id} periods={len(periods)} buckets={len(rows)}")
+        return len(rows)
+
+    @classmethod
+    def rebuild(cls, months: int = 24) -> int:
+        start = add_months(month_start(timezone.now()), -(months - 1))
+        periods = [add_months(start, offset) for offset in range(months)]
+        province_ids = Property.objects.filter(
+            is_active=True,
+            published_at__gte=start,
+        ).order_by().values_list('province_id', flat=True).distinct()
+
+        total = 0
+        for province_id in province_ids:
+            total += cls.refresh(province_id, periods)
+        return total
+
+    @staticmethod
+    def get_series(
+        province_id: int,
+        city_id: Optional[int] = None,
+        region_id: Optional[int] = None,
+        property_type_id: Optional[int] = None,
+        state_id: Optional[int] = None,
+        months: int = 12,
+    ) -> List[dict]:
+        months = max(1, min(int(months), MARKET_INDEX_MAX_MONTHS))
+        cache_key = (
+            f"real_estate:market_index:series:{province_id}:{city_id}:{region_id}"
+            f":{property_type_id}:{state_id}:{months}"
+        )
+
+        def compute():
+            start = add_months(month_start(timezone.now()), -(months - 1))
+            return list(
+                MarketPriceIndex.objects.filter(
+                    province_id=province_id,
+                    city_id=city_id,
+                    region_id=region_id,
+                    property_type_id=property_type_id,
+                    state_id=state_id,
+                    period__gte=start,
+                ).order_by('period').values(*SERIES_FIELDS)
+            )
+
+        return get_or_compute(cache_key, compute, MARKET_INDEX_SERIES_TTL)
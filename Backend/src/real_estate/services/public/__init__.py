@@ -8,6 +8,8 @@ from .feature_services import PropertyFeaturePublicService
 from .agent_services import PropertyAgentPublicService
 from .agency_services import RealEstateAgencyPublicService
 from .floor_plan_services import FloorPlanPublicService
+from .map_tile_service import PropertyMapTileService
+from .related_property_service import PropertyRelatedService
 
 __all__ = [
     'ListingTypePublicService',
@@ -20,4 +22,6 @@ __all__ = [
     'PropertyAgentPublicService',
     'RealEstateAgencyPublicService',
     'FloorPlanPublicService',
+    'PropertyMapTileService',
+    'PropertyRelatedService',
 ]
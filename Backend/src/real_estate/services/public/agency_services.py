@@ -1,14 +1,16 @@
 from datetime import datetime
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.agency import RealEstateAgency
+from src.real_estate.models.agent import PropertyAgent
 from src.real_estate.messages.messages import AGENCY_ERRORS
 from src.real_estate.serializers.public.agency_serializer import (
     RealEstateAgencyPublicDetailSerializer,
     RealEstateAgencyPublicListSerializer,
 )
 from src.real_estate.serializers.public.agent_serializer import PropertyAgentPublicListSerializer
+from src.real_estate.services.admin.property_geo_services import PropertyGeoService
 from src.real_estate.utils.cache_public import AgencyPublicCacheKeys
 from src.real_estate.utils.cache_ttl import (
     PUBLIC_AGENCY_DETAIL_TTL,
@@ -82,15 +84,7 @@ class RealEstateAgencyPublicService:
             'social_media',
             'social_media__icon'
         ).annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-                distinct=True,
-            ),
+            property_count=F('published_property_count'),
             agent_count=Count(
                 'agents',
                 filter=Q(agents__is_active=True),
@@ -276,144 +270,179 @@ class RealEstateAgencyPublicService:
         
         return queryset.order_by('-rating', 'name').distinct()
 
+    @staticmethod
+    def _nearby_queryset():
+
+        return RealEstateAgency.objects.filter(
+            is_active=True,
+            latitude__isnull=False,
+            longitude__isnull=False,
+        ).select_related(
+            'province',
+            'city',
+            'profile_picture'
+        )
+
+    @staticmethod
+    def _attach_listing_counts(agencies):
+
+        agency_ids = [agency.id for agency in agencies]
+        if not agency_ids:
+            return agencies
+
+        agent_counts = dict(
+            PropertyAgent.objects.filter(
+                agency_id__in=agency_ids,
+                is_active=True,
+            ).order_by().values('agency_id').annotate(total=Count('id')).values_list('agency_id', 'total')
+        )
+
+        for agency in agencies:
+            agency.property_count = agency.published_property_count
+            agency.agent_count = agent_counts.get(agency.id, 0)
+        return agencies
+
     @staticmethod
     def get_nearby_agencies(latitude, longitude, radius_km=10, limit=10):
 
-        return RealEstateAgencyPublicService._base_queryset().order_by('-rating')[:limit]
+        agencies = list(PropertyGeoService.search_nearby_locations(
+            queryset=RealEstateAgencyPublicService._nearby_queryset(),
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
+        ))
+        return RealEstateAgencyPublicService._attach_listing_counts(agencies)
+
+    @staticmethod
+    def get_nearby_agencies_data(latitude, longitude, radius_km=10, limit=10):
+
+        agencies = RealEstateAgencyPublicService.get_nearby_agencies(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
+        )
+        data = RealEstateAgencyPublicListSerializer(agencies, many=True).data
+        for item, agency in zip(data, agencies):
+            distance_m = getattr(agency, '_distance_m', None)
+            item['distance_km'] = round(distance_m / 1000.0, 2) if distance_m is not None else None
+        return data
 
     @staticmethod
     def get_agency_list_data(filters=None, search=None, ordering=None):
         cache_key = AgencyPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = RealEstateAgencyPublicService.get_agency_queryset(filters=filters, search=search, ordering=ordering)
-        data = RealEstateAgencyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_LIST_TTL)
-        return data
+        def compute():
+            queryset = RealEstateAgencyPublicService.get_agency_queryset(filters=filters, search=search, ordering=ordering)
+            return RealEstateAgencyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_LIST_TTL)
 
     @staticmethod
     def get_agency_detail_by_slug_data(slug):
         cache_key = AgencyPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agency = RealEstateAgencyPublicService.get_agency_by_slug(slug)
-        if not agency:
-            return None
+        def compute():
+            agency = RealEstateAgencyPublicService.get_agency_by_slug(slug)
+            if not agency:
+                return None
 
-        data = RealEstateAgencyPublicDetailSerializer(agency).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_DETAIL_TTL)
-        return data
+            return RealEstateAgencyPublicDetailSerializer(agency).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_DETAIL_TTL)
 
     @staticmethod
     def get_agency_detail_by_id_data(agency_id):
         cache_key = AgencyPublicCacheKeys.detail_id(agency_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agency = RealEstateAgencyPublicService.get_agency_by_id(agency_id)
-        if not agency:
-            return None
+        def compute():
+            agency = RealEstateAgencyPublicService.get_agency_by_id(agency_id)
+            if not agency:
+                return None
 
-        data = RealEstateAgencyPublicDetailSerializer(agency).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_DETAIL_TTL)
-        return data
+            return RealEstateAgencyPublicDetailSerializer(agency).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_DETAIL_TTL)
 
     @staticmethod
     def get_agency_detail_by_public_id_data(public_id):
         cache_key = AgencyPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agency = RealEstateAgencyPublicService.get_agency_by_public_id(public_id)
-        if not agency:
-            return None
+        def compute():
+            agency = RealEstateAgencyPublicService.get_agency_by_public_id(public_id)
+            if not agency:
+                return None
 
-        data = RealEstateAgencyPublicDetailSerializer(agency).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_DETAIL_TTL)
-        return data
+            return RealEstateAgencyPublicDetailSerializer(agency).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_DETAIL_TTL)
 
     @staticmethod
     def get_featured_agencies_data(limit=6):
         cache_key = AgencyPublicCacheKeys.featured(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = RealEstateAgencyPublicService.get_featured_agencies(limit=limit)
-        data = RealEstateAgencyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_LIST_TTL)
-        return data
+        def compute():
+            queryset = RealEstateAgencyPublicService.get_featured_agencies(limit=limit)
+            return RealEstateAgencyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_LIST_TTL)
 
     @staticmethod
     def get_top_rated_agencies_data(limit=10):
         cache_key = AgencyPublicCacheKeys.top_rated(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = RealEstateAgencyPublicService.get_top_rated_agencies(limit=limit)
-        data = RealEstateAgencyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_LIST_TTL)
-        return data
+        def compute():
+            queryset = RealEstateAgencyPublicService.get_top_rated_agencies(limit=limit)
+            return RealEstateAgencyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_LIST_TTL)
 
     @staticmethod
     def get_agencies_by_city_data(city_id, limit=None):
         cache_key = AgencyPublicCacheKeys.by_city(city_id, limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = RealEstateAgencyPublicService.get_agencies_by_city(city_id=city_id, limit=limit)
-        data = RealEstateAgencyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_LIST_TTL)
-        return data
+        def compute():
+            queryset = RealEstateAgencyPublicService.get_agencies_by_city(city_id=city_id, limit=limit)
+            return RealEstateAgencyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_LIST_TTL)
 
     @staticmethod
     def get_agencies_by_province_data(province_id, limit=None):
         cache_key = AgencyPublicCacheKeys.by_province(province_id, limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = RealEstateAgencyPublicService.get_agencies_by_province(province_id=province_id, limit=limit)
-        data = RealEstateAgencyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENCY_LIST_TTL)
-        return data
+        def compute():
+            queryset = RealEstateAgencyPublicService.get_agencies_by_province(province_id=province_id, limit=limit)
+            return RealEstateAgencyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_LIST_TTL)
 
     @staticmethod
     def get_agency_statistics_data(agency_id):
         cache_key = AgencyPublicCacheKeys.statistics(agency_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        stats = RealEstateAgencyPublicService.get_agency_statistics(agency_id)
-        if stats is None:
-            return None
+        def compute():
+            stats = RealEstateAgencyPublicService.get_agency_statistics(agency_id)
+            if stats is None:
+                return None
+            return stats
 
-        cache.set(cache_key, stats, PUBLIC_AGENCY_STATS_TTL)
-        return stats
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_STATS_TTL)
 
     @staticmethod
     def get_agency_with_agents_data(slug):
         cache_key = AgencyPublicCacheKeys.with_agents(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agency_data = RealEstateAgencyPublicService.get_agency_with_agents(slug)
-        if not agency_data:
-            return None
+        def compute():
+            agency_data = RealEstateAgencyPublicService.get_agency_with_agents(slug)
+            if not agency_data:
+                return None
 
-        payload = {
-            'agency': RealEstateAgencyPublicDetailSerializer(agency_data['agency']).data,
-            'agents': PropertyAgentPublicListSerializer(agency_data['agents'], many=True).data,
-        }
-        cache.set(cache_key, payload, PUBLIC_AGENCY_WITH_AGENTS_TTL)
-        return payload
+            payload = {
+                'agency': RealEstateAgencyPublicDetailSerializer(agency_data['agency']).data,
+                'agents': PropertyAgentPublicListSerializer(agency_data['agents'], many=True).data,
+            }
+            return payload
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENCY_WITH_AGENTS_TTL)
@@ -1,13 +1,15 @@
 from datetime import datetime
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import F, Q
 
+from src.core.cache import get_or_compute
+from src.real_estate.models.agency import RealEstateAgency
 from src.real_estate.models.agent import PropertyAgent
 from src.real_estate.messages.messages import AGENT_ERRORS
 from src.real_estate.serializers.public.agent_serializer import (
     PropertyAgentPublicDetailSerializer,
     PropertyAgentPublicListSerializer,
 )
+from src.real_estate.services.admin.property_geo_services import PropertyGeoService
 from src.real_estate.utils.cache_public import AgentPublicCacheKeys
 from src.real_estate.utils.cache_ttl import (
     PUBLIC_AGENT_DETAIL_TTL,
@@ -83,15 +85,7 @@ class PropertyAgentPublicService:
             'social_media',
             'social_media__icon'
         ).annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-                distinct=True,
-            )
+            property_count=F('published_property_count')
         )
 
     @staticmethod
@@ -190,6 +184,65 @@ class PropertyAgentPublicService:
         
         return queryset
 
+    @staticmethod
+    def get_nearby_agents(latitude, longitude, radius_km=10, limit=10):
+
+        agencies = PropertyGeoService.search_nearby_locations(
+            queryset=RealEstateAgency.objects.filter(
+                is_active=True,
+                latitude__isnull=False,
+                longitude__isnull=False,
+            ).only('id', 'latitude', 'longitude'),
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
+        )
+        agency_distances = {agency.id: getattr(agency, '_distance_m', None) for agency in agencies}
+        if not agency_distances:
+            return []
+
+        agents = list(
+            PropertyAgent.objects.filter(
+                is_active=True,
+                agency_id__in=list(agency_distances),
+            ).select_related(
+                'user',
+                'user__admin_profile',
+                'user__admin_profile__city',
+                'user__admin_profile__province',
+                'agency',
+                'profile_picture'
+            ).prefetch_related(
+                'social_media',
+                'social_media__icon'
+            )
+        )
+
+        for agent in agents:
+            agent.property_count = agent.published_property_count
+            agent._distance_m = agency_distances.get(agent.agency_id)
+
+        agents.sort(key=lambda agent: (
+            agent._distance_m if agent._distance_m is not None else float('inf'),
+            -(agent.rating or 0),
+        ))
+        return agents[:limit]
+
+    @staticmethod
+    def get_nearby_agents_data(latitude, longitude, radius_km=10, limit=10):
+
+        agents = PropertyAgentPublicService.get_nearby_agents(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
+        )
+        data = PropertyAgentPublicListSerializer(agents, many=True).data
+        for item, agent in zip(data, agents):
+            item['distance_km'] = round(agent._distance_m / 1000.0, 2) if agent._distance_m is not None else None
+        return data
+
     @staticmethod
     def get_agent_statistics(agent_id):
 
@@ -247,106 +300,90 @@ class PropertyAgentPublicService:
     @staticmethod
     def get_agent_list_data(filters=None, search=None, ordering=None):
         cache_key = AgentPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyAgentPublicService.get_agent_queryset(filters=filters, search=search, ordering=ordering)
-        data = PropertyAgentPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENT_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyAgentPublicService.get_agent_queryset(filters=filters, search=search, ordering=ordering)
+            return PropertyAgentPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_LIST_TTL)
 
     @staticmethod
     def get_agent_detail_by_slug_data(slug):
         cache_key = AgentPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agent = PropertyAgentPublicService.get_agent_by_slug(slug)
-        if not agent:
-            return None
+        def compute():
+            agent = PropertyAgentPublicService.get_agent_by_slug(slug)
+            if not agent:
+                return None
 
-        data = PropertyAgentPublicDetailSerializer(agent).data
-        cache.set(cache_key, data, PUBLIC_AGENT_DETAIL_TTL)
-        return data
+            return PropertyAgentPublicDetailSerializer(agent).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_DETAIL_TTL)
 
     @staticmethod
     def get_agent_detail_by_id_data(agent_id):
         cache_key = AgentPublicCacheKeys.detail_id(agent_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agent = PropertyAgentPublicService.get_agent_by_id(agent_id)
-        if not agent:
-            return None
+        def compute():
+            agent = PropertyAgentPublicService.get_agent_by_id(agent_id)
+            if not agent:
+                return None
 
-        data = PropertyAgentPublicDetailSerializer(agent).data
-        cache.set(cache_key, data, PUBLIC_AGENT_DETAIL_TTL)
-        return data
+            return PropertyAgentPublicDetailSerializer(agent).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_DETAIL_TTL)
 
     @staticmethod
     def get_agent_detail_by_public_id_data(public_id):
         cache_key = AgentPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        agent = PropertyAgentPublicService.get_agent_by_public_id(public_id)
-        if not agent:
-            return None
+        def compute():
+            agent = PropertyAgentPublicService.get_agent_by_public_id(public_id)
+            if not agent:
+                return None
 
-        data = PropertyAgentPublicDetailSerializer(agent).data
-        cache.set(cache_key, data, PUBLIC_AGENT_DETAIL_TTL)
-        return data
+            return PropertyAgentPublicDetailSerializer(agent).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_DETAIL_TTL)
 
     @staticmethod
     def get_featured_agents_data(limit=6):
         cache_key = AgentPublicCacheKeys.featured(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyAgentPublicService.get_featured_agents(limit=limit)
-        data = PropertyAgentPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENT_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyAgentPublicService.get_featured_agents(limit=limit)
+            return PropertyAgentPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_LIST_TTL)
 
     @staticmethod
     def get_top_rated_agents_data(limit=10):
         cache_key = AgentPublicCacheKeys.top_rated(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyAgentPublicService.get_top_rated_agents(limit=limit)
-        data = PropertyAgentPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENT_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyAgentPublicService.get_top_rated_agents(limit=limit)
+            return PropertyAgentPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_LIST_TTL)
 
     @staticmethod
     def get_agents_by_agency_data(agency_id, limit=None):
         cache_key = AgentPublicCacheKeys.by_agency(agency_id, limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyAgentPublicService.get_agents_by_agency(agency_id=agency_id, limit=limit)
-        data = PropertyAgentPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_AGENT_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyAgentPublicService.get_agents_by_agency(agency_id=agency_id, limit=limit)
+            return PropertyAgentPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_LIST_TTL)
 
     @staticmethod
     def get_agent_statistics_data(agent_id):
         cache_key = AgentPublicCacheKeys.statistics(agent_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        stats = PropertyAgentPublicService.get_agent_statistics(agent_id)
-        if stats is None:
-            return None
+        def compute():
+            stats = PropertyAgentPublicService.get_agent_statistics(agent_id)
+            if stats is None:
+                return None
+            return stats
 
-        cache.set(cache_key, stats, PUBLIC_AGENT_STATS_TTL)
-        return stats
+        return get_or_compute(cache_key, compute, PUBLIC_AGENT_STATS_TTL)
@@ -1,6 +1,6 @@
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import F, Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.feature import PropertyFeature
 from src.real_estate.serializers.public.taxonomy_serializer import PropertyFeaturePublicSerializer
 from src.real_estate.utils.cache_public import FeaturePublicCacheKeys
@@ -31,15 +31,7 @@ class PropertyFeaturePublicService:
         return PropertyFeature.objects.filter(
             is_active=True,
         ).select_related('image', 'parent').annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-                distinct=True,
-            )
+            property_count=F('published_property_count')
         )
 
     @staticmethod
@@ -96,41 +88,35 @@ class PropertyFeaturePublicService:
     @staticmethod
     def get_feature_list_data(filters=None, search=None, ordering=None):
         cache_key = FeaturePublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyFeaturePublicService.get_feature_queryset(filters=filters, search=search, ordering=ordering)
-        data = PropertyFeaturePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyFeaturePublicService.get_feature_queryset(filters=filters, search=search, ordering=ordering)
+            return PropertyFeaturePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_feature_detail_by_public_id_data(public_id):
         cache_key = FeaturePublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        feature = PropertyFeaturePublicService.get_feature_by_public_id(public_id)
-        if not feature:
-            return None
+        def compute():
+            feature = PropertyFeaturePublicService.get_feature_by_public_id(public_id)
+            if not feature:
+                return None
 
-        data = PropertyFeaturePublicSerializer(feature).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return PropertyFeaturePublicSerializer(feature).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_feature_detail_by_id_data(feature_id):
         cache_key = FeaturePublicCacheKeys.detail_id(feature_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        feature = PropertyFeaturePublicService.get_feature_by_id(feature_id)
-        if not feature:
-            return None
+        def compute():
+            feature = PropertyFeaturePublicService.get_feature_by_id(feature_id)
+            if not feature:
+                return None
+
+            return PropertyFeaturePublicSerializer(feature).data
 
-        data = PropertyFeaturePublicSerializer(feature).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
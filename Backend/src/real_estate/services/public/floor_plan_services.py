@@ -1,6 +1,6 @@
-from django.core.cache import cache
 from django.db.models import Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.floor_plan import RealEstateFloorPlan
 from src.real_estate.serializers.public.floor_plan_serializer import FloorPlanPublicListSerializer
 from src.real_estate.utils.cache_public import FloorPlanPublicCacheKeys
@@ -115,56 +115,48 @@ class FloorPlanPublicService:
     @staticmethod
     def get_floor_plan_list_data(filters=None, search=None, ordering=None):
         cache_key = FloorPlanPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = FloorPlanPublicService.get_floor_plan_queryset(filters=filters, search=search, ordering=ordering)
-        data = FloorPlanPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_FLOOR_PLAN_LIST_TTL)
-        return data
+        def compute():
+            queryset = FloorPlanPublicService.get_floor_plan_queryset(filters=filters, search=search, ordering=ordering)
+            return FloorPlanPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_FLOOR_PLAN_LIST_TTL)
 
     @staticmethod
     def get_floor_plan_detail_by_slug_data(slug):
         cache_key = FloorPlanPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        floor_plan = FloorPlanPublicService.get_floor_plan_by_slug(slug)
-        if not floor_plan:
-            return None
+        def compute():
+            floor_plan = FloorPlanPublicService.get_floor_plan_by_slug(slug)
+            if not floor_plan:
+                return None
 
-        data = FloorPlanPublicListSerializer(floor_plan).data
-        cache.set(cache_key, data, PUBLIC_FLOOR_PLAN_DETAIL_TTL)
-        return data
+            return FloorPlanPublicListSerializer(floor_plan).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_FLOOR_PLAN_DETAIL_TTL)
 
     @staticmethod
     def get_floor_plan_detail_by_public_id_data(public_id):
         cache_key = FloorPlanPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        floor_plan = FloorPlanPublicService.get_floor_plan_by_public_id(public_id)
-        if not floor_plan:
-            return None
+        def compute():
+            floor_plan = FloorPlanPublicService.get_floor_plan_by_public_id(public_id)
+            if not floor_plan:
+                return None
 
-        data = FloorPlanPublicListSerializer(floor_plan).data
-        cache.set(cache_key, data, PUBLIC_FLOOR_PLAN_DETAIL_TTL)
-        return data
+            return FloorPlanPublicListSerializer(floor_plan).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_FLOOR_PLAN_DETAIL_TTL)
 
     @staticmethod
     def get_floor_plan_detail_by_id_data(floor_plan_id):
         cache_key = FloorPlanPublicCacheKeys.detail_id(floor_plan_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        floor_plan = FloorPlanPublicService.get_floor_plan_by_id(floor_plan_id)
-        if not floor_plan:
-            return None
+        def compute():
+            floor_plan = FloorPlanPublicService.get_floor_plan_by_id(floor_plan_id)
+            if not floor_plan:
+                return None
+
+            return FloorPlanPublicListSerializer(floor_plan).data
 
-        data = FloorPlanPublicListSerializer(floor_plan).data
-        cache.set(cache_key, data, PUBLIC_FLOOR_PLAN_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_FLOOR_PLAN_DETAIL_TTL)
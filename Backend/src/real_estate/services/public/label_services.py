@@ -1,6 +1,6 @@
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import F, Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.label import PropertyLabel
 from src.real_estate.serializers.public.taxonomy_serializer import PropertyLabelPublicSerializer
 from src.real_estate.utils.cache_public import LabelPublicCacheKeys
@@ -29,15 +29,7 @@ class PropertyLabelPublicService:
     @staticmethod
     def _base_queryset():
         return PropertyLabel.objects.filter(is_active=True).annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-                distinct=True,
-            )
+            property_count=F('published_property_count')
         )
 
     @staticmethod
@@ -76,56 +68,48 @@ class PropertyLabelPublicService:
     @staticmethod
     def get_label_list_data(filters=None, search=None, ordering=None):
         cache_key = LabelPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyLabelPublicService.get_label_queryset(filters=filters, search=search, ordering=ordering)
-        data = PropertyLabelPublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyLabelPublicService.get_label_queryset(filters=filters, search=search, ordering=ordering)
+            return PropertyLabelPublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_label_detail_by_slug_data(slug):
         cache_key = LabelPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        label = PropertyLabelPublicService.get_label_by_slug(slug)
-        if not label:
-            return None
+        def compute():
+            label = PropertyLabelPublicService.get_label_by_slug(slug)
+            if not label:
+                return None
+
+            return PropertyLabelPublicSerializer(label).data
 
-        data = PropertyLabelPublicSerializer(label).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_label_detail_by_id_data(label_id):
         cache_key = LabelPublicCacheKeys.detail_id(label_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        label = PropertyLabelPublicService.get_label_by_id(label_id)
-        if not label:
-            return None
+        def compute():
+            label = PropertyLabelPublicService.get_label_by_id(label_id)
+            if not label:
+                return None
 
-        data = PropertyLabelPublicSerializer(label).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return PropertyLabelPublicSerializer(label).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_label_detail_by_public_id_data(public_id):
         cache_key = LabelPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        label = PropertyLabelPublicService.get_label_by_public_id(public_id)
-        if not label:
-            return None
+        def compute():
+            label = PropertyLabelPublicService.get_label_by_public_id(public_id)
+            if not label:
+                return None
+
+            return PropertyLabelPublicSerializer(label).data
 
-        data = PropertyLabelPublicSerializer(label).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
@@ -1,6 +1,6 @@
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import F, Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.listing_type import ListingType
 from src.real_estate.serializers.public.listing_type_serializer import ListingTypePublicSerializer
 from src.real_estate.utils.cache_public import ListingTypePublicCacheKeys
@@ -38,14 +38,7 @@ class ListingTypePublicService:
         return ListingType.objects.filter(
             is_active=True,
         ).select_related('image').annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-            )
+            property_count=F('published_property_count')
         )
 
     @staticmethod
@@ -91,69 +84,59 @@ class ListingTypePublicService:
     @staticmethod
     def get_listing_type_list_data(filters=None, search=None, ordering=None):
         cache_key = ListingTypePublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = ListingTypePublicService.get_listing_type_queryset(filters=filters, search=search, ordering=ordering)
-        data = ListingTypePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = ListingTypePublicService.get_listing_type_queryset(filters=filters, search=search, ordering=ordering)
+            return ListingTypePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_listing_type_detail_by_slug_data(slug):
         cache_key = ListingTypePublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        listing_type = ListingTypePublicService.get_listing_type_by_slug(slug)
-        if not listing_type:
-            return None
+        def compute():
+            listing_type = ListingTypePublicService.get_listing_type_by_slug(slug)
+            if not listing_type:
+                return None
 
-        data = ListingTypePublicSerializer(listing_type).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return ListingTypePublicSerializer(listing_type).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_listing_type_detail_by_id_data(listing_type_id):
         cache_key = ListingTypePublicCacheKeys.detail_id(listing_type_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        listing_type = ListingTypePublicService.get_listing_type_by_id(listing_type_id)
-        if not listing_type:
-            return None
+        def compute():
+            listing_type = ListingTypePublicService.get_listing_type_by_id(listing_type_id)
+            if not listing_type:
+                return None
 
-        data = ListingTypePublicSerializer(listing_type).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return ListingTypePublicSerializer(listing_type).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_listing_type_detail_by_public_id_data(public_id):
         cache_key = ListingTypePublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        listing_type = ListingTypePublicService.get_listing_type_by_public_id(public_id)
-        if not listing_type:
-            return None
+        def compute():
+            listing_type = ListingTypePublicService.get_listing_type_by_public_id(public_id)
+            if not listing_type:
+                return None
+
+            return ListingTypePublicSerializer(listing_type).data
 
-        data = ListingTypePublicSerializer(listing_type).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_featured_listing_types_data(limit=3):
         cache_key = ListingTypePublicCacheKeys.featured(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = ListingTypePublicService.get_featured_listing_types(limit=limit)
-        data = ListingTypePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+
+        def compute():
+            queryset = ListingTypePublicService.get_featured_listing_types(limit=limit)
+            return ListingTypePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
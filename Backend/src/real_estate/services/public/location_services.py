@@ -1,6 +1,6 @@
-from django.core.cache import cache
 from django.db.models import Count, Q
 
+from src.core.cache import get_or_compute
 from src.core.models import City, Province
 from src.real_estate.models.location import CityRegion
 from src.real_estate.serializers.public.location_serializer import CityPublicSerializer, ProvincePublicSerializer, RegionPublicSerializer
@@ -104,65 +104,57 @@ class PropertyLocationPublicService:
     def get_province_list_data(filters=None, search: str | None = None, ordering: str | None = None):
         normalized_filters = filters or {}
         cache_key = LocationPublicCacheKeys.province_list(filters=normalized_filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = PropertyLocationPublicService.get_provinces_queryset(
-            filters=normalized_filters,
-            search=search,
-            ordering=ordering,
-        )
-        data = ProvincePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+
+        def compute():
+            queryset = PropertyLocationPublicService.get_provinces_queryset(
+                filters=normalized_filters,
+                search=search,
+                ordering=ordering,
+            )
+            return ProvincePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_city_list_data(filters=None, search: str | None = None, ordering: str | None = None):
         normalized_filters = filters or {}
         cache_key = LocationPublicCacheKeys.city_list(filters=normalized_filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = PropertyLocationPublicService.get_cities_queryset(
-            filters=normalized_filters,
-            search=search,
-            ordering=ordering,
-        )
-        data = CityPublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+
+        def compute():
+            queryset = PropertyLocationPublicService.get_cities_queryset(
+                filters=normalized_filters,
+                search=search,
+                ordering=ordering,
+            )
+            return CityPublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_province_detail_by_id_data(province_id):
         cache_key = LocationPublicCacheKeys.province_detail(province_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        province = PropertyLocationPublicService._base_provinces_queryset().filter(id=province_id).first()
-        if not province:
-            return None
+        def compute():
+            province = PropertyLocationPublicService._base_provinces_queryset().filter(id=province_id).first()
+            if not province:
+                return None
 
-        data = ProvincePublicSerializer(province).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return ProvincePublicSerializer(province).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_city_detail_by_id_data(city_id):
         cache_key = LocationPublicCacheKeys.city_detail(city_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        city = City.objects.filter(id=city_id, is_active=True).select_related("province").first()
-        if not city:
-            return None
+        def compute():
+            city = City.objects.filter(id=city_id, is_active=True).select_related("province").first()
+            if not city:
+                return None
+
+            return CityPublicSerializer(city).data
 
-        data = CityPublicSerializer(city).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_regions_queryset(filters=None, search: str | None = None, ordering: str | None = None):
@@ -200,30 +192,26 @@ class PropertyLocationPublicService:
     def get_region_list_data(filters=None, search: str | None = None, ordering: str | None = None):
         normalized_filters = filters or {}
         cache_key = LocationPublicCacheKeys.region_list(filters=normalized_filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = PropertyLocationPublicService.get_regions_queryset(
-            filters=normalized_filters,
-            search=search,
-            ordering=ordering,
-        )
-        data = RegionPublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+
+        def compute():
+            queryset = PropertyLocationPublicService.get_regions_queryset(
+                filters=normalized_filters,
+                search=search,
+                ordering=ordering,
+            )
+            return RegionPublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_region_detail_by_id_data(region_id):
         cache_key = LocationPublicCacheKeys.region_detail(region_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        region = CityRegion.objects.filter(id=region_id, is_active=True).select_related("city", "city__province").first()
-        if not region:
-            return None
+        def compute():
+            region = CityRegion.objects.filter(id=region_id, is_active=True).select_related("city", "city__province").first()
+            if not region:
+                return None
+
+            return RegionPublicSerializer(region).data
 
-        data = RegionPublicSerializer(region).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
@@ -0,0 +1,155 @@
+import base64
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from django.db import connection
+
+from src.core.cache import CacheService
+from src.real_estate.models.property import Property
+from src.real_estate.services.admin.property_geo_services import PropertyGeoService
+from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
+from src.real_estate.utils.cache_ttl import PUBLIC_MAP_TILE_TTL
+from src.real_estate.utils.map_tiles import is_valid_tile, tile_bounds
+
+logger = logging.getLogger(__name__)
+
+MAP_TILE_LAYER = 'properties'
+MAP_TILE_EXTENT = 4096
+MAP_TILE_BUFFER = 64
+MAP_TILE_MAX_FEATURES = 2000
+MAP_TILE_FIELDS = (
+    'id',
+    'slug',
+    'price',
+    'sale_price',
+    'monthly_rent',
+    'bedrooms',
+    'built_area',
+    'is_featured',
+)
+MAP_TILE_CONTENT_TYPES = {
+    'mvt': 'application/vnd.mapbox-vector-tile',
+    'json': 'application/json',
+}
+
+class PropertyMapTileService:
+
+    @staticmethod
+    def is_valid_tile(zoom: int, x: int, y: int) -> bool:
+        return is_valid_tile(zoom, x, y)
+
+    @staticmethod
+    def resolve_format(requested: Optional[str] = None) -> str:
+        if requested == 'json':
+            return 'json'
+        return 'mvt' if PropertyGeoService._use_postgis() else 'json'
+
+    @staticmethod
+    def content_type(tile_format: str) -> str:
+        return MAP_TILE_CONTENT_TYPES[tile_format]
+
+    @classmethod
+    def get_tile(cls, zoom: int, x: int, y: int, tile_format: str) -> Dict[str, Any]:
+        cache_key = PropertyPublicCacheKeys.map_tile(tile_format, zoom, x, y)
+        cached = CacheService.get(cache_key)
+        if cached is not None:
+            return {**cached, 'body': base64.b64decode(cached['body'])}
+
+        body = None
+        if tile_format == 'mvt':
+            try:
+                body = cls._render_mvt(zoom, x, y)
+            except Exception:
+                logger.exception("PostGIS MVT tile query failed. Falling back to JSON tile.")
+                tile_format = 'json'
+                cache_key = PropertyPublicCacheKeys.map_tile(tile_format, zoom, x, y)
+        if body is None:
+            body = cls._render_json(zoom, x, y)
+
+        entry = {
+            'format': tile_format,
+            'body': body,
+            'etag': f'"{hashlib.sha1(body).hexdigest()}"',
+        }
+        CacheService.set(cache_key, {**entry, 'body': base64.b64encode(body).decode()}, PUBLIC_MAP_TILE_TTL)
+        return entry
+
+    @staticmethod
+    def _render_mvt(zoom: int, x: int, y: int) -> bytes:
+        table = connection.ops.quote_name(Property._meta.db_table)
+        point_expr = PropertyGeoService._location_point_expr_sql()
+
+        sql = f"""
+            WITH bounds AS (
+                SELECT ST_TileEnvelope(%s, %s, %s) AS geom_3857
+            ),
+            features AS (
+                SELECT
+                    ST_AsMVTGeom(ST_Transform({point_expr}, 3857), bounds.geom_3857, %s, %s, true) AS geom,
+                    {table}.id,
+                    {table}.slug,
+                    {table}.price,
+                    {table}.sale_price,
+                    {table}.monthly_rent,
+                    {table}.bedrooms,
+                    {table}.built_area::float8 AS built_area,
+                    {table}.is_featured
+                FROM {table}, bounds
+                WHERE {table}.is_published
+                  AND {table}.is_public
+                  AND {table}.is_active
+                  AND {table}.latitude IS NOT NULL
+                  AND {table}.longitude IS NOT NULL
+                  AND ({point_expr}) && ST_Transform(bounds.geom_3857, 4326)
+                ORDER BY {table}.is_featured DESC, {table}.published_at DESC NULLS LAST
+                LIMIT %s
+            )
+            SELECT ST_AsMVT(features, %s, %s, 'geom') FROM features
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [
+                zoom, x, y,
+                MAP_TILE_EXTENT, MAP_TILE_BUFFER,
+                MAP_TILE_MAX_FEATURES,
+                MAP_TILE_LAYER, MAP_TILE_EXTENT,
+            ])
+            row = cursor.fetchone()
+
+        return bytes(row[0]) if row and row[0] is not None else b''
+
+    @staticmethod
+    def _render_json(zoom: int, x: int, y: int) -> bytes:
+        min_lat, max_lat, min_lon, max_lon = tile_bounds(zoom, x, y)
+        queryset = PropertyGeoService._filter_bbox(
+            min_lat,
+            max_lat,
+            min_lon,
+            max_lon,
+            Property.objects.published().active(),
+        ).order_by('-is_featured', '-published_at')
+
+        values = list(
+            queryset.values_list('latitude', 'longitude', *MAP_TILE_FIELDS)[:MAP_TILE_MAX_FEATURES + 1]
+        )
+        truncated = len(values) > MAP_TILE_MAX_FEATURES
+
+        area_index = MAP_TILE_FIELDS.index('built_area')
+        rows = []
+        for latitude, longitude, *fields in values[:MAP_TILE_MAX_FEATURES]:
+            if fields[area_index] is not None:
+                fields[area_index] = float(fields[area_index])
+            rows.append([round(float(latitude), 6), round(float(longitude), 6), *fields])
+
+        payload = {
+            'layer': MAP_TILE_LAYER,
+            'z': zoom,
+            'x': x,
+            'y': y,
+            'fields': ['latitude', 'longitude', *MAP_TILE_FIELDS],
+            'rows': rows,
+            'truncated': truncated,
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode()
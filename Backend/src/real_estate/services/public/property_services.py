@@ -1,21 +1,27 @@
+import logging
 from datetime import datetime
 
 from django.core.cache import cache
 from django.db.models import Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.property import Property
 from src.real_estate.serializers.public.property_serializer import (
     PropertyPublicDetailSerializer,
     PropertyPublicListSerializer,
 )
+from src.real_estate.services.public.related_property_service import PropertyRelatedService
 from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
 from src.real_estate.utils.cache_ttl import (
     PUBLIC_PROPERTY_DETAIL_TTL,
     PUBLIC_PROPERTY_FEATURED_TTL,
     PUBLIC_PROPERTY_LIST_TTL,
+    PUBLIC_PROPERTY_RELATED_REFRESH_LOCK_TTL,
     PUBLIC_PROPERTY_RELATED_TTL,
 )
 
+logger = logging.getLogger(__name__)
+
 class PropertyPublicService:
     ALLOWED_ORDERING_FIELDS = {
         'created_at',
@@ -209,6 +215,10 @@ class PropertyPublicService:
     def get_property_by_slug(slug):
         return Property.objects.for_detail().published().active().filter(slug=slug).first()
 
+    @staticmethod
+    def get_property_id_by_slug(slug):
+        return Property.objects.published().active().filter(slug=slug).values_list('id', flat=True).first()
+
     @staticmethod
     def get_property_by_id(property_id):
         return Property.objects.for_detail().published().active().filter(id=property_id).first()
@@ -226,6 +236,29 @@ class PropertyPublicService:
         if not property_obj:
             return Property.objects.none()
 
+        related_ids = PropertyRelatedService.get_related_ids(property_obj.id)
+        if related_ids is None:
+            PropertyPublicService._schedule_related_refresh(property_obj.id)
+            return PropertyPublicService._get_fallback_related_properties(property_obj, limit)
+
+        related_ids = related_ids[:limit * 2]
+        by_id = PropertyPublicService._base_queryset().in_bulk(related_ids)
+        return [by_id[pk] for pk in related_ids if pk in by_id][:limit]
+
+    @staticmethod
+    def _schedule_related_refresh(property_id):
+        from src.real_estate.tasks import refresh_related_properties
+
+        lock_key = PropertyPublicCacheKeys.related_refresh_lock(property_id)
+        try:
+            if not cache.add(lock_key, 1, PUBLIC_PROPERTY_RELATED_REFRESH_LOCK_TTL):
+                return
+            refresh_related_properties.delay(property_id)
+        except Exception as e:
+            logger.warning(f"Related properties refresh scheduling failed for property={property_id}: {e}")
+
+    @staticmethod
+    def _get_fallback_related_properties(property_obj, limit=4):
         queryset = PropertyPublicService._base_queryset().exclude(id=property_obj.id)
 
         related_filter = Q()
@@ -244,71 +277,61 @@ class PropertyPublicService:
     @staticmethod
     def get_property_list_data(filters=None, search=None, ordering=None):
         cache_key = PropertyPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyPublicService.get_property_queryset(filters=filters, search=search, ordering=ordering)
-        data = PropertyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_PROPERTY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyPublicService.get_property_queryset(filters=filters, search=search, ordering=ordering)
+            return PropertyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_PROPERTY_LIST_TTL)
 
     @staticmethod
     def get_property_detail_by_slug_data(slug):
         cache_key = PropertyPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        property_obj = PropertyPublicService.get_property_by_slug(slug)
-        if not property_obj:
-            return None
+        def compute():
+            property_obj = PropertyPublicService.get_property_by_slug(slug)
+            if not property_obj:
+                return None
+
+            return PropertyPublicDetailSerializer(property_obj).data
 
-        data = PropertyPublicDetailSerializer(property_obj).data
-        cache.set(cache_key, data, PUBLIC_PROPERTY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_PROPERTY_DETAIL_TTL)
 
     @staticmethod
     def get_property_detail_by_id_data(property_id):
         cache_key = PropertyPublicCacheKeys.detail_id(property_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        property_obj = PropertyPublicService.get_property_by_id(property_id)
-        if not property_obj:
-            return None
+        def compute():
+            property_obj = PropertyPublicService.get_property_by_id(property_id)
+            if not property_obj:
+                return None
+
+            return PropertyPublicDetailSerializer(property_obj).data
 
-        data = PropertyPublicDetailSerializer(property_obj).data
-        cache.set(cache_key, data, PUBLIC_PROPERTY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_PROPERTY_DETAIL_TTL)
 
     @staticmethod
     def get_property_detail_by_public_id_data(public_id):
         cache_key = PropertyPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        property_obj = PropertyPublicService.get_property_by_public_id(public_id)
-        if not property_obj:
-            return None
+        def compute():
+            property_obj = PropertyPublicService.get_property_by_public_id(public_id)
+            if not property_obj:
+                return None
+
+            return PropertyPublicDetailSerializer(property_obj).data
 
-        data = PropertyPublicDetailSerializer(property_obj).data
-        cache.set(cache_key, data, PUBLIC_PROPERTY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_PROPERTY_DETAIL_TTL)
 
     @staticmethod
     def get_featured_properties_data(limit=10):
         cache_key = PropertyPublicCacheKeys.featured(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyPublicService.get_featured_properties(limit=limit)
-        data = PropertyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_PROPERTY_FEATURED_TTL)
-        return data
+        def compute():
+            queryset = PropertyPublicService.get_featured_properties(limit=limit)
+            return PropertyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_PROPERTY_FEATURED_TTL)
 
     @staticmethod
     def get_related_properties_data(property_obj, limit=4):
@@ -316,11 +339,9 @@ class PropertyPublicService:
             return []
 
         cache_key = PropertyPublicCacheKeys.related(property_obj.slug, limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = PropertyPublicService.get_related_properties(property_obj, limit=limit)
-        data = PropertyPublicListSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_PROPERTY_RELATED_TTL)
-        return data
+
+        def compute():
+            queryset = PropertyPublicService.get_related_properties(property_obj, limit=limit)
+            return PropertyPublicListSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_PROPERTY_RELATED_TTL)
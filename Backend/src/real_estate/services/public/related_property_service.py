@@ -0,0 +1,253 @@
+import heapq
+import logging
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+
+from src.real_estate.models.property import Property
+from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
+from src.real_estate.utils.cache_ttl import PUBLIC_PROPERTY_RELATED_INDEX_TTL
+
+logger = logging.getLogger(__name__)
+
+RELATED_TOP_K = 24
+RELATED_CANDIDATE_LIMIT = 1000
+RELATED_WRITE_CHUNK = 500
+RELATED_RATIO_SPAN = math.log(2)
+RELATED_BEDROOM_SPAN = 3.0
+RELATED_WEIGHTS = {
+    'property_type': 3.0,
+    'region': 1.5,
+    'price_per_sqm': 2.0,
+    'built_area': 1.5,
+    'bedrooms': 1.0,
+    'attributes': 2.0,
+    'featured': 0.1,
+}
+FEATURE_COLUMNS = (
+    'id',
+    'property_type_id',
+    'state_id',
+    'city_id',
+    'province_id',
+    'region_id',
+    'price_per_sqm',
+    'built_area',
+    'bedrooms',
+    'is_featured',
+)
+
+class PropertyFeatureMatrix:
+
+    __slots__ = ('ids', 'type_ids', 'region_ids', 'log_ppsqm', 'log_area', 'bedrooms', 'featured', 'attributes', 'index')
+
+    def __init__(self, rows: List[tuple], attributes: Dict[int, frozenset]):
+        self.ids = [row[0] for row in rows]
+        self.type_ids = [row[1] for row in rows]
+        self.region_ids = [row[5] for row in rows]
+        self.log_ppsqm = [_log(row[6]) for row in rows]
+        self.log_area = [_log(row[7]) for row in rows]
+        self.bedrooms = [row[8] for row in rows]
+        self.featured = [bool(row[9]) for row in rows]
+        self.attributes = [attributes.get(row[0], frozenset()) for row in rows]
+        self.index = {pk: i for i, pk in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, i: int) -> List[float]:
+        weights = RELATED_WEIGHTS
+        type_id = self.type_ids[i]
+        region_id = self.region_ids[i]
+        log_ppsqm = self.log_ppsqm[i]
+        log_area = self.log_area[i]
+        bedrooms = self.bedrooms[i]
+        attributes = self.attributes[i]
+
+        scores = []
+        for j in range(len(self.ids)):
+            score = 0.0
+            if type_id is not None and self.type_ids[j] == type_id:
+                score += weights['property_type']
+            if region_id is not None and self.region_ids[j] == region_id:
+                score += weights['region']
+            other = self.log_ppsqm[j]
+            if log_ppsqm is not None and other is not None:
+                score += weights['price_per_sqm'] * max(0.0, 1.0 - abs(log_ppsqm - other) / RELATED_RATIO_SPAN)
+            other = self.log_area[j]
+            if log_area is not None and other is not None:
+                score += weights['built_area'] * max(0.0, 1.0 - abs(log_area - other) / RELATED_RATIO_SPAN)
+            other = self.bedrooms[j]
+            if bedrooms is not None and other is not None:
+                score += weights['bedrooms'] * max(0.0, 1.0 - abs(bedrooms - other) / RELATED_BEDROOM_SPAN)
+            other = self.attributes[j]
+            if attributes and other:
+                shared = len(attributes & other)
+                if shared:
+                    score += weights['attributes'] * shared / (len(attributes) + len(other) - shared)
+            if self.featured[j]:
+                score += weights['featured']
+            scores.append(score)
+        scores[i] = -1.0
+        return scores
+
+    def top_k(self, i: int, k: int = RELATED_TOP_K, scores: Optional[List[float]] = None) -> List[list]:
+        if scores is None:
+            scores = self.scores(i)
+        best = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        return [[self.ids[j], round(scores[j], 4)] for j in best if scores[j] > 0]
+
+def _log(value) -> Optional[float]:
+    if value is None:
+        return None
+    value = float(value)
+    return math.log(value) if value > 0 else None
+
+class PropertyRelatedService:
+
+    @staticmethod
+    def _published():
+        return Property.objects.published().active()
+
+    @staticmethod
+    def _attributes(property_ids: List[int]) -> Dict[int, frozenset]:
+        attributes = defaultdict(set)
+        tag_through = Property.tags.through
+        feature_through = Property.features.through
+        for property_id, tag_id in tag_through.objects.filter(property_id__in=property_ids).values_list('property_id', 'propertytag_id'):
+            attributes[property_id].add(tag_id)
+        for property_id, feature_id in feature_through.objects.filter(property_id__in=property_ids).values_list('property_id', 'propertyfeature_id'):
+            attributes[property_id].add(-feature_id)
+        return {property_id: frozenset(values) for property_id, values in attributes.items()}
+
+    @classmethod
+    def _block_rows(cls, city_id, province_id, state_id, include_id=None) -> List[tuple]:
+        queryset = cls._published().filter(city_id=city_id)
+        if state_id is not None:
+            queryset = queryset.filter(state_id=state_id)
+        rows = list(queryset.order_by('-published_at', '-id').values_list(*FEATURE_COLUMNS)[:RELATED_CANDIDATE_LIMIT])
+
+        if len(rows) <= RELATED_TOP_K and province_id is not None:
+            queryset = cls._published().filter(province_id=province_id)
+            if state_id is not None:
+                queryset = queryset.filter(state_id=state_id)
+            rows = list(queryset.order_by('-published_at', '-id').values_list(*FEATURE_COLUMNS)[:RELATED_CANDIDATE_LIMIT])
+
+        if include_id is not None and all(row[0] != include_id for row in rows):
+            rows.extend(cls._published().filter(pk=include_id).values_list(*FEATURE_COLUMNS))
+        return rows
+
+    @classmethod
+    def _matrix(cls, rows: List[tuple]) -> PropertyFeatureMatrix:
+        return PropertyFeatureMatrix(rows, cls._attributes([row[0] for row in rows]))
+
+    @staticmethod
+    def get_related_ids(property_id: int) -> Optional[List[int]]:
+        entries = cache.get(PropertyPublicCacheKeys.related_index(property_id))
+        if entries is None:
+            return None
+        return [entry[0] for entry in entries]
+
+    @staticmethod
+    def _store(lists: Dict[int, List[list]]) -> None:
+        items = list(lists.items())
+        for start in range(0, len(items), RELATED_WRITE_CHUNK):
+            cache.set_many(
+                {
+                    PropertyPublicCacheKeys.related_index(property_id): entries
+                    for property_id, entries in items[start:start + RELATED_WRITE_CHUNK]
+                },
+                PUBLIC_PROPERTY_RELATED_INDEX_TTL,
+            )
+
+    @classmethod
+    def refresh_property(cls, property_id: int) -> int:
+        row = Property.objects.filter(pk=property_id).values('city_id', 'province_id', 'state_id', 'is_published', 'is_public', 'is_active').first()
+        if row is None or not (row['is_published'] and row['is_public'] and row['is_active']):
+            cache.delete(PropertyPublicCacheKeys.related_index(property_id))
+            return 0
+
+        rows = cls._block_rows(row['city_id'], row['province_id'], row['state_id'], include_id=property_id)
+        matrix = cls._matrix(rows)
+        i = matrix.index.get(property_id)
+        if i is None:
+            return 0
+
+        scores = matrix.scores(i)
+        updates = {property_id: matrix.top_k(i, scores=scores)}
+        updates.update(cls._merge_into_neighbours(matrix, i, scores))
+        cls._store(updates)
+        return len(updates)
+
+    @staticmethod
+    def _merge_into_neighbours(matrix: PropertyFeatureMatrix, i: int, scores: List[float]) -> Dict[int, List[list]]:
+        property_id = matrix.ids[i]
+        featured_weight = RELATED_WEIGHTS['featured']
+        neighbour_ids = [matrix.ids[j] for j, score in enumerate(scores) if score > 0]
+        if not neighbour_ids:
+            return {}
+
+        keys = {PropertyPublicCacheKeys.related_index(pk): pk for pk in neighbour_ids}
+        stored = cache.get_many(list(keys))
+
+        updates = {}
+        for key, entries in stored.items():
+            neighbour_id = keys[key]
+            j = matrix.index[neighbour_id]
+            score = scores[j] - featured_weight * matrix.featured[j] + featured_weight * matrix.featured[i]
+            score = round(score, 4)
+            entries = [entry for entry in entries if entry[0] != property_id]
+            if len(entries) < RELATED_TOP_K or score > entries[-1][1]:
+                entries.append([property_id, score])
+                entries.sort(key=lambda entry: entry[1], reverse=True)
+                updates[neighbour_id] = entries[:RELATED_TOP_K]
+        return updates
+
+    @classmethod
+    def rebuild(cls, city_ids: Optional[Iterable[int]] = None) -> int:
+        blocks = cls._published().order_by()
+        if city_ids is not None:
+            blocks = blocks.filter(city_id__in=list(city_ids))
+        blocks = blocks.values_list('city_id', 'province_id', 'state_id').distinct()
+
+        total = 0
+        for city_id, province_id, state_id in blocks:
+            candidate_rows = cls._block_rows(city_id, province_id, state_id)
+            candidate_ids = [row[0] for row in candidate_rows]
+            attributes = cls._attributes(candidate_ids)
+
+            matrix = PropertyFeatureMatrix(candidate_rows, attributes)
+            lists = {
+                row[0]: matrix.top_k(i)
+                for i, row in enumerate(candidate_rows)
+                if row[3] == city_id and row[2] == state_id
+            }
+
+            remaining = cls._published().filter(
+                city_id=city_id,
+                state_id=state_id,
+            ).exclude(pk__in=candidate_ids).values_list(*FEATURE_COLUMNS)
+            chunk = []
+            for row in remaining.iterator(chunk_size=RELATED_WRITE_CHUNK):
+                chunk.append(row)
+                if len(chunk) >= RELATED_WRITE_CHUNK:
+                    lists.update(cls._top_k_for_rows(candidate_rows, attributes, chunk))
+                    chunk = []
+            if chunk:
+                lists.update(cls._top_k_for_rows(candidate_rows, attributes, chunk))
+
+            cls._store(lists)
+            total += len(lists)
+            logger.info(f"🔗 [RelatedProperties] city={city_id} state={state_id} listings={len(lists)} candidates={len(candidate_rows)}")
+        return total
+
+    @classmethod
+    def _top_k_for_rows(cls, candidate_rows, attributes, rows) -> Dict[int, List[list]]:
+        matrix = PropertyFeatureMatrix(
+            candidate_rows + rows,
+            {**attributes, **cls._attributes([row[0] for row in rows])},
+        )
+        offset = len(candidate_rows)
+        return {row[0]: matrix.top_k(offset + i) for i, row in enumerate(rows)}
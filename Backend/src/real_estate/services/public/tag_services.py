@@ -1,6 +1,6 @@
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import F, Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.tag import PropertyTag
 from src.real_estate.serializers.public.taxonomy_serializer import PropertyTagPublicSerializer
 from src.real_estate.utils.cache_public import TagPublicCacheKeys
@@ -33,15 +33,7 @@ class PropertyTagPublicService:
             is_active=True,
             is_public=True,
         ).annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-                distinct=True,
-            )
+            property_count=F('published_property_count')
         )
 
     @staticmethod
@@ -86,68 +78,58 @@ class PropertyTagPublicService:
     @staticmethod
     def get_tag_list_data(filters=None, search=None, ordering=None):
         cache_key = TagPublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyTagPublicService.get_tag_queryset(filters=filters, search=search, ordering=ordering)
-        data = PropertyTagPublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyTagPublicService.get_tag_queryset(filters=filters, search=search, ordering=ordering)
+            return PropertyTagPublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_tag_detail_by_slug_data(slug):
         cache_key = TagPublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = PropertyTagPublicService.get_tag_by_slug(slug)
-        if not tag:
-            return None
+        def compute():
+            tag = PropertyTagPublicService.get_tag_by_slug(slug)
+            if not tag:
+                return None
 
-        data = PropertyTagPublicSerializer(tag).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return PropertyTagPublicSerializer(tag).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_tag_detail_by_id_data(tag_id):
         cache_key = TagPublicCacheKeys.detail_id(tag_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = PropertyTagPublicService.get_tag_by_id(tag_id)
-        if not tag:
-            return None
+        def compute():
+            tag = PropertyTagPublicService.get_tag_by_id(tag_id)
+            if not tag:
+                return None
+
+            return PropertyTagPublicSerializer(tag).data
 
-        data = PropertyTagPublicSerializer(tag).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_tag_detail_by_public_id_data(public_id):
         cache_key = TagPublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        tag = PropertyTagPublicService.get_tag_by_public_id(public_id)
-        if not tag:
-            return None
+        def compute():
+            tag = PropertyTagPublicService.get_tag_by_public_id(public_id)
+            if not tag:
+                return None
 
-        data = PropertyTagPublicSerializer(tag).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return PropertyTagPublicSerializer(tag).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_popular_tags_data(limit=10):
         cache_key = TagPublicCacheKeys.popular(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = PropertyTagPublicService.get_popular_tags(limit=limit)
-        data = PropertyTagPublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_POPULAR_TTL)
-        return data
+
+        def compute():
+            queryset = PropertyTagPublicService.get_popular_tags(limit=limit)
+            return PropertyTagPublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_POPULAR_TTL)
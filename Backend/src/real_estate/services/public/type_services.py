@@ -1,6 +1,6 @@
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import F, Q
 
+from src.core.cache import get_or_compute
 from src.real_estate.models.type import PropertyType
 from src.real_estate.serializers.public.taxonomy_serializer import PropertyTypePublicSerializer
 from src.real_estate.utils.cache_public import TypePublicCacheKeys
@@ -33,15 +33,7 @@ class PropertyTypePublicService:
             is_active=True,
             is_public=True,
         ).select_related('image').annotate(
-            property_count=Count(
-                'properties',
-                filter=Q(
-                    properties__is_active=True,
-                    properties__is_public=True,
-                    properties__is_published=True,
-                ),
-                distinct=True,
-            )
+            property_count=F('published_property_count')
         )
 
     @staticmethod
@@ -96,92 +88,78 @@ class PropertyTypePublicService:
     @staticmethod
     def get_type_list_data(filters=None, search=None, ordering=None):
         cache_key = TypePublicCacheKeys.list(filters=filters, search=search, ordering=ordering)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyTypePublicService.get_type_queryset(filters=filters, search=search, ordering=ordering)
-        data = PropertyTypePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyTypePublicService.get_type_queryset(filters=filters, search=search, ordering=ordering)
+            return PropertyTypePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_type_detail_by_slug_data(slug):
         cache_key = TypePublicCacheKeys.detail_slug(slug)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        property_type = PropertyTypePublicService.get_type_by_slug(slug)
-        if not property_type:
-            return None
+        def compute():
+            property_type = PropertyTypePublicService.get_type_by_slug(slug)
+            if not property_type:
+                return None
+
+            return PropertyTypePublicSerializer(property_type).data
 
-        data = PropertyTypePublicSerializer(property_type).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_type_detail_by_id_data(type_id):
         cache_key = TypePublicCacheKeys.detail_id(type_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        property_type = PropertyTypePublicService.get_type_by_id(type_id)
-        if not property_type:
-            return None
+        def compute():
+            property_type = PropertyTypePublicService.get_type_by_id(type_id)
+            if not property_type:
+                return None
 
-        data = PropertyTypePublicSerializer(property_type).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+            return PropertyTypePublicSerializer(property_type).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_type_detail_by_public_id_data(public_id):
         cache_key = TypePublicCacheKeys.detail_public_id(public_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        property_type = PropertyTypePublicService.get_type_by_public_id(public_id)
-        if not property_type:
-            return None
+        def compute():
+            property_type = PropertyTypePublicService.get_type_by_public_id(public_id)
+            if not property_type:
+                return None
+
+            return PropertyTypePublicSerializer(property_type).data
 
-        data = PropertyTypePublicSerializer(property_type).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_DETAIL_TTL)
-        return data
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_DETAIL_TTL)
 
     @staticmethod
     def get_root_types_data():
         cache_key = TypePublicCacheKeys.roots()
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyTypePublicService.get_root_types()
-        data = PropertyTypePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyTypePublicService.get_root_types()
+            return PropertyTypePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_tree_data():
         cache_key = TypePublicCacheKeys.tree()
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
 
-        queryset = PropertyTypePublicService.get_tree_queryset()
-        data = PropertyTypePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_LIST_TTL)
-        return data
+        def compute():
+            queryset = PropertyTypePublicService.get_tree_queryset()
+            return PropertyTypePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_LIST_TTL)
 
     @staticmethod
     def get_popular_types_data(limit=10):
         cache_key = TypePublicCacheKeys.popular(limit)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        queryset = PropertyTypePublicService.get_popular_types(limit=limit)
-        data = PropertyTypePublicSerializer(queryset, many=True).data
-        cache.set(cache_key, data, PUBLIC_TAXONOMY_POPULAR_TTL)
-        return data
+
+        def compute():
+            queryset = PropertyTypePublicService.get_popular_types(limit=limit)
+            return PropertyTypePublicSerializer(queryset, many=True).data
+
+        return get_or_compute(cache_key, compute, PUBLIC_TAXONOMY_POPULAR_TTL)
@@ -1,7 +1,8 @@
 
-from django.db.models.signals import post_save, post_delete
+from collections import Counter
+
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
 from django.dispatch import receiver
-from django.core.cache import cache
 
 from .models.property import Property
 from .models.type import PropertyType
@@ -11,21 +12,124 @@ from .models.feature import PropertyFeature
 from .models.label import PropertyLabel
 from .models.agent import PropertyAgent
 from .models.agency import RealEstateAgency
+from src.core.cache import invalidate_pattern
+from src.core.utils.commit_batch import add_to_commit_batch
+from src.real_estate.services.admin.property_counter_service import COUNTED_MANY_TO_MANY, PropertyCounterService
+from src.real_estate.services.analytics.market_index_service import MarketPriceIndexService
 from src.real_estate.utils.cache_admin import PropertyCacheManager, TypeCacheManager
 from src.user.services.admin_performance_service import AdminPerformanceService
 from src.user.models.admin_profile import AdminProfile
 
+def _loaded_location(instance):
+    loaded = getattr(instance, '_loaded_values', None)
+    if not loaded:
+        return None
+    return loaded.get('latitude'), loaded.get('longitude')
+
 @receiver(post_save, sender=Property)
 def invalidate_property_cache_on_save(sender, instance, **kwargs):
     if instance.pk:
         PropertyCacheManager.invalidate_property(instance.pk)
         PropertyCacheManager.invalidate_list()
+        PropertyCacheManager.invalidate_map_tiles([
+            _loaded_location(instance),
+            (instance.latitude, instance.longitude),
+        ])
 
 @receiver(post_delete, sender=Property)
 def invalidate_property_cache_on_delete(sender, instance, **kwargs):
     if instance.pk:
         PropertyCacheManager.invalidate_property(instance.pk)
         PropertyCacheManager.invalidate_list()
+        PropertyCacheManager.invalidate_map_tiles([
+            _loaded_location(instance),
+            (instance.latitude, instance.longitude),
+        ])
+
+@receiver(post_save, sender=Property, dispatch_uid='property_published_count_on_save')
+def update_published_counts_on_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        PropertyCounterService.on_property_saved(instance, created)
+
+@receiver(pre_delete, sender=Property, dispatch_uid='property_published_count_on_delete')
+def update_published_counts_on_delete(sender, instance, **kwargs):
+    PropertyCounterService.on_property_deleting(instance)
+
+def _update_published_counts_on_m2m_change(relation):
+    def handler(sender, instance, action, reverse, pk_set, **kwargs):
+        PropertyCounterService.on_relation_changed(relation, instance, action, reverse, pk_set)
+    return handler
+
+for _relation in COUNTED_MANY_TO_MANY:
+    m2m_changed.connect(
+        _update_published_counts_on_m2m_change(_relation),
+        sender=getattr(Property, _relation).through,
+        weak=False,
+        dispatch_uid=f'property_published_count_{_relation}',
+    )
+
+class _PropertySideEffects:
+
+    __slots__ = ('related_ids', 'market_buckets', 'created_by')
+
+    def __init__(self):
+        self.related_ids: set[int] = set()
+        self.market_buckets: set[tuple] = set()
+        self.created_by: Counter = Counter()
+
+    def flush(self) -> None:
+        if self.market_buckets:
+            MarketPriceIndexService.mark_dirty(self.market_buckets)
+        if self.related_ids:
+            from src.real_estate.tasks import refresh_related_properties
+            for property_id in self.related_ids:
+                refresh_related_properties.delay(property_id)
+        if self.created_by:
+            profiles = AdminProfile.objects.filter(admin_user_id__in=list(self.created_by))
+            for profile in profiles:
+                AdminPerformanceService.track_content_creation(
+                    profile, 'property', count=self.created_by[profile.admin_user_id]
+                )
+
+def _add_side_effects(update):
+    add_to_commit_batch('property_side_effects', _PropertySideEffects, _PropertySideEffects.flush, update)
+
+def _schedule_related_refresh(instance):
+    _add_side_effects(lambda batch: batch.related_ids.add(instance.pk))
+
+@receiver(post_save, sender=Property, dispatch_uid='property_related_refresh_on_save')
+def refresh_related_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _schedule_related_refresh(instance)
+
+def _refresh_related_on_m2m_change(sender, instance, action, reverse, **kwargs):
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        _schedule_related_refresh(instance)
+
+for _relation in ('tags', 'features'):
+    m2m_changed.connect(
+        _refresh_related_on_m2m_change,
+        sender=getattr(Property, _relation).through,
+        dispatch_uid=f'property_related_refresh_{_relation}',
+    )
+
+def _schedule_market_index_refresh(instance, include_current=True):
+    loaded = getattr(instance, '_loaded_values', None) or {}
+
+    def update(batch):
+        batch.market_buckets.add((loaded.get('province_id'), loaded.get('published_at')))
+        if include_current:
+            batch.market_buckets.add((instance.province_id, instance.published_at))
+    _add_side_effects(update)
+
+@receiver(post_save, sender=Property, dispatch_uid='property_market_index_on_save')
+def mark_market_index_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _schedule_market_index_refresh(instance)
+
+@receiver(post_delete, sender=Property, dispatch_uid='property_market_index_on_delete')
+def mark_market_index_on_delete(sender, instance, **kwargs):
+    _schedule_market_index_refresh(instance)
 
 @receiver(post_save, sender=PropertyType)
 def invalidate_type_cache_on_save(sender, **kwargs):
@@ -52,12 +156,12 @@ def invalidate_public_real_estate_taxonomy_cache(sender, **kwargs):
     }
     pattern = model_patterns.get(sender)
     if pattern:
-        cache.delete_pattern(pattern)
+        invalidate_pattern(pattern)
 
 @receiver(post_save, sender=Property)
-def track_property_creation(sender, instance, created, **kwargs):
-    if created and instance.created_by:
-        profile = AdminProfile.objects.filter(admin_user=instance.created_by).first()
-        if profile:
-            AdminPerformanceService.track_content_creation(profile, 'property')
+def track_property_creation(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.created_by_id:
+        def update(batch):
+            batch.created_by[instance.created_by_id] += 1
+        _add_side_effects(update)
 
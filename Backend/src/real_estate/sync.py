@@ -0,0 +1,61 @@
+from django.db.models import F
+
+from src.core.sync import SyncRegistry
+from src.real_estate.models.feature import PropertyFeature
+from src.real_estate.models.label import PropertyLabel
+from src.real_estate.models.listing_type import ListingType
+from src.real_estate.models.property import Property
+from src.real_estate.models.tag import PropertyTag
+from src.real_estate.models.type import PropertyType
+from src.real_estate.serializers.public.listing_type_serializer import ListingTypePublicSerializer
+from src.real_estate.serializers.public.property_serializer import PropertyPublicListSerializer
+from src.real_estate.serializers.public.taxonomy_serializer import (
+    PropertyFeaturePublicSerializer,
+    PropertyLabelPublicSerializer,
+    PropertyTagPublicSerializer,
+    PropertyTypePublicSerializer,
+)
+
+def _taxonomy_serializer(serializer_class, *related):
+    def serialize(queryset):
+        queryset = queryset.select_related(*related).annotate(property_count=F('published_property_count'))
+        return list(serializer_class(queryset, many=True).data)
+    return serialize
+
+def register_sync_resources():
+    SyncRegistry.register(
+        'properties',
+        Property,
+        visible=lambda: Property.objects.published().active(),
+        serialize=lambda queryset: list(PropertyPublicListSerializer(queryset.for_public_listing(), many=True).data),
+    )
+    SyncRegistry.register(
+        'property-types',
+        PropertyType,
+        visible=lambda: PropertyType.objects.filter(is_active=True, is_public=True),
+        serialize=_taxonomy_serializer(PropertyTypePublicSerializer, 'image'),
+    )
+    SyncRegistry.register(
+        'property-states',
+        ListingType,
+        visible=lambda: ListingType.objects.filter(is_active=True),
+        serialize=_taxonomy_serializer(ListingTypePublicSerializer, 'image'),
+    )
+    SyncRegistry.register(
+        'property-tags',
+        PropertyTag,
+        visible=lambda: PropertyTag.objects.filter(is_active=True, is_public=True),
+        serialize=_taxonomy_serializer(PropertyTagPublicSerializer),
+    )
+    SyncRegistry.register(
+        'property-labels',
+        PropertyLabel,
+        visible=lambda: PropertyLabel.objects.filter(is_active=True),
+        serialize=_taxonomy_serializer(PropertyLabelPublicSerializer),
+    )
+    SyncRegistry.register(
+        'property-features',
+        PropertyFeature,
+        visible=lambda: PropertyFeature.objects.filter(is_active=True),
+        serialize=_taxonomy_serializer(PropertyFeaturePublicSerializer, 'image', 'parent'),
+    )
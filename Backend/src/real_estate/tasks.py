@@ -0,0 +1,35 @@
+from celery import shared_task
+
+from src.real_estate.services.admin.property_import_service import PropertyImportService
+from src.real_estate.services.analytics.engagement_service import PropertyEngagementService
+from src.real_estate.services.analytics.market_index_service import MarketPriceIndexService
+from src.real_estate.services.public.related_property_service import PropertyRelatedService
+
+@shared_task(acks_late=True)
+def import_properties(job_id):
+    job = PropertyImportService.run(job_id)
+    return {
+        'status': job.status,
+        'created': job.created_count,
+        'failed': job.failed_count,
+    }
+
+@shared_task(ignore_result=True)
+def refresh_related_properties(property_id):
+    return PropertyRelatedService.refresh_property(property_id)
+
+@shared_task(acks_late=True)
+def rebuild_related_properties(city_ids=None):
+    return {'listings': PropertyRelatedService.rebuild(city_ids)}
+
+@shared_task(ignore_result=True)
+def refresh_market_price_index():
+    return MarketPriceIndexService.refresh_dirty()
+
+@shared_task(acks_late=True)
+def rebuild_market_price_index(months=24):
+    return {'buckets': MarketPriceIndexService.rebuild(months)}
+
+@shared_task(ignore_result=True)
+def flush_property_engagement():
+    return PropertyEngagementService.flush()
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from src.core.cache import CacheService
+from src.real_estate.services.public.map_tile_service import PropertyMapTileService
+from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
+
+TILE = (12, 2650, 1620)
+
+class PropertyMapTileCacheTest(TestCase):
+
+    def setUp(self):
+        self.cache_key = PropertyPublicCacheKeys.map_tile('json', *TILE)
+        CacheService.delete(self.cache_key)
+        self.addCleanup(CacheService.delete, self.cache_key)
+
+    def test_second_request_is_served_from_cache(self):
+        with patch.object(
+            PropertyMapTileService,
+            '_render_json',
+            wraps=PropertyMapTileService._render_json,
+        ) as render:
+            first = PropertyMapTileService.get_tile(*TILE, 'json')
+            second = PropertyMapTileService.get_tile(*TILE, 'json')
+
+        render.assert_called_once()
+        self.assertIsInstance(second['body'], bytes)
+        self.assertEqual(second, first)
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from src.core.models import City, Country, Province
+from src.real_estate.models.property import Property
+from src.real_estate.models.statistics import PropertyFavorite, PropertyInquiry
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+@override_settings(CACHES=LOCMEM_CACHES)
+@patch('src.real_estate.services.analytics.engagement_service.CacheService.list_push', return_value=None)
+class PropertyEngagementViewTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        province = Province.objects.create(name='تهران', code='1', country=Country.get_iran())
+        city = City.objects.create(name='تهران', code='1', province=province)
+        self.property = Property.objects.create(
+            title='engagement',
+            slug='engagement',
+            province=province,
+            city=city,
+            address='Tehran',
+            is_published=True,
+            is_public=True,
+        )
+        self.user = get_user_model().objects.create_user(mobile='09123000301', password='test1234')
+
+    def url(self, action):
+        return reverse(f'public-property-{action}', kwargs={'slug': self.property.slug})
+
+    def test_inquiry_is_recorded(self, list_push):
+        response = self.client.post(self.url('inquiry'), {
+            'name': 'Ali',
+            'email': 'ali@example.com',
+            'message': 'Is it available?',
+        }, content_type='application/json')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(PropertyInquiry.objects.filter(property=self.property).exists())
+
+    def test_favorite_requires_authentication(self, list_push):
+        response = self.client.post(self.url('favorite'), {'added': True}, content_type='application/json')
+
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_favorite_is_recorded_for_authenticated_user(self, list_push):
+        self.client.force_login(self.user)
+
+        response = self.client.post(self.url('favorite'), {'added': True}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 202)
+        self.property.refresh_from_db()
+        self.assertEqual(self.property.favorites_count, 1)
+
+    def test_repeated_favorite_counts_once_and_unfavorite_reverts(self, list_push):
+        self.client.force_login(self.user)
+
+        for _ in range(2):
+            self.client.post(self.url('favorite'), {'added': True}, content_type='application/json')
+        self.property.refresh_from_db()
+        self.assertEqual(self.property.favorites_count, 1)
+        self.assertTrue(PropertyFavorite.objects.filter(user=self.user, property=self.property).exists())
+
+        for _ in range(2):
+            self.client.post(self.url('favorite'), {'added': False}, content_type='application/json')
+        self.property.refresh_from_db()
+        self.assertEqual(self.property.favorites_count, 0)
+        self.assertFalse(PropertyFavorite.objects.exists())
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from src.real_estate.models.import_job import PropertyImportJob
+from src.real_estate.services.admin.property_import_service import IMPORT_LEASE_TIMEOUT, PropertyImportService
+
+class PropertyImportLeaseTest(TestCase):
+
+    def create_job(self, status, heartbeat_age):
+        job = PropertyImportJob.objects.create(file='real_estate/imports/lease.csv', status=status)
+        PropertyImportJob.objects.filter(pk=job.pk).update(updated_at=timezone.now() - heartbeat_age)
+        job.refresh_from_db()
+        return job
+
+    def test_live_running_job_is_not_claimed(self):
+        job = self.create_job('running', timedelta(seconds=30))
+
+        self.assertFalse(PropertyImportService.is_retryable(job))
+        self.assertFalse(PropertyImportService._claim(job))
+
+    def test_running_job_with_expired_lease_is_claimed_once(self):
+        job = self.create_job('running', IMPORT_LEASE_TIMEOUT + timedelta(minutes=1))
+
+        self.assertTrue(PropertyImportService.is_retryable(job))
+        self.assertTrue(PropertyImportService._claim(job))
+        self.assertFalse(PropertyImportService._claim(job))
+
+    def test_completed_job_is_not_retryable(self):
+        job = self.create_job('completed', IMPORT_LEASE_TIMEOUT * 2)
+
+        self.assertFalse(PropertyImportService.is_retryable(job))
+        self.assertFalse(PropertyImportService._claim(job))
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from src.core.models import City, Country, Province
+from src.real_estate.models.property import Property
+from src.user.models.admin_profile import AdminProfile
+
+@patch('src.real_estate.signals.AdminPerformanceService.track_content_creation')
+@patch('src.real_estate.signals.MarketPriceIndexService.mark_dirty')
+@patch('src.real_estate.tasks.refresh_related_properties')
+class PropertySideEffectsRollbackTest(TransactionTestCase):
+
+    def setUp(self):
+        self.province = Province.objects.create(name='تهران', code='1', country=Country.get_iran())
+        self.city = City.objects.create(name='تهران', code='1', province=self.province)
+        self.admin = get_user_model().objects.create_user(
+            mobile='09123000201',
+            password='test1234',
+            user_type='admin',
+            is_staff=True,
+            is_admin_active=True,
+        )
+        AdminProfile.objects.get_or_create(admin_user=self.admin)
+
+    def create_property(self, slug):
+        return Property.objects.create(
+            title=slug,
+            slug=slug,
+            province=self.province,
+            city=self.city,
+            address='Tehran',
+            is_published=True,
+            is_public=True,
+            created_by=self.admin,
+        )
+
+    def test_rolled_back_create_flushes_nothing(self, refresh, mark_dirty, track):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.create_property('rolled-back')
+                raise RuntimeError
+
+        refresh.delay.assert_not_called()
+        mark_dirty.assert_not_called()
+        track.assert_not_called()
+
+    def test_next_commit_does_not_replay_rolled_back_create(self, refresh, mark_dirty, track):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                rolled_back = self.create_property('rolled-back')
+                rolled_back_id = rolled_back.pk
+                raise RuntimeError
+
+        with transaction.atomic():
+            committed = self.create_property('committed')
+
+        refresh.delay.assert_called_once_with(committed.pk)
+        self.assertNotEqual(rolled_back_id, committed.pk)
+        mark_dirty.assert_called_once_with({(None, None), (self.province.pk, committed.published_at)})
+        track.assert_called_once()
+        self.assertEqual(track.call_args.kwargs['count'], 1)
@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path, include, re_path
 from rest_framework.routers import DefaultRouter
 from src.real_estate import views
 from src.real_estate.views.admin import location_views as admin_location_views, property_geo_views
@@ -13,6 +13,7 @@ from src.real_estate.views.public import (
     agent_views,
     agency_views,
     floor_plan_views,
+    map_tile_views,
 )
 
 admin_router = DefaultRouter()
@@ -46,5 +47,10 @@ public_router.register(r'real-estate/agencies', agency_views.RealEstateAgencyPub
 urlpatterns = [
     path('', include(admin_router.urls)),
     path('', include(public_router.urls)),
+    re_path(
+        r'^real-estate/tiles/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)(?:\.(?P<tile_format>mvt|pbf|json))?/?$',
+        map_tile_views.PropertyMapTileView.as_view(),
+        name='public-property-map-tile',
+    ),
 ]
 
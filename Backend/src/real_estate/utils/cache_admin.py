@@ -1,7 +1,18 @@
 from django.core.cache import cache
 
-from src.core.cache import CacheKeyBuilder, CacheService, CacheTTL
+from src.core.cache import (
+    CacheKeyBuilder,
+    CacheNamespace,
+    CacheService,
+    CacheTTL,
+    invalidate_keys,
+    invalidate_pattern,
+)
+from src.core.responses import ResponseCache
+from src.core.utils.tree_materializer import TreeMaterializer
+from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
 from src.real_estate.utils.cache_shared import hash_payload
+from src.real_estate.utils.map_tiles import MAP_TILE_FORMATS, tiles_for_points
 
 class PropertyCacheKeys:
 
@@ -70,50 +81,65 @@ class PropertyCacheManager:
 
     @staticmethod
     def invalidate_property(property_id: int) -> int:
-        deleted = CacheService.clear_property_cache(property_id)
-        deleted += CacheService.delete_pattern("public:real_estate:property:detail:*")
-        deleted += CacheService.delete_pattern("public:real_estate:property:related:*")
-        return deleted
+        return PropertyCacheManager.invalidate_properties([property_id])
 
     @staticmethod
     def invalidate_properties(property_ids: list[int]) -> int:
-        deleted = CacheService.clear_properties_cache(property_ids)
-        deleted += CacheService.delete_pattern("public:real_estate:property:detail:*")
-        deleted += CacheService.delete_pattern("public:real_estate:property:related:*")
-        return deleted
+        keys = []
+        for property_id in property_ids:
+            keys.extend(PropertyCacheKeys.all_keys(property_id))
+        queued = invalidate_keys(keys)
+        queued += invalidate_pattern(
+            "public:real_estate:property:detail:*",
+            "public:real_estate:property:related:*",
+        )
+        ResponseCache.invalidate_on_commit(PropertyPublicCacheKeys.response_detail())
+        return queued
 
     @staticmethod
     def invalidate_list() -> int:
-        deleted = CacheService.clear_property_lists()
-        deleted += CacheService.delete_pattern("public:real_estate:property:list:*")
-        deleted += CacheService.delete_pattern("public:real_estate:property:featured:*")
-        deleted += CacheService.delete_pattern("public:real_estate:property:related:*")
-        return deleted
+        queued = invalidate_keys([PropertyCacheKeys.featured()])
+        queued += invalidate_pattern(
+            CacheKeyBuilder.pattern(f"{CacheNamespace.PROPERTY_LIST}:admin"),
+            "public:real_estate:property:list:*",
+            "public:real_estate:property:featured:*",
+            "public:real_estate:property:related:*",
+            "public:real_estate:map:cluster:*",
+        )
+        ResponseCache.invalidate_on_commit(PropertyPublicCacheKeys.response_list())
+        return queued
+
+    @staticmethod
+    def invalidate_map_tiles(points) -> int:
+        keys = [
+            PropertyPublicCacheKeys.map_tile(tile_format, zoom, x, y)
+            for zoom, x, y in tiles_for_points(points)
+            for tile_format in MAP_TILE_FORMATS
+        ]
+        if not keys:
+            return 0
+        return invalidate_keys(keys)
 
     @staticmethod
     def invalidate_statistics() -> int:
-        keys = [
+        return invalidate_keys([
             PropertyCacheKeys.statistics(),
             PropertyCacheKeys.statistics_seo_report(),
-        ]
-        return CacheService.delete_many(keys)
+        ])
 
     @staticmethod
     def invalidate_all() -> int:
-        from src.core.cache import CacheNamespace
-        pattern = f"{CacheNamespace.PROPERTY_LIST}:*"
-        deleted = CacheService.delete_pattern(pattern)
-
-        pattern = f"{CacheNamespace.PROPERTY_DETAIL}:*"
-        deleted += CacheService.delete_pattern(pattern)
-
-        pattern = f"{CacheNamespace.PROPERTY_SEO}:*"
-        deleted += CacheService.delete_pattern(pattern)
-
-        deleted += CacheService.delete_pattern("public:real_estate:property:*")
-        deleted += PropertyCacheManager.invalidate_statistics()
-
-        return deleted
+        queued = invalidate_pattern(
+            CacheKeyBuilder.pattern(CacheNamespace.PROPERTY_LIST),
+            CacheKeyBuilder.pattern(CacheNamespace.PROPERTY_DETAIL),
+            CacheKeyBuilder.pattern(CacheNamespace.PROPERTY_SEO),
+            "public:real_estate:property:*",
+            "public:real_estate:map:*",
+        )
+        queued += PropertyCacheManager.invalidate_statistics()
+        ResponseCache.invalidate_on_commit(PropertyPublicCacheKeys.response_list())
+        ResponseCache.invalidate_on_commit(PropertyPublicCacheKeys.response_detail())
+        return queued
 
 class PropertyTagCacheKeys:
 
@@ -209,6 +235,7 @@ class TypeCacheManager:
     @staticmethod
     def invalidate_type(type_id: int) -> int:
         keys = TypeCacheKeys.all_keys([type_id])
+        TreeMaterializer.invalidate(TypeCacheKeys.tree_admin())
         deleted = CacheService.delete_many(keys)
         deleted += CacheService.delete_pattern("public:real_estate:type:*")
         return deleted
@@ -216,6 +243,7 @@ class TypeCacheManager:
     @staticmethod
     def invalidate_types(type_ids: list[int]) -> int:
         keys = TypeCacheKeys.all_keys(type_ids)
+        TreeMaterializer.invalidate(TypeCacheKeys.tree_admin())
         deleted = CacheService.delete_many(keys)
         deleted += CacheService.delete_pattern("public:real_estate:type:*")
         return deleted
@@ -224,5 +252,6 @@ class TypeCacheManager:
     def invalidate_all() -> int:
         pattern = f"{TypeCacheKeys.NAMESPACE}:*"
         deleted = CacheService.delete_pattern(pattern)
+        TreeMaterializer.invalidate(TypeCacheKeys.tree_admin())
         deleted += CacheService.delete_pattern("public:real_estate:type:*")
         return deleted
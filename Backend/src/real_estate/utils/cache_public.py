@@ -33,6 +33,30 @@ class PropertyPublicCacheKeys:
     def related(slug, limit):
         return f"public:real_estate:property:related:{PropertyPublicCacheKeys.SCHEMA_VERSION}:{slug}:{limit}"
 
+    @staticmethod
+    def related_index(property_id):
+        return f"real_estate:property:related_index:{property_id}"
+
+    @staticmethod
+    def related_refresh_lock(property_id):
+        return f"real_estate:property:related_refresh_lock:{property_id}"
+
+    @staticmethod
+    def response_list():
+        return f"public:real_estate:property:list:{PropertyPublicCacheKeys.SCHEMA_VERSION}"
+
+    @staticmethod
+    def response_detail():
+        return f"public:real_estate:property:detail:{PropertyPublicCacheKeys.SCHEMA_VERSION}"
+
+    @staticmethod
+    def map_cluster_tile(zoom, x, y):
+        return f"public:real_estate:map:cluster:{PropertyPublicCacheKeys.SCHEMA_VERSION}:{zoom}:{x}:{y}"
+
+    @staticmethod
+    def map_tile(tile_format, zoom, x, y):
+        return f"public:real_estate:map:tile:{PropertyPublicCacheKeys.SCHEMA_VERSION}:{tile_format}:{zoom}:{x}:{y}"
+
 class TypePublicCacheKeys:
 
     @staticmethod
@@ -2,6 +2,12 @@ PUBLIC_PROPERTY_LIST_TTL = 120
 PUBLIC_PROPERTY_DETAIL_TTL = 300
 PUBLIC_PROPERTY_FEATURED_TTL = 120
 PUBLIC_PROPERTY_RELATED_TTL = 180
+PUBLIC_PROPERTY_RELATED_INDEX_TTL = 604800
+PUBLIC_PROPERTY_RELATED_REFRESH_LOCK_TTL = 60
+PUBLIC_MAP_CLUSTER_TTL = 600
+PUBLIC_MAP_TILE_TTL = 86400
+PUBLIC_MAP_TILE_MAX_AGE = 60
+PUBLIC_MAP_TILE_STALE_TTL = 600
 
 PUBLIC_TAXONOMY_LIST_TTL = 900
 PUBLIC_TAXONOMY_DETAIL_TTL = 1800
@@ -0,0 +1,115 @@
+import math
+from typing import List, Sequence, Tuple
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9
+GEOHASH_MAX_COVER_CELLS = 32
+
+def encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    value = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                value = (value << 1) | 1
+                lon_range[0] = mid
+            else:
+                value <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                value = (value << 1) | 1
+                lat_range[0] = mid
+            else:
+                value <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(BASE32[value])
+            bit = 0
+            value = 0
+
+    return ''.join(chars)
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+def covering(
+    min_lat: float,
+    max_lat: float,
+    min_lon: float,
+    max_lon: float,
+    max_cells: int = GEOHASH_MAX_COVER_CELLS,
+) -> List[str]:
+    min_lat, max_lat = max(min_lat, -90.0), min(max_lat, 90.0)
+    min_lon, max_lon = max(min_lon, -180.0), min(max_lon, 180.0)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_size, lon_size = cell_size(precision)
+        y0 = math.floor((min_lat + 90.0) / lat_size)
+        y1 = math.floor((max_lat + 90.0) / lat_size)
+        x0 = math.floor((min_lon + 180.0) / lon_size)
+        x1 = math.floor((max_lon + 180.0) / lon_size)
+
+        if (y1 - y0 + 1) * (x1 - x0 + 1) > max_cells:
+            continue
+
+        cells = set()
+        for y in range(y0, y1 + 1):
+            center_lat = min(-90.0 + (y + 0.5) * lat_size, 90.0)
+            for x in range(x0, x1 + 1):
+                center_lon = min(-180.0 + (x + 0.5) * lon_size, 180.0)
+                cells.add(encode(center_lat, center_lon, precision))
+        return sorted(cells)
+
+    return ['']
+
+def haversine_km_batch(
+    latitude: float,
+    longitude: float,
+    points: Sequence[Tuple[float, float]],
+) -> List[float]:
+    lat0 = math.radians(latitude)
+    lon0 = math.radians(longitude)
+    cos_lat0 = math.cos(lat0)
+    sin, cos, asin, sqrt, radians = math.sin, math.cos, math.asin, math.sqrt, math.radians
+
+    distances = []
+    for lat, lon in points:
+        lat1 = radians(lat)
+        a = sin((lat1 - lat0) / 2) ** 2 + cos_lat0 * cos(lat1) * sin((radians(lon) - lon0) / 2) ** 2
+        distances.append(12742.0 * asin(min(1.0, sqrt(a))))
+    return distances
+
+def points_in_polygon(
+    polygon: Sequence[Tuple[float, float]],
+    points: Sequence[Tuple[float, float]],
+) -> List[bool]:
+    edges = []
+    count = len(polygon)
+    for i in range(count):
+        lat_a, lon_a = polygon[i]
+        lat_b, lon_b = polygon[(i + 1) % count]
+        if lat_a == lat_b:
+            continue
+        edges.append((lat_a, lon_a, lat_b, lon_b, (lon_b - lon_a) / (lat_b - lat_a)))
+
+    results = []
+    for lat, lon in points:
+        inside = False
+        for lat_a, lon_a, lat_b, lon_b, slope in edges:
+            if (lat_a > lat) != (lat_b > lat) and lon < lon_a + (lat - lat_a) * slope:
+                inside = not inside
+        results.append(inside)
+    return results
@@ -0,0 +1,39 @@
+import math
+from typing import Iterable, List, Optional, Tuple
+
+MAP_TILE_MIN_ZOOM = 0
+MAP_TILE_MAX_ZOOM = 18
+MAP_TILE_FORMATS = ('mvt', 'json')
+MERCATOR_MAX_LAT = 85.0511287798
+
+def is_valid_tile(zoom: int, x: int, y: int) -> bool:
+    if zoom < MAP_TILE_MIN_ZOOM or zoom > MAP_TILE_MAX_ZOOM:
+        return False
+    n = 1 << zoom
+    return 0 <= x < n and 0 <= y < n
+
+def tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    n = 1 << zoom
+    min_lon = x / n * 360.0 - 180.0
+    max_lon = (x + 1) / n * 360.0 - 180.0
+    max_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    min_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return min_lat, max_lat, min_lon, max_lon
+
+def tile_for_point(latitude: float, longitude: float, zoom: int) -> Tuple[int, int]:
+    n = 1 << zoom
+    latitude = max(-MERCATOR_MAX_LAT, min(MERCATOR_MAX_LAT, latitude))
+    x = int((longitude + 180.0) / 360.0 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(latitude))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+def tiles_for_points(points: Iterable[Optional[Tuple]]) -> List[Tuple[int, int, int]]:
+    tiles = set()
+    for point in points:
+        if not point or point[0] is None or point[1] is None:
+            continue
+        latitude, longitude = float(point[0]), float(point[1])
+        for zoom in range(MAP_TILE_MIN_ZOOM, MAP_TILE_MAX_ZOOM + 1):
+            x, y = tile_for_point(latitude, longitude, zoom)
+            tiles.add((zoom, x, y))
+    return sorted(tiles)
@@ -201,6 +201,22 @@ class PropertyGeoViewSet(PermissionRequiredMixin, viewsets.ViewSet):
                 )
             
             limit = int(request.query_params.get('limit', 500))
+            zoom = request.query_params.get('zoom')
+            
+            if zoom is not None:
+                map_data = PropertyGeoService.get_map_clusters(
+                    min_lat=min_lat,
+                    max_lat=max_lat,
+                    min_lon=min_lon,
+                    max_lon=max_lon,
+                    zoom=int(zoom),
+                    limit=limit
+                )
+                return APIResponse.success(
+                    message=PROPERTY_SUCCESS["property_map_data_retrieved"],
+                    data=map_data,
+                    status_code=status.HTTP_200_OK
+                )
             
             map_properties = PropertyGeoService.get_properties_for_map(
                 min_lat=min_lat,
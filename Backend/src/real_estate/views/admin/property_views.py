@@ -6,7 +6,7 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 from django.core.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db.models import Q
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.conf import settings
 from src.core.utils.request_helpers import MultipartDataParser
 
@@ -37,7 +37,9 @@ from src.real_estate.services.admin import (
     PropertyAdminMediaService,
     PropertyExcelExportService,
     PropertyPDFListExportService,
+    PropertyImportService,
 )
+from src.real_estate.services.analytics.market_index_service import MarketPriceIndexService
 from src.real_estate.messages.messages import PROPERTY_SUCCESS, PROPERTY_ERRORS
 from src.real_estate.models.constants import LISTING_TYPE_CHOICES
 from src.core.utils.validation_helpers import extract_validation_message, normalize_validation_error
@@ -67,6 +69,7 @@ class PropertyFinalizeDealSerializer(serializers.Serializer):
 
 class PropertyAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
     permission_classes = [real_estate_permission]
+    query_budget = {'list': 12, 'retrieve': 16}
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = PropertyAdminFilter
     ordering_fields = ['created_at', 'updated_at', 'title', 'price', 'published_at', 'views_count']
@@ -97,6 +100,10 @@ class PropertyAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
         'validate_seo': 'real_estate.property.read',
         'field_options': 'real_estate.property.read',
         'export': 'real_estate.property.read',
+        'import_properties': 'real_estate.property.create',
+        'import_status': 'real_estate.property.read',
+        'import_retry': 'real_estate.property.create',
+        'market_index': 'real_estate.property.read',
     }
     permission_denied_message = PROPERTY_ERRORS["property_not_authorized"]
 
@@ -926,6 +933,120 @@ class PropertyAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_properties(self, request):
+        uploaded_file = request.FILES.get('file')
+        if not uploaded_file:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS["property_import_file_required"],
+                errors={'file': [PROPERTY_ERRORS["property_import_file_required"]]},
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        defaults = request.data.get('defaults')
+        if isinstance(defaults, str):
+            import json
+            try:
+                defaults = json.loads(defaults)
+            except ValueError:
+                defaults = None
+
+        try:
+            job = PropertyImportService.create_job(
+                uploaded_file,
+                created_by=request.user,
+                options={'defaults': defaults} if isinstance(defaults, dict) else {},
+            )
+        except ValidationError as e:
+            return APIResponse.error(
+                message=extract_validation_message(e, PROPERTY_ERRORS["property_import_invalid_format"]),
+                errors=normalize_validation_error(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except ImportError as e:
+            return APIResponse.error(
+                message=extract_validation_message(e, PROPERTY_ERRORS["property_import_xlsx_unavailable"]),
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        from src.real_estate.tasks import import_properties
+        transaction.on_commit(lambda: import_properties.delay(job.id))
+
+        return APIResponse.success(
+            message=PROPERTY_SUCCESS["property_import_started"],
+            data=PropertyImportService.serialize_job(job),
+            status_code=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=False, methods=['get'], url_path=r'import/(?P<job_id>\d+)')
+    def import_status(self, request, job_id=None):
+        job = PropertyImportService.get_job(job_id)
+        if not job:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS["property_import_job_not_found"],
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        return APIResponse.success(
+            message=PROPERTY_SUCCESS["property_import_status_retrieved"],
+            data=PropertyImportService.serialize_job(job),
+            status_code=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=['post'], url_path=r'import/(?P<job_id>\d+)/retry')
+    def import_retry(self, request, job_id=None):
+        job = PropertyImportService.get_job(job_id)
+        if not job:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS["property_import_job_not_found"],
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        if not PropertyImportService.is_retryable(job):
+            return APIResponse.error(
+                message=PROPERTY_ERRORS["property_import_not_retryable"],
+                status_code=status.HTTP_409_CONFLICT
+            )
+
+        from src.real_estate.tasks import import_properties
+        transaction.on_commit(lambda: import_properties.delay(job.id))
+
+        return APIResponse.success(
+            message=PROPERTY_SUCCESS["property_import_retry_started"],
+            data=PropertyImportService.serialize_job(job),
+            status_code=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=False, methods=['get'], url_path='market-index')
+    def market_index(self, request):
+        params = {}
+        for name in ('province_id', 'city_id', 'region_id', 'property_type_id', 'state_id', 'months'):
+            value = request.query_params.get(name)
+            try:
+                params[name] = int(value) if value not in (None, '') else None
+            except (TypeError, ValueError):
+                params[name] = None
+
+        if not params['province_id']:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS["property_market_index_province_required"],
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        series = MarketPriceIndexService.get_series(
+            province_id=params['province_id'],
+            city_id=params['city_id'],
+            region_id=params['region_id'] if params['city_id'] else None,
+            property_type_id=params['property_type_id'],
+            state_id=params['state_id'],
+            months=params['months'] or 12,
+        )
+        return APIResponse.success(
+            message=PROPERTY_SUCCESS["property_market_index_retrieved"],
+            data=series,
+            status_code=status.HTTP_200_OK
+        )
+
     @action(detail=True, methods=['get'], url_path='export-pdf')
     def export_pdf(self, request, pk=None):
         
@@ -62,6 +62,12 @@ class PropertyTypeAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
         else:
             return PropertyTypeAdminDetailSerializer
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in ('list', 'retrieve', 'children'):
+            context['type_tree'] = PropertyTypeAdminService.get_materialized_tree()
+        return context
+
     def list(self, request, *args, **kwargs):
         tree_mode = request.GET.get('tree', '').lower() == 'true'
         if tree_mode:
@@ -84,7 +90,7 @@ class PropertyTypeAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
         
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = PropertyTypeAdminListSerializer(page, many=True)
+            serializer = PropertyTypeAdminListSerializer(page, many=True, context=self.get_serializer_context())
             response = self.get_paginated_response(serializer.data)
             PropertyTypeAdminService.set_cached_list_payload(
                 user_id=user_id,
@@ -93,7 +99,7 @@ class PropertyTypeAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
             )
             return response
         
-        serializer = PropertyTypeAdminListSerializer(queryset, many=True)
+        serializer = PropertyTypeAdminListSerializer(queryset, many=True, context=self.get_serializer_context())
         response = APIResponse.success(
             message=TYPE_SUCCESS["type_list_success"],
             data=serializer.data,
@@ -270,7 +276,7 @@ class PropertyTypeAdminViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
             )
         
         children = property_type.get_children().filter(is_active=True)
-        serializer = PropertyTypeAdminListSerializer(children, many=True)
+        serializer = PropertyTypeAdminListSerializer(children, many=True, context=self.get_serializer_context())
         
         return APIResponse.success(
             message=TYPE_SUCCESS["type_list_success"],
@@ -8,6 +8,7 @@ from .feature_views import PropertyFeaturePublicViewSet
 from .agent_views import PropertyAgentPublicViewSet
 from .agency_views import RealEstateAgencyPublicViewSet
 from .floor_plan_views import FloorPlanPublicViewSet
+from .map_tile_views import PropertyMapTileView
 
 __all__ = [
 	'ListingTypePublicViewSet',
@@ -22,4 +23,5 @@ __all__ = [
 	'PropertyAgentPublicViewSet',
 	'RealEstateAgencyPublicViewSet',
 	'FloorPlanPublicViewSet',
+	'PropertyMapTileView',
 ]
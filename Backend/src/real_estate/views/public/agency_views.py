@@ -5,6 +5,7 @@ from rest_framework.permissions import AllowAny
 
 from src.core.pagination import StandardLimitPagination
 from src.core.responses.response import APIResponse
+from src.real_estate.services.admin.property_geo_services import PropertyGeoService
 from src.real_estate.serializers.public.agency_serializer import (
     RealEstateAgencyPublicListSerializer,
     RealEstateAgencyPublicDetailSerializer,
@@ -174,6 +175,34 @@ class RealEstateAgencyPublicViewSet(viewsets.ReadOnlyModelViewSet):
             status_code=status.HTTP_200_OK
         )
     
+    @action(detail=False, methods=['get'], url_path='nearby')
+    def nearby(self, request):
+
+        coordinates = PropertyGeoService.parse_coordinates(request.query_params)
+        if coordinates is None:
+            return APIResponse.error(
+                message=AGENCY_ERRORS["coordinates_required"],
+                errors={'coordinates': [AGENCY_ERRORS["coordinates_required"]]},
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        latitude, longitude = coordinates
+        radius_km = PropertyGeoService.parse_radius_km(request.query_params.get('radius_km'), default=10.0)
+        limit = self._parse_positive_int(request.query_params.get('limit'), default=10, max_value=50)
+
+        data = RealEstateAgencyPublicService.get_nearby_agencies_data(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit
+        )
+
+        return APIResponse.success(
+            message=AGENCY_SUCCESS["agency_list_success"],
+            data=data,
+            status_code=status.HTTP_200_OK
+        )
+    
     @action(detail=True, methods=['get'], url_path='statistics')
     def statistics(self, request, slug=None):
 
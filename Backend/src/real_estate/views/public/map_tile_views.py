@@ -0,0 +1,59 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from src.core.responses.response import APIResponse
+from src.real_estate.messages.messages import PROPERTY_ERRORS
+from src.real_estate.services.public.map_tile_service import PropertyMapTileService
+from src.real_estate.utils.cache_ttl import PUBLIC_MAP_TILE_MAX_AGE, PUBLIC_MAP_TILE_STALE_TTL
+
+class PropertyMapTileView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request, z, x, y, tile_format=None):
+        zoom, x, y = int(z), int(x), int(y)
+        if not PropertyMapTileService.is_valid_tile(zoom, x, y):
+            return APIResponse.error(
+                message=PROPERTY_ERRORS['property_map_tile_invalid'],
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            entry = PropertyMapTileService.get_tile(
+                zoom,
+                x,
+                y,
+                PropertyMapTileService.resolve_format(tile_format),
+            )
+        except Exception:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS['property_map_tile_failed'],
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        etag = entry['etag']
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        if if_none_match:
+            tags = {tag.strip() for tag in if_none_match.split(',')}
+            if '*' in tags or etag in tags or f"W/{etag}" in tags:
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                response['Cache-Control'] = self._cache_control()
+                return response
+
+        if entry['body']:
+            response = HttpResponse(
+                entry['body'],
+                content_type=PropertyMapTileService.content_type(entry['format']),
+            )
+        else:
+            response = HttpResponse(status=status.HTTP_204_NO_CONTENT)
+        response['ETag'] = etag
+        response['Cache-Control'] = self._cache_control()
+        return response
+
+    @staticmethod
+    def _cache_control():
+        return f"public, max-age={PUBLIC_MAP_TILE_MAX_AGE}, stale-while-revalidate={PUBLIC_MAP_TILE_STALE_TTL}"
@@ -1,19 +1,30 @@
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.throttling import ScopedRateThrottle
 
 from src.core.pagination import StandardLimitPagination
+from src.core.responses import ResponseCache
 from src.core.responses.response import APIResponse
 from src.real_estate.messages.messages import PROPERTY_ERRORS, PROPERTY_SUCCESS
 from src.real_estate.models.constants.property_status_choices import get_property_status_choices_list
+from src.real_estate.serializers.public.inquiry_serializer import (
+    PropertyFavoriteSerializer,
+    PropertyInquiryCreateSerializer,
+)
 from src.real_estate.serializers.public.property_serializer import (
     PropertyPublicDetailSerializer,
     PropertyPublicListSerializer,
 )
+from src.real_estate.services.analytics.engagement_service import PropertyEngagementService
 from src.real_estate.services.public.property_services import PropertyPublicService
+from src.real_estate.utils.cache_public import PropertyPublicCacheKeys
+from src.real_estate.utils.cache_ttl import PUBLIC_PROPERTY_DETAIL_TTL, PUBLIC_PROPERTY_LIST_TTL
 
 class PropertyPublicViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [AllowAny]
+    throttle_scope = None
+    query_budget = {'list': 8, 'retrieve': 12}
     lookup_field = 'slug'
     pagination_class = StandardLimitPagination
 
@@ -26,6 +37,14 @@ class PropertyPublicViewSet(viewsets.ReadOnlyModelViewSet):
         return PropertyPublicDetailSerializer
 
     def list(self, request, *args, **kwargs):
+        return ResponseCache.serve(
+            request,
+            PropertyPublicCacheKeys.response_list(),
+            lambda: self._build_list_response(request),
+            PUBLIC_PROPERTY_LIST_TTL,
+        )
+
+    def _build_list_response(self, request):
         filters = {
             'status': request.query_params.get('status'),
             'is_featured': self._parse_bool(request.query_params.get('is_featured')),
@@ -83,7 +102,14 @@ class PropertyPublicViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
     def retrieve(self, request, *args, **kwargs):
-        slug = kwargs.get('slug')
+        return ResponseCache.serve(
+            request,
+            PropertyPublicCacheKeys.response_detail(),
+            lambda: self._build_retrieve_response(kwargs.get('slug')),
+            PUBLIC_PROPERTY_DETAIL_TTL,
+        )
+
+    def _build_retrieve_response(self, slug):
         property_data = PropertyPublicService.get_property_detail_by_slug_data(slug)
         if not property_data:
             return APIResponse.error(
@@ -154,6 +180,54 @@ class PropertyPublicViewSet(viewsets.ReadOnlyModelViewSet):
             status_code=status.HTTP_200_OK,
         )
 
+    @action(detail=True, methods=['post'], throttle_classes=[ScopedRateThrottle], throttle_scope='property_inquiry')
+    def inquiry(self, request, slug=None):
+        property_id = PropertyPublicService.get_property_id_by_slug(slug)
+        if not property_id:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS['property_not_found'],
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = PropertyInquiryCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        PropertyEngagementService.record_inquiry(
+            property_id,
+            user_id=request.user.pk if request.user.is_authenticated else None,
+            **serializer.validated_data,
+        )
+        return APIResponse.success(
+            message=PROPERTY_SUCCESS['property_inquiry_received'],
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(
+        detail=True,
+        methods=['post'],
+        permission_classes=[IsAuthenticated],
+        throttle_classes=[ScopedRateThrottle],
+        throttle_scope='property_favorite',
+    )
+    def favorite(self, request, slug=None):
+        property_id = PropertyPublicService.get_property_id_by_slug(slug)
+        if not property_id:
+            return APIResponse.error(
+                message=PROPERTY_ERRORS['property_not_found'],
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = PropertyFavoriteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        PropertyEngagementService.record_favorite(
+            property_id,
+            user_id=request.user.pk,
+            added=serializer.validated_data['added'],
+        )
+        return APIResponse.success(
+            message=PROPERTY_SUCCESS['property_favorite_recorded'],
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
     @action(detail=False, methods=['get'])
     def statuses(self, request):
         status_choices = [
@@ -5,3 +5,6 @@ class SettingsConfig(AppConfig):
     name = 'src.settings'
     verbose_name = 'Site Settings'
 
+    def ready(self):
+        import src.settings.signals
+
@@ -1,8 +1,11 @@
 from .branding_service import get_public_logo_settings, get_public_active_sliders
 from .contact_service import get_public_contact_payload
+from .bootstrap_service import get_site_bootstrap, rebuild_site_bootstrap
 
 __all__ = [
     'get_public_logo_settings',
     'get_public_active_sliders',
     'get_public_contact_payload',
+    'get_site_bootstrap',
+    'rebuild_site_bootstrap',
 ]
@@ -0,0 +1,38 @@
+import time
+
+from src.core.cache import get_or_compute
+from src.core.feature_flags.models import FeatureFlag
+from src.settings.serializers.public.branding_serializer import PublicLogoSerializer, PublicSliderSerializer
+from src.settings.serializers.public.contact_serializer import PublicContactSettingsSerializer
+from src.settings.serializers.public.footer_about_serializer import PublicFooterAboutSerializer
+from src.settings.serializers.public.footer_serializer import PublicFooterSectionSerializer
+from src.settings.serializers.public.general_settings_serializer import PublicGeneralSettingsSerializer
+from src.settings.services.public.branding_service import get_public_active_sliders, get_public_logo_settings
+from src.settings.services.public.contact_service import get_public_contact_payload
+from src.settings.services.public.footer_about_service import get_public_footer_about
+from src.settings.services.public.footer_service import get_public_footer_sections
+from src.settings.services.public.general_settings_service import get_public_general_settings
+from src.settings.utils.cache_admin import SettingsCacheManager
+from src.settings.utils.cache_public import SettingsPublicCacheKeys
+from src.settings.utils.cache_ttl import PUBLIC_BOOTSTRAP_TTL
+
+def build_site_bootstrap() -> dict:
+    return {
+        'version': int(time.time() * 1000),
+        'general': PublicGeneralSettingsSerializer(get_public_general_settings()).data,
+        'branding': {
+            'logo': PublicLogoSerializer(get_public_logo_settings()).data,
+            'sliders': PublicSliderSerializer(get_public_active_sliders(), many=True).data,
+        },
+        'contact': PublicContactSettingsSerializer(get_public_contact_payload()).data,
+        'footer': PublicFooterSectionSerializer(list(get_public_footer_sections()), many=True).data,
+        'footer_about': PublicFooterAboutSerializer(get_public_footer_about()).data,
+        'feature_flags': dict(FeatureFlag.objects.values_list('key', 'is_active')),
+    }
+
+def get_site_bootstrap() -> dict:
+    return get_or_compute(SettingsPublicCacheKeys.bootstrap(), build_site_bootstrap, PUBLIC_BOOTSTRAP_TTL)
+
+def rebuild_site_bootstrap() -> dict:
+    SettingsCacheManager.invalidate_bootstrap()
+    return get_site_bootstrap()
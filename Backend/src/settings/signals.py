@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from src.core.feature_flags.models import FeatureFlag
+from src.settings.models import (
+    ContactEmail,
+    ContactMobile,
+    ContactPhone,
+    FooterAbout,
+    FooterLink,
+    FooterSection,
+    GeneralSettings,
+    MapSettings,
+    Slider,
+    SocialMedia,
+)
+from src.settings.utils.cache_admin import SettingsCacheManager
+
+BOOTSTRAP_SOURCE_MODELS = (
+    GeneralSettings,
+    MapSettings,
+    ContactPhone,
+    ContactMobile,
+    ContactEmail,
+    SocialMedia,
+    Slider,
+    FooterSection,
+    FooterLink,
+    FooterAbout,
+    FeatureFlag,
+)
+
+def schedule_bootstrap_invalidation(sender, **kwargs):
+    transaction.on_commit(SettingsCacheManager.invalidate_bootstrap)
+
+for model in BOOTSTRAP_SOURCE_MODELS:
+    post_save.connect(
+        schedule_bootstrap_invalidation,
+        sender=model,
+        dispatch_uid=f'settings_bootstrap_post_save_{model.__name__}',
+    )
+    post_delete.connect(
+        schedule_bootstrap_invalidation,
+        sender=model,
+        dispatch_uid=f'settings_bootstrap_post_delete_{model.__name__}',
+    )
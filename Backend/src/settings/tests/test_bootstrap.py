@@ -0,0 +1,28 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+
+from src.core.feature_flags.models import FeatureFlag
+from src.settings.utils.cache_admin import SettingsCacheManager
+
+class PublicBootstrapFeatureFlagTest(TestCase):
+
+    def setUp(self):
+        SettingsCacheManager.invalidate_bootstrap()
+        self.addCleanup(SettingsCacheManager.invalidate_bootstrap)
+
+    def fetch_flags(self):
+        response = self.client.get(reverse('public-settings-bootstrap'))
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)['data']['feature_flags']
+
+    def test_flipped_flag_is_visible_on_next_bootstrap(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            flag = FeatureFlag.objects.create(key='bootstrap_test_flag', is_active=True)
+        self.assertIs(self.fetch_flags()['bootstrap_test_flag'], True)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            flag.is_active = False
+            flag.save()
+        self.assertIs(self.fetch_flags()['bootstrap_test_flag'], False)
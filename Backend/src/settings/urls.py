@@ -8,6 +8,7 @@ from src.settings.views.public.contact_view import PublicContactView
 from src.settings.views.public.general_settings_view import PublicGeneralSettingsView
 from src.settings.views.public.footer_view import PublicFooterView
 from src.settings.views.public.footer_about_view import PublicFooterAboutView
+from src.settings.views.public.bootstrap_view import PublicSiteBootstrapView
 from src.settings.views.admin import (
     GeneralSettingsViewSet,
     MapSettingsViewSet,
@@ -40,6 +41,7 @@ urlpatterns = [
     path('settings/general/public/', PublicGeneralSettingsView.as_view(), name='public-settings-general'),
     path('settings/footer/', PublicFooterView.as_view(), name='public-settings-footer'),
     path('settings/footer/about/', PublicFooterAboutView.as_view(), name='public-settings-footer-about'),
+    path('settings/bootstrap/', PublicSiteBootstrapView.as_view(), name='public-settings-bootstrap'),
     path('', include(router.urls)),
 ]
 
@@ -1,5 +1,6 @@
 from src.core.cache import CacheService
-from src.settings.utils.cache_public import SettingsPublicCacheKeys
+from src.core.responses import ResponseCache
+from src.settings.utils.cache_public import SettingsPublicCacheKeys, settings_public_cache
 
 class SettingsAdminCacheKeys:
 
@@ -51,6 +52,7 @@ class SettingsCacheManager:
         deleted += CacheService.delete(SettingsAdminCacheKeys.general_settings_model_pk())
         deleted += CacheService.delete(SettingsPublicCacheKeys.general_settings())
         deleted += CacheService.delete(SettingsPublicCacheKeys.branding_logo())
+        settings_public_cache.invalidate()
         return deleted
 
     @staticmethod
@@ -71,20 +73,34 @@ class SettingsCacheManager:
 
     @staticmethod
     def invalidate_contact_public():
-        return CacheService.delete(SettingsPublicCacheKeys.contact_payload())
+        deleted = CacheService.delete(SettingsPublicCacheKeys.contact_payload())
+        settings_public_cache.invalidate()
+        return deleted
 
     @staticmethod
     def invalidate_footer_public():
-        return CacheService.delete(SettingsPublicCacheKeys.footer())
+        deleted = CacheService.delete(SettingsPublicCacheKeys.footer())
+        settings_public_cache.invalidate()
+        ResponseCache.invalidate(SettingsPublicCacheKeys.footer_response())
+        return deleted
 
     @staticmethod
     def invalidate_footer_about_public():
-        return CacheService.delete(SettingsPublicCacheKeys.footer_about())
+        deleted = CacheService.delete(SettingsPublicCacheKeys.footer_about())
+        settings_public_cache.invalidate()
+        return deleted
 
     @staticmethod
     def invalidate_branding_public():
         deleted = CacheService.delete(SettingsPublicCacheKeys.branding_logo())
         deleted += CacheService.delete(SettingsPublicCacheKeys.branding_sliders())
+        settings_public_cache.invalidate()
+        return deleted
+
+    @staticmethod
+    def invalidate_bootstrap():
+        deleted = CacheService.delete(SettingsPublicCacheKeys.bootstrap())
+        ResponseCache.invalidate(SettingsPublicCacheKeys.bootstrap_response())
         return deleted
 
     @staticmethod
@@ -95,4 +111,7 @@ class SettingsCacheManager:
     def invalidate_all():
         deleted = CacheService.delete_many(SettingsAdminCacheKeys.all_keys())
         deleted += CacheService.delete_many(SettingsPublicCacheKeys.all_keys())
+        settings_public_cache.invalidate()
+        ResponseCache.invalidate(SettingsPublicCacheKeys.footer_response())
+        ResponseCache.invalidate(SettingsPublicCacheKeys.bootstrap_response())
         return deleted
@@ -1,3 +1,7 @@
+from src.core.cache import get_local_cache
+
+settings_public_cache = get_local_cache('settings_public', max_entries=64, ttl=10.0)
+
 class SettingsPublicCacheKeys:
 
     @staticmethod
@@ -12,6 +16,10 @@ class SettingsPublicCacheKeys:
     def footer():
         return "public:settings:footer"
 
+    @staticmethod
+    def footer_response():
+        return "public:settings:footer:response"
+
     @staticmethod
     def footer_about():
         return "public:settings:footer:about"
@@ -24,6 +32,14 @@ class SettingsPublicCacheKeys:
     def branding_sliders():
         return "public:settings:branding:sliders"
 
+    @staticmethod
+    def bootstrap():
+        return "public:settings:bootstrap"
+
+    @staticmethod
+    def bootstrap_response():
+        return "public:settings:bootstrap:response"
+
     @staticmethod
     def all_keys():
         return [
@@ -33,4 +49,5 @@ class SettingsPublicCacheKeys:
             SettingsPublicCacheKeys.footer_about(),
             SettingsPublicCacheKeys.branding_logo(),
             SettingsPublicCacheKeys.branding_sliders(),
+            SettingsPublicCacheKeys.bootstrap(),
         ]
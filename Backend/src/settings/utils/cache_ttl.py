@@ -4,6 +4,9 @@ PUBLIC_FOOTER_TTL = 900
 PUBLIC_FOOTER_ABOUT_TTL = 900
 PUBLIC_BRANDING_LOGO_TTL = 300
 PUBLIC_BRANDING_SLIDERS_TTL = 120
+PUBLIC_BOOTSTRAP_TTL = 3600
+PUBLIC_BOOTSTRAP_MAX_AGE = 300
+PUBLIC_BOOTSTRAP_STALE_WHILE_REVALIDATE = 86400
 
 ADMIN_GENERAL_SETTINGS_TTL = 60
 ADMIN_LIST_TTL = 60
@@ -0,0 +1,40 @@
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from src.core.responses import ResponseCache
+from src.core.responses.response import APIResponse
+from src.settings.messages.messages import SETTINGS_ERRORS, SETTINGS_SUCCESS
+from src.settings.services.public.bootstrap_service import get_site_bootstrap
+from src.settings.utils.cache_public import SettingsPublicCacheKeys
+from src.settings.utils import cache_ttl
+
+class PublicSiteBootstrapView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        response = ResponseCache.serve(
+            request,
+            SettingsPublicCacheKeys.bootstrap_response(),
+            self._build_response,
+            cache_ttl.PUBLIC_BOOTSTRAP_TTL,
+        )
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['Cache-Control'] = (
+                f"public, max-age={cache_ttl.PUBLIC_BOOTSTRAP_MAX_AGE}, "
+                f"stale-while-revalidate={cache_ttl.PUBLIC_BOOTSTRAP_STALE_WHILE_REVALIDATE}"
+            )
+        return response
+
+    def _build_response(self):
+        try:
+            return APIResponse.success(
+                message=SETTINGS_SUCCESS['settings_retrieved'],
+                data=get_site_bootstrap(),
+                status_code=status.HTTP_200_OK,
+            )
+        except Exception:
+            return APIResponse.error(
+                message=SETTINGS_ERRORS['settings_retrieve_failed'],
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
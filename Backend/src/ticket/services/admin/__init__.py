@@ -1,9 +1,11 @@
 from .ticket_service import TicketAdminService
 from .ticket_message_service import TicketMessageService
 from .ticket_stats_service import TicketStatsService
+from .ticket_unread_service import TicketUnreadService
 
 __all__ = [
     'TicketAdminService',
     'TicketMessageService',
     'TicketStatsService',
+    'TicketUnreadService',
 ]
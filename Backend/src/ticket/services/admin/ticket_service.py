@@ -3,6 +3,7 @@ from django.db.models import Count, Q, Exists, OuterRef, Prefetch
 from rest_framework.exceptions import ValidationError
 from src.ticket.models.ticket import Ticket
 from src.ticket.models.ticket_message import TicketMessage
+from src.ticket.services.admin.ticket_unread_service import TicketUnreadService
 from src.ticket.utils.cache import TicketCacheManager
 from src.analytics.utils.cache import AnalyticsCacheManager
 from src.ticket.messages.messages import TICKET_ERRORS
@@ -56,6 +57,7 @@ class TicketAdminService:
                 unread_messages.update(is_read=True)
                 TicketCacheManager.invalidate_ticket(ticket.id)
                 AnalyticsCacheManager.invalidate_tickets()
+                transaction.on_commit(lambda: TicketUnreadService.sync_ticket(ticket, has_unread=False))
         
         return ticket
 
@@ -76,6 +78,13 @@ class TicketAdminService:
 
     @staticmethod
     def get_stats(user):
+        stats = TicketUnreadService.get_stats(user)
+        if stats is not None:
+            return stats
+        return TicketAdminService.get_stats_from_db(user)
+
+    @staticmethod
+    def get_stats_from_db(user):
         has_unread = TicketMessage.objects.filter(
             ticket=OuterRef('pk'),
             sender_type='user',
@@ -0,0 +1,215 @@
+from typing import Optional
+
+from django.db.models import Exists, OuterRef
+
+from src.core.cache import CacheService
+from src.ticket.models.ticket import Ticket
+from src.ticket.models.ticket_message import TicketMessage
+from src.ticket.utils.cache import TicketCacheKeys
+from src.ticket.utils.cache_ttl import ADMIN_TICKET_UNREAD_READY_TTL
+
+ACTIVE_STATUSES = ('open', 'in_progress')
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+class TicketUnreadService:
+
+    @staticmethod
+    def _client():
+        return CacheService.get_default_manager().get_redis_client()
+
+    @staticmethod
+    def _bucket(status, assigned_admin_id) -> Optional[str]:
+        if assigned_admin_id is None:
+            if status == 'open':
+                return TicketCacheKeys.unread_unassigned()
+            return None
+        if status in ACTIVE_STATUSES:
+            return TicketCacheKeys.unread_admin(assigned_admin_id)
+        return None
+
+    @staticmethod
+    def _bump_version(pipe):
+        pipe.incr(TicketCacheKeys.unread_version())
+
+    @classmethod
+    def sync_ticket(cls, ticket, has_unread: Optional[bool] = None) -> bool:
+        try:
+            client = cls._client()
+            if not client:
+                return False
+
+            ticket_id = str(ticket.id)
+            if has_unread is None:
+                has_unread = bool(client.sismember(TicketCacheKeys.unread_all(), ticket_id))
+            old_bucket = _decode(client.hget(TicketCacheKeys.unread_index(), ticket_id))
+            new_bucket = cls._bucket(ticket.status, ticket.assigned_admin_id) if has_unread else None
+
+            pipe = client.pipeline(transaction=True)
+            if old_bucket and old_bucket != new_bucket:
+                pipe.srem(old_bucket, ticket_id)
+            if has_unread:
+                pipe.sadd(TicketCacheKeys.unread_all(), ticket_id)
+            else:
+                pipe.srem(TicketCacheKeys.unread_all(), ticket_id)
+            if new_bucket:
+                pipe.sadd(new_bucket, ticket_id)
+                pipe.hset(TicketCacheKeys.unread_index(), ticket_id, new_bucket)
+            else:
+                pipe.hdel(TicketCacheKeys.unread_index(), ticket_id)
+            if has_unread and ticket.status in ACTIVE_STATUSES:
+                pipe.zadd(TicketCacheKeys.unread_recent(), {ticket_id: ticket.created_at.timestamp()})
+            else:
+                pipe.zrem(TicketCacheKeys.unread_recent(), ticket_id)
+            cls._bump_version(pipe)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def remove_ticket(cls, ticket_id) -> bool:
+        try:
+            client = cls._client()
+            if not client:
+                return False
+
+            ticket_id = str(ticket_id)
+            old_bucket = _decode(client.hget(TicketCacheKeys.unread_index(), ticket_id))
+
+            pipe = client.pipeline(transaction=True)
+            if old_bucket:
+                pipe.srem(old_bucket, ticket_id)
+            pipe.srem(TicketCacheKeys.unread_all(), ticket_id)
+            pipe.hdel(TicketCacheKeys.unread_index(), ticket_id)
+            pipe.zrem(TicketCacheKeys.unread_recent(), ticket_id)
+            cls._bump_version(pipe)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def on_message_saved(cls, message, created: bool) -> bool:
+        if message.sender_type != 'user':
+            return False
+        if created and not message.is_read:
+            return cls.sync_ticket(message.ticket, has_unread=True)
+        if message.is_read:
+            has_unread = TicketMessage.objects.filter(
+                ticket_id=message.ticket_id,
+                sender_type='user',
+                is_read=False
+            ).exists()
+            return cls.sync_ticket(message.ticket, has_unread=has_unread)
+        return False
+
+    @classmethod
+    def rebuild(cls) -> bool:
+        try:
+            client = cls._client()
+            if not client:
+                return False
+
+            has_unread = TicketMessage.objects.filter(
+                ticket=OuterRef('pk'),
+                sender_type='user',
+                is_read=False
+            )
+            rows = Ticket.objects.annotate(
+                has_unread_messages=Exists(has_unread)
+            ).filter(
+                has_unread_messages=True
+            ).values_list('id', 'status', 'assigned_admin_id', 'created_at')
+
+            stale_buckets = {_decode(bucket) for bucket in client.hvals(TicketCacheKeys.unread_index())}
+
+            pipe = client.pipeline(transaction=True)
+            pipe.delete(
+                TicketCacheKeys.unread_all(),
+                TicketCacheKeys.unread_unassigned(),
+                TicketCacheKeys.unread_recent(),
+                TicketCacheKeys.unread_index(),
+                *stale_buckets
+            )
+            for ticket_id, status, assigned_admin_id, created_at in rows:
+                ticket_id = str(ticket_id)
+                pipe.sadd(TicketCacheKeys.unread_all(), ticket_id)
+                bucket = cls._bucket(status, assigned_admin_id)
+                if bucket:
+                    pipe.sadd(bucket, ticket_id)
+                    pipe.hset(TicketCacheKeys.unread_index(), ticket_id, bucket)
+                if status in ACTIVE_STATUSES:
+                    pipe.zadd(TicketCacheKeys.unread_recent(), {ticket_id: created_at.timestamp()})
+            pipe.set(TicketCacheKeys.unread_ready(), 1, ex=ADMIN_TICKET_UNREAD_READY_TTL)
+            cls._bump_version(pipe)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def get_version(cls) -> int:
+        try:
+            client = cls._client()
+            if not client:
+                return 0
+            return int(client.get(TicketCacheKeys.unread_version()) or 0)
+        except Exception:
+            return 0
+
+    @classmethod
+    def get_stats(cls, user) -> Optional[dict]:
+        try:
+            client = cls._client()
+            if not client:
+                return None
+            if not client.exists(TicketCacheKeys.unread_ready()) and not cls.rebuild():
+                return None
+
+            admin_profile = getattr(user, 'admin_profile', None)
+
+            pipe = client.pipeline(transaction=False)
+            pipe.scard(TicketCacheKeys.unread_unassigned())
+            if admin_profile:
+                pipe.scard(TicketCacheKeys.unread_admin(admin_profile.id))
+            pipe.zrevrange(TicketCacheKeys.unread_recent(), 0, 4)
+            pipe.get(TicketCacheKeys.unread_version())
+            results = pipe.execute()
+        except Exception:
+            return None
+
+        new_tickets_count = int(results[0] or 0)
+        assigned_to_me_count = int(results[1] or 0) if admin_profile else 0
+        recent_ids = [int(_decode(ticket_id)) for ticket_id in results[-2]]
+        version = int(results[-1] or 0)
+
+        tickets_by_id = {
+            ticket.id: ticket
+            for ticket in Ticket.objects.filter(id__in=recent_ids).only(
+                'id', 'public_id', 'subject', 'status', 'priority', 'created_at'
+            )
+        }
+        recent_tickets_data = [
+            {
+                'id': ticket.id,
+                'public_id': str(ticket.public_id),
+                'subject': ticket.subject,
+                'status': ticket.status,
+                'priority': ticket.priority,
+                'created_at': ticket.created_at.isoformat(),
+            }
+            for ticket in (tickets_by_id.get(ticket_id) for ticket_id in recent_ids)
+            if ticket is not None
+        ]
+
+        return {
+            'new_tickets_count': new_tickets_count,
+            'assigned_to_me_count': assigned_to_me_count,
+            'total_new': new_tickets_count + assigned_to_me_count,
+            'recent_tickets': recent_tickets_data,
+            'version': version,
+        }
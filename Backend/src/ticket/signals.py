@@ -1,7 +1,10 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from src.ticket.models.ticket import Ticket
+from src.ticket.models.ticket_message import TicketMessage
 from src.ticket.services.admin.ticket_stats_service import TicketStatsService
+from src.ticket.services.admin.ticket_unread_service import TicketUnreadService
 from src.user.services.admin_performance_service import AdminPerformanceService
 
 @receiver(post_save, sender=Ticket)
@@ -31,3 +34,18 @@ def track_ticket_analytics(sender, instance, created, **kwargs):
                 task_type='ticket',
                 response_time_minutes=response_time
             )
+
+@receiver(post_save, sender=Ticket)
+def sync_ticket_unread_bucket(sender, instance, created, **kwargs):
+    if created:
+        return
+    transaction.on_commit(lambda: TicketUnreadService.sync_ticket(instance))
+
+@receiver(post_delete, sender=Ticket)
+def remove_ticket_unread(sender, instance, **kwargs):
+    ticket_id = instance.id
+    transaction.on_commit(lambda: TicketUnreadService.remove_ticket(ticket_id))
+
+@receiver(post_save, sender=TicketMessage)
+def track_ticket_message_unread(sender, instance, created, **kwargs):
+    transaction.on_commit(lambda: TicketUnreadService.on_message_saved(instance, created))
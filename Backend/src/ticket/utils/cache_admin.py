@@ -19,6 +19,34 @@ class TicketCacheKeys:
     def admin_stats():
         return AnalyticsCacheKeys.tickets()
 
+    @staticmethod
+    def unread_all():
+        return "ticket:unread:all"
+
+    @staticmethod
+    def unread_unassigned():
+        return "ticket:unread:unassigned"
+
+    @staticmethod
+    def unread_admin(admin_profile_id):
+        return f"ticket:unread:admin:{admin_profile_id}"
+
+    @staticmethod
+    def unread_recent():
+        return "ticket:unread:recent"
+
+    @staticmethod
+    def unread_index():
+        return "ticket:unread:index"
+
+    @staticmethod
+    def unread_version():
+        return "ticket:unread:version"
+
+    @staticmethod
+    def unread_ready():
+        return "ticket:unread:ready"
+
     @staticmethod
     def all_keys(ticket_id):
         return [
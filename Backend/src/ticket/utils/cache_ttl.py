@@ -6,3 +6,5 @@ ADMIN_TICKET_LIST_TTL = 15
 ADMIN_TICKET_DETAIL_TTL = 20
 ADMIN_TICKET_MESSAGES_TTL = 15
 ADMIN_TICKET_STATS_TTL = 10
+
+ADMIN_TICKET_UNREAD_READY_TTL = 24 * 60 * 60
@@ -2,6 +2,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from django.db.models import Exists, OuterRef
+from django.http import HttpResponseNotModified
 from src.core.responses.response import APIResponse
 from src.ticket.models.ticket import Ticket
 from src.ticket.models.ticket_message import TicketMessage
@@ -24,6 +25,7 @@ class AdminTicketViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
         'mark_as_read': ['ticket.manage', 'ticket.read'],
         'update_status': ['ticket.manage', 'ticket.update'],
         'stats': ['ticket.manage', 'ticket.read'],
+        'stats_poll': ['ticket.manage', 'ticket.read'],
     }
     permission_denied_message = TICKET_ERRORS['permission_denied']
     serializer_class = TicketSerializer
@@ -144,3 +146,30 @@ class AdminTicketViewSet(PermissionRequiredMixin, viewsets.ModelViewSet):
                 errors=normalize_validation_error(e),
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    @action(detail=False, methods=['get'], url_path='stats/poll')
+    def stats_poll(self, request):
+        from src.ticket.services.admin.ticket_service import TicketAdminService
+        from src.ticket.services.admin.ticket_unread_service import TicketUnreadService
+        try:
+            since = request.query_params.get('since')
+            version = TicketUnreadService.get_version()
+            if since is not None and version:
+                try:
+                    if int(since) == version:
+                        return HttpResponseNotModified()
+                except (TypeError, ValueError):
+                    pass
+
+            stats = TicketAdminService.get_stats(request.user)
+            return APIResponse.success(
+                message=TICKET_SUCCESS["statistics_retrieved"],
+                data=stats,
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return APIResponse.error(
+                message=TICKET_ERRORS["statistics_retrieve_failed"].format(error=extract_validation_message(e, TICKET_ERRORS['error_occurred'])),
+                errors=normalize_validation_error(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -48,7 +48,7 @@ class AdminPerformanceService:
         AdminPerformanceStatistics.objects.filter(pk=stats.pk).update(**update_data)
 
     @classmethod
-    def track_content_creation(cls, admin_profile, content_type):
+    def track_content_creation(cls, admin_profile, content_type, count=1):
         
         stats = cls._get_monthly_stats(admin_profile)
         
@@ -61,7 +61,7 @@ class AdminPerformanceService:
         field_name = field_map.get(content_type)
         if field_name:
             AdminPerformanceStatistics.objects.filter(pk=stats.pk).update(
-                **{field_name: F(field_name) + 1},
+                **{field_name: F(field_name) + count},
                 updated_at=timezone.now()
             )
 
@@ -1,5 +1,8 @@
-import requests
+import time
+import uuid
+
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from src.user.messages import AUTH_ERRORS
 from src.user.utils import validate_identifier, validate_otp, generate_otp, get_otp_expiry_time
@@ -7,6 +10,7 @@ from src.user.models import User
 from src.user.utils.jwt_tokens import generate_jwt_tokens
 from src.core.cache import CacheService
 from src.core.utils.validation_helpers import extract_validation_message
+from src.user.services.sms_gateway import SMSGatewayError, get_sms_gateway
 from django.core.exceptions import ValidationError
 
 class OTPService:
@@ -35,10 +39,19 @@ class OTPService:
         return f"otp_expiry:{mobile}"
 
     def _check_request_limit(self, mobile):
-        request_key = self._get_request_key(mobile)
-        current_requests = int(CacheService.get(request_key) or 0)
+        request_key = cache.make_key(self._get_request_key(mobile))
+        try:
+            client = CacheService.get_default_manager().get_redis_client()
+            if not client:
+                return 0
+            pipe = client.pipeline(transaction=True)
+            pipe.set(request_key, 0, ex=self.request_window, nx=True)
+            pipe.incr(request_key)
+            current_requests = pipe.execute()[1]
+        except Exception:
+            return 0
         
-        if current_requests >= self.max_requests:
+        if current_requests > self.max_requests:
             raise Exception(AUTH_ERRORS["otp_request_limit"])
         
         return current_requests
@@ -48,33 +61,25 @@ class OTPService:
         
         expiry_key = self._get_expiry_key(mobile)
         CacheService.set(expiry_key, expiry_time.timestamp(), self.otp_expiry)
-        
-        request_key = self._get_request_key(mobile)
-        current = int(CacheService.get(request_key) or 0)
-        CacheService.set(request_key, current + 1, self.request_window)
 
     def _send_sms(self, mobile, otp):
         if self.use_simulator:
             return
 
-        sms_data = {
-            'bodyId': settings.MELIPAYAMAK_BODY_ID,
-            'to': mobile,
-            'args': [otp]
-        }
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {settings.MELIPAYAMAK_API_KEY}'
-        }
-        
-        response = requests.post(
-            settings.MELIPAYAMAK_API_URL,
-            json=sms_data,
-            headers=headers
-        )
-        
-        if response.status_code != 200:
+        from src.user.tasks import send_otp_sms
+
+        deadline = time.time() + self.otp_expiry
+        otp_id = uuid.uuid4().hex
+        if CacheService.set_otp_delivery(otp_id, mobile, otp, self.otp_expiry):
+            try:
+                send_otp_sms.apply_async(args=[otp_id, deadline], expires=self.otp_expiry)
+                return
+            except Exception:
+                CacheService.delete_otp_delivery(otp_id)
+
+        try:
+            get_sms_gateway().send_otp(mobile, otp)
+        except SMSGatewayError:
             raise Exception(AUTH_ERRORS["otp_send_failed"])
 
     def send_otp(self, identifier):
@@ -0,0 +1,72 @@
+import threading
+from abc import ABC, abstractmethod
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+class SMSGatewayError(Exception):
+    pass
+
+class BaseSMSGateway(ABC):
+
+    @abstractmethod
+    def send_otp(self, mobile: str, code: str) -> None:
+        pass
+
+class MelipayamakGateway(BaseSMSGateway):
+
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self):
+        self.api_url = settings.MELIPAYAMAK_API_URL
+        self.body_id = settings.MELIPAYAMAK_BODY_ID
+        self.api_key = settings.MELIPAYAMAK_API_KEY
+        self.timeout = (
+            getattr(settings, 'SMS_CONNECT_TIMEOUT', 3),
+            getattr(settings, 'SMS_READ_TIMEOUT', 5),
+        )
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    pool_size = getattr(settings, 'SMS_POOL_SIZE', 10)
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    cls._session = session
+        return cls._session
+
+    def send_otp(self, mobile: str, code: str) -> None:
+        try:
+            response = self.get_session().post(
+                self.api_url,
+                json={
+                    'bodyId': self.body_id,
+                    'to': mobile,
+                    'args': [code],
+                },
+                headers={'Authorization': f'Bearer {self.api_key}'},
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            raise SMSGatewayError(str(e)) from e
+
+        if response.status_code != 200:
+            raise SMSGatewayError(f"SMS provider returned {response.status_code}")
+
+class FakeSMSGateway(BaseSMSGateway):
+
+    outbox: list[dict] = []
+
+    def send_otp(self, mobile: str, code: str) -> None:
+        self.outbox.append({'mobile': mobile, 'code': code})
+
+def get_sms_gateway() -> BaseSMSGateway:
+    backend = getattr(settings, 'SMS_GATEWAY_BACKEND', 'src.user.services.sms_gateway.MelipayamakGateway')
+    return import_string(backend)()
@@ -0,0 +1,23 @@
+import time
+
+from celery import shared_task
+
+from src.core.cache import CacheService
+from src.user.services.sms_gateway import SMSGatewayError, get_sms_gateway
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=2, acks_late=True)
+def send_otp_sms(self, otp_id, deadline):
+    delivery = CacheService.get_otp_delivery(otp_id)
+    if not delivery or time.time() >= deadline:
+        return {'skipped': True}
+
+    try:
+        get_sms_gateway().send_otp(delivery['mobile'], delivery['code'])
+    except SMSGatewayError as exc:
+        countdown = self.default_retry_delay * (2 ** self.request.retries)
+        if time.time() + countdown >= deadline:
+            raise
+        raise self.retry(exc=exc, countdown=countdown)
+
+    CacheService.delete_otp_delivery(otp_id)
+    return {'sent': True}